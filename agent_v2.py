@@ -1,9 +1,26 @@
+import os
 import json
 import time
-from typing import Dict, List, Any, Optional
+import threading
+import contextvars
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
 from abc import ABC, abstractmethod
 from core.model import LLMClient
-from tools.tools_manager import ToolsManager
+from core.routing import ModelRouter
+from core.cancellation import CancellationError, CancellationToken, use_token, run_cancellable
+from core.summarizer import ToolOutputSummarizer
+from core.blob_store import BlobStore
+from core.journal import SessionJournal
+from core.cassette import Cassette, use_cassette
+from core.tracing import Tracer, trace_span, get_current_span
+from core.event_bus import EventBus
+from core.tool_retriever import ToolRetriever
+from core.intent_router import IntentRouter, IntentMatch, is_failed_output
+from core.metrics import ACTIVE_RUNS, RUNS, RUN_LATENCY, CONTEXT_MESSAGES, CONTEXT_TOKENS
+from config.server_config import ServerConfig
+from tools.tools_manager import ToolsManager, ERROR_OUTPUT_PREFIXES
 
 
 class ReasoningCallback(ABC):
@@ -96,75 +113,41 @@ class DefaultCallback(ReasoningCallback):
         print(f"   {error}")
 
 
-class ReactAgentV2:
+class EventBusCallback(ReasoningCallback):
     """
-    개선된 ReAct 에이전트 - 실시간 추론 과정 표시 지원
-    
-    주요 개선사항:
-    1. 콜백 시스템으로 실시간 업데이트 제공
-    2. 추론 과정을 명확히 분리하여 표시
-    3. 구조화된 실행 로그로 각 단계 추적
+    콜백 호출을 이벤트 버스 발행으로 바꾸는 콜백 - 실제 처리는 구독자 스레드에서 수행
     """
     
-    def __init__(
-        self,
-        endpoint: str = "http://localhost:11434",
-        model: str = "gpt-oss:20b",
-        max_iterations: int = 10,
-        system_prompt: Optional[str] = None,
-        callback: Optional[ReasoningCallback] = None,
-        verbose: bool = True
-    ):
-        """
-        ReactAgentV2 초기화
-        
-        Args:
-            endpoint: LLM 서버 엔드포인트
-            model: 사용할 모델명
-            max_iterations: 최대 반복 횟수
-            system_prompt: 사용자 정의 시스템 프롬프트
-            callback: 실시간 업데이트를 위한 콜백 객체
-            verbose: 상세 로그 출력 여부
-        """
-        self.endpoint = endpoint
-        self.model = model
-        self.max_iterations = max_iterations
-        self.verbose = verbose
-        
-        # 콜백 설정 (없으면 기본 콜백 사용)
-        self.callback = callback or DefaultCallback()
-        
-        # 핵심 컴포넌트 초기화
-        self.llm_client = LLMClient(endpoint=endpoint, model=model)
-        self.tools_manager = ToolsManager()
-        
-        # 실행 상태
-        self.current_iteration = 0
-        self.conversation_history = []
-        self.execution_log = []
-        self.reasoning_history = []  # 추론 과정 저장
-        self.token_usage_history = []  # 실제 토큰 사용량 저장
-        
-        # 시스템 프롬프트 설정
-        self.system_prompt = system_prompt or self._get_default_system_prompt()
-        
-        # 초기 시스템 메시지 설정
-        self._initialize_conversation()
+    def __init__(self, event_bus: EventBus):
+        self.event_bus = event_bus
     
-    def _get_default_system_prompt(self) -> str:
-        """
-        기본 시스템 프롬프트 생성 - 참조 파일 기반으로 개선된 체계적 프롬프트
-        """
-        available_tools = self.tools_manager.get_available_tools()
-        tools_info = []
-        
-        for tool_name in available_tools:
-            tool_info = self.tools_manager.get_tool_info(tool_name)
-            tools_info.append(f"- {tool_name}: {tool_info.get('description', 'No description')}")
-        
-        tools_list = "\n".join(tools_info)
-        
-        return f"""
+    def on_iteration_start(self, iteration: int, max_iterations: int):
+        self.event_bus.publish("iteration_start", iteration=iteration, max_iterations=max_iterations)
+    
+    def on_reasoning(self, iteration: int, thought: str):
+        self.event_bus.publish("reasoning", iteration=iteration, thought=thought)
+    
+    def on_tool_call(self, iteration: int, tool: str, arguments: Dict[str, Any]):
+        self.event_bus.publish("tool_call", iteration=iteration, tool=tool, arguments=arguments)
+    
+    def on_tool_result(self, iteration: int, tool: str, result: str, success: bool):
+        self.event_bus.publish("tool_result", iteration=iteration, tool=tool, result=result, success=success)
+    
+    def on_observation(self, iteration: int, observation: str):
+        self.event_bus.publish("observation", iteration=iteration, observation=observation)
+    
+    def on_iteration_end(self, iteration: int):
+        self.event_bus.publish("iteration_end", iteration=iteration)
+    
+    def on_final_result(self, result: str, iterations: int):
+        self.event_bus.publish("final_result", result=result, iterations=iterations)
+    
+    def on_error(self, iteration: int, error: str):
+        self.event_bus.publish("error", iteration=iteration, error=error)
+
+
+# 기본 시스템 프롬프트 템플릿 - {tools_list}에 도구 목록이 채워짐
+SYSTEM_PROMPT_TEMPLATE = """
 당신은 전문적인 시스템 분석 및 문제 해결 전문가입니다.
 ReAct(Reasoning-Acting-Observing) 패턴을 사용하여 체계적으로 문제를 해결합니다.
 
@@ -247,40 +230,463 @@ ReAct(Reasoning-Acting-Observing) 패턴을 사용하여 체계적으로 문제
 
 이제 주어진 작업을 ReAct 패턴으로 처리하겠습니다.
 """
+
+# 축약 시스템 프롬프트 - 이모지/응답 서식 예시를 빼고 추론 절차와 보고서 구성만 유지
+COMPACT_SYSTEM_PROMPT_TEMPLATE = """당신은 시스템 분석 및 문제 해결 전문가입니다. ReAct 방식(추론 → 도구 실행 → 관찰)으로 문제를 해결합니다.
+
+사용 가능한 도구:
+{tools_list}
+
+절차:
+1. 현재 상황과 필요한 정보를 짧게 정리한 뒤 도구를 호출하세요. 서로 독립적인 도구 호출은 한 번에 함께 요청하세요.
+2. 결과를 해석하고 근거가 부족하면 추가 정보를 수집하세요. 이미 얻은 결과는 다시 요청하지 마세요.
+3. 수치와 근거를 바탕으로 위험도(높음/중간/낮음)를 판단하세요.
+
+최종 답변: 요약, 상세 분석(데이터와 발견사항), 우선순위별 권장사항, 위험 요소, 다음 단계
+"""
+
+# 최소 시스템 프롬프트 - 도구 목록과 핵심 지시만 (컨텍스트가 작은 소형 모델용)
+MINIMAL_SYSTEM_PROMPT_TEMPLATE = """시스템 분석 전문가로서 도구를 호출해 정보를 수집하고 근거에 기반해 답하세요.
+
+도구:
+{tools_list}
+
+독립적인 도구 호출은 함께 요청하고, 충분한 정보가 모이면 요약과 권장 조치로 답하세요.
+"""
+
+# 프롬프트 프로필 → 템플릿
+SYSTEM_PROMPT_PROFILES = {
+    "full": SYSTEM_PROMPT_TEMPLATE,
+    "compact": COMPACT_SYSTEM_PROMPT_TEMPLATE,
+    "minimal": MINIMAL_SYSTEM_PROMPT_TEMPLATE
+}
+
+# 모델명 패턴 → 기본 프롬프트 프로필 (목록에 없는 모델은 full 사용)
+# 축약 프로필은 해당 모델의 실제 카세트 모음으로 benchmarks.prompt_profile_benchmark --cassettes 회귀 확인을
+# 통과한 뒤에만 추가 (기본 프로필이 바뀌면 시스템 프롬프트가 달라져 기존 카세트도 재생되지 않음)
+# 그 전까지는 REACT_AGENT_PROMPT_PROFILE 또는 prompt_profile로 명시적으로 선택
+MODEL_PROMPT_PROFILES: Dict[str, str] = {}
+
+# 지정 시 모델과 관계없이 사용할 기본 프롬프트 프로필
+DEFAULT_PROMPT_PROFILE = os.getenv("REACT_AGENT_PROMPT_PROFILE")
+
+# 세션 저널에서 LLM 컨텍스트로 복원할 최근 대화 턴(사용자 요청) 수 - 이전 턴은 저널에만 남김
+DEFAULT_JOURNAL_RESTORE_TURNS = int(os.getenv("REACT_AGENT_JOURNAL_RESTORE_TURNS", "3"))
+
+
+def prompt_profile_for_model(model: str) -> str:
+    """
+    모델의 기본 프롬프트 프로필
+
+    Args:
+        model: 모델명
+
+    Returns:
+        str: 프롬프트 프로필 (REACT_AGENT_PROMPT_PROFILE → 모델명 패턴 → full 순)
+    """
+    if DEFAULT_PROMPT_PROFILE:
+        return DEFAULT_PROMPT_PROFILE
+    model_lower = model.lower()
+    for model_pattern, profile in MODEL_PROMPT_PROFILES.items():
+        if model_pattern in model_lower:
+            return profile
+    return "full"
+
+# 빠른 경로 LLM 요약 지시문 (대화 히스토리 없이 도구 출력만 보내는 짧은 호출)
+FAST_PATH_SUMMARY_PROMPT = """당신은 시스템 운영 도우미입니다. 사용자 요청에 대해 실행한 명령의 출력을 보고
+핵심 수치와 주의할 점만 3~5줄의 한국어로 요약하세요. 출력에 없는 내용은 추측하지 마세요."""
+
+# 스키마 지문별로 렌더링된 시스템 프롬프트 캐시 (도구 구성이 바뀔 때만 다시 렌더링)
+# 도구 핫 리로드로 지문이 계속 바뀌어도 커지지 않도록 오래된 항목부터 제거
+_SYSTEM_PROMPT_CACHE: Dict[str, str] = {}
+_SYSTEM_PROMPT_CACHE_LOCK = threading.Lock()
+_SYSTEM_PROMPT_CACHE_SIZE = 32
+
+# 실행 종료 시 이벤트 버스 구독자가 남은 이벤트를 처리하기를 기다릴 최대 시간 (초)
+EVENT_FLUSH_TIMEOUT = 30.0
+
+
+# Plan 모드 계획 수립 지시문
+PLAN_PROMPT = """지금은 계획 단계입니다. 사용자 요청을 해결하는 데 필요한 도구 호출 계획을 JSON 객체 하나로만 출력하세요.
+
+형식:
+{{"goal": "요청 요약", "steps": [{{"id": "s1", "tool": "도구명", "arguments": {{}}, "depends_on": [], "purpose": "이 단계가 필요한 이유"}}]}}
+
+규칙:
+- 서로 독립적인 단계는 depends_on을 비워 두세요 (동시에 실행됩니다)
+- 앞선 단계의 결과를 확인한 뒤에만 의미가 있는 단계만 depends_on에 해당 id를 적으세요
+- 도구가 필요 없는 요청이면 steps를 빈 배열로 두세요
+- 최대 {max_steps}단계까지 계획하세요"""
+
+
+class ReactAgentV2:
+    """
+    개선된 ReAct 에이전트 - 실시간 추론 과정 표시 지원
+    
+    주요 개선사항:
+    1. 콜백 시스템으로 실시간 업데이트 제공
+    2. 추론 과정을 명확히 분리하여 표시
+    3. 구조화된 실행 로그로 각 단계 추적
+    """
+    
+    def __init__(
+        self,
+        endpoint: str = "http://localhost:11434",
+        model: str = "gpt-oss:20b",
+        max_iterations: int = 10,
+        system_prompt: Optional[str] = None,
+        callback: Optional[ReasoningCallback] = None,
+        verbose: bool = True,
+        summary_model: Optional[str] = None,
+        summarizer: Optional[ToolOutputSummarizer] = None,
+        fast_model: Optional[str] = None,
+        fast_endpoint: Optional[str] = None,
+        router: Optional[ModelRouter] = None,
+        max_tool_workers: int = 4,
+        run_timeout: Optional[float] = None,
+        tool_timeout: Optional[float] = 60.0,
+        llm_timeout: Optional[float] = 120.0,
+        memoize_tool_calls: bool = True,
+        mode: str = "react",
+        max_plan_steps: int = 8,
+        blob_store: Optional[BlobStore] = None,
+        journal: Optional[SessionJournal] = None,
+        journal_restore_turns: Optional[int] = None,
+        cassette: Optional[Cassette] = None,
+        tracer: Optional[Tracer] = None,
+        llm_client: Optional[LLMClient] = None,
+        tools_manager: Optional[ToolsManager] = None,
+        event_bus: Optional[EventBus] = None,
+        tool_top_k: Optional[int] = None,
+        tool_retriever: Optional[ToolRetriever] = None,
+        prompt_profile: Optional[str] = None,
+        intent_router: Optional[IntentRouter] = None
+    ):
+        """
+        ReactAgentV2 초기화
+        
+        Args:
+            endpoint: LLM 서버 엔드포인트
+            model: 사용할 모델명
+            max_iterations: 최대 반복 횟수
+            system_prompt: 사용자 정의 시스템 프롬프트
+            callback: 실시간 업데이트를 위한 콜백 객체
+            verbose: 상세 로그 출력 여부
+            summary_model: 대용량 도구 출력 요약에 사용할 저비용 모델명 (지정 시 요약 활성화)
+            summarizer: 직접 구성한 도구 출력 요약기 (summary_model보다 우선)
+            fast_model: 도구 선택 단계에 사용할 빠른 모델명 (지정 시 2-tier 라우팅 활성화)
+            fast_endpoint: 빠른 모델 엔드포인트 (기본값: endpoint)
+            router: 직접 구성한 모델 라우터 (fast_model보다 우선)
+            max_tool_workers: 한 번의 응답에 포함된 도구 호출을 동시에 실행할 최대 스레드 수 (1이면 순차 실행)
+            run_timeout: 실행(run) 전체 제한 시간 (초, None이면 무제한)
+            tool_timeout: 도구 호출 1회당 제한 시간 (초)
+            llm_timeout: LLM 호출 1회당 제한 시간 (초)
+            memoize_tool_calls: 한 실행 안에서 동일한 도구 호출 결과를 재사용할지 여부
+            mode: 실행 모드 - "react"(단계별 추론) 또는 "plan"(계획 수립 후 일괄 실행)
+            max_plan_steps: plan 모드에서 한 번에 계획할 최대 도구 호출 수
+            blob_store: 도구 출력을 보관할 내용 주소 기반 저장소 (세션 단위로 공유 가능)
+            journal: 대화/실행 이벤트를 기록할 세션 저널 (기록이 있으면 해당 대화를 복원하여 이어감)
+            journal_restore_turns: 저널에서 복원할 최근 대화 턴 수 (기본값: REACT_AGENT_JOURNAL_RESTORE_TURNS 또는 3,
+                                   0이면 복원하지 않고 새 대화 시작)
+            cassette: LLM/SSH 상호작용을 기록하거나 재생할 카세트 (재생 시 LLM 서버/원격 서버 불필요)
+            tracer: 실행/반복/LLM 호출/도구/SSH 구간을 스팬으로 기록할 추적기 (없으면 상위 추적에만 연결)
+            llm_client: 여러 에이전트가 공유할 LLM 클라이언트 (지정 시 endpoint/model 대신 사용)
+            tools_manager: 여러 에이전트가 공유할 도구 매니저 (지정 시 도구 탐색 생략)
+            event_bus: 콜백을 에이전트 스레드 밖에서 처리할 이벤트 버스 (지정 시 callback은 버스 구독자로 등록되고,
+                       실행 종료 시 모든 구독자가 이벤트를 처리할 때까지 대기, callback이 없으면 기본 콜백 미사용)
+            tool_top_k: 지정 시 사용자 요청과 관련 있는 상위 K개 도구(+ 이번 실행에서 사용한 도구)의 스키마만 LLM에 전달
+            tool_retriever: 직접 구성한 도구 선택기 (tool_top_k보다 우선)
+            prompt_profile: 기본 시스템 프롬프트 프로필 - "full", "compact", "minimal" (기본값: 모델별 설정)
+            intent_router: 지정 시 단순 진단 요청(예: "메모리 사용량 보여줘")은 LLM 없이 해당 도구를 바로 실행하고
+                           템플릿 응답(또는 짧은 LLM 요약 1회)으로 답함 - 판별되지 않는 요청은 일반 실행
+        """
+        self.endpoint = endpoint
+        self.model = model
+        self.max_iterations = max_iterations
+        self.verbose = verbose
+        self.max_tool_workers = max_tool_workers
+        self.run_timeout = run_timeout
+        self.tool_timeout = tool_timeout
+        self.llm_timeout = llm_timeout
+        self.memoize_tool_calls = memoize_tool_calls
+        
+        if mode not in ("react", "plan"):
+            raise ValueError(f"지원하지 않는 실행 모드입니다: {mode}")
+        self.mode = mode
+        self.max_plan_steps = max_plan_steps
+        
+        # 콜백 설정 (없으면 기본 콜백 사용)
+        # 이벤트 버스가 있으면 콜백은 구독자 스레드에서 실행하고, 루프에서는 발행만 함
+        # (콜백 없이 버스만 주어지면 버스에 직접 구독한 소비자만 이벤트를 받음)
+        self.event_bus = event_bus
+        if event_bus is None:
+            self.callback = callback or DefaultCallback()
+        else:
+            if callback is not None:
+                event_bus.subscribe_callback(callback)
+            self.callback = EventBusCallback(event_bus)
+        
+        # LLM/SSH 기록·재생 카세트 (선택)
+        self.cassette = cassette
+        
+        # 구조화된 실행 추적 (선택)
+        self.tracer = tracer
+        
+        with use_cassette(cassette):
+            # 핵심 컴포넌트 초기화 (공유 인스턴스가 주어지면 재사용)
+            if llm_client is not None:
+                self.llm_client = llm_client
+                self.endpoint, self.model = llm_client.endpoint, llm_client.model
+            else:
+                self.llm_client = LLMClient(endpoint=endpoint, model=model)
+            self.tools_manager = tools_manager if tools_manager is not None else ToolsManager()
+            
+            # 대용량 도구 출력 요약기 (선택)
+            if summarizer is None and summary_model:
+                summarizer = ToolOutputSummarizer(LLMClient(endpoint=endpoint, model=summary_model))
+            self.summarizer = summarizer
+            
+            # 2-tier 모델 라우팅 (선택) - 도구 선택은 빠른 모델, 최종 보고서는 기본 모델
+            if router is None and fast_model:
+                router = ModelRouter(
+                    fast_client=LLMClient(endpoint=fast_endpoint or endpoint, model=fast_model),
+                    strong_client=self.llm_client
+                )
+            self.router = router
+        
+        # 질의 기반 도구 선택 (선택) - 실행마다 관련 도구만 스키마/프롬프트에 포함
+        if tool_retriever is None and tool_top_k:
+            tool_retriever = ToolRetriever(self.tools_manager, top_k=tool_top_k)
+        self.tool_retriever = tool_retriever
+        self.selected_tools: Optional[List[str]] = None  # 이번 실행에서 선택된 도구 (None이면 전체)
+        self._default_prompt = system_prompt is None
+        
+        # 기본 시스템 프롬프트 프로필 (사용자 정의 프롬프트가 있으면 사용하지 않음)
+        prompt_profile = prompt_profile or prompt_profile_for_model(self.model)
+        if prompt_profile not in SYSTEM_PROMPT_PROFILES:
+            raise ValueError(f"지원하지 않는 프롬프트 프로필입니다: {prompt_profile}")
+        self.prompt_profile = prompt_profile
+        
+        # LLM 없이 처리할 단순 진단 요청 판별기 (선택)
+        self.intent_router = intent_router
+        
+        # 도구 출력 저장소 - 로그에는 digest 참조만 보관
+        self.blob_store = blob_store if blob_store is not None else BlobStore()
+        
+        # 실행 상태
+        self.current_iteration = 0
+        self.stop_reason: Optional[str] = None  # completed / max_iterations / timeout / cancelled
+        self._run_token: Optional[CancellationToken] = None
+        self._tool_memo: Dict[str, Dict] = {}  # (도구, 정규화된 인자) → 최초 도구 호출 로그
+        self.last_plan: Optional[Dict[str, Any]] = None  # plan 모드에서 마지막으로 수립한 계획
+        self.last_intent: Optional[Dict[str, Any]] = None  # 마지막 실행의 빠른 경로 판별 결과
+        self.conversation_history = []
+        self.execution_log = []
+        self.reasoning_history = []  # 추론 과정 저장
+        self.token_usage_history = []  # 실제 토큰 사용량 저장
+        
+        # 시스템 프롬프트 설정
+        self.system_prompt = system_prompt or self._get_default_system_prompt()
+        
+        # 세션 저널 - 기록된 대화가 있으면 최근 턴만 복원, 없으면 새 대화 시작
+        self.journal = journal
+        self.journal_restore_turns = (
+            DEFAULT_JOURNAL_RESTORE_TURNS if journal_restore_turns is None else journal_restore_turns
+        )
+        if not (journal is not None and self.restore_from_journal()):
+            # 초기 시스템 메시지 설정
+            self._initialize_conversation()
+    
+    def _get_default_system_prompt(self, tool_names: Optional[List[str]] = None) -> str:
+        """
+        기본 시스템 프롬프트 생성 - 참조 파일 기반으로 개선된 체계적 프롬프트
+        
+        같은 프롬프트 프로필, 도구 구성(스키마 지문), 도구 선택에 대해서는 한 번만 렌더링하여 재사용
+        
+        Args:
+            tool_names: 프롬프트에 나열할 도구 (기본값: 전체)
+        """
+        fingerprint = f"{self.prompt_profile}:{self.tools_manager.schema_fingerprint}"
+        if tool_names is not None:
+            fingerprint = f"{fingerprint}:{','.join(tool_names)}"
+        
+        with _SYSTEM_PROMPT_CACHE_LOCK:
+            cached = _SYSTEM_PROMPT_CACHE.get(fingerprint)
+        if cached is not None:
+            return cached
+        
+        available_tools = tool_names if tool_names is not None else self.tools_manager.get_available_tools()
+        tools_info = []
+        
+        for tool_name in available_tools:
+            tool_info = self.tools_manager.get_tool_info(tool_name)
+            tools_info.append(f"- {tool_name}: {tool_info.get('description', 'No description')}")
+        
+        tools_list = "\n".join(tools_info)
+        prompt = SYSTEM_PROMPT_PROFILES[self.prompt_profile].format(tools_list=tools_list)
+        
+        with _SYSTEM_PROMPT_CACHE_LOCK:
+            _SYSTEM_PROMPT_CACHE[fingerprint] = prompt
+            while len(_SYSTEM_PROMPT_CACHE) > _SYSTEM_PROMPT_CACHE_SIZE:
+                del _SYSTEM_PROMPT_CACHE[next(iter(_SYSTEM_PROMPT_CACHE))]
+        
+        return prompt
     
     def _initialize_conversation(self):
         """대화 초기화"""
-        self.conversation_history = [
-            {"role": "system", "content": self.system_prompt}
-        ]
+        self.conversation_history = []
         self.reasoning_history = []
         self.execution_log = []
         self.token_usage_history = []  # 초기화 시에도 토큰 히스토리 리셋
+        
+        self._journal(SessionJournal.RESET, {"model": self.model, "mode": self.mode})
+        self._record_message({"role": "system", "content": self.system_prompt})
+    
+    def _journal(self, event_type: str, data: Any):
+        """세션 저널에 이벤트 기록 (저널 미사용 시 무시)"""
+        if self.journal is not None:
+            self.journal.append(event_type, data)
+    
+    def _record_message(self, message: Dict[str, Any]):
+        """대화 히스토리에 메시지 추가"""
+        self.conversation_history.append(message)
+        self._journal(SessionJournal.MESSAGE, message)
+    
+    def _record_execution(self, entry: Dict[str, Any]):
+        """실행 로그에 항목 추가"""
+        self.execution_log.append(entry)
+        self._journal(SessionJournal.EXECUTION, entry)
+    
+    def _record_reasoning(self, entry: Dict[str, Any]):
+        """추론 히스토리에 항목 추가"""
+        self.reasoning_history.append(entry)
+        self._journal(SessionJournal.REASONING, entry)
     
-    def run(self, user_input: str) -> Dict[str, Any]:
+    def _record_token_usage(self, entry: Dict[str, Any]):
+        """토큰 사용량 기록 추가"""
+        self.token_usage_history.append(entry)
+        self._journal(SessionJournal.TOKEN_USAGE, entry)
+    
+    def restore_from_journal(self, journal: Optional[SessionJournal] = None, max_turns: Optional[int] = None) -> bool:
+        """
+        세션 저널에서 마지막 대화 상태 복원 (LLM/SSH 호출 없이 기록만 재생)
+        
+        LLM 컨텍스트가 세션 길이에 비례해 커지지 않도록 최근 max_turns개 턴만 복원하고,
+        시스템 메시지는 기록 당시가 아닌 현재 설정(도구 구성, 프롬프트 프로필)으로 다시 만듦
+        
+        Args:
+            journal: 복원할 저널 (기본값: 에이전트에 설정된 저널, 지정 시 이후 기록도 이 저널에 남김)
+            max_turns: 복원할 최근 대화 턴 수 (기본값: journal_restore_turns)
+            
+        Returns:
+            복원 여부 (기록된 대화가 없거나 max_turns가 0이면 False)
+        """
+        if journal is not None:
+            self.journal = journal
+        if self.journal is None:
+            return False
+        
+        max_turns = self.journal_restore_turns if max_turns is None else max_turns
+        if max_turns <= 0:
+            return False
+        
+        state = self.journal.replay()
+        messages = [message for message in state["conversation"] if message.get("role") != "system"]
+        if not messages:
+            return False
+        
+        # 사용자 메시지 경계에서 자르므로 도구 호출과 도구 결과 쌍이 나뉘지 않음
+        turn_starts = [index for index, message in enumerate(messages) if message.get("role") == "user"]
+        if len(turn_starts) > max_turns:
+            messages = messages[turn_starts[-max_turns]:]
+        
+        self.conversation_history = [{"role": "system", "content": self.system_prompt}] + messages
+        self.execution_log = state["execution_log"]
+        self.reasoning_history = state["reasoning_history"]
+        self.token_usage_history = state["token_usage"]
+        self.current_iteration = 0
+        
+        # 실행 로그가 참조하는 도구 출력을 대화 히스토리의 도구 메시지로부터 저장소에 다시 채움
+        tool_messages = {
+            message.get("tool_call_id"): message
+            for message in self.conversation_history
+            if message.get("role") == "tool"
+        }
+        for entry in self.execution_log:
+            message = tool_messages.get(entry.get("tool_call_id"))
+            if entry.get("result_ref") and message is not None:
+                ref = self.blob_store.put(message["content"])
+                message["content"] = self.blob_store.get(ref)
+        
+        return True
+    
+    def run(self, user_input: str, timeout: Optional[float] = None) -> Dict[str, Any]:
         """
         사용자 입력에 대해 ReAct 패턴으로 처리
         
         Args:
             user_input: 사용자 요청
+            timeout: 이번 실행의 제한 시간 (초, 기본값: run_timeout)
             
         Returns:
             실행 결과와 메타데이터
         """
+        # 추적기가 없으면 호출 측에서 이미 시작한 추적(있는 경우)의 하위 스팬으로 기록
+        open_span = self.tracer.span if self.tracer is not None else trace_span
+        ACTIVE_RUNS.inc()
+        try:
+            with open_span("agent.run", mode=self.mode, model=self.model, input_length=len(user_input)):
+                if self.cassette is None:
+                    return self._run(user_input, timeout)
+                
+                self.cassette.record_run(user_input, mode=self.mode, model=self.model, prompt_profile=self.prompt_profile)
+                
+                # 재생 시 서버 설정이 없으면 기록 당시 접속 대상으로 도구 실행 (실제 연결은 하지 않음)
+                connection_info = ServerConfig.get_connection_info()
+                if connection_info is None and self.cassette.replaying:
+                    connection_info = dict(self.cassette.connection or {}, password=None)
+                
+                with use_cassette(self.cassette), ServerConfig.bind_connection_info(connection_info or {}):
+                    return self._run(user_input, timeout)
+        finally:
+            # 실행이 끝나기 전에 발행된 이벤트(최종 결과 등)가 모두 표시되도록 대기
+            if self.event_bus is not None:
+                self.event_bus.flush(timeout=EVENT_FLUSH_TIMEOUT)
+            ACTIVE_RUNS.dec()
+    
+    def _run(self, user_input: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """run 본체 - 카세트 설정 이후 실행"""
         start_time = time.time()
+        self._run_token = CancellationToken(timeout=timeout if timeout is not None else self.run_timeout)
+        self.stop_reason = None
         self.current_iteration = 0
+        self._tool_memo = {}
+        self.last_plan = None
+        self.last_intent = None
         self.execution_log = []
         self.reasoning_history = []
+        if self.router:
+            self.router.reset()
+        self._select_tools(user_input)
+        
+        self._journal(SessionJournal.RUN_START, {"user_input": user_input, "mode": self.mode})
         
         # 사용자 메시지 추가
-        self.conversation_history.append({
+        self._record_message({
             "role": "user",
             "content": user_input
         })
         
         try:
-            # ReAct 루프 실행
-            final_result = self._react_loop()
+            # 단순 진단 요청은 LLM 없이 바로 처리 (판별되지 않으면 None)
+            final_result = self._run_fast_path(user_input) if self.intent_router else None
+            
+            if final_result is None:
+                # 실행 모드에 따라 계획 수립 후 실행 또는 ReAct 루프 실행
+                if self.mode == "plan":
+                    final_result = self._plan_and_execute()
+                else:
+                    final_result = self._react_loop()
             
             execution_time = time.time() - start_time
             
@@ -290,7 +696,7 @@ ReAct(Reasoning-Acting-Observing) 패턴을 사용하여 체계적으로 문제
             # 최종 결과 콜백
             self.callback.on_final_result(final_result, self.current_iteration)
             
-            return {
+            return self._finish_run(user_input, {
                 "success": True,
                 "result": final_result,
                 "iterations": self.current_iteration,
@@ -299,8 +705,14 @@ ReAct(Reasoning-Acting-Observing) 패턴을 사용하여 체계적으로 문제
                 "conversation_length": len(self.conversation_history),
                 "token_usage": total_token_usage,
                 "reasoning_history": self.reasoning_history.copy(),
-                "execution_log": self.execution_log.copy()
-            }
+                "execution_log": self.execution_log.copy(),
+                "routing": self.get_routing_metrics(),
+                "stop_reason": self.stop_reason,
+                "partial": self.stop_reason != "completed",
+                "mode": self.mode,
+                "plan": self.last_plan,
+                "intent": self.last_intent
+            })
             
         except Exception as e:
             execution_time = time.time() - start_time
@@ -308,22 +720,46 @@ ReAct(Reasoning-Acting-Observing) 패턴을 사용하여 체계적으로 문제
             
             self.callback.on_error(self.current_iteration, error_msg)
             
-            return {
+            return self._finish_run(user_input, {
                 "success": False,
                 "error": error_msg,
+                "stop_reason": "error",
                 "iterations": self.current_iteration,
                 "execution_time": round(execution_time, 2),
                 "conversation_length": len(self.conversation_history),
                 "tools_used": [log["tool"] for log in self.execution_log if log.get("type") == "tool_call"],
                 "reasoning_history": self.reasoning_history.copy(),
                 "execution_log": self.execution_log.copy()
-            }
+            })
+    
+    def _finish_run(self, user_input: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        실행 결과를 세션 저널에 기록하고 디스크에 반영
+        
+        추론/실행 로그는 개별 이벤트로 이미 기록되어 있으므로 제외
+        """
+        get_current_span().set_attributes(
+            success=result.get("success"),
+            iterations=result.get("iterations"),
+            stop_reason=result.get("stop_reason")
+        )
+        RUNS.labels(self.mode, result.get("stop_reason") or "unknown").inc()
+        RUN_LATENCY.labels(self.mode).observe(result.get("execution_time", 0.0))
+        if self.journal is not None:
+            summary = {key: value for key, value in result.items() if key not in ("reasoning_history", "execution_log")}
+            self._journal(SessionJournal.RUN_END, {"user_input": user_input, "timestamp": time.time(), "result": summary})
+            self.journal.sync()
+        return result
     
     def _react_loop(self) -> str:
         """
         ReAct 패턴의 핵심 루프 - 개선된 추론 과정 추적
         """
         while self.current_iteration < self.max_iterations:
+            # 마감 시각 경과 또는 취소 요청 시 중단하고 부분 결론 반환
+            if self._run_token and self._run_token.cancelled:
+                break
+            
             self.current_iteration += 1
             
             # 반복 시작 콜백
@@ -338,84 +774,113 @@ ReAct(Reasoning-Acting-Observing) 패턴을 사용하여 체계적으로 문제
                 "observations": []
             }
             
-            try:
-                # LLM 응답 생성
-                response = self._get_llm_response()
-                
-                if not response.get("success", False):
-                    raise Exception(f"LLM 응답 실패: {response.get('error', 'Unknown error')}")
-                
-                message = response.get("message")
-                finish_reason = response.get("finish_reason")
-                
-                # 추론 과정 추출 - 실제 reasoning 속성 우선 사용
-                reasoning = response.get("reasoning")  # LLM에서 제공하는 실제 reasoning
-                if not reasoning:
-                    # 폴백: 응답 내용에서 추론 과정 추출
-                    reasoning = self._extract_reasoning(message.content)
-                
-                if reasoning:
-                    iteration_log["reasoning"] = reasoning
-                    self.reasoning_history.append({
-                        "iteration": self.current_iteration,
-                        "reasoning": reasoning,
-                        "timestamp": time.time()
-                    })
+            with trace_span("agent.iteration", iteration=self.current_iteration) as iteration_span:
+                try:
+                    # LLM 응답 생성
+                    response = self._get_llm_response()
                     
-                    # 추론 콜백
-                    self.callback.on_reasoning(self.current_iteration, reasoning)
-                
-                # 대화 히스토리에 응답 추가
-                self.conversation_history.append(message.model_dump())
-                
-                # 도구 호출이 없으면 최종 응답으로 간주
-                if finish_reason != "tool_calls" or not hasattr(message, 'tool_calls'):
-                    final_response = message.content or "작업이 완료되었습니다."
+                    if not response.get("success", False):
+                        raise Exception(f"LLM 응답 실패: {response.get('error', 'Unknown error')}")
+                    
+                    # 빠른 모델이 결론에 도달하면 최종 보고서는 강한 모델로 다시 작성
+                    if (self.router and response.get("tier") == ModelRouter.FAST
+                            and response.get("finish_reason") != "tool_calls"):
+                        response = self._get_llm_response(tier=ModelRouter.STRONG)
+                        if not response.get("success", False):
+                            raise Exception(f"LLM 응답 실패: {response.get('error', 'Unknown error')}")
+                    
+                    message = response.get("message")
+                    finish_reason = response.get("finish_reason")
+                    iteration_span.set_attribute("finish_reason", finish_reason)
+                    
+                    # 추론 과정 추출 - 실제 reasoning 속성 우선 사용
+                    reasoning = response.get("reasoning")  # LLM에서 제공하는 실제 reasoning
+                    if not reasoning:
+                        # 폴백: 응답 내용에서 추론 과정 추출
+                        reasoning = self._extract_reasoning(message.content)
+                    
+                    if reasoning:
+                        iteration_log["reasoning"] = reasoning
+                        self._record_reasoning({
+                            "iteration": self.current_iteration,
+                            "reasoning": reasoning,
+                            "timestamp": time.time()
+                        })
+                    
+                        # 추론 콜백
+                        self.callback.on_reasoning(self.current_iteration, reasoning)
+                    
+                    # 대화 히스토리에 응답 추가
+                    self._record_message(message.model_dump())
+                    
+                    # 도구 호출이 없으면 최종 응답으로 간주
+                    if finish_reason != "tool_calls" or not hasattr(message, 'tool_calls'):
+                        final_response = message.content or "작업이 완료되었습니다."
+                    
+                        # 최종 관찰 콜백
+                        self.callback.on_observation(self.current_iteration, "최종 결론 도달")
+                    
+                        # 반복 종료 콜백
+                        self.callback.on_iteration_end(self.current_iteration)
+                    
+                        self._record_execution(iteration_log)
+                        self.stop_reason = "completed"
+                        return final_response
+                    
+                    # 도구 호출 처리
+                    tool_results = self._process_tool_calls(message.tool_calls, iteration_log)
+                    
+                    # 빠른 모델이 같은 도구 호출을 반복하면 강한 모델로 승격
+                    if self.router:
+                        self.router.observe_tool_calls([
+                            (result["tool"], self._canonical_arguments(result["arguments"]))
+                            for result in tool_results
+                        ])
                     
-                    # 최종 관찰 콜백
-                    self.callback.on_observation(self.current_iteration, "최종 결론 도달")
+                    # 도구 결과에 대한 관찰
+                    if tool_results:
+                        observation = self._generate_observation(tool_results)
+                        iteration_log["observations"].append(observation)
+                    
+                        # 관찰 콜백
+                        self.callback.on_observation(self.current_iteration, observation)
                     
                     # 반복 종료 콜백
                     self.callback.on_iteration_end(self.current_iteration)
                     
-                    self.execution_log.append(iteration_log)
-                    return final_response
-                
-                # 도구 호출 처리
-                tool_results = self._process_tool_calls(message.tool_calls, iteration_log)
-                
-                # 도구 결과에 대한 관찰
-                if tool_results:
-                    observation = self._generate_observation(tool_results)
-                    iteration_log["observations"].append(observation)
+                    # 실행 로그에 추가
+                    self._record_execution(iteration_log)
                     
-                    # 관찰 콜백
-                    self.callback.on_observation(self.current_iteration, observation)
-                
-                # 반복 종료 콜백
-                self.callback.on_iteration_end(self.current_iteration)
-                
-                # 실행 로그에 추가
-                self.execution_log.append(iteration_log)
-                
-            except Exception as e:
-                error_msg = f"반복 {self.current_iteration}에서 오류 발생: {str(e)}"
-                
-                # 오류 콜백
-                self.callback.on_error(self.current_iteration, str(e))
-                
-                # 오류 로그 추가
-                iteration_log["error"] = str(e)
-                self.execution_log.append(iteration_log)
-                
-                # 심각한 오류가 아니면 계속 진행
-                if self.current_iteration < self.max_iterations - 1:
-                    continue
-                else:
-                    raise Exception(error_msg)
+                except CancellationError as e:
+                    # 취소/시간 초과는 재시도하지 않고 부분 결론으로 전환
+                    iteration_span.add_event(e.reason)
+                    iteration_log["error"] = str(e)
+                    self._record_execution(iteration_log)
+                    break
+                    
+                except Exception as e:
+                    error_msg = f"반복 {self.current_iteration}에서 오류 발생: {str(e)}"
+                    
+                    # 오류 콜백
+                    self.callback.on_error(self.current_iteration, str(e))
+                    
+                    # 오류 로그 추가
+                    iteration_span.record_error(e)
+                    iteration_log["error"] = str(e)
+                    self._record_execution(iteration_log)
+                    
+                    # 심각한 오류가 아니면 계속 진행
+                    if self.current_iteration < self.max_iterations - 1:
+                        continue
+                    else:
+                        raise Exception(error_msg)
         
-        # 최대 반복 횟수 도달 - 부분적인 결론 생성
-        partial_conclusion = self._generate_partial_conclusion()
+        # 최대 반복 횟수 도달, 시간 초과 또는 취소 - 부분적인 결론 생성
+        if self._run_token and self._run_token.cancelled:
+            self.stop_reason = self._run_token.reason or "cancelled"
+        else:
+            self.stop_reason = "max_iterations"
+        partial_conclusion = self._generate_partial_conclusion(self.stop_reason)
         
         # 경고 콜백 (부분 결론의 첫 번째 줄만 사용)
         warning_msg = partial_conclusion.split('\n')[0] if partial_conclusion else f"최대 반복 횟수 ({self.max_iterations}) 도달"
@@ -423,6 +888,315 @@ ReAct(Reasoning-Acting-Observing) 패턴을 사용하여 체계적으로 문제
         
         return partial_conclusion
     
+    def _plan_and_execute(self) -> str:
+        """
+        Plan 모드 - 도구 호출 계획을 한 번에 수립하고 독립 단계를 동시에 실행
+        
+        계획 실행 결과를 받은 모델은 최종 보고서를 작성하거나 추가 도구 호출(계획 수정)을 요청하며,
+        이후 과정은 ReAct 루프가 그대로 처리
+        계획 수립에 실패하면 일반 ReAct 루프로 폴백
+        
+        Returns:
+            최종 결과
+        """
+        if self._run_token and self._run_token.cancelled:
+            return self._react_loop()
+        
+        self.current_iteration += 1
+        self.callback.on_iteration_start(self.current_iteration, self.max_iterations)
+        
+        iteration_log = {
+            "iteration": self.current_iteration,
+            "timestamp": time.time(),
+            "reasoning": None,
+            "tool_calls": [],
+            "observations": [],
+            "plan": None
+        }
+        
+        try:
+            with trace_span("agent.plan", iteration=self.current_iteration) as plan_span:
+                response = self._get_llm_response(
+                    extra_messages=[{
+                        "role": "user",
+                        "content": PLAN_PROMPT.format(max_steps=self.max_plan_steps)
+                    }],
+                    include_tools=False
+                )
+                if not response.get("success", False):
+                    raise Exception(f"LLM 응답 실패: {response.get('error', 'Unknown error')}")
+                
+                plan = self._parse_plan(response.get("response"))
+                plan_span.set_attribute("steps", len(plan["steps"]))
+            
+        except CancellationError as e:
+            iteration_log["error"] = str(e)
+            self._record_execution(iteration_log)
+            return self._react_loop()
+            
+        except Exception as e:
+            # 계획 수립 실패 - 같은 반복 번호에서 ReAct 루프로 폴백
+            self.callback.on_observation(self.current_iteration, f"계획 수립 실패, ReAct 모드로 전환: {str(e)}")
+            self.current_iteration -= 1
+            return self._react_loop()
+        
+        if not plan["steps"]:
+            # 도구가 필요 없는 요청은 ReAct 루프가 바로 답변
+            self.callback.on_observation(self.current_iteration, "도구 호출이 필요 없는 요청 - 바로 답변 작성")
+            self.current_iteration -= 1
+            return self._react_loop()
+        
+        self.last_plan = plan
+        iteration_log["plan"] = plan
+        
+        plan_summary = "\n".join(
+            f"{step['id']}. {step['tool']}"
+            + (f" (선행: {', '.join(step['depends_on'])})" if step["depends_on"] else "")
+            + (f" - {step['purpose']}" if step.get("purpose") else "")
+            for step in plan["steps"]
+        )
+        reasoning = f"📋 실행 계획: {plan.get('goal') or '요청 분석'}\n{plan_summary}"
+        iteration_log["reasoning"] = reasoning
+        self._record_reasoning({
+            "iteration": self.current_iteration,
+            "reasoning": reasoning,
+            "timestamp": time.time()
+        })
+        self.callback.on_reasoning(self.current_iteration, reasoning)
+        
+        # 계획을 도구 호출 메시지로 기록하여 이후 ReAct 루프와 같은 대화 형식 유지
+        tool_calls = {
+            step["id"]: SimpleNamespace(
+                id=f"plan_{step['id']}",
+                type="function",
+                function=SimpleNamespace(
+                    name=step["tool"],
+                    arguments=json.dumps(step["arguments"], ensure_ascii=False)
+                )
+            )
+            for step in plan["steps"]
+        }
+        self._record_message({
+            "role": "assistant",
+            "content": reasoning,
+            "tool_calls": [
+                {
+                    "id": tool_call.id,
+                    "type": "function",
+                    "function": {"name": tool_call.function.name, "arguments": tool_call.function.arguments}
+                }
+                for tool_call in tool_calls.values()
+            ]
+        })
+        
+        # 의존 관계에 따라 단계를 묶어 실행 - 같은 묶음의 단계는 동시에 실행
+        tool_results = []
+        completed = {}
+        pending = list(plan["steps"])
+        with trace_span("agent.plan_execute", iteration=self.current_iteration, steps=len(pending)):
+            while pending:
+                ready = [step for step in pending if all(dep in completed for dep in step["depends_on"])]
+                pending = [step for step in pending if step not in ready]
+                
+                runnable = []
+                for step in ready:
+                    failed_deps = [dep for dep in step["depends_on"] if not completed[dep]]
+                    if failed_deps or (self._run_token and self._run_token.cancelled):
+                        # 선행 단계 실패 또는 취소 - 실행하지 않고 응답 메시지만 기록
+                        reason = f"선행 단계 실패로 건너뜀: {', '.join(failed_deps)}" if failed_deps else "실행이 중단되어 건너뜀"
+                        self._record_message({
+                            "role": "tool",
+                            "content": reason,
+                            "tool_call_id": tool_calls[step["id"]].id
+                        })
+                        completed[step["id"]] = False
+                    else:
+                        runnable.append(step)
+                
+                results = self._process_tool_calls([tool_calls[step["id"]] for step in runnable], iteration_log)
+                for step, result in zip(runnable, results):
+                    completed[step["id"]] = bool(result.get("success"))
+                tool_results.extend(results)
+        
+        if tool_results:
+            observation = self._generate_observation(tool_results)
+            iteration_log["observations"].append(observation)
+            self.callback.on_observation(self.current_iteration, observation)
+        
+        self.callback.on_iteration_end(self.current_iteration)
+        self._record_execution(iteration_log)
+        
+        # 결과 검토 후 최종 보고서 작성 또는 계획 수정은 ReAct 루프에서 처리
+        return self._react_loop()
+    
+    def _run_fast_path(self, user_input: str) -> Optional[str]:
+        """
+        빠른 경로 - 단순 진단 요청을 LLM 도구 선택 없이 처리
+        
+        판별된 의도의 도구를 바로 실행하고 결정적 템플릿(또는 짧은 LLM 요약 1회)으로 답함
+        도구 호출은 일반 실행과 같은 대화 형식으로 기록되므로, 도구 실행이 실패하면
+        그 결과를 가진 채로 ReAct 루프가 이어서 처리
+        
+        Args:
+            user_input: 사용자 요청
+            
+        Returns:
+            Optional[str]: 최종 결과 (판별되지 않으면 None - 일반 실행)
+        """
+        with trace_span("agent.intent_match") as match_span:
+            match = self.intent_router.match(user_input)
+            match_span.set_attribute("intent", match.intent.name if match else None)
+        if match is None or self.tools_manager.get_tool_spec(match.intent.tool) is None:
+            return None
+        
+        intent = match.intent
+        self.last_intent = {"name": intent.name, "method": match.method, "score": round(match.score, 3), "fallback": False}
+        self.current_iteration += 1
+        self.callback.on_iteration_start(self.current_iteration, self.max_iterations)
+        
+        iteration_log = {
+            "iteration": self.current_iteration,
+            "timestamp": time.time(),
+            "reasoning": None,
+            "tool_calls": [],
+            "observations": [],
+            "intent": intent.name
+        }
+        
+        with trace_span("agent.fast_path", intent=intent.name, method=match.method) as span:
+            reasoning = f"⚡ 빠른 경로: '{intent.title}' 요청으로 판별 ({match.method}) - {intent.tool} 바로 실행"
+            iteration_log["reasoning"] = reasoning
+            self._record_reasoning({
+                "iteration": self.current_iteration,
+                "reasoning": reasoning,
+                "timestamp": time.time()
+            })
+            self.callback.on_reasoning(self.current_iteration, reasoning)
+            
+            # LLM이 도구를 호출한 것과 같은 형식으로 기록 (폴백 시 ReAct 루프가 그대로 이어받음)
+            tool_call = SimpleNamespace(
+                id=f"intent_{intent.name}",
+                type="function",
+                function=SimpleNamespace(name=intent.tool, arguments=json.dumps(intent.arguments, ensure_ascii=False))
+            )
+            self._record_message({
+                "role": "assistant",
+                "content": reasoning,
+                "tool_calls": [{
+                    "id": tool_call.id,
+                    "type": "function",
+                    "function": {"name": tool_call.function.name, "arguments": tool_call.function.arguments}
+                }]
+            })
+            result = self._process_tool_calls([tool_call], iteration_log)[0]
+            output = self.blob_store.get(result["result_ref"]) if result.get("success") else None
+            
+            if is_failed_output(output) or (self._run_token and self._run_token.cancelled):
+                # 도구 실행 실패(오류 메시지, stderr, 빈 출력) - 같은 대화로 ReAct 루프에서 처리
+                span.add_event("fallback")
+                self.last_intent["fallback"] = True
+                observation = "빠른 경로 도구 실행 실패 - 일반 실행으로 전환"
+                iteration_log["observations"].append(observation)
+                self.callback.on_observation(self.current_iteration, observation)
+                self.callback.on_iteration_end(self.current_iteration)
+                self._record_execution(iteration_log)
+                return self._react_loop()
+            
+            final_result = None
+            if self.intent_router.summarize_with_llm:
+                final_result = self._summarize_fast_path(user_input, match, output)
+            if final_result is None:
+                final_result = intent.render(output)
+            span.set_attribute("llm_summary", self.intent_router.summarize_with_llm)
+        
+        self._record_message({"role": "assistant", "content": final_result})
+        self.callback.on_observation(self.current_iteration, "최종 결론 도달")
+        self.callback.on_iteration_end(self.current_iteration)
+        self._record_execution(iteration_log)
+        self.stop_reason = "completed"
+        return final_result
+    
+    def _summarize_fast_path(self, user_input: str, match: IntentMatch, output: str) -> Optional[str]:
+        """
+        빠른 경로 도구 출력의 짧은 LLM 요약 (대화 히스토리/도구 스키마 없이 1회 호출)
+        
+        라우팅 사용 시 빠른 모델로 호출하며, 실패하면 None (템플릿 응답 사용)
+        """
+        messages = [
+            {"role": "system", "content": FAST_PATH_SUMMARY_PROMPT},
+            {"role": "user", "content": f"요청: {user_input}\n명령: {match.intent.arguments.get('command', match.intent.tool)}\n\n출력:\n{output}"}
+        ]
+        try:
+            response = self._get_llm_response(
+                tier=ModelRouter.FAST if self.router else None,
+                messages=messages,
+                include_tools=False
+            )
+        except CancellationError:
+            return None
+        if not response.get("success") or not response.get("response"):
+            return None
+        return f"## {match.intent.title}\n\n{response['response'].strip()}"
+    
+    def _parse_plan(self, content: Optional[str]) -> Dict[str, Any]:
+        """
+        LLM이 출력한 계획 JSON 파싱 및 검증
+        
+        Args:
+            content: LLM 응답 내용
+            
+        Returns:
+            정규화된 계획 (goal, steps)
+            
+        Raises:
+            ValueError: JSON 형식이 아니거나 알 수 없는 도구/순환 의존이 있는 경우
+        """
+        if not content:
+            raise ValueError("계획 응답이 비어 있습니다")
+        
+        # 코드 블록이나 설명 문장이 섞여 있어도 첫 JSON 객체만 사용
+        start, end = content.find("{"), content.rfind("}")
+        if start < 0 or end < start:
+            raise ValueError("계획 JSON을 찾을 수 없습니다")
+        data = json.loads(content[start:end + 1])
+        
+        available_tools = set(self.tools_manager.get_available_tools())
+        steps = []
+        for index, raw_step in enumerate(data.get("steps") or [], start=1):
+            tool = raw_step.get("tool")
+            if tool not in available_tools:
+                raise ValueError(f"알 수 없는 도구가 계획에 포함되었습니다: {tool}")
+            arguments = raw_step.get("arguments") or {}
+            if not isinstance(arguments, dict):
+                raise ValueError(f"도구 인자가 객체 형식이 아닙니다: {tool}")
+            steps.append({
+                "id": str(raw_step.get("id") or f"s{index}"),
+                "tool": tool,
+                "arguments": arguments,
+                "depends_on": [str(dep) for dep in raw_step.get("depends_on") or []],
+                "purpose": raw_step.get("purpose", "")
+            })
+        
+        steps = steps[:self.max_plan_steps]
+        step_ids = [step["id"] for step in steps]
+        if len(set(step_ids)) != len(step_ids):
+            raise ValueError("계획 단계 id가 중복되었습니다")
+        
+        # 존재하지 않는 선행 단계는 무시하고, 순환 의존은 거부
+        for step in steps:
+            step["depends_on"] = [dep for dep in step["depends_on"] if dep in step_ids and dep != step["id"]]
+        
+        resolved = set()
+        remaining = list(steps)
+        while remaining:
+            ready = [step for step in remaining if all(dep in resolved for dep in step["depends_on"])]
+            if not ready:
+                raise ValueError("계획에 순환 의존이 있습니다")
+            resolved.update(step["id"] for step in ready)
+            remaining = [step for step in remaining if step not in ready]
+        
+        return {"goal": data.get("goal", ""), "steps": steps}
+    
     def _extract_reasoning(self, content: Optional[str]) -> Optional[str]:
         """
         LLM 응답에서 추론 과정 추출 (폴백용)
@@ -461,27 +1235,82 @@ ReAct(Reasoning-Acting-Observing) 패턴을 사용하여 체계적으로 문제
         
         return None
     
-    def _get_llm_response(self) -> Dict[str, Any]:
-        """LLM으로부터 응답 획득"""
+    def _get_llm_response(
+        self,
+        tier: Optional[str] = None,
+        extra_messages: Optional[List[Dict[str, Any]]] = None,
+        include_tools: bool = True,
+        messages: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """
+        LLM으로부터 응답 획득
+        
+        Args:
+            tier: 라우팅 사용 시 호출할 모델 계층 (기본값: 라우터 정책에 따름)
+            extra_messages: 이번 호출에만 덧붙일 메시지 (대화 히스토리에는 저장하지 않음)
+            include_tools: 도구 스키마 전달 여부
+            messages: 대화 히스토리 대신 보낼 메시지 (빠른 경로 요약 등 독립 호출)
+        """
         # 도구 스키마 가져오기
-        tools_schemas = self.tools_manager.get_tools_schemas()
+        tools_schemas = self._tools_for_call() if include_tools else None
+        if messages is None:
+            messages = self.conversation_history + extra_messages if extra_messages else self.conversation_history
         
-        # LLM 호출
-        response = self.llm_client.chat_completion(
-            messages=self.conversation_history,
-            tools=tools_schemas if tools_schemas else None,
-            temperature=0.7
-        )
+        # 라우팅 정책에 따라 모델 선택
+        if self.router:
+            tier = tier or self.router.select_tier()
+            client = self.router.get_client(tier)
+        else:
+            client = self.llm_client
+        
+        # LLM 호출 - 호출별 제한 시간은 실행 마감 시각을 넘지 않도록 조정하고,
+        # 취소 시 HTTP 응답을 기다리지 않고 즉시 반환
+        token = self._run_token
+        llm_timeout = token.timeout_for(self.llm_timeout) if token else self.llm_timeout
+        request_options = {"timeout": llm_timeout} if llm_timeout else {}
+        
+        CONTEXT_MESSAGES.observe(len(messages))
+        
+        start_time = time.time()
+        with use_token(token):
+            # 호출 스레드가 토큰을 참조하여 동시 요청 제한 대기 중 취소되면 호출하지 않음
+            response = run_cancellable(
+                token,
+                client.chat_completion,
+                messages=messages,
+                tools=tools_schemas if tools_schemas else None,
+                temperature=0.7,
+                **request_options
+            )
+        
+        if self.router:
+            self.router.record_call(tier, time.time() - start_time, response)
+            response["tier"] = tier
+            
+            # 빠른 모델 호출 실패 시 강한 모델로 승격하여 재시도
+            if (not response.get("success") and tier == ModelRouter.FAST
+                    and self.router.escalate_on_failure):
+                self.router.escalate(f"빠른 모델 호출 실패: {response.get('error', 'Unknown error')}")
+                return self._get_llm_response(
+                    tier=ModelRouter.STRONG,
+                    include_tools=include_tools,
+                    messages=messages
+                )
         
         # 실제 토큰 사용량 저장 (있는 경우)
         if response.get("success") and response.get("usage"):
+            if response["usage"].get("prompt_tokens"):
+                CONTEXT_TOKENS.observe(response["usage"]["prompt_tokens"])
             usage_info = {
                 "iteration": self.current_iteration,
                 "timestamp": time.time(),
                 "usage": response["usage"],
-                "type": "llm_response"
+                "type": "llm_response",
+                "model": client.model
             }
-            self.token_usage_history.append(usage_info)
+            if tier:
+                usage_info["tier"] = tier
+            self._record_token_usage(usage_info)
         
         return response
     
@@ -489,6 +1318,11 @@ ReAct(Reasoning-Acting-Observing) 패턴을 사용하여 체계적으로 문제
         """
         도구 호출들을 처리하고 결과 반환
         
+        병렬 실행이 안전한 도구들은 스레드 풀에서 동시에 실행하고,
+        그렇지 않은 도구는 단독으로 순차 실행
+        같은 배치에 동일 호출이 있으면 앞선 배치를 마친 뒤(최초 호출 결과를 안 뒤) 중복 여부를 판단
+        대화 히스토리와 콜백은 항상 호출 스레드에서 원래 순서대로 처리
+        
         Args:
             tool_calls: 도구 호출 목록
             iteration_log: 현재 반복의 로그
@@ -496,15 +1330,111 @@ ReAct(Reasoning-Acting-Observing) 패턴을 사용하여 체계적으로 문제
         Returns:
             도구 실행 결과 목록
         """
+        calls = [
+            self._prepare_tool_call(tool_call)
+            for tool_call in tool_calls
+            if tool_call.type == "function"
+        ]
+        
+        if self.max_tool_workers <= 1 or len(calls) <= 1:
+            return [
+                self._finalize_tool_call(call, self._invoke_tool(self._resolve_memo(call)), iteration_log)
+                for call in calls
+            ]
+        
         results = []
+        batch = []
+        for call in calls:
+            if self._is_parallel_safe(call["tool"]):
+                # 같은 배치의 동일 호출은 최초 호출이 실패할 수 있으므로 앞선 배치를 마친 뒤 판단
+                if call.get("memo_key") and any(queued.get("memo_key") == call["memo_key"] for queued in batch):
+                    results.extend(self._run_tool_batch(batch, iteration_log))
+                    batch = []
+                batch.append(call)
+                continue
+            
+            # 병렬 실행이 안전하지 않은 도구는 앞선 배치를 마친 뒤 단독 실행
+            results.extend(self._run_tool_batch(batch, iteration_log))
+            batch = []
+            results.append(self._finalize_tool_call(call, self._invoke_tool(self._resolve_memo(call)), iteration_log))
+        
+        results.extend(self._run_tool_batch(batch, iteration_log))
+        return results
+    
+    def _run_tool_batch(self, calls: List[Dict], iteration_log: Dict) -> List[Dict]:
+        """
+        병렬 실행이 안전한 도구 호출 묶음을 스레드 풀에서 동시 실행
+        
+        Args:
+            calls: 준비된 도구 호출 목록
+            iteration_log: 현재 반복의 로그
+            
+        Returns:
+            원래 순서대로 정리된 도구 실행 결과 목록
+        """
+        for call in calls:
+            self._resolve_memo(call)
+        
+        if len(calls) <= 1:
+            return [
+                self._finalize_tool_call(call, self._invoke_tool(call), iteration_log)
+                for call in calls
+            ]
         
-        for tool_call in tool_calls:
-            if tool_call.type == "function":
-                result = self._execute_single_tool(tool_call, iteration_log)
-                results.append(result)
+        # 워커 스레드에서는 Streamlit 세션 상태에 접근할 수 없으므로 접속 정보를 바인딩하여 전달
+        connection_info = ServerConfig.get_connection_info()
+        
+        results = []
+        with ServerConfig.bind_connection_info(connection_info or {}):
+            workers = min(self.max_tool_workers, len(calls))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tool") as executor:
+                futures = [
+                    executor.submit(contextvars.copy_context().run, self._invoke_tool, call)
+                    for call in calls
+                ]
+                
+                # 완료 순서와 관계없이 원래 순서대로 결과 반영
+                for call, future in zip(calls, futures):
+                    results.append(self._finalize_tool_call(call, future.result(), iteration_log))
         
         return results
     
+    def _select_tools(self, user_input: str):
+        """
+        이번 실행에서 LLM에 보낼 도구 선택 (도구 선택기 사용 시)
+        
+        기본 시스템 프롬프트를 쓰는 경우 프롬프트의 도구 목록도 선택된 도구로 바꿈
+        """
+        if self.tool_retriever is None:
+            self.selected_tools = None
+            return
+        
+        with trace_span("agent.select_tools") as span:
+            self.selected_tools = self.tool_retriever.select(user_input)
+            span.set_attribute("tools", len(self.selected_tools))
+        
+        if self._default_prompt:
+            prompt = self._get_default_system_prompt(self.selected_tools)
+            if prompt != self.system_prompt:
+                self.system_prompt = prompt
+                if self.conversation_history and self.conversation_history[0].get("role") == "system":
+                    self.conversation_history[0] = {"role": "system", "content": prompt}
+    
+    def _tools_for_call(self) -> Tuple[Dict[str, Any], ...]:
+        """LLM 호출에 보낼 도구 스키마 - 선택된 도구 + 이번 실행에서 이미 사용한 도구"""
+        schemas = self.tools_manager.get_tools_schemas()
+        if self.selected_tools is None:
+            return schemas
+        
+        allowed = set(self.selected_tools)
+        allowed.update(log["tool"] for log in self.execution_log if log.get("type") == "tool_call")
+        return tuple(schema for schema in schemas if schema["function"]["name"] in allowed)
+    
+    def _is_parallel_safe(self, tool_name: str) -> bool:
+        """도구의 병렬 실행 안전 여부 (알 수 없는 도구는 안전하지 않은 것으로 간주, 임포트 없이 메타데이터로 판단)"""
+        spec = self.tools_manager.get_tool_spec(tool_name)
+        return bool(spec and spec.parallel_safe)
+    
     def _execute_single_tool(self, tool_call, iteration_log: Dict) -> Dict:
         """
         단일 도구 실행 및 결과 반환
@@ -516,6 +1446,19 @@ ReAct(Reasoning-Acting-Observing) 패턴을 사용하여 체계적으로 문제
         Returns:
             도구 실행 결과
         """
+        call = self._prepare_tool_call(tool_call)
+        return self._finalize_tool_call(call, self._invoke_tool(self._resolve_memo(call)), iteration_log)
+    
+    def _prepare_tool_call(self, tool_call) -> Dict:
+        """
+        도구 호출 정보 파싱 및 호출 콜백 (호출 스레드에서 실행)
+        
+        Args:
+            tool_call: 도구 호출 정보
+            
+        Returns:
+            도구 호출 로그
+        """
         function_name = tool_call.function.name
         function_args = json.loads(tool_call.function.arguments)
         tool_call_id = tool_call.id
@@ -524,20 +1467,154 @@ ReAct(Reasoning-Acting-Observing) 패턴을 사용하여 체계적으로 문제
         self.callback.on_tool_call(self.current_iteration, function_name, function_args)
         
         # 도구 호출 로그
-        tool_log = {
+        call = {
             "tool": function_name,
             "arguments": function_args,
             "timestamp": time.time(),
             "tool_call_id": tool_call_id
         }
         
-        try:
-            # 도구 실행
-            result = self.tools_manager.execute_tool(function_name, function_args)
+        # 결과 재사용이 가능한 호출 식별 (중복 여부는 실행 직전 _resolve_memo에서 판단)
+        if self.memoize_tool_calls and self._is_cacheable(function_name, function_args):
+            call["memo_key"] = f"{function_name}:{self._canonical_arguments(function_args)}"
+        
+        return call
+    
+    def _resolve_memo(self, call: Dict) -> Dict:
+        """
+        실행 직전 중복 호출 판단 (호출 스레드에서 실행)
+        
+        같은 실행에서 이미 성공한 동일 호출이 있으면 결과 대신 참조를 반환하도록 표시하고,
+        없으면 이 호출을 최초 호출로 등록 (실패하면 _finalize_tool_call에서 등록 해제)
+        
+        Args:
+            call: 도구 호출 로그
+            
+        Returns:
+            Dict: 같은 도구 호출 로그
+        """
+        memo_key = call.get("memo_key")
+        if not memo_key:
+            return call
+        
+        original = self._tool_memo.get(memo_key)
+        if original is not None:
+            call["memoized_from"] = original["tool_call_id"]
+            call["memoized_iteration"] = original["iteration"]
+        else:
+            self._tool_memo[memo_key] = {
+                "tool_call_id": call["tool_call_id"],
+                "iteration": self.current_iteration
+            }
+        return call
+    
+    def _forget_memo(self, call: Dict):
+        """실패한 최초 호출을 메모에서 제거 - 이후 동일 호출(모델의 재시도)이 다시 실행되도록"""
+        memo_key = call.get("memo_key")
+        if memo_key and self._tool_memo.get(memo_key, {}).get("tool_call_id") == call["tool_call_id"]:
+            del self._tool_memo[memo_key]
+    
+    def _is_cacheable(self, tool_name: str, arguments: Dict[str, Any]) -> bool:
+        """도구 호출 결과의 실행 내 재사용 가능 여부 (알 수 없는 도구는 재사용하지 않음)"""
+        tool = self.tools_manager.get_tool(tool_name)
+        return bool(tool and tool.is_cacheable(arguments))
+    
+    @staticmethod
+    def _canonical_arguments(arguments: Dict[str, Any]) -> str:
+        """인자 순서/공백과 무관하게 동일 호출을 식별하기 위한 정규화된 인자 문자열"""
+        return json.dumps(arguments, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    
+    def _invoke_tool(self, call: Dict) -> Dict:
+        """
+        도구 실행 (워커 스레드에서 실행될 수 있으므로 콜백/대화 히스토리에 접근하지 않음)
+        
+        Args:
+            call: 도구 호출 로그
+            
+        Returns:
+            실행 결과 (result 또는 error)
+        """
+        function_name = call["tool"]
+        outcome = {}
+        
+        # 중복 호출은 실행하지 않고 최초 호출 결과를 참조
+        if "memoized_from" in call:
+            outcome["result"] = (
+                f"[중복 호출] 반복 {call['memoized_iteration']}의 tool_call {call['memoized_from']}과 "
+                f"동일한 호출입니다. 해당 결과를 참조하세요."
+            )
+            outcome["duration"] = 0.0
+            return outcome
+        
+        # 도구별 제한 시간 토큰 - SSH 계층이 현재 컨텍스트의 토큰을 참조하여 채널을 중단
+        token = self._run_token.child(self.tool_timeout) if self._run_token else None
+        
+        with trace_span("tool.execute", tool=function_name, tool_call_id=call["tool_call_id"]) as span:
+            try:
+                with use_token(token):
+                    # 도구 실행
+                    result = self.tools_manager.execute_tool(function_name, call["arguments"])
+                    span.set_attribute("output_length", len(str(result)))
+                    
+                    # 대용량 출력은 요약 단계를 거쳐 대화에 추가 (요약 LLM 호출도 도구 토큰의 마감 시각을 따름)
+                    if self.summarizer and self.summarizer.should_summarize(result):
+                        with trace_span("tool.summarize", tool=function_name):
+                            summary_info = self.summarizer.summarize(
+                                function_name, result, token=token, llm_timeout=self.llm_timeout
+                            )
+                        outcome["summarized"] = True
+                        outcome["original_length"] = summary_info["original_length"]
+                        outcome["summary_chunks"] = summary_info["chunks"]
+                        result = (
+                            f"[요약됨: 원본 {summary_info['original_length']}자, {summary_info['chunks']}개 구간]\n"
+                            f"{summary_info['summary']}"
+                        )
+                
+                outcome["result"] = result
+                
+            except Exception as e:
+                span.record_error(e)
+                outcome["error"] = str(e)
+            finally:
+                if token:
+                    token.close()
+        
+        outcome["duration"] = round(time.time() - call["timestamp"], 3)
+        return outcome
+    
+    def _finalize_tool_call(self, call: Dict, outcome: Dict, iteration_log: Dict) -> Dict:
+        """
+        도구 실행 결과 반영 - 결과 콜백, 대화 히스토리, 실행 로그 (호출 스레드에서 실행)
+        
+        Args:
+            call: 도구 호출 로그
+            outcome: _invoke_tool 실행 결과
+            iteration_log: 현재 반복의 로그
+            
+        Returns:
+            도구 실행 결과
+        """
+        tool_log = call
+        function_name = tool_log["tool"]
+        tool_call_id = tool_log["tool_call_id"]
+        tool_log["duration"] = outcome["duration"]
+        
+        if "error" not in outcome:
+            # 출력은 저장소에 한 번만 보관하고 로그에는 참조만 기록 (대화 히스토리도 같은 인스턴스 공유)
+            result_ref = self.blob_store.put(str(outcome["result"]))
+            result = self.blob_store.get(result_ref)
+            
+            for key in ("summarized", "original_length", "summary_chunks"):
+                if key in outcome:
+                    tool_log[key] = outcome[key]
             
             tool_log["success"] = True
-            tool_log["result"] = result
-            tool_log["result_length"] = len(str(result))
+            tool_log["result_ref"] = result_ref
+            tool_log["result_length"] = len(result)
+            
+            # 도구는 예외 대신 오류 문자열(연결 오류, SSH 시간 초과 등)을 반환하므로 재사용하지 않음
+            if result.startswith(ERROR_OUTPUT_PREFIXES):
+                self._forget_memo(tool_log)
             
             # 도구 결과 콜백
             self.callback.on_tool_result(
@@ -548,17 +1625,19 @@ ReAct(Reasoning-Acting-Observing) 패턴을 사용하여 체계적으로 문제
             )
             
             # 도구 실행 결과를 대화 히스토리에 추가
-            self.conversation_history.append({
+            self._record_message({
                 "role": "tool",
-                "content": str(result),
+                "content": result,
                 "tool_call_id": tool_call_id
             })
             
-        except Exception as e:
-            error_msg = f"도구 실행 실패: {str(e)}"
+        else:
+            error_msg = f"도구 실행 실패: {outcome['error']}"
             tool_log["success"] = False
-            tool_log["error"] = str(e)
-            result = error_msg
+            tool_log["error"] = outcome["error"]
+            
+            # 실패한 호출은 이후 동일 호출이 다시 실행되도록 메모에서 제거
+            self._forget_memo(tool_log)
             
             # 도구 오류 콜백
             self.callback.on_tool_result(
@@ -569,7 +1648,7 @@ ReAct(Reasoning-Acting-Observing) 패턴을 사용하여 체계적으로 문제
             )
             
             # 오류 결과도 대화 히스토리에 추가
-            self.conversation_history.append({
+            self._record_message({
                 "role": "tool",
                 "content": f"오류: {error_msg}",
                 "tool_call_id": tool_call_id
@@ -579,7 +1658,7 @@ ReAct(Reasoning-Acting-Observing) 패턴을 사용하여 체계적으로 문제
         iteration_log["tool_calls"].append(tool_log)
         
         # 전체 실행 로그에도 추가
-        self.execution_log.append({
+        self._record_execution({
             "iteration": self.current_iteration,
             "type": "tool_call",
             **tool_log
@@ -607,12 +1686,15 @@ ReAct(Reasoning-Acting-Observing) 패턴을 사용하여 체계적으로 문제
         
         return ", ".join(observations) if observations else "도구 실행 완료"
     
-    def _generate_partial_conclusion(self) -> str:
+    def _generate_partial_conclusion(self, reason: str = "max_iterations") -> str:
         """
-        최대 반복 횟수 도달 시 부분적인 결론 생성
+        최대 반복 횟수 도달, 시간 초과 또는 취소 시 부분적인 결론 생성
         
         실행 로그와 추론 히스토리를 바탕으로 의미 있는 부분 결과를 제시
         
+        Args:
+            reason: 중단 사유 (max_iterations / timeout / cancelled)
+        
         Returns:
             부분적인 분석 결과와 권장사항
         """
@@ -634,7 +1716,7 @@ ReAct(Reasoning-Acting-Observing) 패턴을 사용하여 체계적으로 문제
                     if log_entry.get("success", False):
                         successful_tools.append(tool_name)
                         # 성공한 도구의 결과에서 인사이트 추출
-                        result = log_entry.get("result", "")
+                        result = self.get_tool_result(log_entry) or ""
                         if result and len(str(result)) > 50:
                             preview = str(result)[:200] + "..." if len(str(result)) > 200 else str(result)
                             key_insights.append(f"• {tool_name}: {preview}")
@@ -665,8 +1747,15 @@ ReAct(Reasoning-Acting-Observing) 패턴을 사용하여 체계적으로 문제
                         important_context.append(f"• {preview}")
         
         # 부분 결론 구성
+        if reason == "timeout":
+            headline = "⏱️ 실행 시간 제한 도달로 분석이 중단되었습니다."
+        elif reason == "cancelled":
+            headline = "⏹️ 사용자 요청으로 분석이 중단되었습니다."
+        else:
+            headline = f"⚠️ 최대 반복 횟수 ({self.max_iterations}) 도달로 분석이 중단되었습니다."
+        
         conclusion_parts = [
-            f"⚠️ 최대 반복 횟수 ({self.max_iterations}) 도달로 분석이 중단되었습니다.",
+            headline,
             "",
             "## 📊 현재까지의 진행 상황"
         ]
@@ -705,10 +1794,14 @@ ReAct(Reasoning-Acting-Observing) 패턴을 사용하여 체계적으로 문제
             "",
             "## 🎯 권장사항",
             "• 문제를 더 구체적이고 단순한 하위 작업으로 나누어 다시 시도하세요",
-            "• 특정 부분에 집중하여 단계별로 접근해보세요",
-            f"• max_iterations 값을 {self.max_iterations + 5} 이상으로 증가시켜 재시도하세요"
+            "• 특정 부분에 집중하여 단계별로 접근해보세요"
         ])
         
+        if reason == "timeout":
+            conclusion_parts.append("• 실행 시간 제한(run_timeout)을 늘리거나 응답이 느린 명령을 확인하세요")
+        elif reason == "max_iterations":
+            conclusion_parts.append(f"• max_iterations 값을 {self.max_iterations + 5} 이상으로 증가시켜 재시도하세요")
+        
         if successful_tools:
             conclusion_parts.append("• 성공한 작업 결과를 바탕으로 다음 단계를 계획하세요")
         
@@ -764,6 +1857,15 @@ ReAct(Reasoning-Acting-Observing) 패턴을 사용하여 체계적으로 문제
         
         return total_usage
     
+    def cancel(self):
+        """
+        진행 중인 실행을 협조적으로 취소 (다른 스레드에서 호출 가능)
+        
+        진행 중인 SSH 채널을 닫고, LLM 응답 대기를 중단한 뒤 부분 결론을 반환하게 함
+        """
+        if self._run_token:
+            self._run_token.cancel("cancelled")
+    
     def get_conversation_history(self) -> List[Dict[str, Any]]:
         """대화 히스토리 반환"""
         return self.conversation_history.copy()
@@ -776,6 +1878,22 @@ ReAct(Reasoning-Acting-Observing) 패턴을 사용하여 체계적으로 문제
         """추론 히스토리 반환"""
         return self.reasoning_history.copy()
     
+    def get_tool_result(self, tool_log: Dict[str, Any]) -> Optional[str]:
+        """
+        실행 로그 항목이 참조하는 도구 출력 조회
+        
+        Args:
+            tool_log: 실행 로그의 도구 호출 항목
+            
+        Returns:
+            도구 출력 (참조가 없으면 None)
+        """
+        return self.blob_store.get(tool_log.get("result_ref"))
+    
+    def get_routing_metrics(self) -> Optional[Dict[str, Any]]:
+        """모델 계층별 지연 시간/토큰 지표 반환 (라우팅 미사용 시 None)"""
+        return self.router.get_metrics() if self.router else None
+    
     def reset(self):
         """에이전트 상태 리셋"""
         self.current_iteration = 0
@@ -798,7 +1916,9 @@ ReAct(Reasoning-Acting-Observing) 패턴을 사용하여 체계적으로 문제
                 "endpoint": self.endpoint,
                 "model": self.model,
                 "max_iterations": self.max_iterations,
-                "callback": self.callback.__class__.__name__
+                "mode": self.mode,
+                "callback": self.callback.__class__.__name__,
+                "fast_model": self.router.get_client(ModelRouter.FAST).model if self.router else None
             }
         }
     
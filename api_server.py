@@ -0,0 +1,783 @@
+"""
+헤드리스 HTTP API 서버
+ReactAgentV2 실행을 제한된 워커 풀에서 처리하고, 진행 상황을 SSE로 스트리밍하며 결과를 조회
+
+    python api_server.py --tenants tenants.json --port 8080
+
+테넌트 파일 형식 (서버 접속 정보는 테넌트별로 관리하며 LLM이나 API 응답에 노출되지 않음):
+
+    {
+      "tenants": {
+        "ops-team": {
+          "api_key": "<임의의 긴 문자열>",
+          "servers": {
+            "default": {"ip": "10.0.0.12", "port": 22, "username": "ops", "password": "..."}
+          }
+        }
+      }
+    }
+
+엔드포인트 (Authorization: Bearer <api_key>):
+    POST /v1/runs                       실행 제출 {"input", "server", "mode", "max_iterations", "timeout"}
+    GET  /v1/runs                       테넌트의 실행 목록
+    GET  /v1/runs/<id>                  실행 상태 및 결과
+    GET  /v1/runs/<id>/events           진행 이벤트 스트림 (text/event-stream, Last-Event-ID 지원)
+    GET  /v1/runs/<id>/outputs/<ref>    도구 출력 원문 (실행 로그의 result_ref)
+    POST /v1/runs/<id>/cancel           실행 취소
+    GET  /v1/stats                      대기열/워커/LLM 동시 요청 상태와 테넌트의 상태별 실행 수
+    GET  /healthz, GET /metrics         상태 확인({"status": "ok"}만 반환), Prometheus 지표 (인증 없음)
+"""
+import os
+import json
+import hmac
+import time
+import uuid
+import queue
+import argparse
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional, Tuple
+from agent_v2 import ReactAgentV2, ReasoningCallback
+from config.server_config import ServerConfig
+from core.model import LLMClient
+from core.metrics import REGISTRY
+from core.tracing import tracer_from_env
+from core.intent_router import IntentRouter
+from tools.tools_manager import ToolsManager
+from tools.remote_session import TransportPool, set_transport_pool
+
+
+# SSE 이벤트에 포함할 도구 결과 최대 길이 (전체 출력은 outputs 엔드포인트로 조회)
+MAX_EVENT_RESULT_CHARS = 4000
+
+# 요청 본문 최대 크기 (바이트)
+MAX_REQUEST_BYTES = 1024 * 1024
+
+API_REJECTED = REGISTRY.counter(
+    "react_agent_api_rejected_total", "Run submissions rejected by backpressure", ("reason",))
+API_QUEUED = REGISTRY.gauge(
+    "react_agent_api_queued_runs", "Runs waiting for a worker")
+API_BUSY_WORKERS = REGISTRY.gauge(
+    "react_agent_api_busy_workers", "Workers currently executing a run")
+
+
+class ServiceBusyError(Exception):
+    """
+    백엔드 포화로 실행 제출을 거부했음을 나타내는 예외 (HTTP 429/503 응답)
+    """
+
+    def __init__(self, reason: str, status: int, retry_after: int):
+        self.reason = reason
+        self.status = status
+        self.retry_after = retry_after
+        super().__init__(reason)
+
+
+class TenantRegistry:
+    """
+    테넌트별 API 키와 원격 서버 접속 정보 관리
+    """
+
+    def __init__(self, tenants: Dict[str, Dict[str, Any]]):
+        """
+        TenantRegistry 초기화
+
+        Args:
+            tenants: 테넌트명 → {"api_key": str, "servers": {서버명: 접속 정보}}
+        """
+        for name, tenant in tenants.items():
+            if not tenant.get("api_key"):
+                raise ValueError(f"테넌트 '{name}'에 api_key가 없습니다")
+        self.tenants = tenants
+
+    @classmethod
+    def load(cls, path: str) -> "TenantRegistry":
+        """테넌트 JSON 파일 로드"""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f).get("tenants", {}))
+
+    def authenticate(self, authorization: Optional[str]) -> Optional[str]:
+        """
+        Authorization 헤더로 테넌트 식별
+
+        Args:
+            authorization: "Bearer <api_key>" 형식의 헤더 값
+
+        Returns:
+            Optional[str]: 테넌트명 (인증 실패 시 None)
+        """
+        if not authorization or not authorization.startswith("Bearer "):
+            return None
+        api_key = authorization[len("Bearer "):].strip().encode("utf-8")
+        for name, tenant in self.tenants.items():
+            if hmac.compare_digest(api_key, str(tenant["api_key"]).encode("utf-8")):
+                return name
+        return None
+
+    def get_server(self, tenant: str, server: Optional[str] = None) -> Dict[str, Any]:
+        """
+        테넌트의 원격 서버 접속 정보
+
+        Args:
+            tenant: 테넌트명
+            server: 서버명 (생략 시 "default" 또는 유일한 서버)
+
+        Returns:
+            Dict: 접속 정보 (ip, port, username, password)
+
+        Raises:
+            KeyError: 서버가 없거나 서버명이 모호한 경우
+        """
+        servers = self.tenants[tenant].get("servers", {})
+        if server is None:
+            if "default" in servers:
+                server = "default"
+            elif len(servers) == 1:
+                server = next(iter(servers))
+            else:
+                raise KeyError("server를 지정해야 합니다")
+        if server not in servers:
+            raise KeyError(f"알 수 없는 서버입니다: {server}")
+        info = servers[server]
+        return {
+            "ip": info["ip"],
+            "port": int(info.get("port", 22)),
+            "username": info["username"],
+            "password": info.get("password")
+        }
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        return f"TenantRegistry(tenants={sorted(self.tenants)})"
+
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
+
+
+class RunRecord:
+    """
+    API로 제출된 실행 1건의 상태, 진행 이벤트, 결과
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    FINISHED = (COMPLETED, FAILED, CANCELLED)
+
+    def __init__(self, tenant: str, user_input: str, options: Dict[str, Any], connection_info: Dict[str, Any]):
+        """
+        RunRecord 초기화
+
+        Args:
+            tenant: 제출한 테넌트
+            user_input: 사용자 요청
+            options: 실행 옵션 (server, mode, max_iterations, timeout)
+            connection_info: 도구가 사용할 서버 접속 정보
+        """
+        self.id = uuid.uuid4().hex
+        self.tenant = tenant
+        self.user_input = user_input
+        self.options = options
+        self.connection_info = connection_info
+        self.status = self.QUEUED
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.cancel_requested = False
+        self.agent: Optional[ReactAgentV2] = None
+        self.events: List[Dict[str, Any]] = []
+        self._cond = threading.Condition()
+        self.emit("status", {"status": self.status, "error": None})
+
+    @property
+    def finished(self) -> bool:
+        """종료 여부"""
+        return self.status in self.FINISHED
+
+    def emit(self, event: str, data: Dict[str, Any]):
+        """진행 이벤트 추가 및 대기 중인 스트림에 알림"""
+        with self._cond:
+            self.events.append({"id": len(self.events) + 1, "event": event, "data": data, "time": time.time()})
+            self._cond.notify_all()
+
+    def set_status(self, status: str, result: Optional[Dict[str, Any]] = None, error: Optional[str] = None):
+        """
+        상태 변경 및 상태 이벤트 기록
+
+        Args:
+            status: 새 상태
+            result: 실행 결과 (종료 시)
+            error: 오류 메시지 (실패 시)
+        """
+        now = time.time()
+        if status == self.RUNNING:
+            self.started_at = now
+        if status in self.FINISHED:
+            self.finished_at = now
+        self.result = result if result is not None else self.result
+        self.error = error
+        self.status = status
+        self.emit("status", {"status": status, "error": error})
+
+    def wait_events(self, after: int, timeout: float) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        지정한 이벤트 이후의 새 이벤트 대기
+
+        Args:
+            after: 이미 받은 마지막 이벤트 id
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            Tuple[List, bool]: (새 이벤트 목록, 실행 종료 여부)
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: len(self.events) > after or self.finished, timeout)
+            return self.events[after:], self.finished
+
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        """API 응답용 딕셔너리 (접속 정보 제외)"""
+        data = {
+            "id": self.id,
+            "status": self.status,
+            "input": self.user_input,
+            "options": self.options,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error
+        }
+        if include_result:
+            data["result"] = self.result
+        return data
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        return f"RunRecord(id='{self.id}', tenant='{self.tenant}', status='{self.status}')"
+
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
+
+
+class ApiCallback(ReasoningCallback):
+    """
+    에이전트 진행 상황을 RunRecord 이벤트로 전달하는 콜백
+    """
+
+    def __init__(self, record: RunRecord):
+        self.record = record
+
+    def on_iteration_start(self, iteration: int, max_iterations: int):
+        # 실행 시작 직전에 들어온 취소 요청은 취소 토큰이 생긴 뒤 여기서 반영
+        if self.record.cancel_requested and self.record.agent:
+            self.record.agent.cancel()
+        self.record.emit("iteration_start", {"iteration": iteration, "max_iterations": max_iterations})
+
+    def on_reasoning(self, iteration: int, thought: str):
+        self.record.emit("reasoning", {"iteration": iteration, "thought": thought})
+
+    def on_tool_call(self, iteration: int, tool: str, arguments: Dict[str, Any]):
+        self.record.emit("tool_call", {"iteration": iteration, "tool": tool, "arguments": arguments})
+
+    def on_tool_result(self, iteration: int, tool: str, result: str, success: bool):
+        self.record.emit("tool_result", {
+            "iteration": iteration,
+            "tool": tool,
+            "success": success,
+            "result": result[:MAX_EVENT_RESULT_CHARS],
+            "result_length": len(result)
+        })
+
+    def on_observation(self, iteration: int, observation: str):
+        self.record.emit("observation", {"iteration": iteration, "observation": observation})
+
+    def on_iteration_end(self, iteration: int):
+        self.record.emit("iteration_end", {"iteration": iteration})
+
+    def on_final_result(self, result: str, iterations: int):
+        self.record.emit("final_result", {"result": result, "iterations": iterations})
+
+    def on_error(self, iteration: int, error: str):
+        self.record.emit("error", {"iteration": iteration, "error": error})
+
+
+class AgentService:
+    """
+    제한된 워커 풀에서 에이전트 실행을 처리하는 서비스
+
+    LLM 클라이언트, 도구 매니저, SSH 연결 풀은 모든 실행이 공유하고(웜 상태 유지),
+    실행마다 새 ReactAgentV2를 만들어 대화 상태만 분리
+    대기열이 가득 차거나 LLM 백엔드 대기 요청이 한도를 넘으면 새 실행을 거부 (backpressure)
+    """
+
+    def __init__(
+        self,
+        tenants: TenantRegistry,
+        endpoint: str = "http://localhost:11434",
+        model: str = "gpt-oss:20b",
+        workers: int = 4,
+        queue_size: int = 32,
+        llm_concurrency: int = 4,
+        llm_max_waiting: Optional[int] = None,
+        max_iterations: int = 10,
+        run_timeout: Optional[float] = 600.0,
+        max_finished_runs: int = 500,
+        tool_top_k: Optional[int] = None,
+        fast_path: bool = False
+    ):
+        """
+        AgentService 초기화
+
+        Args:
+            tenants: 테넌트 레지스트리
+            endpoint: LLM 서버 엔드포인트
+            model: 사용할 모델명
+            workers: 동시에 처리할 최대 실행 수
+            queue_size: 워커를 기다릴 수 있는 최대 실행 수 (초과 시 429)
+            llm_concurrency: LLM 백엔드로 동시에 보낼 최대 요청 수
+            llm_max_waiting: LLM 동시 요청 한도로 대기 중인 요청이 이 수 이상이면 새 실행 거부 (503, 기본값: llm_concurrency)
+            max_iterations: 실행당 기본 최대 반복 횟수
+            run_timeout: 실행당 기본 제한 시간 (초)
+            max_finished_runs: 메모리에 보관할 종료된 실행 수
+            tool_top_k: 지정 시 요청과 관련 있는 상위 K개 도구 스키마만 LLM에 전달
+            fast_path: 단순 진단 요청(메모리/디스크/실패한 서비스 등)을 LLM 없이 바로 처리할지 여부
+        """
+        self.tenants = tenants
+        self.workers = workers
+        self.max_iterations = max_iterations
+        self.run_timeout = run_timeout
+        self.max_finished_runs = max_finished_runs
+        self.tool_top_k = tool_top_k
+        self.intent_router = IntentRouter() if fast_path else None
+        self.llm_max_waiting = llm_max_waiting if llm_max_waiting is not None else llm_concurrency
+
+        # 모든 실행이 공유하는 웜 자원
+        self.llm_client = LLMClient(endpoint=endpoint, model=model, max_concurrency=llm_concurrency)
+        self.tools_manager = ToolsManager()
+        self.tracer = tracer_from_env()
+
+        self._queue: "queue.Queue[Optional[RunRecord]]" = queue.Queue(maxsize=queue_size)
+        self._runs: "OrderedDict[str, RunRecord]" = OrderedDict()
+        self._runs_lock = threading.Lock()
+        self._busy = 0
+        self._busy_lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+
+        API_QUEUED.set_function(self._queue.qsize)
+        API_BUSY_WORKERS.set_function(lambda: self._busy)
+
+    def start(self) -> "AgentService":
+        """워커 스레드 시작"""
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"agent-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def shutdown(self, timeout: Optional[float] = None):
+        """진행 중인 실행을 취소하고 워커 종료"""
+        with self._runs_lock:
+            records = list(self._runs.values())
+        for record in records:
+            if not record.finished:
+                self._request_cancel(record)
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def submit(self, tenant: str, payload: Dict[str, Any]) -> RunRecord:
+        """
+        실행 제출
+
+        Args:
+            tenant: 테넌트명
+            payload: 요청 본문 {"input", "server", "mode", "max_iterations", "timeout"}
+
+        Returns:
+            RunRecord: 대기열에 들어간 실행
+
+        Raises:
+            ValueError: 요청 형식이 잘못된 경우
+            KeyError: 테넌트에 해당 서버가 없는 경우
+            ServiceBusyError: 대기열이 가득 찼거나 LLM 백엔드가 포화된 경우
+        """
+        user_input = payload.get("input")
+        if not isinstance(user_input, str) or not user_input.strip():
+            raise ValueError("input은 비어 있지 않은 문자열이어야 합니다")
+
+        mode = payload.get("mode", "react")
+        if mode not in ("react", "plan"):
+            raise ValueError(f"지원하지 않는 실행 모드입니다: {mode}")
+        max_iterations = int(payload.get("max_iterations") or self.max_iterations)
+        if not 1 <= max_iterations <= 50:
+            raise ValueError("max_iterations는 1~50 사이여야 합니다")
+        timeout = payload.get("timeout", self.run_timeout)
+        if timeout is not None and float(timeout) <= 0:
+            raise ValueError("timeout은 0보다 커야 합니다")
+
+        connection_info = self.tenants.get_server(tenant, payload.get("server"))
+
+        # LLM 백엔드가 이미 포화 상태면 대기열에 쌓지 않고 바로 거부
+        if self.llm_client.waiting >= self.llm_max_waiting:
+            API_REJECTED.labels("llm_saturated").inc()
+            raise ServiceBusyError("LLM 백엔드가 포화 상태입니다", status=503, retry_after=5)
+
+        options = {"server": payload.get("server"), "mode": mode, "max_iterations": max_iterations, "timeout": timeout}
+        record = RunRecord(tenant, user_input, options, connection_info)
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            API_REJECTED.labels("queue_full").inc()
+            raise ServiceBusyError("실행 대기열이 가득 찼습니다", status=429, retry_after=10)
+
+        with self._runs_lock:
+            self._runs[record.id] = record
+            self._evict_finished()
+        return record
+
+    def _evict_finished(self):
+        """보관 한도를 넘은 오래된 종료 실행 제거 (_runs_lock 보유 상태에서 호출)"""
+        finished = [run_id for run_id, record in self._runs.items() if record.finished]
+        for run_id in finished[:max(0, len(finished) - self.max_finished_runs)]:
+            del self._runs[run_id]
+
+    def get(self, tenant: str, run_id: str) -> Optional[RunRecord]:
+        """테넌트의 실행 조회 (다른 테넌트의 실행은 None)"""
+        with self._runs_lock:
+            record = self._runs.get(run_id)
+        return record if record is not None and record.tenant == tenant else None
+
+    def list(self, tenant: str) -> List[RunRecord]:
+        """테넌트의 실행 목록 (최근 제출 순)"""
+        with self._runs_lock:
+            return [record for record in reversed(self._runs.values()) if record.tenant == tenant]
+
+    def cancel(self, tenant: str, run_id: str) -> Optional[RunRecord]:
+        """
+        실행 취소 요청
+
+        대기 중인 실행은 워커가 가져갈 때 건너뛰고, 진행 중인 실행은 부분 결론을 반환하며 종료
+        """
+        record = self.get(tenant, run_id)
+        if record is not None and not record.finished:
+            self._request_cancel(record)
+        return record
+
+    @staticmethod
+    def _request_cancel(record: RunRecord):
+        record.cancel_requested = True
+        if record.agent is not None:
+            record.agent.cancel()
+
+    def _worker(self):
+        """대기열에서 실행을 꺼내 처리"""
+        while True:
+            record = self._queue.get()
+            if record is None:
+                return
+            if record.cancel_requested:
+                record.set_status(RunRecord.CANCELLED)
+                continue
+            with self._busy_lock:
+                self._busy += 1
+            try:
+                self._execute(record)
+            finally:
+                with self._busy_lock:
+                    self._busy -= 1
+
+    def _execute(self, record: RunRecord):
+        """실행 1건 처리 - 공유 자원으로 에이전트를 만들고 테넌트 서버 정보를 바인딩하여 실행"""
+        options = record.options
+        try:
+            record.agent = ReactAgentV2(
+                callback=ApiCallback(record),
+                verbose=False,
+                max_iterations=options["max_iterations"],
+                run_timeout=options["timeout"],
+                mode=options["mode"],
+                tracer=self.tracer,
+                llm_client=self.llm_client,
+                tools_manager=self.tools_manager,
+                tool_top_k=self.tool_top_k,
+                intent_router=self.intent_router
+            )
+            record.set_status(RunRecord.RUNNING)
+            with ServerConfig.bind_connection_info(record.connection_info):
+                result = record.agent.run(record.user_input)
+        except Exception as e:
+            record.set_status(RunRecord.FAILED, error=str(e))
+            return
+
+        if result.get("stop_reason") == "cancelled":
+            record.set_status(RunRecord.CANCELLED, result=result)
+        elif result.get("success"):
+            record.set_status(RunRecord.COMPLETED, result=result)
+        else:
+            record.set_status(RunRecord.FAILED, result=result, error=result.get("error"))
+
+    def stats(self, tenant: Optional[str] = None) -> Dict[str, Any]:
+        """
+        서비스 상태 요약
+
+        Args:
+            tenant: 지정 시 상태별 실행 수는 해당 테넌트의 실행만 집계
+
+        Returns:
+            Dict: 워커/대기열/LLM 동시 요청 상태와 상태별 실행 수
+        """
+        with self._runs_lock:
+            statuses: Dict[str, int] = {}
+            for record in self._runs.values():
+                if tenant is None or record.tenant == tenant:
+                    statuses[record.status] = statuses.get(record.status, 0) + 1
+        return {
+            "workers": self.workers,
+            "busy_workers": self._busy,
+            "queued": self._queue.qsize(),
+            "queue_size": self._queue.maxsize,
+            "llm_waiting": self.llm_client.waiting,
+            "llm_concurrency": self.llm_client.max_concurrency,
+            "runs": statuses
+        }
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        return f"AgentService(model='{self.llm_client.model}', workers={self.workers}, queue_size={self._queue.maxsize})"
+
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
+
+
+def make_handler(service: AgentService):
+    """AgentService에 연결된 HTTP 요청 처리기 클래스 생성"""
+
+    class ApiRequestHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            path = self.path.split("?", 1)[0].rstrip("/")
+            if path == "/healthz":
+                # 인증 없이 노출되므로 상세 상태는 /v1/stats로만 제공
+                self._send_json(200, {"status": "ok"})
+                return
+            if path == "/metrics":
+                self._send_text(200, REGISTRY.render(), "text/plain; version=0.0.4; charset=utf-8")
+                return
+
+            tenant = self._authenticate()
+            if tenant is None:
+                return
+            parts = path.strip("/").split("/")
+            if parts == ["v1", "stats"]:
+                self._send_json(200, service.stats(tenant))
+                return
+            if parts == ["v1", "runs"]:
+                self._send_json(200, {"runs": [record.to_dict(include_result=False) for record in service.list(tenant)]})
+                return
+            if len(parts) >= 3 and parts[:2] == ["v1", "runs"]:
+                record = service.get(tenant, parts[2])
+                if record is None:
+                    self._send_json(404, {"error": "실행을 찾을 수 없습니다"})
+                elif len(parts) == 3:
+                    self._send_json(200, record.to_dict())
+                elif parts[3:] == ["events"]:
+                    self._stream_events(record)
+                elif len(parts) == 5 and parts[3] == "outputs":
+                    self._send_output(record, parts[4])
+                else:
+                    self._send_json(404, {"error": "not found"})
+                return
+            self._send_json(404, {"error": "not found"})
+
+        def do_POST(self):
+            tenant = self._authenticate()
+            if tenant is None:
+                return
+            parts = self.path.split("?", 1)[0].strip("/").split("/")
+
+            if parts == ["v1", "runs"]:
+                payload = self._read_json()
+                if payload is None:
+                    return
+                try:
+                    record = service.submit(tenant, payload)
+                except ServiceBusyError as e:
+                    self._send_json(e.status, {"error": e.reason}, headers={"Retry-After": str(e.retry_after)})
+                    return
+                except (ValueError, TypeError) as e:
+                    self._send_json(400, {"error": str(e)})
+                    return
+                except KeyError as e:
+                    self._send_json(400, {"error": e.args[0] if e.args else "server"})
+                    return
+                self._send_json(202, {
+                    "id": record.id,
+                    "status": record.status,
+                    "links": {
+                        "self": f"/v1/runs/{record.id}",
+                        "events": f"/v1/runs/{record.id}/events",
+                        "cancel": f"/v1/runs/{record.id}/cancel"
+                    }
+                }, headers={"Location": f"/v1/runs/{record.id}"})
+                return
+
+            if len(parts) == 4 and parts[:2] == ["v1", "runs"] and parts[3] == "cancel":
+                record = service.cancel(tenant, parts[2])
+                if record is None:
+                    self._send_json(404, {"error": "실행을 찾을 수 없습니다"})
+                else:
+                    self._send_json(202, {"id": record.id, "status": record.status, "cancel_requested": True})
+                return
+
+            self._send_json(404, {"error": "not found"})
+
+        def _authenticate(self) -> Optional[str]:
+            tenant = service.tenants.authenticate(self.headers.get("Authorization"))
+            if tenant is None:
+                self._send_json(401, {"error": "유효한 API 키가 필요합니다"}, headers={"WWW-Authenticate": "Bearer"})
+            return tenant
+
+        def _read_json(self) -> Optional[Dict[str, Any]]:
+            length = int(self.headers.get("Content-Length") or 0)
+            if length > MAX_REQUEST_BYTES:
+                self._send_json(413, {"error": "요청 본문이 너무 큽니다"})
+                return None
+            try:
+                payload = json.loads(self.rfile.read(length) or b"{}")
+            except json.JSONDecodeError:
+                self._send_json(400, {"error": "JSON 형식이 아닙니다"})
+                return None
+            if not isinstance(payload, dict):
+                self._send_json(400, {"error": "JSON 객체가 필요합니다"})
+                return None
+            return payload
+
+        def _send_output(self, record: RunRecord, result_ref: str):
+            blob_store = record.agent.blob_store if record.agent else None
+            if blob_store is None or result_ref not in blob_store:
+                self._send_json(404, {"error": "출력을 찾을 수 없습니다"})
+                return
+            self._send_text(200, blob_store.get(result_ref), "text/plain; charset=utf-8")
+
+        def _stream_events(self, record: RunRecord):
+            """진행 이벤트를 SSE로 전송 (재접속 시 Last-Event-ID 이후부터)"""
+            try:
+                after = int(self.headers.get("Last-Event-ID") or 0)
+            except ValueError:
+                after = 0
+
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.close_connection = True
+
+            try:
+                while True:
+                    events, finished = record.wait_events(after, timeout=15.0)
+                    if not events and not finished:
+                        # 프록시가 유휴 연결을 끊지 않도록 주석 줄 전송
+                        self.wfile.write(b": keepalive\n\n")
+                    for event in events:
+                        data = json.dumps(event["data"], ensure_ascii=False, default=str)
+                        self.wfile.write(f"id: {event['id']}\nevent: {event['event']}\ndata: {data}\n\n".encode("utf-8"))
+                        after = event["id"]
+                    self.wfile.flush()
+                    if finished and after >= len(record.events):
+                        self.wfile.write(f"event: end\ndata: {json.dumps({'status': record.status})}\n\n".encode("utf-8"))
+                        self.wfile.flush()
+                        return
+            except (BrokenPipeError, ConnectionResetError):
+                # 클라이언트가 스트림을 먼저 닫은 경우
+                return
+
+        def _send_json(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+            body = json.dumps(payload, ensure_ascii=False, default=str)
+            self._send_text(status, body, "application/json; charset=utf-8", headers)
+
+        def _send_text(self, status: int, text: str, content_type: str, headers: Optional[Dict[str, str]] = None):
+            body = text.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return ApiRequestHandler
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="ReAct 에이전트 헤드리스 API 서버")
+    parser.add_argument("--host", default=os.getenv("REACT_AGENT_API_HOST", "0.0.0.0"), help="바인딩 주소")
+    parser.add_argument("--port", type=int, default=int(os.getenv("REACT_AGENT_API_PORT", "8080")), help="바인딩 포트")
+    parser.add_argument("--tenants", default=os.getenv("REACT_AGENT_TENANTS_FILE", "tenants.json"), help="테넌트 JSON 파일")
+    parser.add_argument("--endpoint", default=os.getenv("REACT_AGENT_LLM_ENDPOINT", "http://localhost:11434"), help="LLM 서버 엔드포인트")
+    parser.add_argument("--model", default=os.getenv("REACT_AGENT_LLM_MODEL", "gpt-oss:20b"), help="사용할 모델명")
+    parser.add_argument("--workers", type=int, default=4, help="동시에 처리할 최대 실행 수")
+    parser.add_argument("--queue-size", type=int, default=32, help="워커를 기다릴 수 있는 최대 실행 수")
+    parser.add_argument("--llm-concurrency", type=int, default=4, help="LLM 백엔드 동시 요청 한도")
+    parser.add_argument("--llm-max-waiting", type=int, help="이 수 이상 LLM 요청이 대기 중이면 새 실행 거부 (기본값: --llm-concurrency)")
+    parser.add_argument("--max-iterations", type=int, default=10, help="실행당 기본 최대 반복 횟수")
+    parser.add_argument("--run-timeout", type=float, default=600.0, help="실행당 기본 제한 시간 (초)")
+    parser.add_argument("--ssh-pool-size", type=int, default=4, help="서버별로 보관할 유휴 SSH 연결 수 (0이면 풀 사용 안 함)")
+    parser.add_argument("--ssh-idle-timeout", type=float, default=60.0, help="유휴 SSH 연결 보관 시간 (초)")
+    parser.add_argument("--watch-tools", type=float, default=float(os.getenv("REACT_AGENT_TOOL_WATCH_INTERVAL", "0")),
+                        help="도구 디렉토리 변경 확인 주기 (초, 0이면 감시 안 함) - 바뀐 도구만 다시 로딩")
+    parser.add_argument("--tool-top-k", type=int, default=int(os.getenv("REACT_AGENT_TOOL_TOP_K", "0")),
+                        help="요청과 관련 있는 상위 K개 도구 스키마만 LLM에 전달 (0이면 전체 도구)")
+    parser.add_argument("--fast-path", action="store_true", default=os.getenv("REACT_AGENT_FAST_PATH") == "1",
+                        help="단순 진단 요청(메모리/디스크/실패한 서비스 등)은 LLM 없이 도구를 바로 실행하여 응답")
+    args = parser.parse_args(argv)
+
+    tenants = TenantRegistry.load(args.tenants)
+    if args.ssh_pool_size > 0:
+        set_transport_pool(TransportPool(max_idle_per_key=args.ssh_pool_size, idle_timeout=args.ssh_idle_timeout))
+
+    service = AgentService(
+        tenants,
+        endpoint=args.endpoint,
+        model=args.model,
+        workers=args.workers,
+        queue_size=args.queue_size,
+        llm_concurrency=args.llm_concurrency,
+        llm_max_waiting=args.llm_max_waiting,
+        max_iterations=args.max_iterations,
+        run_timeout=args.run_timeout,
+        tool_top_k=args.tool_top_k or None,
+        fast_path=args.fast_path
+    ).start()
+    if args.watch_tools > 0:
+        service.tools_manager.start_watcher(args.watch_tools)
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(service))
+    server.daemon_threads = True
+    print(f"API 서버 시작: http://{args.host}:{server.server_address[1]} ({service}, 테넌트 {len(tenants.tenants)}개)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.tools_manager.stop_watcher()
+        service.shutdown(timeout=5.0)
+        set_transport_pool(None)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
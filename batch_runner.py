@@ -0,0 +1,407 @@
+"""
+프롬프트 파일 일괄 실행기
+JSONL 파일의 프롬프트를 공유 LLM 클라이언트·SSH 연결 풀로 병렬 실행하고,
+완료되는 순서대로 결과를 JSONL로 기록한 뒤 처리량/지연 시간 요약을 출력
+
+    python batch_runner.py prompts.jsonl -o results.jsonl --parallelism 8 --hosts hosts.json
+
+입력 한 줄 형식 (input 대신 prompt도 허용, 나머지는 선택):
+
+    {"id": "disk-web01", "input": "디스크 사용량을 점검해줘", "host": "web01", "mode": "react", "max_iterations": 5}
+
+host는 --hosts 파일의 이름 또는 접속 정보 객체({"ip", "port", "username", "password"})이며,
+생략하면 --default-host를 사용
+hosts 파일 형식: {"web01": {"ip": "10.0.0.12", "port": 22, "username": "ops", "password": "..."}}
+"""
+import sys
+import json
+import time
+import argparse
+import threading
+from contextlib import redirect_stdout
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional
+
+from agent_v2 import ReactAgentV2, ReasoningCallback
+from config.server_config import ServerConfig
+from core.model import LLMClient
+from core.metrics import DEFAULT_METRICS_HOST, percentile, start_metrics_server
+from core.tracing import tracer_from_env
+from core.intent_router import IntentRouter
+from tools.tools_manager import ToolsManager
+from tools.remote_session import TransportPool, set_transport_pool, get_transport_pool
+
+
+class QuietCallback(ReasoningCallback):
+    """진행 상황을 출력하지 않는 콜백 (일괄 실행에서는 결과 파일만 사용)"""
+
+    def on_iteration_start(self, iteration: int, max_iterations: int):
+        pass
+
+    def on_reasoning(self, iteration: int, thought: str):
+        pass
+
+    def on_tool_call(self, iteration: int, tool: str, arguments: Dict[str, Any]):
+        pass
+
+    def on_tool_result(self, iteration: int, tool: str, result: str, success: bool):
+        pass
+
+    def on_observation(self, iteration: int, observation: str):
+        pass
+
+    def on_iteration_end(self, iteration: int):
+        pass
+
+    def on_final_result(self, result: str, iterations: int):
+        pass
+
+    def on_error(self, iteration: int, error: str):
+        pass
+
+
+def load_prompts(path: str, repeat: int = 1) -> List[Dict[str, Any]]:
+    """
+    프롬프트 JSONL 파일 로드
+
+    Args:
+        path: 입력 파일 경로 ("-"이면 표준 입력)
+        repeat: 각 프롬프트 반복 횟수 (부하 테스트용)
+
+    Returns:
+        List[Dict]: 프롬프트 목록 (id가 없으면 줄 번호로 부여)
+
+    Raises:
+        ValueError: JSON 형식이 아니거나 input/prompt가 없는 줄이 있는 경우
+    """
+    stream = sys.stdin if path == "-" else open(path, "r", encoding="utf-8")
+    prompts = []
+    try:
+        for line_number, line in enumerate(stream, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_number}: JSON 형식이 아닙니다 ({e})")
+            user_input = entry.get("input") or entry.get("prompt")
+            if not isinstance(user_input, str) or not user_input.strip():
+                raise ValueError(f"{path}:{line_number}: input 또는 prompt가 필요합니다")
+            entry["input"] = user_input
+            entry.setdefault("id", str(line_number))
+            prompts.append(entry)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+    if repeat > 1:
+        prompts = [
+            dict(entry, id=f"{entry['id']}#{index}")
+            for index in range(repeat)
+            for entry in prompts
+        ]
+    return prompts
+
+
+def resolve_host(entry: Dict[str, Any], hosts: Dict[str, Dict[str, Any]], default_host: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    프롬프트의 대상 서버 접속 정보
+
+    Args:
+        entry: 프롬프트 항목
+        hosts: 이름별 접속 정보
+        default_host: host가 없을 때 사용할 이름
+
+    Returns:
+        Optional[Dict]: 접속 정보 (대상 서버가 없으면 None)
+
+    Raises:
+        KeyError: hosts 파일에 없는 이름인 경우
+    """
+    host = entry.get("host", default_host)
+    if host is None:
+        return None
+    if isinstance(host, dict):
+        info = host
+    elif host in hosts:
+        info = hosts[host]
+    else:
+        raise KeyError(f"알 수 없는 호스트입니다: {host}")
+    return {
+        "ip": info["ip"],
+        "port": int(info.get("port", 22)),
+        "username": info["username"],
+        "password": info.get("password")
+    }
+
+
+def host_label(entry: Dict[str, Any], default_host: Optional[str]) -> Optional[str]:
+    """결과에 기록할 대상 서버 표시 (비밀번호 제외)"""
+    host = entry.get("host", default_host)
+    if isinstance(host, dict):
+        return f"{host.get('username')}@{host.get('ip')}:{host.get('port', 22)}"
+    return host
+
+
+class BatchRunner:
+    """
+    공유 자원으로 프롬프트를 병렬 실행하는 일괄 실행기
+
+    LLM 클라이언트와 도구 매니저는 모든 실행이 공유하고(SSH 연결은 TransportPool로 재사용),
+    프롬프트마다 새 ReactAgentV2를 만들어 대화 상태만 분리
+    """
+
+    def __init__(
+        self,
+        endpoint: str = "http://localhost:11434",
+        model: str = "gpt-oss:20b",
+        parallelism: int = 4,
+        llm_concurrency: Optional[int] = None,
+        hosts: Optional[Dict[str, Dict[str, Any]]] = None,
+        default_host: Optional[str] = None,
+        max_iterations: int = 10,
+        run_timeout: Optional[float] = None,
+        include_log: bool = False,
+        tool_top_k: Optional[int] = None,
+        fast_path: bool = False
+    ):
+        """
+        BatchRunner 초기화
+
+        Args:
+            endpoint: LLM 서버 엔드포인트
+            model: 사용할 모델명
+            parallelism: 동시에 실행할 프롬프트 수
+            llm_concurrency: LLM 백엔드 동시 요청 한도 (기본값: parallelism)
+            hosts: 이름별 접속 정보
+            default_host: host가 없는 프롬프트의 대상 서버 이름
+            max_iterations: 프롬프트별 기본 최대 반복 횟수
+            run_timeout: 프롬프트별 제한 시간 (초)
+            include_log: 결과에 실행 로그(execution_log) 포함 여부
+            tool_top_k: 지정 시 프롬프트와 관련 있는 상위 K개 도구 스키마만 LLM에 전달
+            fast_path: 단순 진단 프롬프트를 LLM 없이 바로 처리할지 여부
+        """
+        self.parallelism = parallelism
+        self.hosts = hosts or {}
+        self.default_host = default_host
+        self.max_iterations = max_iterations
+        self.run_timeout = run_timeout
+        self.include_log = include_log
+        self.tool_top_k = tool_top_k
+        self.intent_router = IntentRouter() if fast_path else None
+
+        self.llm_client = LLMClient(endpoint=endpoint, model=model, max_concurrency=llm_concurrency or parallelism)
+        # 결과를 표준 출력으로 내보낼 수 있으므로 도구 로딩 메시지는 표준 오류로 출력
+        with redirect_stdout(sys.stderr):
+            self.tools_manager = ToolsManager()
+        self.tracer = tracer_from_env()
+
+    def run_one(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        프롬프트 1개 실행
+
+        Args:
+            entry: 프롬프트 항목
+
+        Returns:
+            Dict: 결과 레코드 (id, host, success, stop_reason, latency 등)
+        """
+        record = {
+            "id": entry["id"],
+            "input": entry["input"],
+            "host": host_label(entry, self.default_host),
+            "started_at": time.time()
+        }
+        start_time = time.perf_counter()
+        try:
+            connection_info = resolve_host(entry, self.hosts, self.default_host)
+            agent = ReactAgentV2(
+                callback=QuietCallback(),
+                verbose=False,
+                max_iterations=int(entry.get("max_iterations") or self.max_iterations),
+                run_timeout=self.run_timeout,
+                mode=entry.get("mode", "react"),
+                tracer=self.tracer,
+                llm_client=self.llm_client,
+                tools_manager=self.tools_manager,
+                tool_top_k=self.tool_top_k,
+                intent_router=self.intent_router
+            )
+            with ServerConfig.bind_connection_info(connection_info or {}):
+                result = agent.run(entry["input"])
+        except KeyError as e:
+            result = {"success": False, "error": e.args[0] if e.args else str(e), "stop_reason": "error"}
+        except Exception as e:
+            result = {"success": False, "error": str(e), "stop_reason": "error"}
+
+        record.update({
+            "success": bool(result.get("success")),
+            "stop_reason": result.get("stop_reason"),
+            "latency": round(time.perf_counter() - start_time, 3),
+            "iterations": result.get("iterations", 0),
+            "tools_used": result.get("tools_used", []),
+            "token_usage": result.get("token_usage"),
+            "result": result.get("result"),
+            "error": result.get("error")
+        })
+        if self.include_log:
+            record["execution_log"] = result.get("execution_log", [])
+        return record
+
+    def run(self, prompts: List[Dict[str, Any]], output) -> Dict[str, Any]:
+        """
+        프롬프트 목록 병렬 실행 - 완료되는 순서대로 결과를 output에 한 줄씩 기록
+
+        Args:
+            prompts: 프롬프트 목록
+            output: 결과를 쓸 텍스트 스트림
+
+        Returns:
+            Dict: 실행 요약 (summarize 결과)
+        """
+        records = []
+        write_lock = threading.Lock()
+        start_time = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.parallelism, thread_name_prefix="batch") as executor:
+            futures = [executor.submit(self.run_one, entry) for entry in prompts]
+            for future in as_completed(futures):
+                record = future.result()
+                records.append(record)
+                with write_lock:
+                    output.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+                    output.flush()
+
+        return summarize(records, time.perf_counter() - start_time)
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        return f"BatchRunner(model='{self.llm_client.model}', parallelism={self.parallelism})"
+
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
+
+
+def summarize(records: List[Dict[str, Any]], wall_time: float) -> Dict[str, Any]:
+    """
+    결과 레코드 요약
+
+    Args:
+        records: 결과 레코드 목록
+        wall_time: 전체 소요 시간 (초)
+
+    Returns:
+        Dict: 건수, 처리량, 지연 시간 분포, 중단 사유별 건수, 토큰 합계
+    """
+    latencies = [record["latency"] for record in records]
+    stop_reasons: Dict[str, int] = {}
+    for record in records:
+        reason = record.get("stop_reason") or "unknown"
+        stop_reasons[reason] = stop_reasons.get(reason, 0) + 1
+
+    return {
+        "total": len(records),
+        "succeeded": sum(1 for record in records if record["success"]),
+        "failed": sum(1 for record in records if not record["success"]),
+        "wall_time_s": round(wall_time, 2),
+        "throughput_per_min": round(len(records) / wall_time * 60, 2) if wall_time > 0 else 0.0,
+        "latency_s": {
+            "p50": round(percentile(latencies, 50), 2),
+            "p95": round(percentile(latencies, 95), 2),
+            "max": round(max(latencies), 2) if latencies else 0.0,
+            "mean": round(sum(latencies) / len(latencies), 2) if latencies else 0.0
+        },
+        "stop_reasons": stop_reasons,
+        "total_tokens": sum((record.get("token_usage") or {}).get("total_tokens", 0) for record in records)
+    }
+
+
+def print_summary(summary: Dict[str, Any], stream=sys.stderr):
+    """실행 요약 출력"""
+    latency = summary["latency_s"]
+    print(f"\n{'='*60}", file=stream)
+    print(f"📊 일괄 실행 결과: {summary['succeeded']}/{summary['total']} 성공, {summary['failed']} 실패", file=stream)
+    print(f"   소요 시간 {summary['wall_time_s']}s, 처리량 {summary['throughput_per_min']}건/분", file=stream)
+    print(f"   지연 시간 p50 {latency['p50']}s / p95 {latency['p95']}s / 최대 {latency['max']}s", file=stream)
+    print(f"   중단 사유: {', '.join(f'{reason} {count}' for reason, count in sorted(summary['stop_reasons'].items()))}", file=stream)
+    if summary.get("ssh_pool"):
+        pool = summary["ssh_pool"]
+        print(f"   SSH 연결 재사용 {pool['hits']}회 / 새 연결 {pool['misses']}회", file=stream)
+    print(f"{'='*60}", file=stream)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="프롬프트 JSONL 파일 일괄 실행")
+    parser.add_argument("prompts", help="프롬프트 JSONL 파일 (\"-\"이면 표준 입력)")
+    parser.add_argument("-o", "--output", default="-", help="결과 JSONL 파일 (기본값: 표준 출력)")
+    parser.add_argument("--parallelism", type=int, default=4, help="동시에 실행할 프롬프트 수")
+    parser.add_argument("--llm-concurrency", type=int, help="LLM 백엔드 동시 요청 한도 (기본값: --parallelism)")
+    parser.add_argument("--endpoint", default="http://localhost:11434", help="LLM 서버 엔드포인트")
+    parser.add_argument("--model", default="gpt-oss:20b", help="사용할 모델명")
+    parser.add_argument("--hosts", help="이름별 서버 접속 정보 JSON 파일")
+    parser.add_argument("--default-host", help="host가 없는 프롬프트의 대상 서버 이름")
+    parser.add_argument("--max-iterations", type=int, default=10, help="프롬프트별 기본 최대 반복 횟수")
+    parser.add_argument("--timeout", type=float, help="프롬프트별 제한 시간 (초)")
+    parser.add_argument("--repeat", type=int, default=1, help="각 프롬프트 반복 횟수 (부하 테스트용)")
+    parser.add_argument("--include-log", action="store_true", help="결과에 실행 로그 포함")
+    parser.add_argument("--summary", help="실행 요약을 저장할 JSON 파일")
+    parser.add_argument("--ssh-pool-size", type=int, default=4, help="서버별로 보관할 유휴 SSH 연결 수 (0이면 풀 사용 안 함)")
+    parser.add_argument("--metrics-port", type=int, help="실행 중 Prometheus 지표를 제공할 포트")
+    parser.add_argument("--metrics-host", default=DEFAULT_METRICS_HOST, help="지표 서버 바인딩 주소 (기본값: 127.0.0.1)")
+    parser.add_argument("--tool-top-k", type=int, help="프롬프트와 관련 있는 상위 K개 도구 스키마만 LLM에 전달")
+    parser.add_argument("--fast-path", action="store_true", help="단순 진단 프롬프트는 LLM 없이 도구를 바로 실행하여 응답")
+    args = parser.parse_args(argv)
+
+    try:
+        prompts = load_prompts(args.prompts, args.repeat)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    hosts = {}
+    if args.hosts:
+        with open(args.hosts, "r", encoding="utf-8") as f:
+            hosts = json.load(f)
+
+    if args.ssh_pool_size > 0:
+        set_transport_pool(TransportPool(max_idle_per_key=args.ssh_pool_size))
+    if args.metrics_port:
+        start_metrics_server(args.metrics_port, host=args.metrics_host)
+
+    runner = BatchRunner(
+        endpoint=args.endpoint,
+        model=args.model,
+        parallelism=args.parallelism,
+        llm_concurrency=args.llm_concurrency,
+        hosts=hosts,
+        default_host=args.default_host,
+        max_iterations=args.max_iterations,
+        run_timeout=args.timeout,
+        include_log=args.include_log,
+        tool_top_k=args.tool_top_k,
+        fast_path=args.fast_path
+    )
+    print(f"🚀 {len(prompts)}개 프롬프트 실행 ({runner})", file=sys.stderr)
+
+    output = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        summary = runner.run(prompts, output)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        pool = get_transport_pool()
+        pool_stats = pool.stats() if pool else None
+        set_transport_pool(None)
+
+    summary["ssh_pool"] = pool_stats
+    print_summary(summary)
+    if args.summary:
+        with open(args.summary, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+    return 0 if summary["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,186 @@
+"""
+벤치마크용 OpenAI 호환 가짜 LLM 서버
+시나리오 스크립트에 따라 도구 호출/최종 응답을 반환하고, TTFT와 토큰 생성 속도로 지연 시간을 흉내냄
+"""
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional
+
+
+class FakeLLMServer:
+    """
+    OpenAI 호환 /v1/chat/completions 스텁 서버
+
+    요청에 포함된 assistant 메시지 수로 현재 단계를 판단하여 스크립트의 해당 응답을 반환
+    (상태를 저장하지 않으므로 여러 에이전트가 동시에 사용해도 됨)
+    도구 스키마 없이 호출되면 plan 모드의 계획 요청으로 보고 plan 응답을 반환
+    """
+
+    def __init__(
+        self,
+        script: List[Dict[str, Any]],
+        plan: Optional[Dict[str, Any]] = None,
+        ttft: float = 0.05,
+        tokens_per_second: float = 50.0,
+        prefill_tokens_per_second: Optional[float] = None,
+        host: str = "127.0.0.1",
+        port: int = 0
+    ):
+        """
+        FakeLLMServer 초기화
+
+        Args:
+            script: 단계별 응답 목록 - {"content": str, "tool_calls": [{"name", "arguments"}], "completion_tokens": int}
+            plan: plan 모드 계획 요청에 반환할 계획 JSON
+            ttft: 첫 토큰까지의 지연 시간 (초)
+            tokens_per_second: 출력 토큰 생성 속도
+            prefill_tokens_per_second: 입력 토큰 처리 속도 (지정 시 프롬프트 길이에 비례하는 지연 추가 - CPU 추론 모의)
+            host: 바인딩 주소
+            port: 바인딩 포트 (0이면 임의 포트)
+        """
+        self.script = script
+        self.plan = plan
+        self.ttft = ttft
+        self.tokens_per_second = tokens_per_second
+        self.prefill_tokens_per_second = prefill_tokens_per_second
+        self.prompt_tokens: List[int] = []  # 요청별 입력 토큰 수 (추정)
+
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def endpoint(self) -> str:
+        """에이전트에 전달할 엔드포인트 (OpenAI 클라이언트가 /v1을 붙임)"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip("/") in ("/v1/models", "/api/tags"):
+                    self._send_json({"object": "list", "data": [{"id": "fake", "object": "model"}], "models": []})
+                else:
+                    self._send_json({"error": "not found"}, status=404)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(length) or b"{}")
+                if self.path.rstrip("/") != "/v1/chat/completions":
+                    self._send_json({"error": "not found"}, status=404)
+                    return
+                self._send_json(server.complete(request))
+
+            def _send_json(self, payload: Dict[str, Any], status: int = 200):
+                body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def complete(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        채팅 완료 요청 처리
+
+        Args:
+            request: OpenAI chat.completions 요청 본문
+
+        Returns:
+            Dict: chat.completion 응답 본문
+        """
+        with self._lock:
+            self.requests += 1
+
+        messages = request.get("messages", [])
+        step = sum(1 for message in messages if message.get("role") == "assistant")
+
+        if not request.get("tools") and self.plan is not None:
+            content = json.dumps(self.plan, ensure_ascii=False)
+            entry = {"content": content}
+        else:
+            entry = self.script[min(step, len(self.script) - 1)]
+            content = entry.get("content") or ""
+
+        tool_calls = [
+            {
+                "id": f"call_{step}_{index}",
+                "type": "function",
+                "function": {
+                    "name": call["name"],
+                    "arguments": json.dumps(call.get("arguments", {}), ensure_ascii=False)
+                }
+            }
+            for index, call in enumerate(entry.get("tool_calls", []))
+        ]
+
+        # 출력 토큰 수 (명시값 우선, 없으면 4자당 1토큰으로 추정)
+        completion_tokens = entry.get("completion_tokens") or max(
+            1, (len(content) + sum(len(call["function"]["arguments"]) + 16 for call in tool_calls)) // 4
+        )
+        # 입력 토큰 수 (메시지 + 도구 스키마, 4자당 1토큰으로 추정)
+        prompt_chars = sum(len(str(message.get("content") or "")) for message in messages)
+        prompt_chars += len(json.dumps(request.get("tools") or [], ensure_ascii=False))
+        prompt_tokens = prompt_chars // 4
+        with self._lock:
+            self.prompt_tokens.append(prompt_tokens)
+
+        prefill = prompt_tokens / self.prefill_tokens_per_second if self.prefill_tokens_per_second else 0.0
+        time.sleep(self.ttft + prefill + completion_tokens / self.tokens_per_second)
+
+        message = {"role": "assistant", "content": content or None}
+        if tool_calls:
+            message["tool_calls"] = tool_calls
+
+        return {
+            "id": f"chatcmpl-fake-{self.requests}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "fake"),
+            "choices": [{
+                "index": 0,
+                "message": message,
+                "finish_reason": "tool_calls" if tool_calls else "stop"
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+        }
+
+    def start(self) -> "FakeLLMServer":
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-llm", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """서버 종료"""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeLLMServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        return f"FakeLLMServer(endpoint='{self.endpoint}', ttft={self.ttft}, tokens_per_second={self.tokens_per_second})"
+
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
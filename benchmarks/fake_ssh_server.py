@@ -0,0 +1,254 @@
+"""
+벤치마크용 paramiko SSH 서버 스텁
+비밀번호 인증과 exec 요청만 지원하며, 명령별 고정 출력을 지연 시간과 함께 반환
+"""
+import re
+import socket
+import logging
+import threading
+import time
+import paramiko
+from typing import Dict, Optional
+
+
+# 명령어(첫 단어)별 고정 출력
+CANNED_OUTPUTS = {
+    "uname": "Linux bench-host 6.1.0-18-amd64 #1 SMP PREEMPT_DYNAMIC Debian 6.1.76-1 x86_64 GNU/Linux",
+    "uptime": " 10:42:01 up 12 days,  3:14,  2 users,  load average: 0.42, 0.37, 0.31",
+    "free": (
+        "               total        used        free      shared  buff/cache   available\n"
+        "Mem:            15Gi       4.2Gi       6.1Gi       312Mi       5.1Gi        10Gi\n"
+        "Swap:          2.0Gi          0B       2.0Gi"
+    ),
+    "df": (
+        "Filesystem      Size  Used Avail Use% Mounted on\n"
+        "/dev/sda1        98G   41G   52G  45% /\n"
+        "tmpfs           7.8G     0  7.8G   0% /dev/shm\n"
+        "/dev/sdb1       492G  310G  157G  67% /data"
+    ),
+    "lscpu": (
+        "Architecture:            x86_64\n"
+        "CPU(s):                  8\n"
+        "Model name:              Intel(R) Xeon(R) CPU E5-2680 v4 @ 2.40GHz\n"
+        "Thread(s) per core:      2"
+    ),
+    "ps": "\n".join(
+        ["USER         PID %CPU %MEM    VSZ   RSS TTY      STAT START   TIME COMMAND"]
+        + [f"app       {1000 + i:5d}  {i % 7}.{i % 10}  1.{i % 9} 812344 92120 ?   Ssl  Jan01   1:{i:02d} /usr/bin/worker --id {i}" for i in range(19)]
+    ),
+    "top": "top - 10:42:01 up 12 days,  3:14,  2 users,  load average: 0.42, 0.37, 0.31\nTasks: 212 total,   1 running, 211 sleeping",
+    "pstree": "systemd(1)-+-sshd(812)---sshd(4120)---bash(4121)\n           `-worker(1000)-+-{worker}(1001)",
+    "ip": "1: lo: <LOOPBACK,UP,LOWER_UP> mtu 65536\n    inet 127.0.0.1/8 scope host lo\n2: eth0: <BROADCAST,MULTICAST,UP,LOWER_UP> mtu 1500\n    inet 10.0.0.12/24 brd 10.0.0.255 scope global eth0",
+    "netstat": "\n".join(
+        ["Proto Recv-Q Send-Q Local Address           Foreign Address         State"]
+        + [f"tcp        0      0 0.0.0.0:{8000 + i}            0.0.0.0:*               LISTEN" for i in range(12)]
+    ),
+    "ss": "Netid State  Recv-Q Send-Q Local Address:Port Peer Address:Port\ntcp   LISTEN 0      128    0.0.0.0:22         0.0.0.0:*",
+    "systemctl": "\n".join(
+        ["UNIT                      LOAD   ACTIVE SUB     DESCRIPTION"]
+        + [f"service-{i}.service       loaded active running Bench service {i}" for i in range(15)]
+    ),
+    "docker": "CONTAINER ID   IMAGE          COMMAND                  STATUS          NAMES\n3f2a1b9c8d7e   nginx:1.25     \"/docker-entrypoint.…\"   Up 3 days       web",
+    "kubectl": "NAMESPACE     NAME                     READY   STATUS    RESTARTS   AGE\nkube-system   coredns-5d78c9869d-abcde 1/1     Running   0          12d",
+    "which": "/usr/bin/tool",
+}
+
+# 클라이언트가 연결을 끊을 때마다 남는 서버 측 전송 계층 로그는 출력하지 않음
+_LOG_CHANNEL = "benchmarks.fake_ssh_server"
+logging.getLogger(_LOG_CHANNEL).setLevel(logging.CRITICAL)
+
+# 도구들이 사용하는 배치 명령 형식: echo "SECTION_START:..." && (cmd) 2>&1 && echo "SECTION_END:$?"
+_ECHO_PATTERN = re.compile(r'^echo\s+"(.*)"$')
+_SUBSHELL_PATTERN = re.compile(r'^\((.*)\)\s*2>&1$')
+
+
+class _StubServer(paramiko.ServerInterface):
+    """단일 연결에 대한 paramiko 서버 인터페이스"""
+
+    def __init__(self, owner: "FakeSSHServer"):
+        self.owner = owner
+
+    def get_allowed_auths(self, username):
+        return "password"
+
+    def check_auth_password(self, username, password):
+        if username == self.owner.username and password == self.owner.password:
+            return paramiko.AUTH_SUCCESSFUL
+        return paramiko.AUTH_FAILED
+
+    def check_channel_request(self, kind, chanid):
+        if kind == "session":
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+    def check_channel_exec_request(self, channel, command):
+        threading.Thread(
+            target=self.owner._respond,
+            args=(channel, command.decode("utf-8", errors="replace")),
+            daemon=True
+        ).start()
+        return True
+
+
+class FakeSSHServer:
+    """
+    paramiko 기반 SSH 서버 스텁
+
+    명령 첫 단어로 고정 출력을 찾아 반환하며, 도구들의 배치 명령(SECTION 마커)도 해석
+    연결 지연(connect_delay)과 명령 실행 지연(command_delay)을 주입할 수 있음
+    """
+
+    def __init__(
+        self,
+        outputs: Optional[Dict[str, str]] = None,
+        command_delay: float = 0.0,
+        connect_delay: float = 0.0,
+        output_scale: int = 1,
+        username: str = "bench",
+        password: str = "bench",
+        host: str = "127.0.0.1",
+        port: int = 0
+    ):
+        """
+        FakeSSHServer 초기화
+
+        Args:
+            outputs: 명령 첫 단어별 출력 (기본값: CANNED_OUTPUTS)
+            command_delay: exec 요청 1회당 응답 지연 (초)
+            connect_delay: 연결 수락 후 SSH 핸드셰이크 시작 전 지연 (초)
+            output_scale: 출력 반복 배수 (대용량 출력 시뮬레이션)
+            username: 허용할 사용자명
+            password: 허용할 비밀번호
+            host: 바인딩 주소
+            port: 바인딩 포트 (0이면 임의 포트)
+        """
+        self.outputs = outputs if outputs is not None else CANNED_OUTPUTS
+        self.command_delay = command_delay
+        self.connect_delay = connect_delay
+        self.output_scale = max(1, output_scale)
+        self.username = username
+        self.password = password
+
+        self.host_key = paramiko.RSAKey.generate(2048)
+        self.commands = 0
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind((host, port))
+        self._socket.listen(64)
+        self._socket.settimeout(0.5)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def connection_info(self) -> Dict[str, object]:
+        """에이전트 도구에 전달할 접속 정보"""
+        host, port = self._socket.getsockname()[:2]
+        return {"ip": host, "port": port, "username": self.username, "password": self.password}
+
+    def render(self, command: str) -> str:
+        """
+        명령에 대한 출력 생성
+
+        Args:
+            command: exec 요청 명령
+
+        Returns:
+            str: 표준 출력 내용
+        """
+        parts = [part.strip() for part in command.split(" && ")]
+        if len(parts) > 1 and any(_ECHO_PATTERN.match(part) for part in parts):
+            lines = []
+            for part in parts:
+                echo = _ECHO_PATTERN.match(part)
+                subshell = _SUBSHELL_PATTERN.match(part)
+                if echo:
+                    lines.append(echo.group(1).replace("$?", "0"))
+                elif subshell:
+                    lines.append(self._lookup(subshell.group(1)))
+                else:
+                    lines.append(self._lookup(part))
+            return "\n".join(lines) + "\n"
+        return self._lookup(command) + "\n"
+
+    def _lookup(self, command: str) -> str:
+        """명령 첫 단어로 고정 출력 조회"""
+        words = command.split()
+        output = self.outputs.get(words[0], f"{words[0]}: ok") if words else ""
+        return "\n".join([output] * self.output_scale)
+
+    def _respond(self, channel: paramiko.Channel, command: str):
+        """exec 요청 응답 (지연 후 출력 전송, 종료 코드 0)"""
+        with self._lock:
+            self.commands += 1
+        try:
+            # exec 요청 성공 응답은 이 스레드 시작 직후 transport 스레드가 보내므로,
+            # 그보다 먼저 채널을 닫지 않도록 최소한의 지연을 둠
+            time.sleep(max(self.command_delay, 0.001))
+            channel.sendall(self.render(command).encode("utf-8"))
+            channel.send_exit_status(0)
+            channel.close()
+        except Exception:
+            # 클라이언트가 먼저 연결을 끊은 경우 (취소/시간 초과)
+            pass
+
+    def _serve(self):
+        """연결 수락 루프"""
+        while not self._stopped.is_set():
+            try:
+                client, _ = self._socket.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            threading.Thread(target=self._handle, args=(client,), daemon=True).start()
+
+    def _handle(self, client: socket.socket):
+        """연결 1개 처리 - SSH 전송 계층 시작 후 채널 수락"""
+        if self.connect_delay:
+            time.sleep(self.connect_delay)
+        # 작은 패킷이 Nagle/지연 ACK로 묶여 수십 ms씩 지연되지 않도록 함 (실제 sshd와 동일)
+        client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        transport = paramiko.Transport(client)
+        transport.set_log_channel(_LOG_CHANNEL)
+        transport.add_server_key(self.host_key)
+        try:
+            transport.start_server(server=_StubServer(self))
+            # 수락한 채널은 참조가 사라지면 닫히므로 연결이 끝날 때까지 보관
+            channels = []
+            while transport.is_active() and not self._stopped.is_set():
+                channel = transport.accept(0.5)
+                if channel is not None:
+                    channels = [open_channel for open_channel in channels if not open_channel.closed]
+                    channels.append(channel)
+        except Exception:
+            pass
+        finally:
+            transport.close()
+
+    def start(self) -> "FakeSSHServer":
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self._serve, name="fake-ssh", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """서버 종료"""
+        self._stopped.set()
+        self._socket.close()
+
+    def __enter__(self) -> "FakeSSHServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        info = self.connection_info
+        return f"FakeSSHServer({info['username']}@{info['ip']}:{info['port']}, command_delay={self.command_delay})"
+
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
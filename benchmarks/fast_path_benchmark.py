@@ -0,0 +1,277 @@
+"""
+단순 진단 요청 빠른 경로(IntentRouter) 벤치마크
+
+- 판별 정확도: 라벨링된 요청 모음에 대해 의도 판별 결과, 오판별(빠른 경로로 가면 안 되는 요청을 판별한 경우), 판별 시간
+- 출력 처리 확인: 실제 명령 출력 샘플의 요약 결과와 실패 출력(오류 메시지, stderr, 빈 출력)의 폴백 판별
+  판별 오류나 출력 처리 불일치가 있으면 종료 코드 1
+- 지연 시간: 가짜 LLM 서버(CPU 추론 모의: TTFT, 출력/입력 토큰 속도)와 SSH 서버 스텁으로
+  일반 ReAct 실행(도구 선택 + 보고서 LLM 호출 2회) / 빠른 경로 + 템플릿(LLM 0회) / 빠른 경로 + LLM 요약(1회) 비교
+
+사용법:
+    python -m benchmarks.fast_path_benchmark
+    python -m benchmarks.fast_path_benchmark --repeats 10 --ttft 0.5 --tokens-per-second 20 --prefill-tps 200
+"""
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+from contextlib import redirect_stdout
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+from agent_v2 import ReactAgentV2
+from config.server_config import ServerConfig
+from core.intent_router import IntentRouter, DEFAULT_INTENTS, is_failed_output
+from core.metrics import percentile
+from tools.tools_manager import ToolsManager
+from benchmarks.fake_llm_server import FakeLLMServer
+from benchmarks.fake_ssh_server import FakeSSHServer
+from benchmarks.run_benchmarks import RESULTS_DIR, summarize, git_revision
+
+
+# (요청, 기대 의도) - None은 빠른 경로로 처리하면 안 되는 요청
+ROUTING_CASES = [
+    ("메모리 사용량 보여줘", "memory"),
+    ("램 얼마나 남았어", "memory"),
+    ("check memory usage", "memory"),
+    ("디스크 확인", "disk"),
+    ("디스크 용량 얼마나 남았어?", "disk"),
+    ("스토리지 사용률", "disk"),
+    ("실패한 서비스", "failed_services"),
+    ("실패한 서비스 있어?", "failed_services"),
+    ("list failed systemd units", "failed_services"),
+    ("가동 시간 알려줘", "load"),
+    ("CPU 많이 쓰는 프로세스 찾아줘", "top_cpu"),
+    ("열려 있는 포트 목록", "listening_ports"),
+    ("도커 컨테이너 상태 확인", "containers"),
+    ("서버 상태를 점검해줘", None),
+    ("서버가 느린 원인을 종합적으로 분석해줘", None),
+    ("디스크와 메모리, 부하를 차례로 확인해줘", None),
+    ("메모리 사용량과 디스크 확인", None),
+    ("실패한 서비스 재시작해줘", None),
+    ("디스크가 왜 가득 찼는지 알려줘", None),
+    ("nginx 로그 마지막 100줄 보여줘", None),
+    ("메모리 누수 있는지 봐줘", None),
+    ("디스크가 가득 찼어", None),
+    ("쿠버네티스 파드가 재시작되는 이유", None),
+    ("메모리 누수가 의심되는 프로세스를 찾아서 원인을 분석하고 조치 방법을 알려줘", None),
+]
+
+# 실제 서버에서 수집한 명령 출력 샘플 (의도, 출력, 기대 요약)
+SYSTEMCTL_FAILED_OUTPUT = """  UNIT                         LOAD   ACTIVE SUB    DESCRIPTION
+● nginx.service                loaded failed failed A high performance web server and a reverse proxy server
+● postgresql@14-main.service   loaded failed failed PostgreSQL Cluster 14-main
+
+LOAD   = Reflects whether the unit definition was properly loaded.
+ACTIVE = The high-level unit activation state, i.e. generalization of SUB.
+SUB    = The low-level unit activation state, values depend on unit type.
+2 loaded units listed.
+"""
+SYSTEMCTL_CLEAN_OUTPUT = """  UNIT LOAD ACTIVE SUB DESCRIPTION
+0 loaded units listed.
+"""
+SUMMARY_CASES = [
+    ("failed_services", SYSTEMCTL_FAILED_OUTPUT, "⚠️ 실패한 서비스 2개: nginx.service, postgresql@14-main.service"),
+    ("failed_services", SYSTEMCTL_FAILED_OUTPUT.replace("● ", "* "), "⚠️ 실패한 서비스 2개: nginx.service, postgresql@14-main.service"),
+    ("failed_services", SYSTEMCTL_CLEAN_OUTPUT, "실패한 서비스가 없습니다."),
+    (
+        "memory",
+        "               total        used        free      shared  buff/cache   available\n"
+        "Mem:            15Gi       4.2Gi       6.1Gi       312Mi       5.1Gi        10Gi\n"
+        "Swap:          2.0Gi          0B       2.0Gi\n",
+        "메모리: 전체 15Gi, 사용 4.2Gi, 사용 가능 10Gi\n스왑: 전체 2.0Gi, 사용 0B"
+    ),
+]
+
+# (도구 출력, 실패로 판별해야 하는지)
+FAILURE_CASES = [
+    ("실행 결과:\n\n에러:\nbash: line 1: docker: command not found\n", True),
+    ("실행 결과:\n\n에러:\nbash: systemctl: command not found\n", True),
+    ("연결 오류: timed out", True),
+    ("❌ 연결 오류: Authentication failed.", True),
+    ("Error: Server connection information not configured.", True),
+    ('{"error": "도구 실행 중 오류가 발생했습니다: boom"}', True),
+    ("", True),
+    ("0 loaded units listed.\n", False),
+    (" 10:15:01 up 12 days,  3:04,  2 users,  load average: 0.15, 0.10, 0.05", False),
+]
+
+# 지연 시간 측정 요청
+LATENCY_QUERIES = ["메모리 사용량 보여줘", "디스크 확인", "실패한 서비스"]
+
+
+def measure_routing(router: IntentRouter) -> Dict[str, Any]:
+    """
+    라벨링된 요청 모음에 대한 판별 정확도와 판별 시간
+
+    Returns:
+        Dict: 정확도, 빠른 경로 처리율, 오판별 목록, 판별 시간
+    """
+    correct, routed, false_routes, misses, durations = 0, 0, [], [], []
+    for query, expected in ROUTING_CASES:
+        start_time = time.perf_counter()
+        match = router.match(query)
+        durations.append(time.perf_counter() - start_time)
+        actual = match.intent.name if match else None
+        routed += actual is not None
+        if actual == expected:
+            correct += 1
+        elif expected is None:
+            false_routes.append({"query": query, "intent": actual})
+        else:
+            misses.append({"query": query, "expected": expected, "actual": actual})
+    return {
+        "cases": len(ROUTING_CASES),
+        "accuracy": round(correct / len(ROUTING_CASES), 3),
+        "routed": routed,
+        "false_routes": false_routes,
+        "misses": misses,
+        "match_time": {
+            "p50_us": round(percentile(durations, 50) * 1e6, 1),
+            "p95_us": round(percentile(durations, 95) * 1e6, 1)
+        }
+    }
+
+
+def check_outputs() -> Dict[str, Any]:
+    """
+    실제 명령 출력 샘플의 요약과 실패 출력 판별 확인
+
+    Returns:
+        Dict: 확인 수와 불일치 목록
+    """
+    intents = {intent.name: intent for intent in DEFAULT_INTENTS}
+    mismatches = []
+    for name, output, expected in SUMMARY_CASES:
+        actual = intents[name].summarize(output)
+        if actual != expected:
+            mismatches.append({"intent": name, "expected": expected, "actual": actual})
+    for output, expected in FAILURE_CASES:
+        if is_failed_output(output) != expected:
+            mismatches.append({"output": output[:60], "expected_failure": expected})
+    return {"cases": len(SUMMARY_CASES) + len(FAILURE_CASES), "mismatches": mismatches}
+
+
+def measure_latency(manager: ToolsManager, router: IntentRouter, args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    요청별 일반 실행 / 빠른 경로(템플릿) / 빠른 경로(LLM 요약) 지연 시간
+
+    Returns:
+        Dict: 요청 → 방식 → 지연 통계와 LLM 호출 수
+    """
+    modes = {
+        "react": None,
+        "fast_template": IntentRouter(router.intents, router.classifier),
+        "fast_llm_summary": IntentRouter(router.intents, router.classifier, summarize_with_llm=True),
+    }
+    results = {}
+    for query in LATENCY_QUERIES:
+        intent = router.match(query).intent
+        # 일반 실행: 도구 선택 → 보고서 작성
+        script = [
+            {"content": "요청한 정보를 확인합니다.", "tool_calls": [{"name": intent.tool, "arguments": intent.arguments}]},
+            {"content": f"## {intent.title}\n확인 결과 특이사항이 없습니다.", "completion_tokens": 120},
+        ]
+        llm_server = FakeLLMServer(
+            script, ttft=args.ttft, tokens_per_second=args.tokens_per_second, prefill_tokens_per_second=args.prefill_tps
+        )
+        ssh_server = FakeSSHServer(command_delay=args.command_delay)
+        results[query] = {}
+        with llm_server, ssh_server, redirect_stdout(io.StringIO()):
+            for mode, mode_router in modes.items():
+                agent = ReactAgentV2(
+                    endpoint=llm_server.endpoint,
+                    model="gpt-oss:20b",
+                    verbose=False,
+                    tools_manager=manager,
+                    intent_router=mode_router
+                )
+                samples, calls = [], []
+                with ServerConfig.bind_connection_info(ssh_server.connection_info):
+                    for _ in range(args.repeats):
+                        agent.reset()
+                        requests_before = llm_server.requests
+                        start_time = time.perf_counter()
+                        agent.run(query)
+                        samples.append(time.perf_counter() - start_time)
+                        calls.append(llm_server.requests - requests_before)
+                results[query][mode] = {"latency": summarize(samples), "llm_calls": max(calls)}
+    return results
+
+
+def print_report(report: Dict[str, Any]):
+    """결과 요약 표 출력"""
+    routing = report["routing"]
+    print(f"\n판별 정확도 {routing['accuracy']:.1%} ({routing['cases']}개 요청, 빠른 경로 {routing['routed']}개), "
+          f"판별 시간 p50/p95 {routing['match_time']['p50_us']}/{routing['match_time']['p95_us']} µs")
+    for false_route in routing["false_routes"]:
+        print(f"  ❌ 오판별: {false_route['query']} → {false_route['intent']}")
+    for miss in routing["misses"]:
+        print(f"  ⚠️ 미판별: {miss['query']} (기대 {miss['expected']}, 결과 {miss['actual']})")
+
+    outputs = report["outputs"]
+    print(f"출력 처리 확인 {outputs['cases'] - len(outputs['mismatches'])}/{outputs['cases']}")
+    for mismatch in outputs["mismatches"]:
+        print(f"  ❌ 불일치: {mismatch}")
+
+    meta = report["meta"]
+    print(f"\n지연 시간 p50 ms (TTFT {meta['ttft']}s, 출력 {meta['tokens_per_second']} tok/s, prefill {meta['prefill_tps']} tok/s)")
+    print(f"{'요청':<24} {'react':>12} {'fast(템플릿)':>14} {'fast(LLM 요약)':>16}")
+    for query, modes in report["latency"].items():
+        print(
+            f"{query:<24} {modes['react']['latency']['p50_ms']:>12} "
+            f"{modes['fast_template']['latency']['p50_ms']:>14} {modes['fast_llm_summary']['latency']['p50_ms']:>16}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="단순 진단 요청 빠른 경로 벤치마크")
+    parser.add_argument("--repeats", type=int, default=5, help="요청/방식별 반복 횟수")
+    parser.add_argument("--ttft", type=float, default=0.5, help="가짜 LLM 첫 토큰 지연 (초)")
+    parser.add_argument("--tokens-per-second", type=float, default=20.0, help="가짜 LLM 출력 토큰 속도")
+    parser.add_argument("--prefill-tps", type=float, default=500.0, help="가짜 LLM 입력 토큰 처리 속도")
+    parser.add_argument("--command-delay", type=float, default=0.02, help="SSH 명령 실행 지연 (초)")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본값: benchmarks/results/fast-path-<시각>-<커밋>.json)")
+    args = parser.parse_args(argv)
+
+    with redirect_stdout(io.StringIO()):
+        manager = ToolsManager()
+    router = IntentRouter()
+
+    revision = git_revision()
+    report = {
+        "meta": {
+            **revision,
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeats": args.repeats,
+            "ttft": args.ttft,
+            "tokens_per_second": args.tokens_per_second,
+            "prefill_tps": args.prefill_tps,
+            "command_delay": args.command_delay,
+        },
+        "routing": measure_routing(router),
+        "outputs": check_outputs(),
+    }
+    print("지연 시간 측정", file=sys.stderr)
+    report["latency"] = measure_latency(manager, router, args)
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"fast-path-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{revision['commit']}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print_report(report)
+    print(f"\n결과 저장: {output}")
+    failed = report["routing"]["false_routes"] or report["routing"]["misses"] or report["outputs"]["mismatches"]
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
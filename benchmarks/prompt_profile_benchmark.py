@@ -0,0 +1,258 @@
+"""
+시스템 프롬프트 프로필(full / compact / minimal) 비용 및 회귀 확인
+
+- 토큰 수: 프로필별 시스템 프롬프트와 도구 스키마의 토큰 수를 설정된 토크나이저(tiktoken, 없으면 추정)로 세고,
+  입력 토큰 처리 속도(--prefill-tps)에서 LLM 호출당/실행당 줄어드는 prefill 시간 계산
+- 회귀 확인(--cassettes): 기록된 카세트의 사용자 요청마다 프로필별 첫 LLM 호출을 실제 LLM 서버로 보내
+  유효한 도구 호출(존재하는 도구, JSON 인자, 필수 파라미터)과 기록 당시 호출한 도구 일치 여부로 성공률을 비교
+  축약 프로필의 성공률이 full보다 --tolerance 이상 낮으면 종료 코드 1
+
+사용법:
+    python -m benchmarks.prompt_profile_benchmark
+    python -m benchmarks.prompt_profile_benchmark --cassettes cassettes/ --endpoint http://localhost:11434 --model gpt-oss:20b
+"""
+import io
+import os
+import sys
+import json
+import glob
+import argparse
+import platform
+from contextlib import redirect_stdout
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+from agent_v2 import ReactAgentV2, SYSTEM_PROMPT_PROFILES, prompt_profile_for_model
+from core.cassette import Cassette
+from core.model import LLMClient
+from core.tokenizer import count_tokens, tokenizer_name
+from tools.tools_manager import ToolsManager
+from benchmarks.run_benchmarks import RESULTS_DIR, git_revision
+
+
+def build_agent(manager: ToolsManager, profile: str, llm_client: Optional[LLMClient] = None, model: str = "gpt-oss:20b") -> ReactAgentV2:
+    """프로필을 지정한 에이전트 생성 (시스템 프롬프트 렌더링용)"""
+    with redirect_stdout(io.StringIO()):
+        return ReactAgentV2(model=model, llm_client=llm_client, tools_manager=manager, verbose=False, prompt_profile=profile)
+
+
+def measure_tokens(manager: ToolsManager, model: str, prefill_tps: float, calls_per_run: int) -> Dict[str, Any]:
+    """
+    프로필별 LLM 호출당 입력 토큰 수와 prefill 시간
+
+    Returns:
+        Dict: 프로필 → 시스템 프롬프트/스키마/합계 토큰, full 대비 절감량, prefill 시간
+    """
+    schema_tokens = count_tokens(json.dumps(manager.get_tools_schemas(), ensure_ascii=False), model)
+    results = {}
+    for profile in SYSTEM_PROMPT_PROFILES:
+        prompt = build_agent(manager, profile, model=model).system_prompt
+        prompt_tokens = count_tokens(prompt, model)
+        results[profile] = {
+            "system_prompt_chars": len(prompt),
+            "system_prompt_tokens": prompt_tokens,
+            "schema_tokens": schema_tokens,
+            "tokens_per_call": prompt_tokens + schema_tokens
+        }
+
+    full = results["full"]["tokens_per_call"]
+    for entry in results.values():
+        saved = full - entry["tokens_per_call"]
+        entry["saved_tokens_per_call"] = saved
+        entry["saved_pct"] = round(saved / full * 100, 1) if full else 0.0
+        entry["prefill_ms_per_call"] = round(entry["tokens_per_call"] / prefill_tps * 1000, 1)
+        entry["saved_prefill_ms_per_run"] = round(saved * calls_per_run / prefill_tps * 1000, 1)
+    return results
+
+
+def load_corpus(paths: List[str]) -> List[Dict[str, Any]]:
+    """
+    카세트 파일/디렉토리에서 회귀 확인용 요청 목록 수집
+
+    Returns:
+        List[Dict]: {"source", "user_input", "expected"(기록 당시 첫 LLM 응답이 호출한 도구), "profile"}
+    """
+    files = []
+    for path in paths:
+        files.extend(sorted(glob.glob(os.path.join(path, "*.jsonl"))) if os.path.isdir(path) else [path])
+
+    corpus = []
+    for path in files:
+        current = None
+        for interaction in Cassette(path, mode=Cassette.REPLAY).interactions:
+            if interaction["kind"] == Cassette.RUN:
+                if interaction.get("mode", "react") != "react":
+                    current = None
+                    continue
+                current = {
+                    "source": os.path.basename(path),
+                    "user_input": interaction["user_input"],
+                    "expected": None,
+                    "profile": interaction.get("prompt_profile", "full")
+                }
+                corpus.append(current)
+            elif interaction["kind"] == Cassette.LLM and current is not None and current["expected"] is None:
+                message = (interaction.get("result") or {}).get("message") or {}
+                current["expected"] = sorted({call["function"]["name"] for call in message.get("tool_calls") or []})
+    # 첫 LLM 호출이 실패하여 기록되지 않은 실행 제외
+    return [case for case in corpus if case["expected"] is not None]
+
+
+def validate_tool_calls(manager: ToolsManager, tool_calls) -> List[str]:
+    """
+    도구 호출 유효성 검사
+
+    Returns:
+        List[str]: 문제 목록 (비어 있으면 유효)
+    """
+    problems = []
+    for call in tool_calls or []:
+        name = call.function.name
+        if name not in manager.get_available_tools():
+            problems.append(f"알 수 없는 도구: {name}")
+            continue
+        try:
+            arguments = json.loads(call.function.arguments or "{}")
+        except ValueError:
+            problems.append(f"{name}: 인자 JSON 파싱 실패")
+            continue
+        if not isinstance(arguments, dict):
+            problems.append(f"{name}: 인자가 객체가 아님")
+            continue
+        required = (manager.get_tool_spec(name).parameters or {}).get("required", [])
+        missing = [param for param in required if param not in arguments]
+        if missing:
+            problems.append(f"{name}: 필수 파라미터 누락 {missing}")
+    return problems
+
+
+def check_tool_calls(manager: ToolsManager, llm_client: LLMClient, profile: str,
+                     corpus: List[Dict[str, Any]], repeats: int) -> Dict[str, Any]:
+    """
+    프로필의 첫 LLM 호출 도구 선택 성공률
+
+    성공: 응답 성공 + 모든 도구 호출이 유효 + 기록 당시 도구를 호출했다면 그중 하나 이상을 호출
+
+    Returns:
+        Dict: 시도/성공 수, 성공률, 실패 사례
+    """
+    system_prompt = build_agent(manager, profile, llm_client).system_prompt
+    schemas = manager.get_tools_schemas()
+    attempts, successes, failures = 0, 0, []
+    for case in corpus:
+        for _ in range(repeats):
+            attempts += 1
+            response = llm_client.chat_completion(
+                messages=[{"role": "system", "content": system_prompt}, {"role": "user", "content": case["user_input"]}],
+                tools=schemas,
+                temperature=0.0
+            )
+            if not response.get("success"):
+                failures.append({"user_input": case["user_input"], "problems": [response.get("error", "LLM 호출 실패")]})
+                continue
+            tool_calls = getattr(response.get("message"), "tool_calls", None) or []
+            problems = validate_tool_calls(manager, tool_calls)
+            called = {call.function.name for call in tool_calls}
+            if case["expected"] and not called & set(case["expected"]):
+                problems.append(f"기록된 도구 {case['expected']} 대신 {sorted(called)} 호출")
+            if problems:
+                failures.append({"user_input": case["user_input"], "problems": problems})
+            else:
+                successes += 1
+    return {
+        "attempts": attempts,
+        "successes": successes,
+        "rate": round(successes / attempts, 3) if attempts else 0.0,
+        "failures": failures
+    }
+
+
+def print_report(report: Dict[str, Any]):
+    """결과 요약 표 출력"""
+    meta = report["meta"]
+    print(f"\n모델 {meta['model']} (기본 프로필: {meta['default_profile']}), 토크나이저 {meta['tokenizer']}, "
+          f"prefill {meta['prefill_tps']} tok/s, 실행당 LLM 호출 {meta['calls_per_run']}회")
+    print(f"{'프로필':<10} {'프롬프트 tok':>12} {'스키마 tok':>10} {'호출당 tok':>10} {'절감':>8} {'prefill ms/호출':>16} {'절감 ms/실행':>14}")
+    for profile, entry in report["tokens"].items():
+        print(
+            f"{profile:<10} {entry['system_prompt_tokens']:>12} {entry['schema_tokens']:>10} {entry['tokens_per_call']:>10} "
+            f"{str(entry['saved_pct']) + '%':>8} {entry['prefill_ms_per_call']:>16} {entry['saved_prefill_ms_per_run']:>14}"
+        )
+
+    regression = report.get("regression")
+    if regression:
+        print(f"\n도구 호출 성공률 (카세트 요청 {regression['cases']}개, 허용 하락 {regression['tolerance']})")
+        for profile, result in regression["profiles"].items():
+            status = "❌ 회귀" if profile in regression["regressed"] else "✅"
+            print(f"  {profile:<10} {result['successes']}/{result['attempts']} ({result['rate']:.1%}) {status}")
+            for failure in result["failures"][:3]:
+                print(f"      - {failure['user_input'][:40]}: {'; '.join(failure['problems'])}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="시스템 프롬프트 프로필 토큰 비용 및 도구 호출 회귀 확인")
+    parser.add_argument("--model", default="gpt-oss:20b", help="토크나이저/기본 프로필 결정 및 회귀 확인에 사용할 모델명")
+    parser.add_argument("--endpoint", default="http://localhost:11434", help="회귀 확인에 사용할 LLM 서버 엔드포인트")
+    parser.add_argument("--prefill-tps", type=float, default=100.0, help="prefill 시간 계산용 입력 토큰 처리 속도 (tok/s)")
+    parser.add_argument("--calls-per-run", type=int, default=3, help="실행당 LLM 호출 수 (실행당 절감 시간 계산용)")
+    parser.add_argument("--cassettes", nargs="*", default=[], help="회귀 확인에 사용할 카세트 파일 또는 디렉토리")
+    parser.add_argument("--repeats", type=int, default=1, help="회귀 확인 시 요청별 반복 횟수")
+    parser.add_argument("--tolerance", type=float, default=0.05, help="full 대비 허용하는 성공률 하락 폭")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본값: benchmarks/results/prompt-profiles-<시각>-<커밋>.json)")
+    args = parser.parse_args(argv)
+
+    with redirect_stdout(io.StringIO()):
+        manager = ToolsManager()
+
+    revision = git_revision()
+    report = {
+        "meta": {
+            **revision,
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "model": args.model,
+            "default_profile": prompt_profile_for_model(args.model),
+            "tokenizer": tokenizer_name(args.model),
+            "prefill_tps": args.prefill_tps,
+            "calls_per_run": args.calls_per_run,
+        },
+        "tokens": measure_tokens(manager, args.model, args.prefill_tps, args.calls_per_run),
+    }
+
+    exit_code = 0
+    if args.cassettes:
+        corpus = load_corpus(args.cassettes)
+        if not corpus:
+            print("❌ 카세트에서 react 모드 실행 기록을 찾지 못했습니다", file=sys.stderr)
+            return 2
+        llm_client = LLMClient(endpoint=args.endpoint, model=args.model)
+        profiles = {}
+        for profile in SYSTEM_PROMPT_PROFILES:
+            print(f"도구 호출 확인: {profile} ({len(corpus)}개 요청)", file=sys.stderr)
+            profiles[profile] = check_tool_calls(manager, llm_client, profile, corpus, args.repeats)
+        baseline = profiles["full"]["rate"]
+        regressed = [profile for profile, result in profiles.items() if result["rate"] < baseline - args.tolerance]
+        report["regression"] = {
+            "cases": len(corpus),
+            "repeats": args.repeats,
+            "tolerance": args.tolerance,
+            "profiles": profiles,
+            "regressed": regressed
+        }
+        exit_code = 1 if regressed else 0
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"prompt-profiles-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{revision['commit']}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print_report(report)
+    print(f"\n결과 저장: {output}")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
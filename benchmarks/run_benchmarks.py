@@ -0,0 +1,308 @@
+"""
+ReAct 에이전트 종단 간 지연 시간 벤치마크
+
+로컬 가짜 LLM 서버와 SSH 서버 스텁을 띄워 ReactAgentV2.run을 시나리오 × 환경 조합으로 반복 실행하고,
+LLM / SSH 연결 / 명령 실행 / 출력 파싱 / 콜백 구간별 p50/p95 지연 시간을 JSON 파일로 저장
+
+사용법:
+    python -m benchmarks.run_benchmarks                     # 전체 조합
+    python -m benchmarks.run_benchmarks --quick --repeats 3 # 빠른 확인
+    python -m benchmarks.run_benchmarks --compare benchmarks/results/<이전 결과>.json
+"""
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import itertools
+import subprocess
+import threading
+from contextlib import redirect_stdout
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+from agent_v2 import ReactAgentV2, ReasoningCallback, DefaultCallback
+from config.server_config import ServerConfig
+from core.metrics import percentile
+from tools import remote_session
+from benchmarks.fake_llm_server import FakeLLMServer
+from benchmarks.fake_ssh_server import FakeSSHServer
+from benchmarks.scenarios import SCENARIOS, DEFAULT_MATRIX, QUICK_MATRIX
+
+
+# 결과에 기록할 구간
+PHASES = ["total", "llm", "ssh_connect", "ssh_exec", "parse", "callbacks"]
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+class PhaseTimer:
+    """실행 1회의 구간별 누적 소요 시간 (여러 스레드에서 기록 가능)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.durations: Dict[str, float] = {phase: 0.0 for phase in PHASES}
+        self.counts: Dict[str, int] = {phase: 0 for phase in PHASES}
+
+    def add(self, phase: str, duration: float):
+        with self._lock:
+            self.durations[phase] += duration
+            self.counts[phase] += 1
+
+
+class TimingCallback(ReasoningCallback):
+    """콜백 처리 시간을 측정하는 래퍼 (실제 처리는 내부 콜백에 위임)"""
+
+    def __init__(self, inner: ReasoningCallback):
+        self.inner = inner
+        self.timer: Optional[PhaseTimer] = None
+
+    def _timed(self, name: str, *args):
+        start_time = time.perf_counter()
+        try:
+            getattr(self.inner, name)(*args)
+        finally:
+            if self.timer:
+                self.timer.add("callbacks", time.perf_counter() - start_time)
+
+    def on_iteration_start(self, iteration, max_iterations):
+        self._timed("on_iteration_start", iteration, max_iterations)
+
+    def on_reasoning(self, iteration, thought):
+        self._timed("on_reasoning", iteration, thought)
+
+    def on_tool_call(self, iteration, tool, arguments):
+        self._timed("on_tool_call", iteration, tool, arguments)
+
+    def on_tool_result(self, iteration, tool, result, success):
+        self._timed("on_tool_result", iteration, tool, result, success)
+
+    def on_observation(self, iteration, observation):
+        self._timed("on_observation", iteration, observation)
+
+    def on_iteration_end(self, iteration):
+        self._timed("on_iteration_end", iteration)
+
+    def on_final_result(self, result, iterations):
+        self._timed("on_final_result", result, iterations)
+
+    def on_error(self, iteration, error):
+        self._timed("on_error", iteration, error)
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """구간 요약 통계 (밀리초)"""
+    return {
+        "p50_ms": round(percentile(samples, 50) * 1000, 2),
+        "p95_ms": round(percentile(samples, 95) * 1000, 2),
+        "mean_ms": round(sum(samples) / len(samples) * 1000, 2) if samples else 0.0,
+    }
+
+
+def run_case(scenario_name: str, params: Dict[str, Any], repeats: int, warmup: int) -> Dict[str, Any]:
+    """
+    시나리오 1개 × 환경 조합 1개 실행
+
+    Args:
+        scenario_name: SCENARIOS 키
+        params: 환경 조합 (ttft, tokens_per_second, command_delay, connect_delay, max_tool_workers)
+        repeats: 측정 반복 횟수
+        warmup: 측정 전 예열 실행 횟수
+
+    Returns:
+        Dict: 구간별 지연 통계와 호출 횟수
+    """
+    scenario = SCENARIOS[scenario_name]
+    samples: Dict[str, List[float]] = {phase: [] for phase in PHASES}
+    calls = {"llm": [], "ssh_connect": [], "ssh_exec": []}
+    failures = 0
+
+    llm_server = FakeLLMServer(
+        scenario["script"],
+        plan=scenario.get("plan"),
+        ttft=params["ttft"],
+        tokens_per_second=params["tokens_per_second"]
+    )
+    ssh_server = FakeSSHServer(command_delay=params["command_delay"], connect_delay=params["connect_delay"])
+
+    timing_callback = TimingCallback(DefaultCallback())
+    state = {"timer": None}
+
+    def observe_ssh(event: str, duration: float, details: Dict[str, Any]):
+        timer = state["timer"]
+        if timer:
+            timer.add("ssh_connect" if event == "connect" else "ssh_exec", duration)
+
+    with llm_server, ssh_server, redirect_stdout(io.StringIO()):
+        agent = ReactAgentV2(
+            endpoint=llm_server.endpoint,
+            model="gpt-oss:20b",
+            max_iterations=len(scenario["script"]) + 2,
+            callback=timing_callback,
+            verbose=False,
+            max_tool_workers=params["max_tool_workers"],
+            mode=scenario.get("mode", "react")
+        )
+
+        # LLM 호출 시간 측정 (취소 가능 실행을 위해 별도 스레드에서 호출되어도 동일하게 집계)
+        chat_completion = agent.llm_client.chat_completion
+
+        def timed_chat_completion(*args, **kwargs):
+            start_time = time.perf_counter()
+            try:
+                return chat_completion(*args, **kwargs)
+            finally:
+                if state["timer"]:
+                    state["timer"].add("llm", time.perf_counter() - start_time)
+
+        agent.llm_client.chat_completion = timed_chat_completion
+        remote_session.add_observer(observe_ssh)
+
+        try:
+            with ServerConfig.bind_connection_info(ssh_server.connection_info):
+                for index in range(warmup + repeats):
+                    agent.reset()
+                    timer = PhaseTimer()
+                    state["timer"] = timer
+                    timing_callback.timer = timer
+
+                    start_time = time.perf_counter()
+                    result = agent.run(scenario["user_input"])
+                    timer.add("total", time.perf_counter() - start_time)
+
+                    state["timer"] = None
+                    timing_callback.timer = None
+                    if index < warmup:
+                        continue
+
+                    if not result.get("success") or result.get("stop_reason") != "completed":
+                        failures += 1
+
+                    # 도구 실행 시간 중 SSH 대기를 제외한 나머지를 출력 파싱/가공 시간으로 집계
+                    tool_time = sum(
+                        entry.get("duration", 0.0) for entry in result.get("execution_log", [])
+                        if entry.get("type") == "tool_call" and not entry.get("memoized_from")
+                    )
+                    ssh_time = timer.durations["ssh_connect"] + timer.durations["ssh_exec"]
+                    timer.durations["parse"] = max(0.0, tool_time - ssh_time)
+
+                    for phase in PHASES:
+                        samples[phase].append(timer.durations[phase])
+                    for phase in calls:
+                        calls[phase].append(timer.counts[phase])
+        finally:
+            remote_session.remove_observer(observe_ssh)
+
+    return {
+        "scenario": scenario_name,
+        "mode": scenario.get("mode", "react"),
+        "params": params,
+        "runs": repeats,
+        "failures": failures,
+        "latency": {phase: summarize(samples[phase]) for phase in PHASES},
+        "calls": {phase: round(sum(counts) / len(counts), 2) if counts else 0 for phase, counts in calls.items()},
+    }
+
+
+def case_key(case: Dict[str, Any]) -> str:
+    """비교용 케이스 식별자"""
+    params = ",".join(f"{key}={value}" for key, value in sorted(case["params"].items()))
+    return f"{case['scenario']}[{params}]"
+
+
+def git_revision() -> Dict[str, Any]:
+    """현재 커밋 정보 (git을 사용할 수 없으면 unknown)"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=root, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = bool(subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=root, capture_output=True, text=True
+        ).stdout.strip())
+        return {"commit": commit, "dirty": dirty}
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": "unknown", "dirty": None}
+
+
+def print_report(report: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None):
+    """결과 표 출력 (기준 결과가 있으면 total p50/p95 변화율 함께 표시)"""
+    baseline_cases = {case_key(case): case for case in (baseline or {}).get("results", [])}
+
+    header = f"{'case':<90} " + " ".join(f"{phase + ' p50/p95':>22}" for phase in PHASES)
+    print(header)
+    print("-" * len(header))
+    for case in report["results"]:
+        cells = []
+        for phase in PHASES:
+            stats = case["latency"][phase]
+            cells.append(f"{stats['p50_ms']:>10.1f}/{stats['p95_ms']:<10.1f}")
+        line = f"{case_key(case):<90} " + " ".join(cells)
+
+        previous = baseline_cases.get(case_key(case))
+        if previous:
+            deltas = []
+            for stat in ("p50_ms", "p95_ms"):
+                before = previous["latency"]["total"][stat]
+                after = case["latency"]["total"][stat]
+                deltas.append(f"{(after - before) / before * 100:+.1f}%" if before else "n/a")
+            line += f"  Δtotal p50 {deltas[0]}, p95 {deltas[1]}"
+        if case["failures"]:
+            line += f"  ⚠️ 실패 {case['failures']}회"
+        print(line)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="ReAct 에이전트 종단 간 지연 시간 벤치마크")
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), default=sorted(SCENARIOS),
+                        help="실행할 시나리오 (기본값: 전체)")
+    parser.add_argument("--repeats", type=int, default=5, help="조합별 측정 반복 횟수")
+    parser.add_argument("--warmup", type=int, default=1, help="조합별 예열 실행 횟수")
+    parser.add_argument("--quick", action="store_true", help="축소된 환경 조합으로 실행")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본값: benchmarks/results/<시각>-<커밋>.json)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    args = parser.parse_args(argv)
+
+    matrix = QUICK_MATRIX if args.quick else DEFAULT_MATRIX
+    combinations = [dict(zip(matrix, values)) for values in itertools.product(*matrix.values())]
+
+    revision = git_revision()
+    report = {
+        "meta": {
+            **revision,
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeats": args.repeats,
+            "warmup": args.warmup,
+            "matrix": matrix,
+        },
+        "results": [],
+    }
+
+    total_cases = len(args.scenarios) * len(combinations)
+    for index, (scenario_name, params) in enumerate(itertools.product(args.scenarios, combinations), start=1):
+        print(f"[{index}/{total_cases}] {scenario_name} {params}", file=sys.stderr)
+        report["results"].append(run_case(scenario_name, params, args.repeats, args.warmup))
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{revision['commit']}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    print_report(report, baseline)
+    print(f"\n결과 저장: {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""
+벤치마크 시나리오 정의
+각 시나리오는 사용자 요청, 가짜 LLM의 단계별 응답 스크립트, (plan 모드용) 계획으로 구성
+"""
+from typing import Dict, Any, List
+
+
+SCENARIOS: Dict[str, Dict[str, Any]] = {
+    # 단일 분석 도구 호출 후 보고서 작성
+    "system_overview": {
+        "user_input": "서버 상태를 점검해줘",
+        "mode": "react",
+        "script": [
+            {"content": "시스템 기본 정보를 먼저 확인합니다.", "tool_calls": [{"name": "system_info_analyzer"}]},
+            {"content": "## 분석 결과\n시스템은 정상 상태입니다. 디스크 사용률 67%로 여유가 있습니다.", "completion_tokens": 120},
+        ],
+    },
+    # 한 응답에 독립적인 도구 호출 여러 개 (병렬 실행 대상)
+    "parallel_triage": {
+        "user_input": "서버가 느린 원인을 종합적으로 분석해줘",
+        "mode": "react",
+        "script": [
+            {
+                "content": "시스템, 프로세스, 네트워크, 서비스 상태를 동시에 확인합니다.",
+                "tool_calls": [
+                    {"name": "system_info_analyzer"},
+                    {"name": "process_monitor_analyzer"},
+                    {"name": "network_status_analyzer"},
+                    {"name": "service_status_analyzer"},
+                ],
+            },
+            {"content": "## 종합 분석\nCPU 사용률이 높은 worker 프로세스가 원인으로 보입니다.", "completion_tokens": 250},
+        ],
+    },
+    # 단계마다 명령 하나씩 실행하는 순차 조사 (LLM 왕복 횟수가 많은 경우)
+    "command_chain": {
+        "user_input": "디스크와 메모리, 부하를 차례로 확인해줘",
+        "mode": "react",
+        "script": [
+            {"content": "부하를 확인합니다.", "tool_calls": [{"name": "exec_command_remote_system", "arguments": {"command": "uptime"}}]},
+            {"content": "디스크를 확인합니다.", "tool_calls": [{"name": "exec_command_remote_system", "arguments": {"command": "df -h"}}]},
+            {"content": "메모리를 확인합니다.", "tool_calls": [{"name": "exec_command_remote_system", "arguments": {"command": "free -h"}}]},
+            {"content": "## 결과\n부하, 디스크, 메모리 모두 정상입니다.", "completion_tokens": 80},
+        ],
+    },
+    # plan 모드 - 계획 1회 후 독립 단계 일괄 실행
+    "plan_triage": {
+        "user_input": "서버가 느린 원인을 종합적으로 분석해줘",
+        "mode": "plan",
+        "plan": {
+            "goal": "성능 저하 원인 파악",
+            "steps": [
+                {"id": "s1", "tool": "system_info_analyzer", "arguments": {}, "depends_on": [], "purpose": "기본 자원 확인"},
+                {"id": "s2", "tool": "process_monitor_analyzer", "arguments": {}, "depends_on": [], "purpose": "프로세스 부하 확인"},
+                {"id": "s3", "tool": "network_status_analyzer", "arguments": {}, "depends_on": [], "purpose": "네트워크 확인"},
+            ],
+        },
+        "script": [
+            {"content": "## 종합 분석\nCPU 사용률이 높은 worker 프로세스가 원인으로 보입니다.", "completion_tokens": 250},
+        ],
+    },
+}
+
+
+# 시나리오별로 실행할 환경 조합 (모든 값의 데카르트 곱)
+DEFAULT_MATRIX: Dict[str, List[Any]] = {
+    "ttft": [0.05, 0.3],
+    "tokens_per_second": [60.0],
+    "command_delay": [0.0, 0.2],
+    "connect_delay": [0.05],
+    "max_tool_workers": [1, 4],
+}
+
+# 빠른 확인용 축소 조합
+QUICK_MATRIX: Dict[str, List[Any]] = {
+    "ttft": [0.05],
+    "tokens_per_second": [200.0],
+    "command_delay": [0.05],
+    "connect_delay": [0.0],
+    "max_tool_workers": [4],
+}
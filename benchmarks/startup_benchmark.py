@@ -0,0 +1,174 @@
+"""
+도구 발견/에이전트 생성 시작 비용 벤치마크
+
+- 콜드 스타트: 새 인터프리터에서 ToolsManager 생성과 첫 ReactAgentV2 생성까지의 시간 (import 포함)
+- 에이전트 생성: 같은 프로세스에서 ReactAgentV2를 반복 생성하는 시간
+  (에이전트마다 ToolsManager 새로 생성 / 공유 인스턴스 재사용)
+
+지연 로딩(lazy)과 즉시 로딩(eager)을 나란히 측정하여 JSON 파일로 저장
+
+사용법:
+    python -m benchmarks.startup_benchmark
+    python -m benchmarks.startup_benchmark --cold-repeats 10 --agent-repeats 50
+"""
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+from contextlib import redirect_stdout
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+from benchmarks.run_benchmarks import RESULTS_DIR, summarize, git_revision
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 새 인터프리터에서 실행할 측정 코드 - 단계별 경과 시간을 JSON 한 줄로 출력
+COLD_START_SCRIPT = """
+import io, sys, json, time
+from contextlib import redirect_stdout
+start = time.perf_counter()
+with redirect_stdout(io.StringIO()):
+    from tools.tools_manager import ToolsManager
+    imported = time.perf_counter()
+    manager = ToolsManager(lazy={lazy})
+    discovered = time.perf_counter()
+    from agent_v2 import ReactAgentV2
+    agent = ReactAgentV2(tools_manager=manager, verbose=False)
+    constructed = time.perf_counter()
+print(json.dumps({{
+    "import": imported - start,
+    "discovery": discovered - imported,
+    "first_agent": constructed - discovered,
+    "total": constructed - start,
+    "loaded_tools": len(manager.tools),
+    "tool_modules": sorted(name for name in sys.modules if name.startswith("tools."))
+}}))
+"""
+
+
+def measure_cold_start(lazy: bool, repeats: int) -> Dict[str, Any]:
+    """
+    새 인터프리터를 반복 실행하여 콜드 스타트 구간별 시간 측정
+
+    Args:
+        lazy: 지연 로딩 여부
+        repeats: 반복 횟수
+
+    Returns:
+        Dict: 구간별 요약 통계와 마지막 실행의 로딩 현황
+    """
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+    samples: Dict[str, List[float]] = {"import": [], "discovery": [], "first_agent": [], "total": [], "process": []}
+    last: Dict[str, Any] = {}
+
+    for _ in range(repeats):
+        started = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, "-c", COLD_START_SCRIPT.format(lazy=lazy)],
+            cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, check=True
+        )
+        samples["process"].append(time.perf_counter() - started)
+        last = json.loads(completed.stdout.strip().splitlines()[-1])
+        for phase in ("import", "discovery", "first_agent", "total"):
+            samples[phase].append(last[phase])
+
+    return {
+        "phases": {phase: summarize(values) for phase, values in samples.items()},
+        "loaded_tools": last.get("loaded_tools"),
+        "tool_modules": last.get("tool_modules")
+    }
+
+
+def measure_agent_construction(lazy: bool, shared: bool, repeats: int) -> Dict[str, Any]:
+    """
+    같은 프로세스에서 에이전트 반복 생성 시간 측정
+
+    Args:
+        lazy: 지연 로딩 여부
+        shared: ToolsManager 공유 여부
+        repeats: 반복 횟수
+
+    Returns:
+        Dict: 요약 통계
+    """
+    from agent_v2 import ReactAgentV2
+    from tools.tools_manager import ToolsManager
+
+    samples = []
+    with redirect_stdout(io.StringIO()):
+        shared_manager = ToolsManager(lazy=lazy) if shared else None
+        for _ in range(repeats):
+            started = time.perf_counter()
+            manager = shared_manager or ToolsManager(lazy=lazy)
+            ReactAgentV2(tools_manager=manager, verbose=False)
+            samples.append(time.perf_counter() - started)
+    return summarize(samples)
+
+
+def print_report(report: Dict[str, Any]):
+    """결과 요약 표 출력"""
+    print(f"\n{'콜드 스타트':<24} {'import':>10} {'discovery':>10} {'1st agent':>10} {'process':>10}  (p50 ms)")
+    for mode, result in report["cold_start"].items():
+        phases = result["phases"]
+        print(
+            f"{mode:<24} {phases['import']['p50_ms']:>10} {phases['discovery']['p50_ms']:>10} "
+            f"{phases['first_agent']['p50_ms']:>10} {phases['process']['p50_ms']:>10}  "
+            f"(로딩된 도구 {result['loaded_tools']}개)"
+        )
+    print(f"\n{'에이전트 생성':<24} {'p50':>10} {'p95':>10} {'mean':>10}  (ms)")
+    for mode, stats in report["agent_construction"].items():
+        print(f"{mode:<24} {stats['p50_ms']:>10} {stats['p95_ms']:>10} {stats['mean_ms']:>10}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="도구 발견/에이전트 생성 시작 비용 벤치마크")
+    parser.add_argument("--cold-repeats", type=int, default=5, help="콜드 스타트 측정 반복 횟수")
+    parser.add_argument("--agent-repeats", type=int, default=20, help="에이전트 생성 측정 반복 횟수")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본값: benchmarks/results/startup-<시각>-<커밋>.json)")
+    args = parser.parse_args(argv)
+
+    revision = git_revision()
+    report = {
+        "meta": {
+            **revision,
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cold_repeats": args.cold_repeats,
+            "agent_repeats": args.agent_repeats,
+        },
+        "cold_start": {},
+        "agent_construction": {},
+    }
+
+    for lazy in (True, False):
+        mode = "lazy" if lazy else "eager"
+        print(f"콜드 스타트 측정: {mode}", file=sys.stderr)
+        report["cold_start"][mode] = measure_cold_start(lazy, args.cold_repeats)
+
+    for lazy in (True, False):
+        for shared in (False, True):
+            mode = f"{'lazy' if lazy else 'eager'}/{'shared' if shared else 'per-agent'}"
+            print(f"에이전트 생성 측정: {mode}", file=sys.stderr)
+            report["agent_construction"][mode] = measure_agent_construction(lazy, shared, args.agent_repeats)
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"startup-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{revision['commit']}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print_report(report)
+    print(f"\n결과 저장: {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
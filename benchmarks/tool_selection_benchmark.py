@@ -0,0 +1,286 @@
+"""
+질의 기반 도구 선택(BM25) 효과 벤치마크
+
+- 프롬프트 크기: 질의 모음에 대해 전체 도구 vs 선택된 도구의 시스템 프롬프트 + 도구 스키마 토큰 수(4자당 1토큰 추정)와
+  선택 소요 시간, 시나리오에서 실제 호출하는 도구가 선택에 포함되는 비율
+- 종단 간: 가짜 LLM 서버에 입력 토큰 처리 속도(prefill)를 주고 시나리오를 실행하여
+  LLM 호출당 입력 토큰 수와 전체 지연 시간 비교
+
+--synthetic-tools N을 주면 임시 도구 디렉토리에 가상의 도구 팩 도구 N개를 추가하여 도구가 많은 환경을 모의
+
+사용법:
+    python -m benchmarks.tool_selection_benchmark
+    python -m benchmarks.tool_selection_benchmark --synthetic-tools 40 --top-k 4 --pin exec_command_remote_system
+"""
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+from contextlib import redirect_stdout
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+from agent_v2 import ReactAgentV2
+from config.server_config import ServerConfig
+from core.tool_retriever import ToolRetriever
+from core.metrics import percentile
+from tools.tools_manager import ToolsManager
+from tools.tool_catalog import tool_files
+from benchmarks.fake_llm_server import FakeLLMServer
+from benchmarks.fake_ssh_server import FakeSSHServer
+from benchmarks.scenarios import SCENARIOS
+from benchmarks.run_benchmarks import RESULTS_DIR, summarize, git_revision
+
+
+# 운영자가 자주 입력하는 요청 예시
+QUERIES = [
+    "메모리 사용량 보여줘",
+    "디스크 용량 확인해줘",
+    "실패한 서비스 있어?",
+    "CPU 많이 쓰는 프로세스 찾아줘",
+    "열려 있는 포트 목록",
+    "도커 컨테이너 상태 확인",
+    "nginx 로그 마지막 100줄 보여줘",
+    "서버 가동 시간과 커널 버전",
+    "쿠버네티스 파드가 재시작되는 이유",
+    "네트워크 인터페이스와 라우팅 테이블 확인",
+    "check memory and disk usage",
+    "list failed systemd units",
+]
+
+# 가상 도구 팩 (도메인, 설명, 태그)
+SYNTHETIC_DOMAINS = [
+    ("postgres", "Inspects PostgreSQL replication lag, locks and slow queries", ["database", "sql", "replication", "데이터베이스", "쿼리"]),
+    ("mysql", "Reports MySQL connection counts, buffer pool usage and slow query log", ["database", "mysql", "데이터베이스", "커넥션"]),
+    ("redis", "Shows Redis memory fragmentation, keyspace and eviction statistics", ["cache", "redis", "캐시", "키"]),
+    ("s3_bucket", "Lists object storage buckets, sizes and lifecycle policies", ["storage", "object", "bucket", "스토리지", "버킷"]),
+    ("nfs_mount", "Checks NFS exports, mount options and stale handles", ["storage", "nfs", "mount", "마운트", "공유"]),
+    ("haproxy", "Summarizes HAProxy backend health, sessions and error rates", ["loadbalancer", "haproxy", "backend", "로드밸런서", "백엔드"]),
+    ("certificate", "Checks TLS certificate expiry dates and chain validity", ["tls", "ssl", "cert", "인증서", "만료"]),
+    ("backup_job", "Reports backup job history, durations and failures", ["backup", "snapshot", "백업", "스냅샷"]),
+    ("kafka_topic", "Inspects Kafka topic partitions, consumer lag and ISR", ["queue", "kafka", "consumer", "큐", "컨슈머"]),
+    ("dns_zone", "Validates DNS zone records and resolver latency", ["dns", "zone", "resolver", "도메인", "레코드"]),
+]
+
+
+def build_synthetic_tools_dir(count: int) -> str:
+    """
+    기본 도구 + 가상 도구 count개를 담은 임시 도구 디렉토리 생성
+
+    가상 도구는 메타데이터만 쓰이고 실행되지 않으므로 모듈 임포트가 일어나지 않음
+
+    Returns:
+        str: 임시 도구 디렉토리 경로 (호출자가 삭제)
+    """
+    directory = tempfile.mkdtemp(prefix="tool-selection-")
+    tools_dir = os.path.join(directory, "tools")
+    os.makedirs(tools_dir)
+    for path, _ in tool_files(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tools")):
+        shutil.copy(path, tools_dir)
+
+    for index in range(count):
+        domain, description, tags = SYNTHETIC_DOMAINS[index % len(SYNTHETIC_DOMAINS)]
+        variant = index // len(SYNTHETIC_DOMAINS)
+        name = f"{domain}_analyzer" if variant == 0 else f"{domain}_analyzer_{variant}"
+        source = (
+            "from tools.base_tool import BaseTool\n\n\n"
+            f"class Synthetic{index}(BaseTool):\n"
+            f"    name = {name!r}\n"
+            f"    description = {description + (f' (cluster {variant})' if variant else '')!r}\n"
+            "    parameters = {\"type\": \"object\", \"properties\": {\"target\": {\"type\": \"string\", "
+            "\"description\": \"Resource name to inspect\"}}, \"required\": []}\n"
+            f"    tags = {tags!r}\n\n"
+            "    def execute(self, **kwargs) -> str:\n"
+            "        return \"synthetic\"\n"
+        )
+        with open(os.path.join(tools_dir, f"synthetic_{index:02d}.py"), "w", encoding="utf-8") as f:
+            f.write(source)
+    return tools_dir
+
+
+def scripted_tools(scenario: Dict[str, Any]) -> List[str]:
+    """시나리오 스크립트가 호출하는 도구명"""
+    return sorted({call["name"] for entry in scenario["script"] for call in entry.get("tool_calls", [])})
+
+
+def measure_prompt_size(manager: ToolsManager, retriever: ToolRetriever) -> Dict[str, Any]:
+    """
+    질의별 시스템 프롬프트 + 도구 스키마 토큰 수와 선택 시간 측정
+
+    Returns:
+        Dict: 전체/선택 토큰 통계, 절감률, 선택 시간, 시나리오 도구 포함률
+    """
+    with redirect_stdout(io.StringIO()):
+        agent = ReactAgentV2(tools_manager=manager, verbose=False)
+    retriever.select("warmup")
+
+    def prompt_tokens(names: Optional[List[str]]) -> int:
+        schemas = [schema for schema in manager.get_tools_schemas() if names is None or schema["function"]["name"] in names]
+        return (len(agent._get_default_system_prompt(names)) + len(json.dumps(schemas, ensure_ascii=False))) // 4
+
+    full_tokens = prompt_tokens(None)
+    selected_tokens, selected_counts, durations = [], [], []
+    queries = QUERIES + [scenario["user_input"] for scenario in SCENARIOS.values()]
+    for query in queries:
+        start_time = time.perf_counter()
+        names = retriever.select(query)
+        durations.append(time.perf_counter() - start_time)
+        selected_tokens.append(prompt_tokens(names))
+        selected_counts.append(len(names))
+
+    recall = {}
+    for scenario_name, scenario in SCENARIOS.items():
+        expected = scripted_tools(scenario)
+        selected = set(retriever.select(scenario["user_input"]))
+        recall[scenario_name] = {"expected": expected, "covered": [name for name in expected if name in selected]}
+
+    mean_selected = sum(selected_tokens) / len(selected_tokens)
+    return {
+        "tools": len(manager),
+        "queries": len(queries),
+        "full_tokens": full_tokens,
+        "selected_tokens": {
+            "p50": percentile(selected_tokens, 50),
+            "p95": percentile(selected_tokens, 95),
+            "mean": round(mean_selected, 1)
+        },
+        "selected_tools_mean": round(sum(selected_counts) / len(selected_counts), 2),
+        "savings_pct": round((1 - mean_selected / full_tokens) * 100, 1) if full_tokens else 0.0,
+        "select_time": {
+            "p50_us": round(percentile(durations, 50) * 1e6, 1),
+            "p95_us": round(percentile(durations, 95) * 1e6, 1)
+        },
+        "scenario_recall": recall
+    }
+
+
+def measure_end_to_end(
+    manager: ToolsManager,
+    retriever: Optional[ToolRetriever],
+    prefill_tps: float,
+    repeats: int
+) -> Dict[str, Any]:
+    """
+    react 시나리오를 가짜 서버로 실행하여 LLM 입력 토큰과 지연 시간 측정
+
+    Args:
+        manager: 도구 매니저
+        retriever: 도구 선택기 (None이면 전체 도구 전달)
+        prefill_tps: 가짜 LLM의 입력 토큰 처리 속도
+        repeats: 시나리오별 반복 횟수
+
+    Returns:
+        Dict: 시나리오별 지연 통계, LLM 호출당 평균 입력 토큰 수, 실패 수
+    """
+    results = {}
+    for scenario_name, scenario in SCENARIOS.items():
+        if scenario.get("mode", "react") != "react":
+            continue
+        llm_server = FakeLLMServer(scenario["script"], ttft=0.02, tokens_per_second=400.0, prefill_tokens_per_second=prefill_tps)
+        ssh_server = FakeSSHServer(command_delay=0.01)
+        samples, failures = [], 0
+        with llm_server, ssh_server, redirect_stdout(io.StringIO()):
+            agent = ReactAgentV2(
+                endpoint=llm_server.endpoint,
+                model="gpt-oss:20b",
+                max_iterations=len(scenario["script"]) + 2,
+                verbose=False,
+                tools_manager=manager,
+                tool_retriever=retriever
+            )
+            with ServerConfig.bind_connection_info(ssh_server.connection_info):
+                for _ in range(repeats):
+                    agent.reset()
+                    start_time = time.perf_counter()
+                    result = agent.run(scenario["user_input"])
+                    samples.append(time.perf_counter() - start_time)
+                    if not result.get("success") or result.get("stop_reason") != "completed":
+                        failures += 1
+        tokens = llm_server.prompt_tokens
+        results[scenario_name] = {
+            "latency": summarize(samples),
+            "prompt_tokens_per_call": round(sum(tokens) / len(tokens), 1) if tokens else 0.0,
+            "failures": failures
+        }
+    return results
+
+
+def print_report(report: Dict[str, Any]):
+    """결과 요약 표 출력"""
+    size = report["prompt_size"]
+    print(f"\n도구 {size['tools']}개, 질의 {size['queries']}개, top-k {report['meta']['top_k']}")
+    print(f"  전체 프롬프트+스키마 토큰: {size['full_tokens']}")
+    print(f"  선택 후 토큰 p50/p95/mean: {size['selected_tokens']['p50']}/{size['selected_tokens']['p95']}/{size['selected_tokens']['mean']}"
+          f"  (평균 {size['selected_tools_mean']}개 도구, {size['savings_pct']}% 절감)")
+    print(f"  선택 시간 p50/p95: {size['select_time']['p50_us']}/{size['select_time']['p95_us']} µs")
+    for scenario_name, recall in size["scenario_recall"].items():
+        print(f"  {scenario_name}: 호출 도구 {len(recall['covered'])}/{len(recall['expected'])} 선택됨")
+
+    print(f"\n{'종단 간 (prefill ' + str(report['meta']['prefill_tps']) + ' tok/s)':<36} {'all p50 ms':>12} {'top-k p50 ms':>14} {'all tok/call':>14} {'top-k tok/call':>16}")
+    for scenario_name, full in report["end_to_end"]["all"].items():
+        selected = report["end_to_end"]["top_k"][scenario_name]
+        print(
+            f"{scenario_name:<36} {full['latency']['p50_ms']:>12} {selected['latency']['p50_ms']:>14} "
+            f"{full['prompt_tokens_per_call']:>14} {selected['prompt_tokens_per_call']:>16}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="질의 기반 도구 선택 효과 벤치마크")
+    parser.add_argument("--top-k", type=int, default=4, help="선택할 도구 수")
+    parser.add_argument("--pin", nargs="*", default=[], help="항상 포함할 도구")
+    parser.add_argument("--synthetic-tools", type=int, default=0, help="추가할 가상 도구 수")
+    parser.add_argument("--prefill-tps", type=float, default=1000.0, help="가짜 LLM의 입력 토큰 처리 속도 (tok/s)")
+    parser.add_argument("--repeats", type=int, default=3, help="종단 간 시나리오별 반복 횟수")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본값: benchmarks/results/tool-selection-<시각>-<커밋>.json)")
+    args = parser.parse_args(argv)
+
+    tools_dir = build_synthetic_tools_dir(args.synthetic_tools) if args.synthetic_tools else None
+    try:
+        with redirect_stdout(io.StringIO()):
+            manager = ToolsManager(tools_dir=tools_dir, plugin_cache=None) if tools_dir else ToolsManager()
+        retriever = ToolRetriever(manager, top_k=args.top_k, pinned=args.pin)
+
+        revision = git_revision()
+        report = {
+            "meta": {
+                **revision,
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "top_k": args.top_k,
+                "pinned": args.pin,
+                "synthetic_tools": args.synthetic_tools,
+                "prefill_tps": args.prefill_tps,
+                "repeats": args.repeats,
+            },
+            "prompt_size": measure_prompt_size(manager, retriever),
+            "end_to_end": {},
+        }
+        print("종단 간 측정: 전체 도구", file=sys.stderr)
+        report["end_to_end"]["all"] = measure_end_to_end(manager, None, args.prefill_tps, args.repeats)
+        print(f"종단 간 측정: top-{args.top_k}", file=sys.stderr)
+        report["end_to_end"]["top_k"] = measure_end_to_end(manager, retriever, args.prefill_tps, args.repeats)
+    finally:
+        if tools_dir:
+            shutil.rmtree(os.path.dirname(tools_dir), ignore_errors=True)
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"tool-selection-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{revision['commit']}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print_report(report)
+    print(f"\n결과 저장: {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
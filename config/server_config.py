@@ -2,10 +2,18 @@
 서버 접속 정보를 중앙에서 관리하는 설정 클래스
 민감한 정보를 LLM으로부터 보호하고 UI를 통해서만 관리
 """
+import contextvars
 import streamlit as st
+from contextlib import contextmanager
 from typing import Optional, Dict, Any
 
 
+# 현재 실행 컨텍스트(스레드/작업)에 바인딩된 접속 정보 - 세션 상태보다 우선
+_bound_connection_info: contextvars.ContextVar = contextvars.ContextVar(
+    "bound_connection_info", default=None
+)
+
+
 class ServerConfig:
     """
     서버 접속 정보를 안전하게 관리하는 클래스
@@ -45,6 +53,23 @@ class ServerConfig:
             'is_configured': True
         }
     
+    @staticmethod
+    @contextmanager
+    def bind_connection_info(connection_info: Optional[Dict[str, Any]]):
+        """
+        현재 실행 컨텍스트에 접속 정보 바인딩
+        
+        Streamlit 세션 상태에 접근할 수 없는 워커 스레드에서 도구를 실행할 때 사용
+        
+        Args:
+            connection_info: 접속 정보 딕셔너리 (ip, port, username, password)
+        """
+        token = _bound_connection_info.set(connection_info)
+        try:
+            yield
+        finally:
+            _bound_connection_info.reset(token)
+    
     @staticmethod
     def get_connection_info() -> Optional[Dict[str, Any]]:
         """
@@ -53,6 +78,11 @@ class ServerConfig:
         Returns:
             접속 정보 딕셔너리 또는 None
         """
+        # 바인딩된 접속 정보가 있으면 우선 사용 (빈 딕셔너리는 '미설정'으로 바인딩된 상태)
+        bound = _bound_connection_info.get()
+        if bound is not None:
+            return dict(bound) if bound else None
+        
         ServerConfig.initialize_session()
         
         config = st.session_state.server_config
@@ -0,0 +1,194 @@
+import os
+import zlib
+import shutil
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+
+class BlobStore:
+    """
+    내용 주소 기반(content-addressed) 문자열 저장소
+
+    도구 출력 같은 대용량 결과를 해시(digest) 기준으로 한 번만 저장하고,
+    실행 로그와 UI 기록은 digest 참조만 보관하다가 필요할 때 내용을 가져감
+    같은 내용은 몇 번을 저장해도 하나의 문자열 인스턴스를 공유
+    max_memory_chars를 넘으면 가장 오래 사용하지 않은 내용부터 zlib으로 압축하여 디스크로 내보내고,
+    조회 시 디스크에서 읽어 옴 (세션이 길어져도 메모리 사용량이 일정하게 유지됨)
+    """
+
+    def __init__(self, max_memory_chars: Optional[int] = None, spill_dir: Optional[str] = None):
+        """
+        BlobStore 초기화
+
+        Args:
+            max_memory_chars: 메모리에 보관할 최대 문자 수 (None이면 무제한, 디스크로 내보내지 않음)
+            spill_dir: 내보낸 내용을 저장할 디렉터리 (기본값: 처음 내보낼 때 만드는 임시 디렉터리)
+        """
+        self.max_memory_chars = max_memory_chars
+        self._spill_dir = spill_dir
+        self._owns_spill_dir = False
+        self._blobs: "OrderedDict[str, str]" = OrderedDict()
+        self._memory_chars = 0
+        self._spilled: Dict[str, int] = {}  # digest → 원본 문자 수
+        self._lock = threading.Lock()
+        self._dedup_hits = 0
+        self._chars_saved = 0
+
+    @staticmethod
+    def digest(data: str) -> str:
+        """
+        내용 해시 계산
+
+        Args:
+            data: 저장할 문자열
+
+        Returns:
+            str: sha256 16진수 digest (앞 32자)
+        """
+        return hashlib.sha256(data.encode("utf-8", errors="replace")).hexdigest()[:32]
+
+    def put(self, data: str) -> str:
+        """
+        문자열 저장 (이미 있으면 기존 내용 재사용)
+
+        Args:
+            data: 저장할 문자열
+
+        Returns:
+            str: 참조용 digest
+        """
+        digest = self.digest(data)
+        with self._lock:
+            if digest in self._blobs or digest in self._spilled:
+                self._dedup_hits += 1
+                self._chars_saved += len(data)
+            else:
+                self._blobs[digest] = data
+                self._memory_chars += len(data)
+                self._evict()
+        return digest
+
+    def _evict(self):
+        """메모리 한도를 넘으면 오래된 내용부터 디스크로 내보냄 (_lock 보유 상태에서 호출, 가장 최근 내용은 유지)"""
+        if self.max_memory_chars is None:
+            return
+        while self._memory_chars > self.max_memory_chars and len(self._blobs) > 1:
+            digest, data = self._blobs.popitem(last=False)
+            with open(self._spill_path(digest), "wb") as f:
+                f.write(zlib.compress(data.encode("utf-8", errors="replace")))
+            self._spilled[digest] = len(data)
+            self._memory_chars -= len(data)
+
+    def _spill_path(self, digest: str) -> str:
+        """내보낸 내용의 파일 경로"""
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix="react-agent-blobs-")
+            self._owns_spill_dir = True
+        return os.path.join(self._spill_dir, f"{digest}.z")
+
+    def intern(self, data: str) -> str:
+        """
+        문자열을 저장하고 저장소가 보관 중인 동일 내용의 인스턴스 반환
+
+        대화 히스토리 등에서 같은 출력이 여러 번 등장해도 메모리를 한 번만 사용하도록 함
+
+        Args:
+            data: 저장할 문자열
+
+        Returns:
+            str: 저장소의 정규 인스턴스
+        """
+        digest = self.put(data)
+        with self._lock:
+            # 디스크로 내보낸 내용이면 공유할 인스턴스가 없으므로 입력을 그대로 사용
+            return self._blobs.get(digest, data)
+
+    def get(self, digest: Optional[str]) -> Optional[str]:
+        """
+        digest로 내용 조회
+
+        Args:
+            digest: put이 반환한 참조
+
+        Returns:
+            Optional[str]: 저장된 내용 (없으면 None)
+        """
+        if not digest:
+            return None
+        with self._lock:
+            data = self._blobs.get(digest)
+            if data is not None:
+                self._blobs.move_to_end(digest)
+                return data
+            if digest not in self._spilled:
+                return None
+            with open(self._spill_path(digest), "rb") as f:
+                return zlib.decompress(f.read()).decode("utf-8")
+
+    def size(self, digest: str) -> int:
+        """저장된 내용의 길이 (없으면 0)"""
+        with self._lock:
+            data = self._blobs.get(digest)
+            if data is None:
+                return self._spilled.get(digest, 0)
+        return len(data)
+
+    def discard(self, digest: str):
+        """저장된 내용 삭제"""
+        with self._lock:
+            data = self._blobs.pop(digest, None)
+            if data is not None:
+                self._memory_chars -= len(data)
+            elif self._spilled.pop(digest, None) is not None:
+                os.remove(self._spill_path(digest))
+
+    def clear(self):
+        """모든 내용 삭제"""
+        with self._lock:
+            self._blobs.clear()
+            self._memory_chars = 0
+            for digest in self._spilled:
+                os.remove(self._spill_path(digest))
+            self._spilled.clear()
+            if self._owns_spill_dir:
+                shutil.rmtree(self._spill_dir, ignore_errors=True)
+                self._spill_dir = None
+                self._owns_spill_dir = False
+            self._dedup_hits = 0
+            self._chars_saved = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        저장소 사용 현황
+
+        Returns:
+            Dict: 저장된 blob 수, 총 문자 수, 중복 제거 횟수/절약한 문자 수, 메모리/디스크 보관 현황
+        """
+        with self._lock:
+            return {
+                "blobs": len(self._blobs) + len(self._spilled),
+                "chars": self._memory_chars + sum(self._spilled.values()),
+                "dedup_hits": self._dedup_hits,
+                "chars_saved": self._chars_saved,
+                "memory_chars": self._memory_chars,
+                "spilled_blobs": len(self._spilled)
+            }
+
+    def __contains__(self, digest: str) -> bool:
+        with self._lock:
+            return digest in self._blobs or digest in self._spilled
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._blobs) + len(self._spilled)
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        return f"BlobStore(blobs={len(self)})"
+
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
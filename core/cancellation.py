@@ -0,0 +1,245 @@
+import time
+import threading
+import contextvars
+from contextlib import contextmanager
+from typing import Callable, Dict, Any, Optional
+
+
+class CancellationError(Exception):
+    """
+    실행 취소 또는 시간 초과로 작업이 중단되었음을 나타내는 예외
+    """
+
+    def __init__(self, reason: str = "cancelled"):
+        self.reason = reason
+        message = "실행 시간 제한 초과" if reason == "timeout" else "사용자 요청으로 실행 취소"
+        super().__init__(message)
+
+
+class CancellationToken:
+    """
+    협조적 취소 토큰 - 실행 단위의 마감 시각(deadline)과 명시적 취소를 함께 관리
+
+    취소 시 등록된 콜백(SSH 채널 종료 등)을 호출하여 진행 중인 I/O를 중단
+    자식 토큰은 부모의 마감 시각과 자신의 제한 시간 중 더 이른 시각을 따름
+    """
+
+    def __init__(self, timeout: Optional[float] = None, parent: Optional["CancellationToken"] = None):
+        """
+        CancellationToken 초기화
+
+        Args:
+            timeout: 제한 시간 (초, None이면 무제한)
+            parent: 부모 토큰 (부모가 취소되면 함께 취소)
+        """
+        self.deadline = time.monotonic() + timeout if timeout else None
+        if parent and parent.deadline is not None:
+            self.deadline = parent.deadline if self.deadline is None else min(self.deadline, parent.deadline)
+
+        self.parent = parent
+        self._reason: Optional[str] = None
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: Dict[int, Callable[[], Any]] = {}
+        self._next_handle = 0
+
+        # 부모 취소를 자식에게 전파
+        self._parent_handle = parent.register(lambda: self.cancel(parent.reason or "cancelled")) if parent else None
+
+    @property
+    def cancelled(self) -> bool:
+        """취소 또는 마감 시각 경과 여부"""
+        if self._event.is_set():
+            return True
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            return True
+        return bool(self.parent and self.parent.cancelled)
+
+    @property
+    def reason(self) -> Optional[str]:
+        """취소 사유 (cancelled/timeout, 취소되지 않았으면 None)"""
+        if self._reason:
+            return self._reason
+        if self.parent and self.parent.reason:
+            return self.parent.reason
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            return "timeout"
+        return None
+
+    def remaining(self) -> Optional[float]:
+        """
+        마감 시각까지 남은 시간
+
+        Returns:
+            Optional[float]: 남은 초 (마감 없음이면 None, 경과 시 0)
+        """
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def timeout_for(self, default: Optional[float]) -> Optional[float]:
+        """
+        개별 작업에 적용할 제한 시간 계산 (작업 기본값과 남은 시간 중 작은 값)
+
+        Args:
+            default: 작업별 기본 제한 시간
+
+        Returns:
+            Optional[float]: 적용할 제한 시간 (둘 다 없으면 None)
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return default
+        if default is None:
+            return remaining
+        return min(default, remaining)
+
+    def cancel(self, reason: str = "cancelled"):
+        """
+        토큰 취소 및 등록된 콜백 실행
+
+        Args:
+            reason: 취소 사유 (cancelled/timeout)
+        """
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._reason = reason
+            self._event.set()
+            callbacks = list(self._callbacks.values())
+            self._callbacks.clear()
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+
+    def register(self, callback: Callable[[], Any]) -> Optional[int]:
+        """
+        취소 시 호출할 콜백 등록 (이미 취소된 경우 즉시 호출)
+
+        Args:
+            callback: 인자 없는 콜백
+
+        Returns:
+            Optional[int]: 등록 해제용 핸들 (즉시 호출된 경우 None)
+        """
+        with self._lock:
+            if not self._event.is_set():
+                handle = self._next_handle
+                self._next_handle += 1
+                self._callbacks[handle] = callback
+                return handle
+
+        callback()
+        return None
+
+    def unregister(self, handle: Optional[int]):
+        """등록된 취소 콜백 해제"""
+        if handle is None:
+            return
+        with self._lock:
+            self._callbacks.pop(handle, None)
+
+    def child(self, timeout: Optional[float] = None) -> "CancellationToken":
+        """
+        하위 작업용 자식 토큰 생성
+
+        Args:
+            timeout: 하위 작업 제한 시간
+
+        Returns:
+            CancellationToken: 자식 토큰 (사용 후 close 호출 필요)
+        """
+        return CancellationToken(timeout=timeout, parent=self)
+
+    def close(self):
+        """부모 토큰에 등록된 전파 콜백 해제"""
+        if self.parent:
+            self.parent.unregister(self._parent_handle)
+            self._parent_handle = None
+
+    def raise_if_cancelled(self):
+        """취소되었으면 CancellationError 발생"""
+        if self.cancelled:
+            raise CancellationError(self.reason or "cancelled")
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        명시적 취소 또는 지정 시간까지 대기
+
+        Returns:
+            bool: 취소 여부
+        """
+        self._event.wait(timeout)
+        return self.cancelled
+
+
+# 현재 실행 컨텍스트의 취소 토큰 (도구/SSH 계층에서 참조)
+_current_token: contextvars.ContextVar = contextvars.ContextVar("cancellation_token", default=None)
+
+
+def get_current_token() -> Optional[CancellationToken]:
+    """현재 실행 컨텍스트에 설정된 취소 토큰 반환"""
+    return _current_token.get()
+
+
+@contextmanager
+def use_token(token: Optional[CancellationToken]):
+    """
+    현재 실행 컨텍스트에 취소 토큰 설정
+
+    Args:
+        token: 설정할 취소 토큰
+    """
+    reset_token = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset_token)
+
+
+def run_cancellable(token: Optional[CancellationToken], func: Callable, *args, poll_interval: float = 0.1, **kwargs):
+    """
+    블로킹 호출을 별도 스레드에서 실행하고 취소 시 즉시 반환
+
+    취소된 호출은 백그라운드에서 자체 타임아웃까지 진행된 뒤 결과가 버려짐
+
+    Args:
+        token: 취소 토큰 (None이면 그대로 호출)
+        func: 실행할 함수
+        poll_interval: 취소 확인 주기 (초)
+
+    Returns:
+        func의 반환값
+
+    Raises:
+        CancellationError: 완료 전에 취소되거나 마감 시각이 지난 경우
+    """
+    if token is None:
+        return func(*args, **kwargs)
+
+    token.raise_if_cancelled()
+
+    outcome = {}
+    done = threading.Event()
+
+    def target():
+        try:
+            outcome["value"] = func(*args, **kwargs)
+        except BaseException as e:
+            outcome["error"] = e
+        finally:
+            done.set()
+
+    context = contextvars.copy_context()
+    threading.Thread(target=context.run, args=(target,), name="cancellable", daemon=True).start()
+
+    while not done.wait(poll_interval):
+        if token.cancelled:
+            raise CancellationError(token.reason or "cancelled")
+
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["value"]
@@ -0,0 +1,318 @@
+import json
+import time
+import hashlib
+import threading
+import contextvars
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from core.cancellation import CancellationError, get_current_token
+
+
+class CassetteMissError(LookupError):
+    """
+    재생 모드에서 요청에 해당하는 기록이 카세트에 없을 때 발생하는 예외
+    """
+
+
+class CassetteReplayError(RuntimeError):
+    """
+    기록 당시 실패했던 호출을 재생할 때 발생하는 예외 (원래 오류 메시지 유지)
+    """
+
+
+class Cassette:
+    """
+    LLM/SSH 상호작용 기록 및 재생 카세트
+
+    기록 모드에서는 LLMClient.chat_completion 요청/응답과 SSH 연결, 명령/출력을
+    소요 시간과 함께 JSONL 파일에 한 줄씩 남기고,
+    재생 모드에서는 LLM 서버나 원격 서버 없이 기록된 응답을 원래 지연 시간 또는 지연 없이 반환
+    요청은 내용 해시로 찾고, 찾지 못하면(strict=False) 같은 종류의 다음 기록을 순서대로 사용
+    """
+
+    RECORD = "record"
+    REPLAY = "replay"
+
+    LLM = "llm"
+    SSH_CONNECT = "ssh_connect"
+    SSH_RUN = "ssh_run"
+    RUN = "run"
+
+    VERSION = 1
+
+    def __init__(self, path: str, mode: str = REPLAY, latency: str = "original", strict: bool = False):
+        """
+        Cassette 초기화
+
+        Args:
+            path: 카세트 파일 경로 (.jsonl)
+            mode: "record"(새로 기록, 기존 파일 덮어씀) 또는 "replay"(기록 재생)
+            latency: 재생 지연 시간 - "original"(기록 당시 소요 시간) 또는 "zero"
+            strict: 재생 시 요청 내용이 정확히 일치하는 기록만 사용할지 여부
+        """
+        if mode not in (self.RECORD, self.REPLAY):
+            raise ValueError(f"지원하지 않는 카세트 모드입니다: {mode}")
+        if latency not in ("original", "zero"):
+            raise ValueError(f"지원하지 않는 재생 지연 방식입니다: {latency}")
+
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self.strict = strict
+
+        self._lock = threading.Lock()
+        self._stats = {"recorded": 0, "served": 0, "fallbacks": 0, "misses": 0}
+        self.connection: Optional[Dict[str, Any]] = None  # 기록 당시 접속 대상 (비밀번호 제외)
+
+        if self.recording:
+            self._file = open(path, "w", encoding="utf-8")
+            self._write({"kind": "header", "version": self.VERSION, "created": time.time()})
+            self.interactions: List[Dict[str, Any]] = []
+        else:
+            self._file = None
+            self.interactions = self._load(path)
+            self._by_key: Dict[Tuple[str, str], deque] = {}
+            self._by_kind: Dict[str, deque] = {}
+            for interaction in self.interactions:
+                kind = interaction["kind"]
+                self._by_key.setdefault((kind, interaction["key"]), deque()).append(interaction)
+                self._by_kind.setdefault(kind, deque()).append(interaction)
+                if kind == self.SSH_CONNECT and self.connection is None:
+                    self.connection = interaction.get("connection")
+
+    @property
+    def recording(self) -> bool:
+        """기록 모드 여부"""
+        return self.mode == self.RECORD
+
+    @property
+    def replaying(self) -> bool:
+        """재생 모드 여부"""
+        return self.mode == self.REPLAY
+
+    @staticmethod
+    def _load(path: str) -> List[Dict[str, Any]]:
+        """카세트 파일 읽기 (헤더 제외, 끝이 잘린 줄은 무시)"""
+        interactions = []
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                if record.get("kind") != "header":
+                    interactions.append(record)
+        return interactions
+
+    @staticmethod
+    def request_key(payload: Any) -> str:
+        """요청 내용 해시 (키 순서와 무관)"""
+        canonical = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+
+    def _write(self, record: Dict[str, Any]):
+        """기록 한 줄 추가 (즉시 flush하여 비정상 종료 시에도 보존)"""
+        with self._lock:
+            self._file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+            self._file.flush()
+            if record.get("kind") != "header":
+                self.interactions.append(record)
+                self._stats["recorded"] += 1
+
+    def _take(self, kind: str, key: str) -> Dict[str, Any]:
+        """재생할 기록 꺼내기 - 해시 일치 우선, 없으면 같은 종류의 다음 기록"""
+        with self._lock:
+            queue = self._by_key.get((kind, key))
+            interaction = queue.popleft() if queue else None
+
+            if interaction is None and not self.strict:
+                pending = self._by_kind.get(kind)
+                while pending and pending[0].get("_served"):
+                    pending.popleft()
+                if pending:
+                    interaction = pending.popleft()
+                    self._by_key[(kind, interaction["key"])].remove(interaction)
+                    self._stats["fallbacks"] += 1
+
+            if interaction is None:
+                self._stats["misses"] += 1
+                raise CassetteMissError(f"카세트에 기록되지 않은 {kind} 요청입니다 (key={key})")
+
+            interaction["_served"] = True
+            self._stats["served"] += 1
+            return interaction
+
+    def _delay(self, interaction: Dict[str, Any]):
+        """기록 당시 소요 시간만큼 대기 (취소 토큰이 있으면 취소 시 즉시 중단)"""
+        if self.latency != "original":
+            return
+        latency = interaction.get("latency", 0.0)
+        token = get_current_token()
+        if token is not None:
+            token.wait(latency)
+        elif latency > 0:
+            time.sleep(latency)
+
+    def _perform(self, kind: str, key: str, meta: Dict[str, Any], call: Callable[[], Any],
+                 encode: Callable[[Any], Any], decode: Callable[[Any], Any]) -> Any:
+        """
+        기록 또는 재생 공통 처리
+
+        Args:
+            kind: 상호작용 종류
+            key: 요청 해시
+            meta: 기록에 함께 남길 요청 정보
+            call: 실제 호출 (기록 모드)
+            encode: 결과 → JSON 직렬화 가능한 값
+            decode: 기록된 값 → 결과
+        """
+        if self.replaying:
+            interaction = self._take(kind, key)
+            self._delay(interaction)
+            if "error" in interaction:
+                error_class = TimeoutError if interaction.get("error_type") == "TimeoutError" else CassetteReplayError
+                raise error_class(interaction["error"])
+            return decode(interaction.get("result"))
+
+        record = {"kind": kind, "key": key, **meta}
+        start_time = time.time()
+        try:
+            result = call()
+        except Exception as e:
+            # 취소는 실행 상황에 따른 것이므로 기록하지 않음
+            if not isinstance(e, CancellationError):
+                record.update(latency=time.time() - start_time, error=str(e), error_type=type(e).__name__)
+                self._write(record)
+            raise
+
+        record.update(latency=time.time() - start_time, result=encode(result))
+        self._write(record)
+        return result
+
+    def chat_completion(self, client, call: Callable[[], Dict[str, Any]], messages: List[Dict[str, Any]],
+                        tools: Optional[List[Dict]] = None) -> Dict[str, Any]:
+        """
+        LLMClient.chat_completion 기록/재생
+
+        Args:
+            client: 호출한 LLMClient
+            call: 실제 LLM 호출
+            messages: 요청 메시지
+            tools: 도구 스키마 (temperature 등 나머지 파라미터는 키 계산에 사용하지 않음)
+
+        Returns:
+            Dict: chat_completion 응답 (message는 ChatCompletionMessage로 복원)
+        """
+        key = self.request_key({"model": client.model, "messages": messages, "tools": tools})
+        meta = {"model": client.model, "messages": len(messages)}
+        return self._perform(self.LLM, key, meta, call, self._encode_llm_response, self._decode_llm_response)
+
+    @staticmethod
+    def _encode_llm_response(response: Dict[str, Any]) -> Dict[str, Any]:
+        """LLM 응답 직렬화"""
+        encoded = dict(response)
+        message = encoded.get("message")
+        if message is not None and hasattr(message, "model_dump"):
+            encoded["message"] = message.model_dump()
+        return encoded
+
+    @staticmethod
+    def _decode_llm_response(encoded: Dict[str, Any]) -> Dict[str, Any]:
+        """기록된 LLM 응답 복원"""
+        from openai.types.chat import ChatCompletionMessage
+
+        response = dict(encoded)
+        if response.get("message") is not None:
+            response["message"] = ChatCompletionMessage.model_validate(response["message"])
+        return response
+
+    def ssh_connect(self, connection_info: Dict[str, Any], call: Callable[[], Any]):
+        """
+        SSH 연결 기록/재생 (재생 시 실제 연결하지 않음)
+
+        Args:
+            connection_info: 접속 정보 (비밀번호는 기록하지 않음)
+            call: 실제 연결
+        """
+        connection = {key: connection_info.get(key) for key in ("ip", "port", "username")}
+        if self.recording and self.connection is None:
+            self.connection = connection
+        key = self.request_key(connection)
+        self._perform(self.SSH_CONNECT, key, {"connection": connection}, call, lambda _: None, lambda _: None)
+
+    def ssh_run(self, command: str, call: Callable[[], Tuple[str, str]]) -> Tuple[str, str]:
+        """
+        원격 명령 실행 기록/재생
+
+        Args:
+            command: 실행할 명령어
+            call: 실제 실행
+
+        Returns:
+            Tuple[str, str]: (표준 출력, 표준 에러)
+        """
+        key = self.request_key(command)
+        return self._perform(self.SSH_RUN, key, {"command": command}, call, list, tuple)
+
+    def record_run(self, user_input: str, **meta):
+        """에이전트 실행 입력 기록 (카세트를 벤치마크 시나리오로 재사용할 수 있도록)"""
+        if self.recording:
+            self._write({"kind": self.RUN, "key": self.request_key(user_input), "user_input": user_input, **meta})
+
+    def runs(self) -> List[Dict[str, Any]]:
+        """기록된 에이전트 실행 입력 목록"""
+        return [interaction for interaction in self.interactions if interaction["kind"] == self.RUN]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        기록/재생 현황
+
+        Returns:
+            Dict: 모드, 전체 기록 수, 기록/재생/대체 재생/미일치 횟수
+        """
+        with self._lock:
+            return {"mode": self.mode, "interactions": len(self.interactions), **self._stats}
+
+    def close(self):
+        """카세트 파일 닫기"""
+        if self._file is not None and not self._file.closed:
+            self._file.close()
+
+    def __enter__(self) -> "Cassette":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        return f"Cassette(path='{self.path}', mode='{self.mode}', interactions={len(self.interactions)})"
+
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
+
+
+# 현재 실행 컨텍스트의 카세트 (LLM/SSH 계층에서 참조)
+_current_cassette: contextvars.ContextVar = contextvars.ContextVar("cassette", default=None)
+
+
+def get_current_cassette() -> Optional[Cassette]:
+    """현재 실행 컨텍스트에 설정된 카세트 반환"""
+    return _current_cassette.get()
+
+
+@contextmanager
+def use_cassette(cassette: Optional[Cassette]):
+    """
+    현재 실행 컨텍스트에 카세트 설정
+
+    Args:
+        cassette: 설정할 카세트 (None이면 실제 호출)
+    """
+    reset_token = _current_cassette.set(cassette)
+    try:
+        yield cassette
+    finally:
+        _current_cassette.reset(reset_token)
@@ -0,0 +1,396 @@
+"""
+에이전트 이벤트 버스
+ReAct 루프가 발행한 이벤트를 구독자별 제한 큐에 넣고, 각 구독자는 자신의 스레드에서 처리
+
+콜백(콘솔 출력, Streamlit 위젯 갱신 등)이 에이전트 스레드에서 바로 실행되면 느린 소비자가
+다음 LLM 호출을 지연시키므로, 발행은 큐에 넣기만 하고 즉시 반환
+구독자마다 큐와 스레드가 분리되어 있어 한 소비자가 느려도 다른 소비자에게 영향을 주지 않음
+"""
+import time
+import threading
+from collections import deque
+from typing import Dict, Any, Callable, List, Optional
+
+
+# 큐가 가득 찼을 때 이벤트 종류별 처리 정책
+KEEP = "keep"           # 버리지 않음 - 자리가 날 때까지 잠시(block_timeout) 대기한 뒤에도 가득 차 있으면 버림
+COALESCE = "coalesce"   # 아직 처리되지 않은 같은 종류 이벤트가 큐에 있으면 병합 (큐가 가득 차면 버림)
+DROP = "drop"           # 큐가 가득 차면 버림
+
+# 고빈도 이벤트 기본 정책 (나머지 종류는 KEEP)
+DEFAULT_POLICIES = {
+    "token": COALESCE,      # 스트리밍 토큰 조각 - delta를 이어 붙여 한 번에 전달
+    "progress": COALESCE,   # 진행률 - 최신 값만 전달
+    "heartbeat": DROP
+}
+
+# ReasoningCallback 메서드별 인자 순서 (이벤트 종류 → on_<종류>(*인자))
+CALLBACK_EVENTS = {
+    "iteration_start": ("iteration", "max_iterations"),
+    "reasoning": ("iteration", "thought"),
+    "tool_call": ("iteration", "tool", "arguments"),
+    "tool_result": ("iteration", "tool", "result", "success"),
+    "observation": ("iteration", "observation"),
+    "iteration_end": ("iteration",),
+    "final_result": ("result", "iterations"),
+    "error": ("iteration", "error")
+}
+
+
+class AgentEvent:
+    """
+    버스로 전달되는 이벤트 1건
+    """
+
+    __slots__ = ("type", "payload", "timestamp", "seq")
+
+    def __init__(self, event_type: str, payload: Dict[str, Any], seq: int):
+        self.type = event_type
+        self.payload = payload
+        self.timestamp = time.time()
+        self.seq = seq
+
+    def merge(self, other: "AgentEvent"):
+        """
+        같은 종류의 이후 이벤트를 병합 (COALESCE)
+
+        delta 문자열은 이어 붙이고, 나머지 값은 최신 값으로 덮어씀
+        """
+        delta = self.payload.get("delta")
+        self.payload.update(other.payload)
+        if isinstance(delta, str) and isinstance(other.payload.get("delta"), str):
+            self.payload["delta"] = delta + other.payload["delta"]
+        self.timestamp = other.timestamp
+        self.seq = other.seq
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리 변환"""
+        return {"type": self.type, "seq": self.seq, "timestamp": self.timestamp, **self.payload}
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        return f"AgentEvent(type='{self.type}', seq={self.seq})"
+
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
+
+
+class _Barrier:
+    """flush 요청 시 큐에 넣는 표식 - 구독자가 이 지점까지 처리하면 설정됨"""
+
+    __slots__ = ("done",)
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class Subscription:
+    """
+    구독자 1명 - 전용 제한 큐와 처리 스레드
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[AgentEvent], None],
+        name: str,
+        max_queue: int,
+        policies: Dict[str, str],
+        block_timeout: float,
+        initializer: Optional[Callable[[threading.Thread], None]] = None
+    ):
+        """
+        Subscription 초기화
+
+        Args:
+            handler: 이벤트 처리 함수
+            name: 구독자 이름 (스레드 이름에 사용)
+            max_queue: 큐 최대 길이
+            policies: 이벤트 종류별 포화 정책
+            block_timeout: KEEP 이벤트 발행 시 자리가 날 때까지 대기할 최대 시간 (초)
+            initializer: 처리 스레드 시작 전에 호출할 함수 (스레드를 인자로 받음)
+        """
+        self.handler = handler
+        self.name = name
+        self.max_queue = max_queue
+        self.policies = policies
+        self.block_timeout = block_timeout
+
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.last_error: Optional[str] = None
+
+        self._queue: deque = deque()
+        self._pending: Dict[str, AgentEvent] = {}
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=f"event-bus-{name}", daemon=True)
+        if initializer:
+            initializer(self._thread)
+        self._thread.start()
+
+    def offer(self, event: AgentEvent) -> bool:
+        """
+        이벤트를 큐에 넣음 (정책에 따라 병합/버림)
+
+        Args:
+            event: 발행된 이벤트
+
+        Returns:
+            bool: 큐에 넣었거나 병합했으면 True, 버렸으면 False
+        """
+        policy = self.policies.get(event.type, KEEP)
+        with self._cond:
+            if self._closed:
+                return False
+
+            if policy == COALESCE:
+                pending = self._pending.get(event.type)
+                if pending is not None:
+                    pending.merge(event)
+                    self.coalesced += 1
+                    return True
+
+            if len(self._queue) >= self.max_queue and policy == KEEP:
+                self._cond.wait_for(lambda: len(self._queue) < self.max_queue or self._closed, self.block_timeout)
+
+            if len(self._queue) >= self.max_queue or self._closed:
+                self.dropped += 1
+                return False
+
+            # 병합 대상은 발행 측 원본과 분리 (이후 merge가 발행자의 딕셔너리를 바꾸지 않도록)
+            if policy == COALESCE:
+                event = AgentEvent(event.type, dict(event.payload), event.seq)
+                self._pending[event.type] = event
+            self._queue.append(event)
+            self._cond.notify_all()
+            return True
+
+    def barrier(self) -> _Barrier:
+        """현재까지 들어온 이벤트 뒤에 flush 표식 추가 (큐 길이 제한과 무관)"""
+        barrier = _Barrier()
+        with self._cond:
+            if self._closed and not self._thread.is_alive():
+                barrier.done.set()
+            else:
+                self._queue.append(barrier)
+                self._cond.notify_all()
+        return barrier
+
+    def close(self, timeout: Optional[float] = None):
+        """남은 이벤트를 처리한 뒤 스레드 종료"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if threading.current_thread() is not self._thread:
+            self._thread.join(timeout)
+
+    @property
+    def backlog(self) -> int:
+        """처리 대기 중인 이벤트 수"""
+        return len(self._queue)
+
+    def _run(self):
+        """처리 루프 - 큐가 비고 닫힐 때까지 순서대로 처리"""
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue or self._closed)
+                if not self._queue:
+                    return
+                item = self._queue.popleft()
+                if isinstance(item, AgentEvent) and self._pending.get(item.type) is item:
+                    del self._pending[item.type]
+                self._cond.notify_all()
+
+            if isinstance(item, _Barrier):
+                item.done.set()
+                continue
+
+            try:
+                self.handler(item)
+                self.delivered += 1
+            except Exception as e:
+                # 소비자 오류가 다른 이벤트 처리나 에이전트 실행을 막지 않도록 기록만 함
+                self.errors += 1
+                self.last_error = f"{item.type}: {e}"
+
+    def stats(self) -> Dict[str, Any]:
+        """구독자 처리 통계"""
+        return {
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "backlog": self.backlog,
+            "last_error": self.last_error
+        }
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        return f"Subscription(name='{self.name}', backlog={self.backlog}, delivered={self.delivered}, dropped={self.dropped})"
+
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
+
+
+def callback_handler(callback) -> Callable[[AgentEvent], None]:
+    """
+    ReasoningCallback 객체를 이벤트 처리 함수로 변환
+
+    Args:
+        callback: on_<이벤트 종류> 메서드를 가진 콜백 객체
+
+    Returns:
+        Callable: 이벤트 종류에 맞는 콜백 메서드를 호출하는 함수 (콜백 이벤트가 아니면 무시)
+    """
+    def handle(event: AgentEvent):
+        fields = CALLBACK_EVENTS.get(event.type)
+        if fields is not None:
+            getattr(callback, f"on_{event.type}")(*(event.payload.get(field) for field in fields))
+
+    return handle
+
+
+class EventBus:
+    """
+    구독자별 제한 큐를 가진 이벤트 버스
+
+    publish는 잠금 하나만 잡고 각 구독자 큐에 넣은 뒤 바로 반환하며,
+    flush는 호출 시점까지 발행된 이벤트를 모든 구독자가 처리할 때까지 대기 (실행 종료 시점 동기화)
+    """
+
+    def __init__(
+        self,
+        max_queue: int = 1000,
+        policies: Optional[Dict[str, str]] = None,
+        block_timeout: float = 1.0,
+        thread_initializer: Optional[Callable[[threading.Thread], None]] = None
+    ):
+        """
+        EventBus 초기화
+
+        Args:
+            max_queue: 구독자별 큐 최대 길이
+            policies: 이벤트 종류별 포화 정책 (DEFAULT_POLICIES에 덮어씀)
+            block_timeout: KEEP 이벤트가 가득 찬 큐에 자리가 나기를 기다릴 최대 시간 (초)
+            thread_initializer: 구독자 처리 스레드 시작 전에 호출할 함수 (예: Streamlit 스크립트 컨텍스트 연결)
+        """
+        self.max_queue = max_queue
+        self.policies = dict(DEFAULT_POLICIES, **(policies or {}))
+        self.block_timeout = block_timeout
+        self.thread_initializer = thread_initializer
+
+        self.published = 0
+        self._subscriptions: List[Subscription] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def subscribe(self, handler: Callable[[AgentEvent], None], name: Optional[str] = None) -> Subscription:
+        """
+        이벤트 처리 함수 구독
+
+        Args:
+            handler: 이벤트 처리 함수 (구독자 전용 스레드에서 발행 순서대로 호출)
+            name: 구독자 이름
+
+        Returns:
+            Subscription: 구독 (unsubscribe에 사용)
+        """
+        subscription = Subscription(
+            handler,
+            name or f"subscriber-{len(self._subscriptions)}",
+            self.max_queue,
+            self.policies,
+            self.block_timeout,
+            self.thread_initializer
+        )
+        with self._lock:
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def subscribe_callback(self, callback, name: Optional[str] = None) -> Subscription:
+        """ReasoningCallback 객체 구독 (콜백 이벤트를 on_* 메서드로 전달)"""
+        return self.subscribe(callback_handler(callback), name or callback.__class__.__name__)
+
+    def unsubscribe(self, subscription: Subscription, timeout: Optional[float] = None):
+        """구독 해제 - 남은 이벤트를 처리한 뒤 스레드 종료"""
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+        subscription.close(timeout)
+
+    def publish(self, event_type: str, **payload) -> AgentEvent:
+        """
+        이벤트 발행 (구독자 처리 완료를 기다리지 않음)
+
+        Args:
+            event_type: 이벤트 종류
+            **payload: 이벤트 내용
+
+        Returns:
+            AgentEvent: 발행된 이벤트
+        """
+        with self._lock:
+            self.published += 1
+            event = AgentEvent(event_type, payload, self.published)
+            subscriptions = list(self._subscriptions) if not self._closed else []
+        for subscription in subscriptions:
+            subscription.offer(event)
+        return event
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        지금까지 발행된 이벤트를 모든 구독자가 처리할 때까지 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            bool: 제한 시간 안에 모두 처리되었는지 여부
+        """
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        # 소비자 스레드 안에서 호출되면 자기 자신을 기다리며 멈추므로 해당 구독자는 제외
+        current = threading.current_thread()
+        barriers = [subscription.barrier() for subscription in subscriptions if subscription._thread is not current]
+
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        for barrier in barriers:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not barrier.done.wait(remaining):
+                return False
+        return True
+
+    def close(self, timeout: Optional[float] = None):
+        """남은 이벤트를 처리하고 모든 구독자 종료"""
+        with self._lock:
+            self._closed = True
+            subscriptions, self._subscriptions = self._subscriptions, []
+        for subscription in subscriptions:
+            subscription.close(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """버스 및 구독자별 처리 통계"""
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        return {
+            "published": self.published,
+            "subscribers": {subscription.name: subscription.stats() for subscription in subscriptions}
+        }
+
+    def __enter__(self) -> "EventBus":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        return f"EventBus(subscribers={len(self._subscriptions)}, published={self.published})"
+
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
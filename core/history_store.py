@@ -0,0 +1,181 @@
+import os
+import json
+import zlib
+import tempfile
+import threading
+from collections import deque
+from typing import Dict, Any, Callable, List, Optional
+
+
+class SpillingHistory:
+    """
+    메모리 보관 개수가 제한된 기록 목록 (링 버퍼 + 디스크 내보내기)
+
+    최근 max_in_memory개만 메모리에 두고, 밀려난 오래된 항목은 zlib으로 압축하여
+    추가 전용 파일에 기록한 뒤 (오프셋, 길이)만 보관
+    오래된 항목은 화면에서 열어볼 때 load로 한 건씩 읽어 옴
+    summarize가 주어지면 항목별 요약(목록 표시용)은 내보낸 뒤에도 메모리에 유지
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_in_memory: int = 50,
+        spill_dir: Optional[str] = None,
+        summarize: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+        compress_level: int = 6
+    ):
+        """
+        SpillingHistory 초기화
+
+        Args:
+            name: 기록 이름 (내보내기 파일명에 사용)
+            max_in_memory: 메모리에 보관할 최근 항목 수
+            spill_dir: 내보내기 파일 디렉터리 (기본값: 임시 디렉터리)
+            summarize: 항목 → 목록 표시용 작은 요약 딕셔너리
+            compress_level: zlib 압축 수준
+        """
+        self.name = name
+        self.max_in_memory = max(1, max_in_memory)
+        self.spill_dir = spill_dir
+        self.summarize = summarize
+        self.compress_level = compress_level
+
+        self._recent: deque = deque()
+        self._spilled: List[tuple] = []  # (오프셋, 길이)
+        self._summaries: List[Optional[Dict[str, Any]]] = []
+        self._spilled_bytes = 0
+        self._file = None
+        self._path: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def append(self, item: Dict[str, Any]):
+        """
+        항목 추가 (보관 개수를 넘으면 가장 오래된 항목을 디스크로 내보냄)
+
+        Args:
+            item: JSON 직렬화 가능한 기록
+        """
+        with self._lock:
+            self._summaries.append(self.summarize(item) if self.summarize else None)
+            self._recent.append(item)
+            while len(self._recent) > self.max_in_memory:
+                self._spill(self._recent.popleft())
+
+    def _spill(self, item: Dict[str, Any]):
+        """항목 1건을 압축하여 내보내기 파일 끝에 기록 (_lock 보유 상태에서 호출)"""
+        if self._file is None:
+            directory = self.spill_dir or tempfile.gettempdir()
+            os.makedirs(directory, exist_ok=True)
+            fd, self._path = tempfile.mkstemp(prefix=f"{self.name}-", suffix=".spill", dir=directory)
+            self._file = os.fdopen(fd, "w+b")
+
+        data = zlib.compress(json.dumps(item, ensure_ascii=False, default=str).encode("utf-8"), self.compress_level)
+        self._file.seek(0, os.SEEK_END)
+        offset = self._file.tell()
+        self._file.write(data)
+        self._file.flush()
+        self._spilled.append((offset, len(data)))
+        self._spilled_bytes += len(data)
+
+    def load(self, index: int) -> Dict[str, Any]:
+        """
+        항목 조회 (내보낸 항목은 디스크에서 읽어 압축 해제)
+
+        Args:
+            index: 추가된 순서 기준 위치 (음수는 끝에서부터)
+
+        Returns:
+            Dict: 기록 항목
+
+        Raises:
+            IndexError: 범위를 벗어난 경우
+        """
+        with self._lock:
+            total = len(self._spilled) + len(self._recent)
+            if index < 0:
+                index += total
+            if not 0 <= index < total:
+                raise IndexError(f"{self.name} 기록 범위를 벗어났습니다: {index}")
+            if index >= len(self._spilled):
+                return self._recent[index - len(self._spilled)]
+            offset, length = self._spilled[index]
+            self._file.seek(offset)
+            data = self._file.read(length)
+        return json.loads(zlib.decompress(data).decode("utf-8"))
+
+    def recent(self, count: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        메모리에 있는 최근 항목 (오래된 것부터)
+
+        Args:
+            count: 최대 개수 (None이면 메모리에 있는 전체)
+        """
+        with self._lock:
+            items = list(self._recent)
+        return items if count is None else items[-count:] if count > 0 else []
+
+    def summaries(self) -> List[Optional[Dict[str, Any]]]:
+        """전체 항목의 요약 목록 (추가된 순서)"""
+        with self._lock:
+            return list(self._summaries)
+
+    @property
+    def spilled(self) -> int:
+        """디스크로 내보낸 항목 수"""
+        return len(self._spilled)
+
+    def clear(self):
+        """모든 항목과 내보내기 파일 삭제"""
+        with self._lock:
+            self._recent.clear()
+            self._spilled.clear()
+            self._summaries.clear()
+            self._spilled_bytes = 0
+            self._close_file()
+
+    def close(self):
+        """내보내기 파일 삭제 (메모리 항목은 유지)"""
+        with self._lock:
+            self._close_file()
+            self._spilled.clear()
+            self._summaries = self._summaries[-len(self._recent):] if self._recent else []
+
+    def _close_file(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._path and os.path.exists(self._path):
+            os.remove(self._path)
+        self._path = None
+
+    def stats(self) -> Dict[str, Any]:
+        """보관 현황"""
+        with self._lock:
+            return {
+                "total": len(self._spilled) + len(self._recent),
+                "in_memory": len(self._recent),
+                "spilled": len(self._spilled),
+                "spilled_bytes": self._spilled_bytes
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._spilled) + len(self._recent)
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        return self.load(index)
+
+    def __del__(self):
+        try:
+            self._close_file()
+        except Exception:
+            pass
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        return f"SpillingHistory(name='{self.name}', total={len(self)}, spilled={self.spilled})"
+
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
@@ -0,0 +1,379 @@
+import re
+import math
+from collections import Counter
+from typing import Callable, Dict, List, Any, Iterable, Optional, Tuple
+from core.tool_retriever import tokenize
+from tools.tools_manager import ERROR_OUTPUT_PREFIXES
+
+
+# 단순 조회가 아닌 요청 (원인 분석, 증상 확인, 변경 작업, 여러 단계 요청) - 빠른 경로를 쓰지 않고 ReAct 루프로 처리
+COMPLEX_REQUEST_PATTERN = re.compile(
+    r"왜|원인|이유|해결|분석|진단|추천|권장|비교|조치|개선|최적화|그리고|다음에|후에|차례로|"
+    r"누수|느려|느린|문제|이상|장애|오류|에러|부족|가득|꽉|급증|튀|멈춰|멈췄|먹통|"
+    r"재시작|시작해|중지|정지|삭제|지워|설치|변경|바꿔|수정|설정해|늘려|줄여|죽여|"
+    r"\b(why|cause|fix|analy[sz]e|compare|leak|slow|problem|issue|error|spike|hang|oom|"
+    r"restart|stop|kill|delete|remove|install|change|then)\b",
+    re.IGNORECASE
+)
+
+# 빠른 경로를 적용할 최대 요청 길이 (긴 요청은 조건이나 맥락이 담겨 있을 가능성이 높음)
+MAX_FAST_PATH_CHARS = 60
+
+# exec_command_remote_system이 stderr가 있을 때 반환하는 형식 ("실행 결과:\n<stdout>\n에러:\n<stderr>")
+STDERR_OUTPUT_PREFIX = "실행 결과:\n"
+
+# systemd 유닛 이름 접미어
+SYSTEMD_UNIT_SUFFIXES = (
+    ".service", ".socket", ".target", ".mount", ".automount", ".timer",
+    ".path", ".device", ".swap", ".slice", ".scope"
+)
+
+# 결정적 응답에 포함할 도구 출력 최대 줄 수
+MAX_RENDER_LINES = 40
+
+
+def is_failed_output(output: Optional[str]) -> bool:
+    """
+    빠른 경로 도구 출력이 실패인지 여부 - 실패하면 템플릿 응답 대신 ReAct 루프로 넘김
+
+    도구는 예외 대신 오류 문자열을 반환하므로 ERROR_OUTPUT_PREFIXES로 판별하고,
+    stderr가 있거나(명령 없음, 권한 부족 등) 출력이 비어 있는 경우도 실패로 봄
+
+    Args:
+        output: 도구 출력
+
+    Returns:
+        bool: 실패 여부
+    """
+    if output is None or not output.strip():
+        return True
+    return output.startswith(ERROR_OUTPUT_PREFIXES + (STDERR_OUTPUT_PREFIX,))
+
+
+def _summarize_memory(output: str) -> Optional[str]:
+    """free -h 출력에서 메모리/스왑 사용량 요약"""
+    lines = []
+    for line in output.splitlines():
+        fields = line.split()
+        if fields and fields[0] == "Mem:" and len(fields) >= 7:
+            lines.append(f"메모리: 전체 {fields[1]}, 사용 {fields[2]}, 사용 가능 {fields[6]}")
+        elif fields and fields[0] == "Swap:" and len(fields) >= 4:
+            lines.append(f"스왑: 전체 {fields[1]}, 사용 {fields[2]}")
+    return "\n".join(lines) or None
+
+
+def _summarize_disk(output: str, threshold: int = 80) -> Optional[str]:
+    """df 출력에서 사용률이 높은 파일시스템 요약"""
+    usages = []
+    for line in output.splitlines()[1:]:
+        match = re.search(r"(\d+)%\s+(\S+)\s*$", line)
+        if match:
+            usages.append((int(match.group(1)), match.group(2)))
+    if not usages:
+        return None
+    high = [f"{mount} {usage}%" for usage, mount in sorted(usages, reverse=True) if usage >= threshold]
+    if high:
+        return f"⚠️ 사용률 {threshold}% 이상: {', '.join(high)}"
+    usage, mount = max(usages)
+    return f"모든 파일시스템 사용률 {threshold}% 미만 (최대 {mount} {usage}%)"
+
+
+def _summarize_failed_units(output: str) -> Optional[str]:
+    """
+    systemctl list-units --state=failed 출력에서 실패한 유닛 요약
+
+    실패한 유닛 줄은 "● nginx.service loaded failed failed ..."처럼 상태 표시 기호로 시작하므로
+    첫 단어가 아니라 유닛 접미어로 끝나는 첫 단어를 유닛 이름으로 사용
+    """
+    units = []
+    for line in output.splitlines():
+        words = line.split()
+        if "failed" not in words:
+            continue
+        unit = next((word for word in words if word.endswith(SYSTEMD_UNIT_SUFFIXES)), None)
+        if unit:
+            units.append(unit)
+    if not units:
+        return "실패한 서비스가 없습니다."
+    return f"⚠️ 실패한 서비스 {len(units)}개: {', '.join(units)}"
+
+
+def _summarize_load(output: str) -> Optional[str]:
+    """uptime 출력에서 가동 시간과 부하 요약"""
+    match = re.search(r"up\s+(.*?),\s+\d+\s+users?,\s+load average:\s*(.*)$", output.strip())
+    if not match:
+        return None
+    return f"가동 시간: {match.group(1)} / 부하 평균(1, 5, 15분): {match.group(2)}"
+
+
+class Intent:
+    """빠른 경로로 처리할 진단 의도 1개 - 도구 호출 1회와 결정적 응답 템플릿"""
+
+    def __init__(
+        self,
+        name: str,
+        title: str,
+        tool: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        patterns: Iterable[str] = (),
+        examples: Iterable[str] = (),
+        summarize: Optional[Callable[[str], Optional[str]]] = None
+    ):
+        """
+        Intent 초기화
+
+        Args:
+            name: 의도 이름
+            title: 응답 제목
+            tool: 실행할 도구명
+            arguments: 도구 인자
+            patterns: 요청과 대조할 정규식 (하나라도 일치하면 해당 의도)
+            examples: 분류기 학습용 예시 요청
+            summarize: 도구 출력 → 핵심 요약 한두 줄 (None이면 요약 없이 출력만 표시)
+        """
+        self.name = name
+        self.title = title
+        self.tool = tool
+        self.arguments = arguments or {}
+        self.patterns = [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+        self.examples = list(examples)
+        self.summarize = summarize
+
+    def matches(self, text: str) -> bool:
+        """정규식 일치 여부"""
+        return any(pattern.search(text) for pattern in self.patterns)
+
+    def render(self, output: str) -> str:
+        """
+        도구 출력으로 결정적 응답 생성 (LLM 미사용)
+
+        Args:
+            output: 도구 출력
+
+        Returns:
+            str: 마크다운 응답
+        """
+        lines = output.rstrip().splitlines()
+        shown = "\n".join(lines[:MAX_RENDER_LINES])
+        if len(lines) > MAX_RENDER_LINES:
+            shown += f"\n... ({len(lines) - MAX_RENDER_LINES}줄 생략)"
+
+        parts = [f"## {self.title}"]
+        summary = self.summarize(output) if self.summarize else None
+        if summary:
+            parts.append(summary)
+        parts.append(f"```\n{shown}\n```")
+        command = self.arguments.get("command")
+        parts.append(f"_빠른 경로: `{command}`_" if command else f"_빠른 경로: {self.tool}_")
+        return "\n\n".join(parts)
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        return f"Intent(name='{self.name}', tool='{self.tool}', arguments={self.arguments})"
+
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
+
+
+def _command_intent(name: str, title: str, command: str, **kwargs) -> Intent:
+    """원격 명령 1개로 답할 수 있는 의도"""
+    return Intent(name, title, "exec_command_remote_system", {"command": command}, **kwargs)
+
+
+# 기본 진단 의도 - 요청이 하나의 읽기 전용 명령에 직접 대응하는 경우
+DEFAULT_INTENTS = [
+    _command_intent(
+        "memory", "메모리 사용량", "free -h",
+        patterns=[r"메모리|(?<![가-힣])램|\bram\b|\bmemory\b|\bmem\b|스왑|\bswap\b"],
+        examples=["메모리 사용량 보여줘", "램 얼마나 남았어", "check memory usage", "스왑 사용량"],
+        summarize=_summarize_memory
+    ),
+    _command_intent(
+        "disk", "디스크 사용량", "df -hT -x tmpfs -x devtmpfs",
+        patterns=[r"디스크|(?<!사)용량|파일\s*시스템|스토리지|\bdisk\b|\bdf\b|filesystem|마운트|storage"],
+        examples=["디스크 확인", "디스크 용량 얼마나 남았어", "check disk usage", "파일시스템 사용률"],
+        summarize=_summarize_disk
+    ),
+    _command_intent(
+        "failed_services", "실패한 서비스", "systemctl list-units --state=failed --no-pager",
+        patterns=[r"(실패|죽은|멈춘|failed).*(서비스|유닛|데몬|service|unit)", r"failed\s+(systemd\s+)?(units?|services?)"],
+        examples=["실패한 서비스", "죽은 서비스 있어?", "list failed systemd units", "실패한 유닛 목록"],
+        summarize=_summarize_failed_units
+    ),
+    _command_intent(
+        "load", "가동 시간과 부하", "uptime",
+        patterns=[r"가동\s*시간|업타임|\buptime\b|부하\s*평균|load\s*average"],
+        examples=["가동 시간 알려줘", "업타임 확인", "load average", "부하 평균 보여줘"],
+        summarize=_summarize_load
+    ),
+    _command_intent(
+        "top_cpu", "CPU 사용량 상위 프로세스", "ps aux --sort=-%cpu | head -n 11",
+        patterns=[r"(cpu|씨피유).*(프로세스|많이|상위|top)", r"(top|상위)\s*(프로세스|process)"],
+        examples=["CPU 많이 쓰는 프로세스 찾아줘", "CPU 상위 프로세스", "top processes by cpu"]
+    ),
+    _command_intent(
+        "listening_ports", "열려 있는 포트", "ss -tulpn",
+        patterns=[r"(열린|열려|리슨|listen).*(포트|port)|(포트|port).*(목록|확인|열려|listen)"],
+        examples=["열려 있는 포트 목록", "리슨 중인 포트 확인", "listening ports"]
+    ),
+    _command_intent(
+        "containers", "컨테이너 목록", "docker ps -a",
+        patterns=[r"(도커|docker)\s*(컨테이너|container|ps|목록|상태)|컨테이너\s*(목록|상태|확인)"],
+        examples=["도커 컨테이너 상태 확인", "컨테이너 목록", "docker ps"]
+    ),
+]
+
+
+class IntentMatch:
+    """의도 판별 결과"""
+
+    def __init__(self, intent: Intent, method: str, score: float = 1.0):
+        """
+        IntentMatch 초기화
+
+        Args:
+            intent: 판별된 의도
+            method: 판별 방식 - "pattern"(정규식) 또는 "classifier"
+            score: 분류기 유사도 (정규식 일치는 1.0)
+        """
+        self.intent = intent
+        self.method = method
+        self.score = score
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        return f"IntentMatch(intent='{self.intent.name}', method='{self.method}', score={self.score:.2f})"
+
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
+
+
+class ExampleClassifier:
+    """
+    예시 요청 기반 소형 분류기 (외부 모델 없음)
+
+    의도별 예시 요청의 토큰(한글은 글자 2-gram) 빈도 벡터와 코사인 유사도로 가장 가까운 의도를 고름
+    정규식에 걸리지 않는 다른 표현을 보완하는 용도이며, 유사도가 낮거나 1, 2위 차이가 작으면 판별하지 않음
+    """
+
+    def __init__(self, intents: List[Intent], threshold: float = 0.45, margin: float = 0.1):
+        """
+        ExampleClassifier 초기화
+
+        Args:
+            intents: 분류할 의도 목록 (examples 사용)
+            threshold: 판별에 필요한 최소 유사도
+            margin: 1위와 2위 유사도의 최소 차이
+        """
+        self.threshold = threshold
+        self.margin = margin
+        self.centroids: List[Tuple[Intent, Counter]] = [
+            (intent, Counter(token for example in intent.examples for token in tokenize(example)))
+            for intent in intents if intent.examples
+        ]
+
+    @staticmethod
+    def _cosine(left: Counter, right: Counter) -> float:
+        """두 빈도 벡터의 코사인 유사도"""
+        dot = sum(count * right.get(token, 0) for token, count in left.items())
+        if not dot:
+            return 0.0
+        norm = math.sqrt(sum(count * count for count in left.values())) * math.sqrt(sum(count * count for count in right.values()))
+        return dot / norm
+
+    def classify(self, text: str) -> Optional[Tuple[Intent, float]]:
+        """
+        요청의 의도 판별
+
+        Args:
+            text: 사용자 요청
+
+        Returns:
+            Optional[Tuple[Intent, float]]: (의도, 유사도) - 확신할 수 없으면 None
+        """
+        vector = Counter(tokenize(text))
+        if not vector:
+            return None
+        scores = sorted(
+            ((self._cosine(vector, centroid), intent) for intent, centroid in self.centroids),
+            key=lambda item: -item[0]
+        )
+        if not scores or scores[0][0] < self.threshold:
+            return None
+        if len(scores) > 1 and scores[0][0] - scores[1][0] < self.margin:
+            return None
+        return scores[0][1], scores[0][0]
+
+
+class IntentRouter:
+    """
+    LLM 없이 처리할 수 있는 단순 진단 요청 판별기 (ReactAgentV2.run 앞단의 빠른 경로)
+
+    정규식이 정확히 하나의 의도에만 일치하면 해당 도구를 바로 실행하고,
+    일치하는 의도가 없으면 (선택) 분류기로 판별
+    여러 의도에 걸치거나, 원인 분석/변경 작업 등 단순 조회가 아닌 요청은 판별하지 않음 (ReAct 루프로 처리)
+    """
+
+    def __init__(
+        self,
+        intents: Optional[List[Intent]] = None,
+        classifier: Optional[ExampleClassifier] = None,
+        use_classifier: bool = True,
+        summarize_with_llm: bool = False,
+        max_chars: int = MAX_FAST_PATH_CHARS
+    ):
+        """
+        IntentRouter 초기화
+
+        Args:
+            intents: 의도 목록 (기본값: DEFAULT_INTENTS)
+            classifier: 정규식에 걸리지 않는 요청을 판별할 분류기
+            use_classifier: classifier가 없을 때 의도 예시로 기본 분류기를 만들지 여부
+            summarize_with_llm: 결정적 템플릿 대신 짧은 LLM 요약 호출 1회로 응답할지 여부
+            max_chars: 빠른 경로를 적용할 최대 요청 길이
+        """
+        self.intents = intents if intents is not None else DEFAULT_INTENTS
+        if classifier is None and use_classifier:
+            classifier = ExampleClassifier(self.intents)
+        self.classifier = classifier
+        self.summarize_with_llm = summarize_with_llm
+        self.max_chars = max_chars
+
+    def match(self, user_input: str) -> Optional[IntentMatch]:
+        """
+        요청을 빠른 경로로 처리할 수 있는지 판별
+
+        Args:
+            user_input: 사용자 요청
+
+        Returns:
+            Optional[IntentMatch]: 판별 결과 (모호하거나 단순 조회가 아니면 None)
+        """
+        text = user_input.strip()
+        if not text or len(text) > self.max_chars or COMPLEX_REQUEST_PATTERN.search(text):
+            return None
+
+        matched = [intent for intent in self.intents if intent.matches(text)]
+        if len(matched) == 1:
+            return IntentMatch(matched[0], "pattern")
+        if matched or self.classifier is None:
+            return None
+
+        classified = self.classifier.classify(text)
+        if classified is None:
+            return None
+        intent, score = classified
+        return IntentMatch(intent, "classifier", score)
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        return (
+            f"IntentRouter(intents={[intent.name for intent in self.intents]}, "
+            f"classifier={self.classifier is not None}, summarize_with_llm={self.summarize_with_llm})"
+        )
+
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
@@ -0,0 +1,315 @@
+import os
+import re
+import json
+import time
+import struct
+import threading
+from typing import Dict, Any, Iterator, Optional
+
+
+# 인덱스 항목: (이벤트 시작 오프셋, 해당 시점의 마지막 reset 이벤트 순번)
+_INDEX_ENTRY = struct.Struct("<QQ")
+
+# 세션 ID 허용 형식 (파일명으로 사용되므로 경로 구분자 등 금지)
+_SESSION_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+class SessionJournal:
+    """
+    세션 단위 추가 전용(append-only) 저널
+
+    대화 메시지, 도구 호출, 토큰 사용량 등 에이전트 이벤트를 JSONL 파일에 한 줄씩 기록
+    fsync는 일정 개수/시간 단위로 묶어서 수행하고, 사이드카 인덱스(.idx)에
+    이벤트별 오프셋과 마지막 대화 초기화(reset) 위치를 고정 길이로 기록하여
+    재시작 후 현재 대화 구간만 바로 읽어 에이전트를 복원할 수 있게 함
+    """
+
+    RESET = "reset"
+    RUN_START = "run_start"
+    RUN_END = "run_end"
+    MESSAGE = "message"
+    EXECUTION = "execution"
+    REASONING = "reasoning"
+    TOKEN_USAGE = "token_usage"
+
+    def __init__(self, path: str, fsync_every: int = 64, fsync_interval: float = 1.0):
+        """
+        SessionJournal 초기화 (기존 파일이 있으면 이어서 기록)
+
+        Args:
+            path: 저널 파일 경로 (.jsonl, 인덱스는 같은 경로에 .idx를 붙여 저장)
+            fsync_every: 이 개수의 이벤트가 쌓이면 fsync
+            fsync_interval: 마지막 fsync 이후 이 시간(초)이 지나면 다음 기록 시 fsync
+        """
+        self.path = path
+        self.index_path = path + ".idx"
+        self.fsync_every = max(1, fsync_every)
+        self.fsync_interval = fsync_interval
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+        self._file = open(self.path, "ab+")
+        self._index = open(self.index_path, "ab+")
+        self._recover()
+
+    @classmethod
+    def for_session(cls, directory: str, session_id: str, **kwargs) -> "SessionJournal":
+        """
+        세션 ID로 저널 열기
+
+        Args:
+            directory: 저널 저장 디렉토리
+            session_id: 세션 ID (영문/숫자/-/_ 64자 이내)
+
+        Returns:
+            SessionJournal: <directory>/<session_id>.jsonl 저널
+        """
+        if not _SESSION_ID_PATTERN.match(session_id or ""):
+            raise ValueError(f"유효하지 않은 세션 ID입니다: {session_id!r}")
+        return cls(os.path.join(directory, f"{session_id}.jsonl"), **kwargs)
+
+    @staticmethod
+    def remove_expired(directory: str, max_age: float) -> int:
+        """
+        마지막 기록 이후 max_age(초)가 지난 세션 저널과 인덱스 삭제
+
+        Args:
+            directory: 저널 저장 디렉토리
+            max_age: 보관 기간 (초)
+
+        Returns:
+            int: 삭제한 저널 수
+        """
+        if not os.path.isdir(directory):
+            return 0
+        cutoff = time.time() - max_age
+        removed = 0
+        for name in os.listdir(directory):
+            if not name.endswith(".jsonl"):
+                continue
+            path = os.path.join(directory, name)
+            try:
+                if os.path.getmtime(path) >= cutoff:
+                    continue
+                os.remove(path)
+                if os.path.exists(path + ".idx"):
+                    os.remove(path + ".idx")
+                removed += 1
+            except OSError:
+                # 다른 워커가 먼저 삭제했거나 사용 중인 파일
+                continue
+        return removed
+
+    def _recover(self):
+        """
+        비정상 종료 후 저널과 인덱스 정합성 복구
+
+        저널 기록 후 인덱스 기록 전에 종료된 이벤트는 인덱스에 다시 추가하고,
+        끝이 잘린 마지막 줄과 인덱스 항목은 잘라냄
+        """
+        journal_size = os.fstat(self._file.fileno()).st_size
+        index_size = os.fstat(self._index.fileno()).st_size
+
+        # 저널 범위를 벗어나거나 끝이 잘린 이벤트를 가리키는 인덱스 항목 제거
+        count = index_size // _INDEX_ENTRY.size
+        offset = 0
+        while count:
+            self._file.seek(self._read_index_entry(count - 1)[0])
+            if self._file.readline().endswith(b"\n"):
+                offset = self._file.tell()
+                break
+            count -= 1
+        if count * _INDEX_ENTRY.size != index_size:
+            self._index.truncate(count * _INDEX_ENTRY.size)
+
+        self._seq = count
+        self._checkpoint = self._read_index_entry(count - 1)[1] if count else 0
+
+        # 마지막 인덱스 항목 이후의 저널 내용 재색인
+        self._file.seek(offset)
+
+        for line in iter(self._file.readline, b""):
+            event = self._decode(line) if line.endswith(b"\n") else None
+            if event is None:
+                break
+            if event.get("type") == self.RESET:
+                self._checkpoint = self._seq
+            self._index.write(_INDEX_ENTRY.pack(offset, self._checkpoint))
+            self._seq += 1
+            offset += len(line)
+
+        if offset != journal_size:
+            self._file.truncate(offset)
+        self._file.seek(0, os.SEEK_END)
+        self._index.seek(0, os.SEEK_END)
+        self._index.flush()
+
+    def _read_index_entry(self, seq: int):
+        """인덱스 항목 읽기 → (오프셋, reset 순번)"""
+        self._index.seek(seq * _INDEX_ENTRY.size)
+        return _INDEX_ENTRY.unpack(self._index.read(_INDEX_ENTRY.size))
+
+    @staticmethod
+    def _decode(line: bytes) -> Optional[Dict[str, Any]]:
+        """저널 한 줄 디코딩 (손상된 줄이면 None)"""
+        try:
+            return json.loads(line)
+        except ValueError:
+            return None
+
+    def append(self, event_type: str, data: Any) -> int:
+        """
+        이벤트 기록
+
+        Args:
+            event_type: 이벤트 종류 (RESET, MESSAGE 등)
+            data: JSON 직렬화 가능한 이벤트 내용
+
+        Returns:
+            int: 이벤트 순번
+        """
+        record = {"seq": 0, "ts": time.time(), "type": event_type, "data": data}
+
+        with self._lock:
+            seq = self._seq
+            record["seq"] = seq
+            line = (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+            if event_type == self.RESET:
+                self._checkpoint = seq
+
+            offset = self._file.tell()
+            self._file.write(line)
+            self._file.flush()
+            self._index.write(_INDEX_ENTRY.pack(offset, self._checkpoint))
+            self._index.flush()
+            self._seq += 1
+
+            # fsync는 묶어서 수행 (프로세스 종료에는 flush만으로 충분, fsync는 시스템 장애 대비)
+            self._pending += 1
+            if (self._pending >= self.fsync_every
+                    or time.monotonic() - self._last_sync >= self.fsync_interval):
+                self._sync()
+
+        return seq
+
+    def _sync(self):
+        """대기 중인 기록을 디스크에 반영 (잠금 보유 상태에서 호출)"""
+        if self._pending:
+            os.fsync(self._file.fileno())
+            os.fsync(self._index.fileno())
+            self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def sync(self):
+        """대기 중인 기록을 즉시 디스크에 반영"""
+        with self._lock:
+            self._sync()
+
+    def read(self, start: int = 0, end: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        순번 범위의 이벤트 읽기 (인덱스로 시작 위치를 바로 찾음)
+
+        Args:
+            start: 시작 순번
+            end: 끝 순번 (포함하지 않음, 기본값: 마지막까지)
+
+        Yields:
+            Dict: 이벤트 (seq, ts, type, data)
+        """
+        with self._lock:
+            end = self._seq if end is None else min(end, self._seq)
+            if start >= end:
+                return
+            offset = self._read_index_entry(start)[0]
+
+        with open(self.path, "rb") as reader:
+            reader.seek(offset)
+            for _ in range(end - start):
+                event = self._decode(reader.readline())
+                if event is None:
+                    break
+                yield event
+
+    def replay(self) -> Dict[str, Any]:
+        """
+        현재 대화(마지막 reset 이후)의 상태 재구성
+
+        LLM/SSH 호출 없이 기록된 이벤트만으로 에이전트 상태를 복원하는 데 사용
+
+        Returns:
+            Dict: conversation, execution_log, reasoning_history, token_usage,
+                  runs (실행별 결과), events (읽은 이벤트 수)
+        """
+        with self._lock:
+            checkpoint = self._checkpoint
+
+        state = {
+            "conversation": [],
+            "execution_log": [],
+            "reasoning_history": [],
+            "token_usage": [],
+            "runs": [],
+            "events": 0
+        }
+
+        for event in self.read(checkpoint):
+            state["events"] += 1
+            event_type, data = event["type"], event["data"]
+
+            if event_type == self.RESET:
+                state.update(conversation=[], execution_log=[], reasoning_history=[], token_usage=[], runs=[])
+            elif event_type == self.MESSAGE:
+                state["conversation"].append(data)
+            elif event_type == self.EXECUTION:
+                state["execution_log"].append(data)
+            elif event_type == self.REASONING:
+                state["reasoning_history"].append(data)
+            elif event_type == self.TOKEN_USAGE:
+                state["token_usage"].append(data)
+            elif event_type == self.RUN_START:
+                # 실행 로그와 추론 기록은 실행 단위로 초기화됨 (에이전트와 동일)
+                state["execution_log"] = []
+                state["reasoning_history"] = []
+            elif event_type == self.RUN_END:
+                run = dict(data)
+                run.setdefault("result", {})
+                run["result"] = {
+                    **run["result"],
+                    "reasoning_history": list(state["reasoning_history"]),
+                    "execution_log": list(state["execution_log"])
+                }
+                state["runs"].append(run)
+
+        return state
+
+    def close(self):
+        """저널 닫기 (대기 중인 기록은 디스크에 반영)"""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._sync()
+            self._file.close()
+            self._index.close()
+
+    def __len__(self) -> int:
+        return self._seq
+
+    def __enter__(self) -> "SessionJournal":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        return f"SessionJournal(path='{self.path}', events={self._seq})"
+
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
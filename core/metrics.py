@@ -0,0 +1,533 @@
+"""
+Prometheus 형식 런타임 지표
+카운터/게이지/히스토그램 레지스트리와 텍스트 노출 형식(/metrics) HTTP 엔드포인트
+
+카운터와 히스토그램은 스레드별 샤드에 기록하고 수집 시에만 합산하므로
+기록 경로(hot path)에서 잠금이 필요 없음 (각 샤드는 소유 스레드만 갱신)
+"""
+import bisect
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+
+# 지연 시간(초) 히스토그램 기본 구간
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+# 크기(메시지 수, 토큰 수 등) 히스토그램 기본 구간
+DEFAULT_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384, 32768, 65536, 131072)
+
+
+class _ShardedValues:
+    """
+    스레드별 샤드 집합 - 샤드는 [값, ...] 형태의 리스트이며 소유 스레드만 갱신
+
+    샤드 생성(스레드당 1회)에만 잠금을 사용하고, 합산은 수집 시점에 수행
+    LLM 호출/도구 배치마다 생기는 단명 스레드로 샤드가 계속 늘지 않도록,
+    종료된 스레드의 샤드는 샤드 생성/수집 시 기본 합계에 합친 뒤 제거
+    """
+
+    def __init__(self, width: int):
+        self.width = width
+        self._local = threading.local()
+        self._shards: Dict[threading.Thread, List[float]] = {}
+        self._base = [0.0] * width  # 종료된 스레드 샤드의 합계
+        self._lock = threading.Lock()
+
+    def shard(self) -> List[float]:
+        """현재 스레드의 샤드"""
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = [0.0] * self.width
+            with self._lock:
+                self._fold_finished()
+                self._shards[threading.current_thread()] = shard
+            self._local.shard = shard
+            return shard
+
+    def _fold_finished(self):
+        """종료된 스레드의 샤드를 기본 합계에 합치고 제거 (잠금 보유 상태에서 호출, 종료된 샤드는 더 이상 갱신되지 않음)"""
+        for thread in [thread for thread in self._shards if not thread.is_alive()]:
+            for index, value in enumerate(self._shards.pop(thread)):
+                self._base[index] += value
+
+    def totals(self) -> List[float]:
+        """모든 샤드의 항목별 합계"""
+        with self._lock:
+            self._fold_finished()
+            shards = list(self._shards.values())
+            totals = list(self._base)
+        for shard in shards:
+            for index, value in enumerate(shard):
+                totals[index] += value
+        return totals
+
+
+class _CounterChild:
+    """레이블 값이 정해진 카운터"""
+
+    def __init__(self):
+        self._values = _ShardedValues(1)
+
+    def inc(self, amount: float = 1.0):
+        """증가 (음수 불가)"""
+        if amount < 0:
+            raise ValueError("카운터는 감소할 수 없습니다")
+        self._values.shard()[0] += amount
+
+    def get(self) -> float:
+        """현재 값"""
+        return self._values.totals()[0]
+
+
+class _GaugeChild:
+    """레이블 값이 정해진 게이지 (증감/설정 또는 수집 시 함수 호출)"""
+
+    def __init__(self):
+        self._value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0):
+        with self._lock:
+            self._value -= amount
+
+    def set(self, value: float):
+        with self._lock:
+            self._value = float(value)
+
+    def set_function(self, function: Callable[[], float]):
+        """수집 시점에 값을 계산할 함수 설정 (큐 길이, 풀 사용량 등)"""
+        self._function = function
+
+    def get(self) -> float:
+        """현재 값"""
+        if self._function is not None:
+            try:
+                return float(self._function())
+            except Exception:
+                return float("nan")
+        return self._value
+
+
+class _HistogramChild:
+    """레이블 값이 정해진 히스토그램 - 샤드 구성: [구간별 개수..., 합계, 전체 개수]"""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self._values = _ShardedValues(len(buckets) + 3)
+
+    def observe(self, value: float):
+        """관측값 기록"""
+        shard = self._values.shard()
+        shard[bisect.bisect_left(self.buckets, value)] += 1
+        shard[-2] += value
+        shard[-1] += 1
+
+    def get(self) -> Dict[str, object]:
+        """누적 구간 개수, 합계, 개수"""
+        totals = self._values.totals()
+        cumulative = []
+        running = 0.0
+        for count in totals[:len(self.buckets) + 1]:
+            running += count
+            cumulative.append(running)
+        return {"buckets": cumulative, "sum": totals[-2], "count": totals[-1]}
+
+
+class Metric:
+    """
+    레이블별 하위 지표를 관리하는 지표 기본 클래스
+
+    레이블이 없는 지표는 inc/observe 등을 바로 호출하고,
+    레이블이 있는 지표는 labels(...)로 하위 지표를 얻어 호출
+    """
+
+    TYPE = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        """
+        Metric 초기화
+
+        Args:
+            name: 지표 이름 (Prometheus 명명 규칙)
+            documentation: 설명 (HELP)
+            labelnames: 레이블 이름 목록
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        self._unlabelled = None
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values, **labels):
+        """
+        레이블 값에 해당하는 하위 지표 (없으면 생성)
+
+        Args:
+            *values: 레이블 값 (labelnames 순서)
+            **labels: 이름으로 지정한 레이블 값
+
+        Returns:
+            하위 지표
+        """
+        key = tuple(map(str, values)) if values else tuple(str(labels[name]) for name in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name}: 레이블 개수가 맞지 않습니다 ({self.labelnames})")
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _default(self):
+        """레이블 없는 지표의 하위 지표"""
+        if self._unlabelled is None:
+            if self.labelnames:
+                raise ValueError(f"{self.name}: 레이블 값을 지정해야 합니다 ({self.labelnames})")
+            self._unlabelled = self.labels()
+        return self._unlabelled
+
+    def children(self) -> List[Tuple[Dict[str, str], object]]:
+        """(레이블, 하위 지표) 목록"""
+        with self._lock:
+            items = list(self._children.items())
+        return [(dict(zip(self.labelnames, key)), child) for key, child in items]
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        return f"{self.__class__.__name__}(name='{self.name}', labels={list(self.labelnames)})"
+
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
+
+
+class Counter(Metric):
+    """단조 증가 카운터"""
+
+    TYPE = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0):
+        self._default().inc(amount)
+
+
+class Gauge(Metric):
+    """증감 가능한 게이지"""
+
+    TYPE = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def inc(self, amount: float = 1.0):
+        self._default().inc(amount)
+
+    def dec(self, amount: float = 1.0):
+        self._default().dec(amount)
+
+    def set(self, value: float):
+        self._default().set(value)
+
+    def set_function(self, function: Callable[[], float]):
+        self._default().set_function(function)
+
+
+class Histogram(Metric):
+    """구간별 분포 히스토그램"""
+
+    TYPE = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS
+    ):
+        """
+        Histogram 초기화
+
+        Args:
+            name: 지표 이름
+            documentation: 설명
+            labelnames: 레이블 이름 목록
+            buckets: 구간 상한 목록 (+Inf는 자동 추가)
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float):
+        self._default().observe(value)
+
+
+def _format_value(value: float) -> str:
+    """Prometheus 숫자 표기"""
+    if value != value:
+        return "NaN"
+    if value in (float("inf"), float("-inf")):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    """레이블 표기 ({a="1",b="2"}) - 값의 역슬래시/따옴표/줄바꿈은 이스케이프"""
+    if not labels:
+        return ""
+    pairs = []
+    for name, value in labels.items():
+        escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{name}="{escaped}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def percentile(values: Sequence[float], p: float) -> float:
+    """
+    선형 보간 백분위수 (배치 실행 요약, 벤치마크 등 표본 목록 집계용)
+
+    Args:
+        values: 표본 값
+        p: 백분위 (0-100)
+
+    Returns:
+        float: 백분위수 (표본이 없으면 0.0)
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * p / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+class MetricsRegistry:
+    """
+    지표 레지스트리 - 이름으로 지표를 등록/조회하고 Prometheus 텍스트 형식으로 출력
+
+    같은 이름으로 다시 등록하면 기존 지표를 반환 (모듈 재로딩/Streamlit 재실행에도 안전)
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric_class, name: str, *args, **kwargs) -> Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = metric_class(name, *args, **kwargs)
+                self._metrics[name] = metric
+            elif not isinstance(metric, metric_class):
+                raise ValueError(f"이미 다른 유형으로 등록된 지표입니다: {name}")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """카운터 등록/조회"""
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """게이지 등록/조회"""
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS
+    ) -> Histogram:
+        """히스토그램 등록/조회"""
+        return self._register(Histogram, name, documentation, labelnames, buckets)
+
+    def get(self, name: str) -> Optional[Metric]:
+        """이름으로 지표 조회"""
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """
+        Prometheus 텍스트 노출 형식(0.0.4)으로 출력
+
+        Returns:
+            str: /metrics 응답 본문
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.TYPE}")
+            for labels, child in metric.children():
+                if isinstance(metric, Histogram):
+                    data = child.get()
+                    bounds = [_format_value(bound) for bound in metric.buckets] + ["+Inf"]
+                    for bound, count in zip(bounds, data["buckets"]):
+                        lines.append(f"{metric.name}_bucket{_format_labels(dict(labels, le=bound))} {_format_value(count)}")
+                    lines.append(f"{metric.name}_sum{_format_labels(labels)} {_format_value(data['sum'])}")
+                    lines.append(f"{metric.name}_count{_format_labels(labels)} {_format_value(data['count'])}")
+                else:
+                    lines.append(f"{metric.name}{_format_labels(labels)} {_format_value(child.get())}")
+        return "\n".join(lines) + "\n"
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        return f"MetricsRegistry(metrics={len(self._metrics)})"
+
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
+
+
+# 프로세스 공용 레지스트리
+REGISTRY = MetricsRegistry()
+
+
+# 에이전트 런타임 지표
+LLM_REQUESTS = REGISTRY.counter(
+    "react_agent_llm_requests_total", "LLM chat completion calls", ("model", "status"))
+LLM_LATENCY = REGISTRY.histogram(
+    "react_agent_llm_request_duration_seconds", "LLM chat completion latency", ("model",))
+LLM_TOKENS = REGISTRY.counter(
+    "react_agent_llm_tokens_total", "LLM tokens processed (kind=prompt|completion)", ("model", "kind"))
+LLM_INFLIGHT = REGISTRY.gauge(
+    "react_agent_llm_inflight_requests", "LLM calls currently waiting for a response", ("model",))
+LLM_QUEUE_DEPTH = REGISTRY.gauge(
+    "react_agent_llm_queue_depth", "LLM calls waiting for a concurrency slot", ("model",))
+
+TOOL_EXECUTIONS = REGISTRY.counter(
+    "react_agent_tool_executions_total", "Tool executions by outcome", ("tool", "status"))
+TOOL_LATENCY = REGISTRY.histogram(
+    "react_agent_tool_duration_seconds", "Tool execution latency", ("tool",))
+
+SSH_CONNECTS = REGISTRY.counter(
+    "react_agent_ssh_connects_total", "SSH connection attempts by outcome", ("status",))
+SSH_CONNECT_LATENCY = REGISTRY.histogram(
+    "react_agent_ssh_connect_duration_seconds", "SSH connect latency (TCP, key exchange and auth)")
+SSH_COMMAND_LATENCY = REGISTRY.histogram(
+    "react_agent_ssh_command_duration_seconds", "Remote command latency (exec and read)")
+SSH_SESSIONS_OPEN = REGISTRY.gauge(
+    "react_agent_ssh_sessions_open", "Open SSH transports")
+SSH_POOL_IDLE = REGISTRY.gauge(
+    "react_agent_ssh_pool_idle", "Idle SSH transports kept in the pool")
+SSH_POOL_IN_USE = REGISTRY.gauge(
+    "react_agent_ssh_pool_in_use", "Pooled SSH transports checked out by sessions")
+
+CONTEXT_MESSAGES = REGISTRY.histogram(
+    "react_agent_context_messages", "Messages sent to the LLM per iteration", buckets=DEFAULT_SIZE_BUCKETS)
+CONTEXT_TOKENS = REGISTRY.histogram(
+    "react_agent_context_prompt_tokens", "Prompt tokens per iteration (reported by the LLM)", buckets=DEFAULT_SIZE_BUCKETS)
+
+ACTIVE_RUNS = REGISTRY.gauge(
+    "react_agent_active_runs", "Agent runs in progress")
+RUNS = REGISTRY.counter(
+    "react_agent_runs_total", "Finished agent runs by stop reason", ("mode", "stop_reason"))
+RUN_LATENCY = REGISTRY.histogram(
+    "react_agent_run_duration_seconds", "Agent run latency", ("mode",))
+
+
+# /metrics는 인증 없이 모델명/도구명 등 레이블을 노출하므로 기본적으로 로컬에서만 접근 가능하도록 바인딩
+DEFAULT_METRICS_HOST = "127.0.0.1"
+
+
+class MetricsServer:
+    """
+    /metrics 엔드포인트를 제공하는 표준 라이브러리 HTTP 서버 (백그라운드 스레드)
+    """
+
+    def __init__(self, registry: MetricsRegistry = REGISTRY, host: str = DEFAULT_METRICS_HOST, port: int = 9464):
+        """
+        MetricsServer 초기화
+
+        Args:
+            registry: 노출할 레지스트리
+            host: 바인딩 주소 (외부 수집기가 접근해야 하면 명시적으로 지정)
+            port: 바인딩 포트 (0이면 임의 포트)
+        """
+        self.registry = registry
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        """실제 바인딩된 포트"""
+        return self._server.server_address[1]
+
+    def _make_handler(self):
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0].rstrip("/") not in ("", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "MetricsServer":
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="metrics", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """서버 종료"""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        return f"MetricsServer(host='{self._server.server_address[0]}', port={self.port})"
+
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
+
+
+_server: Optional[MetricsServer] = None
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(port: int, host: str = DEFAULT_METRICS_HOST) -> MetricsServer:
+    """
+    프로세스 공용 /metrics 서버 시작 (이미 실행 중이면 기존 서버 반환)
+
+    Streamlit처럼 스크립트가 반복 실행되는 환경에서도 한 번만 바인딩됨
+
+    Args:
+        port: 바인딩 포트
+        host: 바인딩 주소 (기본값: 127.0.0.1)
+
+    Returns:
+        MetricsServer: 실행 중인 서버
+    """
+    global _server
+    with _server_lock:
+        if _server is None:
+            _server = MetricsServer(REGISTRY, host=host, port=port).start()
+        return _server
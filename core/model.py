@@ -3,8 +3,14 @@ import requests
 import json
 import time
 import os
+import threading
+import itertools
 from typing import List, Dict, Any, Optional, Union
 from dotenv import load_dotenv
+from core.cassette import get_current_cassette
+from core.tracing import trace_span
+from core.metrics import LLM_REQUESTS, LLM_LATENCY, LLM_TOKENS, LLM_INFLIGHT, LLM_QUEUE_DEPTH
+from core.cancellation import get_current_token
 
 # .env 파일 로드
 load_dotenv()
@@ -43,7 +49,7 @@ class LLMClient:
     모델명에 따라 적절한 공식 라이브러리를 동적으로 선택하여 통신
     """
     
-    def __init__(self, endpoint: str = "http://localhost:11434", model: str = "gpt-oss:20b"):
+    def __init__(self, endpoint: str = "http://localhost:11434", model: str = "gpt-oss:20b", max_concurrency: Optional[int] = None):
         """
         LLM 클라이언트 초기화
         모델명에 따라 적절한 공식 라이브러리를 동적으로 선택
@@ -51,13 +57,21 @@ class LLMClient:
         Args:
             endpoint (str): LLM 서버 주소 (기본값: localhost:11434)
             model (str): 사용할 모델명 (기본값: gpt-oss:20b)
+            max_concurrency (int): 동시에 보낼 수 있는 최대 요청 수 (None이면 무제한, 여러 실행이 클라이언트를 공유할 때 사용)
         """
         self.endpoint = endpoint.rstrip('/')
         self.model = model
         self.library_type = self._get_library_for_model(model)
         
-        # 모델에 따라 적절한 클라이언트 동적 생성
-        self.client = self._create_client(model, endpoint)
+        # 동시 요청 제한 - 초과 요청은 대기하며 대기 수는 백엔드 포화 판단(waiting)에 사용
+        self.max_concurrency = max_concurrency
+        self._slots = threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+        self._waiting = 0
+        self._waiting_lock = threading.Lock()
+        
+        # 모델에 따라 적절한 클라이언트 동적 생성 (카세트 재생 중에는 실제 서버를 사용하지 않으므로 생략)
+        cassette = get_current_cassette()
+        self.client = None if cassette and cassette.replaying else self._create_client(model, endpoint)
         
         # 직접 HTTP 요청용 (모델 리스트, 헬스체크 등)
         self.session = requests.Session()
@@ -305,23 +319,53 @@ class LLMClient:
         Returns:
             Dict: 응답 결과
         """
+        # 동시 요청 제한 슬롯 확보 (대기 중 실행이 취소되면 호출하지 않음)
+        if self._slots is not None and not self._acquire_slot():
+            return {
+                "success": False,
+                "response": "Chat completion cancelled while waiting for a free slot",
+                "model": self.model,
+                "endpoint": self.endpoint,
+                "library": self.library_type,
+                "error": "cancelled"
+            }
+        
+        # 응답 대기 중인 호출 수 (백엔드 포화 여부 확인용)
+        inflight = LLM_INFLIGHT.labels(self.model)
+        inflight.inc()
+        start_time = time.perf_counter()
         try:
             # 메시지 형식 정규화
             if isinstance(messages, str):
                 messages = [{"role": "user", "content": messages}]
             
-            # 라이브러리 타입에 따라 다른 처리
-            if self.library_type == "openai":
-                return self._openai_chat_completion(messages, tools, stream, temperature, max_tokens, **kwargs)
-            elif self.library_type == "dashscope":
-                return self._dashscope_chat_completion(messages, tools, stream, temperature, max_tokens, **kwargs)
-            elif self.library_type == "anthropic":
-                return self._anthropic_chat_completion(messages, tools, stream, temperature, max_tokens, **kwargs)
-            else:
-                # 기본값: OpenAI 방식
-                return self._openai_chat_completion(messages, tools, stream, temperature, max_tokens, **kwargs)
+            with trace_span("llm.chat_completion", model=self.model, messages=len(messages), tools=len(tools or [])) as span:
+                # 카세트 기록/재생 중이면 카세트를 거쳐 호출 (스트리밍은 제외)
+                cassette = get_current_cassette()
+                if cassette is not None and not stream:
+                    span.set_attribute("cassette", cassette.mode)
+                    response = cassette.chat_completion(
+                        self,
+                        lambda: self._dispatch_chat_completion(messages, tools, stream, temperature, max_tokens, **kwargs),
+                        messages,
+                        tools
+                    )
+                else:
+                    response = self._dispatch_chat_completion(messages, tools, stream, temperature, max_tokens, **kwargs)
+                
+                ttft = None
+                if stream and response.get("stream") is not None:
+                    # 첫 청크를 받아 TTFT를 측정한 뒤 호출자에게는 첫 청크를 포함한 스트림 그대로 전달
+                    chunks = iter(response["stream"])
+                    first_chunk = next(chunks, None)
+                    ttft = time.perf_counter() - start_time
+                    response["stream"] = itertools.chain([first_chunk], chunks) if first_chunk is not None else iter(())
+                
+                self._record_call(span, response, time.perf_counter() - start_time, ttft)
+                return response
                 
         except Exception as e:
+            LLM_REQUESTS.labels(self.model, "error").inc()
             return {
                 "success": False,
                 "response": f"Error during chat completion: {str(e)}",
@@ -330,6 +374,81 @@ class LLMClient:
                 "library": self.library_type,
                 "error": str(e)
             }
+        finally:
+            inflight.dec()
+            if self._slots is not None:
+                self._slots.release()
+    
+    @property
+    def waiting(self) -> int:
+        """동시 요청 제한으로 대기 중인 호출 수"""
+        return self._waiting
+    
+    def _acquire_slot(self, poll_interval: float = 0.1) -> bool:
+        """
+        동시 요청 슬롯 확보 - 현재 컨텍스트의 취소 토큰이 취소되면 포기
+        
+        Returns:
+            bool: 슬롯 확보 여부
+        """
+        token = get_current_token()
+        queue_depth = LLM_QUEUE_DEPTH.labels(self.model)
+        with self._waiting_lock:
+            self._waiting += 1
+        queue_depth.inc()
+        try:
+            while not self._slots.acquire(timeout=poll_interval):
+                if token is not None and token.cancelled:
+                    return False
+            if token is not None and token.cancelled:
+                self._slots.release()
+                return False
+            return True
+        finally:
+            with self._waiting_lock:
+                self._waiting -= 1
+            queue_depth.dec()
+    
+    def _record_call(self, span, response: Dict[str, Any], latency: float, ttft: Optional[float] = None):
+        """
+        LLM 호출 지표와 스팬에 지연 시간/토큰 사용량 기록
+        
+        TTFT는 스트림의 첫 청크로 측정한 경우에만 기록 (비스트리밍 응답은 첫 토큰 시점을 알 수 없음)
+        출력 토큰 처리량은 전체 지연 시간(대기/prefill 포함) 기준이므로 decode 속도가 아님
+        
+        Args:
+            span: llm.chat_completion 스팬
+            response: 응답 결과
+            latency: 전체 지연 시간 (초)
+            ttft: 첫 청크까지의 시간 (초, 측정하지 않았으면 None)
+        """
+        usage = response.get("usage") or {}
+        LLM_REQUESTS.labels(self.model, "success" if response.get("success") else "error").inc()
+        LLM_LATENCY.labels(self.model).observe(latency)
+        if usage.get("prompt_tokens"):
+            LLM_TOKENS.labels(self.model, "prompt").inc(usage["prompt_tokens"])
+        if usage.get("completion_tokens"):
+            LLM_TOKENS.labels(self.model, "completion").inc(usage["completion_tokens"])
+        
+        if not span:
+            return
+        span.set_attributes(finish_reason=response.get("finish_reason"), ttft=round(ttft, 4) if ttft is not None else None)
+        completion_tokens = usage.get("completion_tokens")
+        span.set_attributes(prefill_tokens=usage.get("prompt_tokens"), decode_tokens=completion_tokens)
+        if completion_tokens and latency > 0:
+            span.set_attribute("output_tokens_per_second", round(completion_tokens / latency, 1))
+    
+    def _dispatch_chat_completion(self, messages, tools, stream, temperature, max_tokens, **kwargs):
+        """라이브러리 타입에 따라 다른 처리"""
+        if self.library_type == "openai":
+            return self._openai_chat_completion(messages, tools, stream, temperature, max_tokens, **kwargs)
+        elif self.library_type == "dashscope":
+            return self._dashscope_chat_completion(messages, tools, stream, temperature, max_tokens, **kwargs)
+        elif self.library_type == "anthropic":
+            return self._anthropic_chat_completion(messages, tools, stream, temperature, max_tokens, **kwargs)
+        else:
+            # 기본값: OpenAI 방식
+            return self._openai_chat_completion(messages, tools, stream, temperature, max_tokens, **kwargs)
     
     def _openai_chat_completion(self, messages, tools, stream, temperature, max_tokens, **kwargs):
         """OpenAI 방식의 채팅 완료"""
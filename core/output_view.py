@@ -0,0 +1,202 @@
+import re
+import threading
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+from core.blob_store import BlobStore
+
+
+# 분석 도구 출력의 섹션 머리글 ("[메모리 사용량]" 다음 줄이 "-----")
+_SECTION_HEADER = re.compile(r"^\[[^\]\n]+\]\n-{3,}$", re.MULTILINE)
+
+
+def detect_language(text: str) -> str:
+    """
+    st.code 강조 표시용 출력 형식 추정 (앞부분만 검사)
+
+    Args:
+        text: 도구 출력
+
+    Returns:
+        str: "json" 또는 "text"
+    """
+    head = text[:64].lstrip()[:1]
+    return "json" if head in ("{", "[") and not _SECTION_HEADER.match(text[:200]) else "text"
+
+
+def _cut_at_line(text: str, limit: int) -> str:
+    """limit 이내에서 마지막 줄바꿈 위치로 자름 (한 줄이 limit보다 길면 공백/구분자 위치)"""
+    if len(text) <= limit:
+        return text
+    cut = text.rfind("\n", 0, limit)
+    if cut <= 0:
+        cut = max(text.rfind(" ", 0, limit), text.rfind(",", 0, limit) + 1)
+    return text[:cut if cut > 0 else limit]
+
+
+def truncate_output(text: str, max_chars: int = 500, section_lines: int = 3) -> str:
+    """
+    구조를 유지하며 도구 출력 축약
+
+    줄 중간에서 자르지 않고, 분석 도구의 섹션 출력은 첫 섹션만 보이지 않도록 섹션마다 머리글과 앞 몇 줄을 남김
+    앞부분(max_chars의 64배)만 검사하므로 출력 크기와 관계없이 일정한 비용으로 동작
+
+    Args:
+        text: 도구 출력
+        max_chars: 축약 결과의 대략적인 최대 길이
+        section_lines: 섹션 출력에서 섹션별로 남길 줄 수
+
+    Returns:
+        str: 축약된 출력 (생략된 분량 표시 포함)
+    """
+    if len(text) <= max_chars:
+        return text
+
+    window = text[:max_chars * 64]
+    headers = [match.start() for match in _SECTION_HEADER.finditer(window)]
+    if len(headers) > 1:
+        # 첫 섹션 앞의 제목 부분도 몇 줄 유지
+        title = window[:headers[0]].strip("\n").split("\n")[:3]
+        parts = ["\n".join(title)] if any(title) else []
+        for index, start in enumerate(headers):
+            end = headers[index + 1] if index + 1 < len(headers) else len(window)
+            lines = window[start:end].rstrip("\n").split("\n")
+            # 머리글 두 줄 + 본문 앞부분
+            kept = lines[:2 + section_lines]
+            if len(lines) > len(kept):
+                kept.append(f"  … ({len(lines) - len(kept)}줄 더 있음)")
+            parts.append("\n".join(kept))
+        preview = _cut_at_line("\n".join(parts), max_chars)
+    else:
+        preview = _cut_at_line(window, max_chars)
+
+    omitted = len(text) - len(preview)
+    return f"{preview}\n… (전체 {len(text):,}자 중 {omitted:,}자 생략)"
+
+
+class OutputPager:
+    """
+    저장소의 도구 출력을 줄 단위 페이지로 조회하고 검색하는 도우미
+
+    출력별 줄 시작 오프셋 색인을 한 번만 만들어 LRU로 보관하므로,
+    페이지 이동은 출력 전체가 아니라 해당 페이지 크기만큼의 비용으로 처리
+    """
+
+    def __init__(self, blob_store: BlobStore, page_lines: int = 200, max_cached: int = 8):
+        """
+        OutputPager 초기화
+
+        Args:
+            blob_store: 도구 출력 저장소
+            page_lines: 페이지당 줄 수
+            max_cached: 색인을 보관할 최대 출력 수
+        """
+        self.blob_store = blob_store
+        self.page_lines = page_lines
+        self.max_cached = max_cached
+        self._cache: "OrderedDict[str, Tuple[str, array]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _indexed(self, ref: str) -> Optional[Tuple[str, array]]:
+        """출력 내용과 줄 시작 오프셋 색인 (없으면 만들어서 캐시)"""
+        with self._lock:
+            entry = self._cache.get(ref)
+            if entry is not None:
+                self._cache.move_to_end(ref)
+                return entry
+
+        text = self.blob_store.get(ref)
+        if text is None:
+            return None
+        offsets = array("Q", [0])
+        position = text.find("\n")
+        while position != -1:
+            offsets.append(position + 1)
+            position = text.find("\n", position + 1)
+
+        with self._lock:
+            self._cache[ref] = (text, offsets)
+            while len(self._cache) > self.max_cached:
+                self._cache.popitem(last=False)
+        return text, offsets
+
+    def info(self, ref: str) -> Optional[Dict[str, Any]]:
+        """
+        출력 요약 정보
+
+        Returns:
+            Optional[Dict]: 문자 수, 줄 수, 페이지 수, 형식 (출력이 없으면 None)
+        """
+        entry = self._indexed(ref)
+        if entry is None:
+            return None
+        text, offsets = entry
+        return {
+            "chars": len(text),
+            "lines": len(offsets),
+            "pages": max(1, -(-len(offsets) // self.page_lines)),
+            "language": detect_language(text)
+        }
+
+    def page(self, ref: str, page: int) -> Optional[str]:
+        """
+        페이지 조회
+
+        Args:
+            ref: 출력 digest
+            page: 0부터 시작하는 페이지 번호
+
+        Returns:
+            Optional[str]: 해당 페이지의 줄들 (출력이 없으면 None)
+        """
+        return self.lines(ref, page * self.page_lines, self.page_lines)
+
+    def lines(self, ref: str, start: int, count: int) -> Optional[str]:
+        """start번째 줄(0부터)부터 count줄 조회"""
+        entry = self._indexed(ref)
+        if entry is None:
+            return None
+        text, offsets = entry
+        start = max(0, min(start, len(offsets) - 1))
+        end = start + count
+        stop = offsets[end] - 1 if end < len(offsets) else len(text)
+        return text[offsets[start]:stop]
+
+    def search(self, ref: str, query: str, max_hits: int = 50, ignore_case: bool = True) -> List[Dict[str, Any]]:
+        """
+        출력 내 문자열 검색
+
+        Args:
+            ref: 출력 digest
+            query: 검색어
+            max_hits: 최대 결과 수
+            ignore_case: 대소문자 무시 여부
+
+        Returns:
+            List[Dict]: 일치한 줄 목록 - {"line": 줄 번호(0부터), "page": 페이지 번호, "text": 줄 내용(앞부분)}
+        """
+        entry = self._indexed(ref)
+        if entry is None or not query:
+            return []
+        text, offsets = entry
+        # 소문자 변환 복사본을 만들지 않고 원문에서 검색 (변환 시 길이가 달라지는 문자가 있어 오프셋이 어긋날 수 있음)
+        pattern = re.compile(re.escape(query), re.IGNORECASE if ignore_case else 0)
+
+        hits = []
+        match = pattern.search(text)
+        while match and len(hits) < max_hits:
+            line = bisect_right(offsets, match.start()) - 1
+            end = offsets[line + 1] - 1 if line + 1 < len(offsets) else len(text)
+            hits.append({"line": line, "page": line // self.page_lines, "text": text[offsets[line]:end][:200]})
+            # 같은 줄의 나머지 일치는 건너뜀
+            match = pattern.search(text, end + 1)
+        return hits
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        return f"OutputPager(page_lines={self.page_lines}, cached={len(self._cache)})"
+
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
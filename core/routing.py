@@ -0,0 +1,170 @@
+import threading
+from typing import Dict, List, Any, Optional, Tuple
+from core.model import LLMClient
+
+
+class ModelRouter:
+    """
+    ReAct 단계별 모델 선택 정책 (2-tier 라우팅)
+
+    도구 선택 단계는 빠른(소형) 모델로 처리하고,
+    최종 보고서 작성은 강한(대형) 모델로 처리
+    빠른 모델이 같은 도구 호출을 반복하거나 실패하면 해당 실행의 나머지를 강한 모델로 승격
+    """
+
+    FAST = "fast"
+    STRONG = "strong"
+
+    def __init__(
+        self,
+        fast_client: LLMClient,
+        strong_client: LLMClient,
+        loop_threshold: int = 2,
+        escalate_on_failure: bool = True
+    ):
+        """
+        ModelRouter 초기화
+
+        Args:
+            fast_client: 도구 선택용 빠른 모델 클라이언트
+            strong_client: 최종 보고서 및 승격용 강한 모델 클라이언트
+            loop_threshold: 동일 도구 호출이 이 횟수에 도달하면 강한 모델로 승격
+            escalate_on_failure: 빠른 모델 호출 실패 시 승격 여부
+        """
+        self.clients = {
+            self.FAST: fast_client,
+            self.STRONG: strong_client
+        }
+        self.loop_threshold = max(1, loop_threshold)
+        self.escalate_on_failure = escalate_on_failure
+
+        # 실행 단위 상태
+        self.escalated = False
+        self.escalation_reason: Optional[str] = None
+        self._call_counts: Dict[Tuple[str, str], int] = {}
+
+        # 계층별 누적 지표
+        self._lock = threading.Lock()
+        self._metrics = {tier: self._empty_metrics() for tier in self.clients}
+
+    @staticmethod
+    def _empty_metrics() -> Dict[str, Any]:
+        """계층별 지표 초기값"""
+        return {
+            "calls": 0,
+            "failures": 0,
+            "total_latency": 0.0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "total_tokens": 0
+        }
+
+    def reset(self):
+        """실행 단위 상태 초기화 (누적 지표는 유지)"""
+        self.escalated = False
+        self.escalation_reason = None
+        self._call_counts = {}
+
+    def select_tier(self) -> str:
+        """
+        다음 도구 선택 단계에 사용할 계층 반환
+
+        Returns:
+            str: FAST 또는 STRONG
+        """
+        return self.STRONG if self.escalated else self.FAST
+
+    def get_client(self, tier: str) -> LLMClient:
+        """계층에 해당하는 LLM 클라이언트 반환"""
+        return self.clients[tier]
+
+    def escalate(self, reason: str):
+        """
+        현재 실행의 나머지 단계를 강한 모델로 승격
+
+        Args:
+            reason: 승격 사유
+        """
+        if not self.escalated:
+            self.escalated = True
+            self.escalation_reason = reason
+
+    def record_call(self, tier: str, latency: float, response: Dict[str, Any]):
+        """
+        LLM 호출 결과를 계층별 지표에 기록
+
+        Args:
+            tier: 호출한 계층
+            latency: 호출 소요 시간 (초)
+            response: LLMClient.chat_completion 응답
+        """
+        with self._lock:
+            metrics = self._metrics[tier]
+            metrics["calls"] += 1
+            metrics["total_latency"] += latency
+
+            if not response.get("success"):
+                metrics["failures"] += 1
+                return
+
+            usage = response.get("usage") or {}
+            metrics["prompt_tokens"] += usage.get("prompt_tokens", 0) or 0
+            metrics["completion_tokens"] += usage.get("completion_tokens", 0) or 0
+            metrics["total_tokens"] += usage.get("total_tokens", 0) or 0
+
+    def observe_tool_calls(self, signatures: List[Tuple[str, str]]) -> bool:
+        """
+        실행된 도구 호출을 기록하고 반복 호출 시 승격
+
+        Args:
+            signatures: (도구명, 정규화된 인자 JSON) 목록
+
+        Returns:
+            bool: 이번 관찰로 승격되었는지 여부
+        """
+        if self.escalated:
+            return False
+
+        for signature in signatures:
+            count = self._call_counts.get(signature, 0) + 1
+            self._call_counts[signature] = count
+            if count >= self.loop_threshold:
+                self.escalate(f"동일 도구 호출 반복: {signature[0]} ({count}회)")
+                return True
+
+        return False
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        계층별 지연 시간 및 토큰 지표 반환
+
+        Returns:
+            Dict: 계층별 지표와 현재 승격 상태
+        """
+        with self._lock:
+            tiers = {}
+            for tier, metrics in self._metrics.items():
+                tier_metrics = dict(metrics)
+                tier_metrics["model"] = self.clients[tier].model
+                tier_metrics["total_latency"] = round(metrics["total_latency"], 3)
+                tier_metrics["avg_latency"] = (
+                    round(metrics["total_latency"] / metrics["calls"], 3) if metrics["calls"] else 0.0
+                )
+                tiers[tier] = tier_metrics
+
+        return {
+            "tiers": tiers,
+            "escalated": self.escalated,
+            "escalation_reason": self.escalation_reason
+        }
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        return (
+            f"ModelRouter(fast='{self.clients[self.FAST].model}', "
+            f"strong='{self.clients[self.STRONG].model}', escalated={self.escalated})"
+        )
+
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
@@ -0,0 +1,325 @@
+import hashlib
+import threading
+import contextvars
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional
+from core.cancellation import CancellationError, CancellationToken, use_token, run_cancellable
+from core.model import LLMClient
+
+
+# 청크 요약 프롬프트
+CHUNK_SUMMARY_PROMPT = """다음은 원격 서버 도구 `{tool}`의 출력 중 일부({index}/{total})입니다.
+시스템 진단에 필요한 핵심 정보(오류, 경고, 비정상 수치, 실패한 항목, 리소스 사용량)만 남기고 간결하게 요약하세요.
+수치와 식별자(서비스명, 컨테이너 ID, PID 등)는 원문 그대로 유지하세요.
+
+```
+{chunk}
+```"""
+
+# 부분 요약 병합 프롬프트
+REDUCE_SUMMARY_PROMPT = """다음은 도구 `{tool}`의 대용량 출력을 {total}개 구간으로 나누어 요약한 결과입니다.
+중복을 제거하고 하나의 관찰 결과로 통합하세요. 오류와 이상 징후를 먼저 나열하고, 수치와 식별자는 그대로 유지하세요.
+
+{summaries}"""
+
+
+class ToolOutputSummarizer:
+    """
+    대용량 도구 출력을 Map-Reduce 방식으로 요약하는 클래스
+
+    출력을 청크로 나눈 뒤 저비용 모델로 병렬 요약(map)하고,
+    부분 요약들을 하나의 관찰 결과로 병합(reduce)
+    청크 요약은 내용 해시 기준으로 캐시하여 동일 출력 재요약을 방지
+    """
+
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        threshold: int = 20000,
+        chunk_size: int = 8000,
+        max_workers: int = 4,
+        cache_size: int = 256,
+        max_tokens: Optional[int] = None
+    ):
+        """
+        ToolOutputSummarizer 초기화
+
+        Args:
+            llm_client: 요약에 사용할 (저비용) LLM 클라이언트
+            threshold: 요약을 적용할 최소 출력 길이 (문자 수)
+            chunk_size: 청크당 최대 문자 수
+            max_workers: 동시에 실행할 최대 요약 요청 수
+            cache_size: 캐시할 청크 요약 최대 개수
+            max_tokens: 요약 응답 최대 토큰 수
+        """
+        self.llm_client = llm_client
+        self.threshold = threshold
+        self.chunk_size = chunk_size
+        self.max_workers = max(1, max_workers)
+        self.cache_size = cache_size
+        self.max_tokens = max_tokens
+
+        # 내용 해시 → 요약 (LRU)
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.stats = {
+            "summarized_outputs": 0,
+            "chunks": 0,
+            "cache_hits": 0,
+            "failed_chunks": 0
+        }
+
+    def should_summarize(self, output: str) -> bool:
+        """
+        요약 적용 여부 판단
+
+        Args:
+            output: 도구 출력
+
+        Returns:
+            bool: 임계값 초과 여부
+        """
+        return output is not None and len(output) > self.threshold
+
+    def summarize(
+        self,
+        tool_name: str,
+        output: str,
+        token: Optional[CancellationToken] = None,
+        llm_timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        도구 출력을 청크 단위로 요약한 뒤 하나로 병합
+
+        Args:
+            tool_name: 출력을 생성한 도구명
+            output: 원본 도구 출력
+            token: 취소 토큰 (도구 실행 토큰 - 마감 시각이 지나거나 취소되면 요약 중단)
+            llm_timeout: 요약 LLM 호출 1회당 제한 시간 (초, 토큰의 남은 시간을 넘지 않음)
+
+        Returns:
+            Dict: 요약 결과 (summary, chunks, original_length, cache_hits 등)
+
+        Raises:
+            CancellationError: 요약 완료 전에 취소되거나 마감 시각이 지난 경우
+        """
+        with use_token(token):
+            return self._summarize(tool_name, output, token, llm_timeout)
+
+    def _summarize(
+        self,
+        tool_name: str,
+        output: str,
+        token: Optional[CancellationToken],
+        llm_timeout: Optional[float]
+    ) -> Dict[str, Any]:
+        """summarize 본문 (취소 토큰이 설정된 컨텍스트에서 실행)"""
+        chunks = self._split_into_chunks(output)
+
+        # Map: 청크별 병렬 요약 (동시성 제한)
+        cache_hits_before = self.stats["cache_hits"]
+        workers = min(self.max_workers, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="summarizer") as executor:
+            # 호출 스레드의 실행 컨텍스트(취소 토큰, 카세트 등)를 워커에 전달
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._summarize_chunk, tool_name, index, len(chunks), chunk, token, llm_timeout
+                )
+                for index, chunk in enumerate(chunks, start=1)
+            ]
+            try:
+                partials = [future.result() for future in futures]
+            except CancellationError:
+                # 아직 시작하지 않은 청크는 요약하지 않음
+                for future in futures:
+                    future.cancel()
+                raise
+
+        # Reduce: 부분 요약 병합 (청크가 하나면 생략)
+        if len(partials) == 1:
+            summary = partials[0]
+        else:
+            summary = self._reduce(tool_name, partials, token, llm_timeout)
+
+        self.stats["summarized_outputs"] += 1
+
+        return {
+            "summary": summary,
+            "chunks": len(chunks),
+            "original_length": len(output),
+            "summary_length": len(summary),
+            "cache_hits": self.stats["cache_hits"] - cache_hits_before
+        }
+
+    def _split_into_chunks(self, output: str) -> List[str]:
+        """
+        출력을 줄 단위 경계에서 청크로 분할
+
+        Args:
+            output: 원본 출력
+
+        Returns:
+            List[str]: 청크 목록
+        """
+        chunks = []
+        current = []
+        current_length = 0
+
+        for line in output.splitlines(keepends=True):
+            # 한 줄이 청크 크기보다 길면 강제로 자름
+            while len(line) > self.chunk_size:
+                if current:
+                    chunks.append("".join(current))
+                    current, current_length = [], 0
+                chunks.append(line[:self.chunk_size])
+                line = line[self.chunk_size:]
+
+            if current_length + len(line) > self.chunk_size and current:
+                chunks.append("".join(current))
+                current, current_length = [], 0
+
+            current.append(line)
+            current_length += len(line)
+
+        if current:
+            chunks.append("".join(current))
+
+        return chunks
+
+    def _summarize_chunk(
+        self,
+        tool_name: str,
+        index: int,
+        total: int,
+        chunk: str,
+        token: Optional[CancellationToken] = None,
+        llm_timeout: Optional[float] = None
+    ) -> str:
+        """
+        단일 청크 요약 (내용 해시 캐시 사용)
+
+        Args:
+            tool_name: 도구명
+            index: 청크 순번 (1부터)
+            total: 전체 청크 수
+            chunk: 청크 내용
+            token: 취소 토큰
+            llm_timeout: LLM 호출 1회당 제한 시간
+
+        Returns:
+            str: 청크 요약 (실패 시 잘린 원문)
+        """
+        key = hashlib.sha256(chunk.encode("utf-8")).hexdigest()
+
+        with self._cache_lock:
+            self.stats["chunks"] += 1
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.stats["cache_hits"] += 1
+                return cached
+
+        response = self._chat_completion(
+            CHUNK_SUMMARY_PROMPT.format(tool=tool_name, index=index, total=total, chunk=chunk),
+            token,
+            llm_timeout
+        )
+
+        if not response.get("success") or not response.get("response"):
+            # 요약 실패 시 원문 앞부분으로 대체 (캐시하지 않음)
+            with self._cache_lock:
+                self.stats["failed_chunks"] += 1
+            return chunk[:1000] + ("..." if len(chunk) > 1000 else "")
+
+        summary = response["response"].strip()
+
+        with self._cache_lock:
+            self._cache[key] = summary
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return summary
+
+    def _reduce(
+        self,
+        tool_name: str,
+        partials: List[str],
+        token: Optional[CancellationToken] = None,
+        llm_timeout: Optional[float] = None
+    ) -> str:
+        """
+        부분 요약들을 하나의 관찰 결과로 병합
+
+        Args:
+            tool_name: 도구명
+            partials: 청크별 요약 목록
+            token: 취소 토큰
+            llm_timeout: LLM 호출 1회당 제한 시간
+
+        Returns:
+            str: 병합된 요약
+        """
+        summaries = "\n\n".join(
+            f"[구간 {index}/{len(partials)}]\n{partial}"
+            for index, partial in enumerate(partials, start=1)
+        )
+
+        response = self._chat_completion(
+            REDUCE_SUMMARY_PROMPT.format(tool=tool_name, total=len(partials), summaries=summaries),
+            token,
+            llm_timeout
+        )
+
+        if response.get("success") and response.get("response"):
+            return response["response"].strip()
+
+        # 병합 실패 시 부분 요약을 그대로 연결
+        return summaries
+
+    def _chat_completion(
+        self,
+        prompt: str,
+        token: Optional[CancellationToken],
+        llm_timeout: Optional[float]
+    ) -> Dict[str, Any]:
+        """
+        요약 LLM 호출 - 제한 시간은 토큰의 남은 시간을 넘지 않도록 조정하고, 취소 시 응답을 기다리지 않고 즉시 반환
+
+        Args:
+            prompt: 요약 프롬프트
+            token: 취소 토큰 (None이면 그대로 호출)
+            llm_timeout: 호출 1회당 제한 시간
+
+        Returns:
+            Dict: LLM 응답 결과
+
+        Raises:
+            CancellationError: 응답 전에 취소되거나 마감 시각이 지난 경우
+        """
+        timeout = token.timeout_for(llm_timeout) if token else llm_timeout
+        request_options = {"timeout": timeout} if timeout else {}
+
+        return run_cancellable(
+            token,
+            self.llm_client.chat_completion,
+            messages=prompt,
+            temperature=0.0,
+            max_tokens=self.max_tokens,
+            **request_options
+        )
+
+    def clear_cache(self):
+        """청크 요약 캐시 비우기"""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        return f"ToolOutputSummarizer(model='{self.llm_client.model}', threshold={self.threshold}, chunk_size={self.chunk_size})"
+
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
@@ -0,0 +1,89 @@
+import os
+import threading
+from typing import Any, Dict, Optional
+
+
+# 모델명 패턴 → tiktoken 인코딩 (모델 서버의 실제 토크나이저와 가장 가까운 것)
+MODEL_ENCODINGS = {
+    "gpt-oss": "o200k_base",
+    "gpt-4o": "o200k_base",
+    "gpt-5": "o200k_base",
+    "gpt-4": "cl100k_base",
+    "gpt-3": "cl100k_base"
+}
+DEFAULT_ENCODING = "o200k_base"
+
+# 지정 시 모델과 관계없이 사용할 인코딩
+TOKENIZER_ENCODING = os.getenv("REACT_AGENT_TOKENIZER")
+
+_ENCODINGS: Dict[str, Any] = {}
+_ENCODINGS_LOCK = threading.Lock()
+
+
+def encoding_for_model(model: Optional[str] = None) -> str:
+    """
+    모델에 사용할 tiktoken 인코딩 이름
+
+    Args:
+        model: 모델명
+
+    Returns:
+        str: 인코딩 이름 (REACT_AGENT_TOKENIZER 우선)
+    """
+    if TOKENIZER_ENCODING:
+        return TOKENIZER_ENCODING
+    model_lower = (model or "").lower()
+    for model_pattern, encoding in MODEL_ENCODINGS.items():
+        if model_pattern in model_lower:
+            return encoding
+    return DEFAULT_ENCODING
+
+
+def _get_encoding(name: str):
+    """tiktoken 인코딩 (설치되어 있지 않거나 인코딩 파일을 받을 수 없으면 None)"""
+    with _ENCODINGS_LOCK:
+        if name in _ENCODINGS:
+            return _ENCODINGS[name]
+    try:
+        import tiktoken
+        encoding = tiktoken.get_encoding(name)
+    except Exception:
+        # 미설치, 알 수 없는 인코딩, 오프라인 환경에서 인코딩 파일 다운로드 실패 등
+        encoding = None
+    with _ENCODINGS_LOCK:
+        _ENCODINGS[name] = encoding
+    return encoding
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    토크나이저 없이 토큰 수 추정
+
+    영문/숫자/기호는 4자당 1토큰, 한글·이모지 등 비ASCII 문자는 글자당 1토큰으로 계산
+    (한글을 4자당 1토큰으로 세면 프롬프트 크기를 크게 과소평가함)
+    """
+    non_ascii = sum(1 for char in text if ord(char) > 127)
+    return (len(text) - non_ascii) // 4 + non_ascii
+
+
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    """
+    텍스트의 토큰 수 (tiktoken이 있으면 모델 인코딩으로, 없으면 추정)
+
+    Args:
+        text: 텍스트
+        model: 모델명
+
+    Returns:
+        int: 토큰 수
+    """
+    encoding = _get_encoding(encoding_for_model(model))
+    if encoding is None:
+        return estimate_tokens(text)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def tokenizer_name(model: Optional[str] = None) -> str:
+    """count_tokens가 사용하는 토크나이저 설명 (보고서용)"""
+    name = encoding_for_model(model)
+    return f"tiktoken:{name}" if _get_encoding(name) is not None else "estimate"
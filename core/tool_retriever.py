@@ -0,0 +1,187 @@
+import re
+import math
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+
+
+# 영문/숫자 단어와 한글 어절
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+|[가-힣]+")
+
+# 필드별 가중치 (문서에 반복해서 넣어 BM25 단어 빈도에 반영)
+FIELD_WEIGHTS = {"name": 2, "tags": 3, "description": 1}
+
+# 스키마 지문 → 색인 (같은 도구 구성이면 에이전트마다 다시 만들지 않음)
+_INDEX_CACHE: "OrderedDict[str, _Bm25Index]" = OrderedDict()
+_INDEX_CACHE_LOCK = threading.Lock()
+_INDEX_CACHE_SIZE = 16
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    검색용 토큰 분리
+
+    영문은 소문자 단어(snake_case는 밑줄에서 분리), 한글은 조사가 붙어도 일치하도록 글자 2-gram으로 분리
+    (예: "메모리를" → "메모", "모리", "리를")
+
+    Args:
+        text: 원문
+
+    Returns:
+        List[str]: 토큰 목록
+    """
+    tokens = []
+    for word in _TOKEN_PATTERN.findall(text.lower()):
+        if "가" <= word[0] <= "힣" and len(word) > 1:
+            tokens.extend(word[index:index + 2] for index in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+class _Bm25Index:
+    """도구 문서 BM25 색인 (불변 - 도구 구성이 바뀌면 새로 생성)"""
+
+    def __init__(self, documents: Dict[str, List[str]], k1: float, b: float):
+        self.names = list(documents)
+        self.k1 = k1
+        self.b = b
+        self.term_freqs = [Counter(tokens) for tokens in documents.values()]
+        self.lengths = [len(tokens) for tokens in documents.values()]
+        self.average_length = (sum(self.lengths) / len(self.lengths)) if self.lengths else 0.0
+
+        document_freqs = Counter(term for freqs in self.term_freqs for term in freqs)
+        count = len(self.names)
+        self.idf = {
+            term: math.log(1 + (count - freq + 0.5) / (freq + 0.5))
+            for term, freq in document_freqs.items()
+        }
+
+    def scores(self, query_tokens: List[str]) -> List[Tuple[str, float]]:
+        """질의 토큰에 대한 도구별 점수 (점수 내림차순, 0점 제외)"""
+        results = []
+        terms = [term for term in set(query_tokens) if term in self.idf]
+        for name, freqs, length in zip(self.names, self.term_freqs, self.lengths):
+            score = 0.0
+            norm = self.k1 * (1 - self.b + self.b * length / self.average_length) if self.average_length else self.k1
+            for term in terms:
+                freq = freqs.get(term)
+                if freq:
+                    score += self.idf[term] * freq * (self.k1 + 1) / (freq + norm)
+            if score > 0:
+                results.append((name, score))
+        results.sort(key=lambda item: (-item[1], item[0]))
+        return results
+
+
+class ToolRetriever:
+    """
+    질의 관련 도구 선택기 (로컬 BM25)
+
+    도구 이름/설명/태그로 만든 색인으로 사용자 요청과 관련 있는 상위 K개 도구만 골라
+    LLM 호출마다 보내는 도구 스키마와 시스템 프롬프트의 도구 목록을 줄임
+    색인은 도구 구성(스키마 지문)별로 한 번만 만들어 공유하며, 도구가 다시 로딩되면 자동으로 새로 만듦
+    """
+
+    def __init__(
+        self,
+        tools_manager,
+        top_k: int = 4,
+        pinned: Iterable[str] = (),
+        k1: float = 1.5,
+        b: float = 0.75
+    ):
+        """
+        ToolRetriever 초기화
+
+        Args:
+            tools_manager: 도구 매니저
+            top_k: 선택할 도구 수
+            pinned: 질의와 관계없이 항상 포함할 도구 (예: 범용 명령 실행 도구)
+            k1: BM25 단어 빈도 포화 계수
+            b: BM25 문서 길이 정규화 계수
+        """
+        self.tools_manager = tools_manager
+        self.top_k = max(1, top_k)
+        self.pinned = list(pinned)
+        self.k1 = k1
+        self.b = b
+
+    def _index(self) -> _Bm25Index:
+        """현재 도구 구성의 색인 (없으면 생성)"""
+        key = f"{self.tools_manager.schema_fingerprint}:{self.k1}:{self.b}"
+        with _INDEX_CACHE_LOCK:
+            index = _INDEX_CACHE.get(key)
+            if index is not None:
+                _INDEX_CACHE.move_to_end(key)
+                return index
+
+        documents = {}
+        for name in self.tools_manager.get_available_tools():
+            info = self.tools_manager.get_tool_info(name)
+            tokens = []
+            for field, text in (
+                ("name", name.replace("_", " ")),
+                ("tags", " ".join(info.get("tags") or [])),
+                ("description", info.get("description") or "")
+            ):
+                tokens.extend(tokenize(text) * FIELD_WEIGHTS[field])
+            documents[name] = tokens
+        index = _Bm25Index(documents, self.k1, self.b)
+
+        with _INDEX_CACHE_LOCK:
+            _INDEX_CACHE[key] = index
+            while len(_INDEX_CACHE) > _INDEX_CACHE_SIZE:
+                _INDEX_CACHE.popitem(last=False)
+        return index
+
+    def rank(self, query: str) -> List[Tuple[str, float]]:
+        """
+        질의와 관련 있는 도구 순위
+
+        Args:
+            query: 사용자 요청
+
+        Returns:
+            List[Tuple[str, float]]: (도구명, BM25 점수) - 점수 내림차순, 관련 없는 도구 제외
+        """
+        return self._index().scores(tokenize(query))
+
+    def select(self, query: str, include: Iterable[str] = (), top_k: Optional[int] = None) -> List[str]:
+        """
+        LLM에 보낼 도구 선택
+
+        일치하는 도구가 없으면(모호한 요청) 도구를 줄이지 않고 전체를 반환
+
+        Args:
+            query: 사용자 요청
+            include: 점수와 관계없이 포함할 도구 (pinned에 더해 추가로)
+            top_k: 선택할 도구 수 (기본값: 생성 시 설정)
+
+        Returns:
+            List[str]: 선택된 도구명 (정렬됨)
+        """
+        available = self.tools_manager.get_available_tools()
+        limit = top_k or self.top_k
+        if len(available) <= limit:
+            return available
+
+        ranked = self.rank(query)
+        if not ranked:
+            return available
+        selected = {name for name, _ in ranked[:limit]}
+        selected.update(name for name in [*self.pinned, *include] if name in available)
+        return sorted(selected)
+
+    def stats(self) -> Dict[str, Any]:
+        """색인 현황"""
+        index = self._index()
+        return {"tools": len(index.names), "terms": len(index.idf), "average_length": round(index.average_length, 1)}
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        return f"ToolRetriever(top_k={self.top_k}, pinned={self.pinned}, tools={len(self.tools_manager)})"
+
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
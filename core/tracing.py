@@ -0,0 +1,442 @@
+"""
+구조화된 실행 추적 (tracing)
+실행(run) → 반복(iteration) → LLM 호출 / 도구 실행 → SSH 하위 작업 순의 계층형 스팬을 기록하고
+교체 가능한 내보내기(exporter)로 전달 - 기본 제공: JSON Lines 파일, Chrome trace 파일, 메모리
+"""
+import os
+import json
+import time
+import uuid
+import threading
+import contextvars
+from contextlib import contextmanager
+from typing import Dict, Any, List, Optional
+
+
+class Span:
+    """
+    추적 스팬 - 이름, 시작/종료 시각, 부모 스팬, 속성(attributes)으로 구성된 작업 구간
+
+    시작 시각은 벽시계(time.time), 소요 시간은 단조 시계(perf_counter)로 측정
+    """
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        trace_id: str,
+        parent_id: Optional[str] = None,
+        attributes: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Span 초기화 (직접 생성하지 않고 Tracer.span 사용)
+
+        Args:
+            tracer: 스팬을 만든 추적기
+            name: 스팬 이름 (예: agent.run, llm.chat_completion, ssh.exec)
+            trace_id: 추적 ID (루트 스팬 기준으로 공유)
+            parent_id: 부모 스팬 ID (루트면 None)
+            attributes: 초기 속성
+        """
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.events: List[Dict[str, Any]] = []
+        self.status = "ok"
+        self.error: Optional[str] = None
+
+        thread = threading.current_thread()
+        self.thread_id = thread.ident
+        self.thread_name = thread.name
+
+        self.start_time = time.time()
+        self._start = time.perf_counter()
+        self.duration: Optional[float] = None
+
+    @property
+    def ended(self) -> bool:
+        """종료 여부"""
+        return self.duration is not None
+
+    def elapsed(self) -> float:
+        """시작 후 경과 시간 (종료된 스팬은 전체 소요 시간)"""
+        return self.duration if self.duration is not None else time.perf_counter() - self._start
+
+    def set_attribute(self, key: str, value: Any) -> "Span":
+        """속성 설정"""
+        self.attributes[key] = value
+        return self
+
+    def set_attributes(self, **attributes) -> "Span":
+        """여러 속성 한 번에 설정 (None 값은 무시)"""
+        self.attributes.update({key: value for key, value in attributes.items() if value is not None})
+        return self
+
+    def add_event(self, name: str, **attributes) -> "Span":
+        """
+        스팬 내 시점 이벤트 기록 (예: 취소, 재시도)
+
+        Args:
+            name: 이벤트 이름
+            **attributes: 이벤트 속성
+        """
+        self.events.append({"name": name, "offset": self.elapsed(), "attributes": attributes})
+        return self
+
+    def record_error(self, error: BaseException) -> "Span":
+        """오류 상태로 표시"""
+        self.status = "error"
+        self.error = f"{type(error).__name__}: {error}"
+        return self
+
+    def end(self):
+        """스팬 종료 및 추적기에 전달 (중복 호출은 무시)"""
+        if self.duration is not None:
+            return
+        self.duration = time.perf_counter() - self._start
+        self.tracer._on_end(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """직렬화용 딕셔너리"""
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "duration": self.duration,
+            "status": self.status,
+            "error": self.error,
+            "thread": self.thread_name,
+            "attributes": self.attributes,
+            "events": self.events
+        }
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        duration = f"{self.duration * 1000:.1f}ms" if self.duration is not None else "open"
+        return f"Span(name='{self.name}', span_id='{self.span_id}', duration={duration})"
+
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
+
+
+class _NoopSpan:
+    """추적이 비활성화된 컨텍스트에서 사용하는 빈 스팬 (계측 코드가 분기 없이 호출 가능)"""
+
+    name = ""
+    trace_id = None
+    span_id = None
+    ended = True
+
+    def elapsed(self) -> float:
+        return 0.0
+
+    def set_attribute(self, key: str, value: Any) -> "_NoopSpan":
+        return self
+
+    def set_attributes(self, **attributes) -> "_NoopSpan":
+        return self
+
+    def add_event(self, name: str, **attributes) -> "_NoopSpan":
+        return self
+
+    def record_error(self, error: BaseException) -> "_NoopSpan":
+        return self
+
+    def end(self):
+        pass
+
+    def __bool__(self) -> bool:
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class SpanExporter:
+    """
+    스팬 내보내기 인터페이스
+
+    루트 스팬이 끝나면 해당 추적의 종료된 스팬 전체가 한 번에 전달되고,
+    루트 종료 이후에 끝난 스팬(취소 후 늦게 끝난 워커 등)은 따로 전달됨
+    """
+
+    def export(self, spans: List[Span]):
+        """
+        종료된 스팬 묶음 내보내기
+
+        Args:
+            spans: 같은 추적에 속한 종료된 스팬 목록 (시작 시각 순)
+        """
+        raise NotImplementedError
+
+    def shutdown(self):
+        """자원 정리"""
+        pass
+
+
+class InMemoryExporter(SpanExporter):
+    """메모리에 스팬을 보관하는 내보내기 (UI 표시/벤치마크용)"""
+
+    def __init__(self, max_spans: int = 10000):
+        """
+        InMemoryExporter 초기화
+
+        Args:
+            max_spans: 보관할 최대 스팬 수 (초과 시 오래된 것부터 제거)
+        """
+        self.max_spans = max_spans
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Span]):
+        with self._lock:
+            self.spans.extend(spans)
+            del self.spans[:-self.max_spans]
+
+    def get_trace(self, trace_id: str) -> List[Span]:
+        """추적 ID에 해당하는 스팬 목록"""
+        with self._lock:
+            return [span for span in self.spans if span.trace_id == trace_id]
+
+    def clear(self):
+        """보관된 스팬 삭제"""
+        with self._lock:
+            self.spans.clear()
+
+
+class JsonFileExporter(SpanExporter):
+    """스팬을 한 줄에 하나씩 JSON Lines 파일에 추가 기록"""
+
+    def __init__(self, path: str):
+        """
+        JsonFileExporter 초기화
+
+        Args:
+            path: 기록할 파일 경로 (없으면 생성)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def export(self, spans: List[Span]):
+        lines = "".join(json.dumps(span.to_dict(), ensure_ascii=False, default=str) + "\n" for span in spans)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(lines)
+
+
+class ChromeTraceExporter(SpanExporter):
+    """
+    추적 1개를 Chrome trace 이벤트 형식 파일 1개로 기록
+
+    chrome://tracing, Perfetto(ui.perfetto.dev), speedscope 등에서 바로 열 수 있음
+    스레드별 트랙으로 표시되므로 병렬 도구 실행/SSH 대기 구간을 한눈에 확인 가능
+    """
+
+    def __init__(self, directory: str):
+        """
+        ChromeTraceExporter 초기화
+
+        Args:
+            directory: 추적 파일을 저장할 디렉터리
+        """
+        self.directory = directory
+        self.last_path: Optional[str] = None
+        os.makedirs(directory, exist_ok=True)
+
+    def export(self, spans: List[Span]):
+        if not spans:
+            return
+
+        pid = os.getpid()
+        events = []
+        threads = {}
+        for span in spans:
+            threads.setdefault(span.thread_id, span.thread_name)
+            args = dict(span.attributes, span_id=span.span_id, parent_id=span.parent_id)
+            if span.error:
+                args["error"] = span.error
+            events.append({
+                "name": span.name,
+                "cat": span.name.split(".", 1)[0],
+                "ph": "X",
+                "ts": round(span.start_time * 1e6),
+                "dur": round((span.duration or 0.0) * 1e6),
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": args
+            })
+            for event in span.events:
+                events.append({
+                    "name": event["name"],
+                    "ph": "i",
+                    "s": "t",
+                    "ts": round((span.start_time + event["offset"]) * 1e6),
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": event["attributes"]
+                })
+        for thread_id, thread_name in threads.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id, "args": {"name": thread_name}})
+
+        root = min(spans, key=lambda span: span.start_time)
+        timestamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(root.start_time))
+        path = os.path.join(self.directory, f"{timestamp}-{root.trace_id}.json")
+        # 루트 종료 후 늦게 끝난 스팬은 같은 추적 파일 대신 별도 파일로 기록
+        if os.path.exists(path):
+            path = os.path.join(self.directory, f"{timestamp}-{root.trace_id}-{root.span_id}.json")
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, ensure_ascii=False, default=str)
+        self.last_path = path
+
+
+# 현재 실행 컨텍스트의 활성 스팬 (하위 계층이 부모 스팬을 찾는 데 사용)
+_current_span: contextvars.ContextVar = contextvars.ContextVar("current_span", default=None)
+
+
+class Tracer:
+    """
+    스팬 생성 및 내보내기 관리
+
+    활성 스팬은 contextvars로 전달되므로 copy_context로 실행한 워커 스레드의 스팬도
+    호출 스레드의 스팬 아래에 연결됨
+    """
+
+    def __init__(self, exporters: Optional[List[SpanExporter]] = None):
+        """
+        Tracer 초기화
+
+        Args:
+            exporters: 스팬 내보내기 목록
+        """
+        self.exporters: List[SpanExporter] = list(exporters or [])
+        self._pending: Dict[str, List[Span]] = {}  # 추적 ID → 루트 종료 전까지 모아둔 스팬
+        self._lock = threading.Lock()
+
+    def add_exporter(self, exporter: SpanExporter):
+        """내보내기 추가"""
+        self.exporters.append(exporter)
+
+    def start_span(self, name: str, parent: Optional[Span] = None, **attributes) -> Span:
+        """
+        스팬 시작 (활성 스팬으로 설정하지 않음 - 종료는 호출자가 end 호출)
+
+        Args:
+            name: 스팬 이름
+            parent: 부모 스팬 (기본값: 현재 활성 스팬, 다른 추적기 스팬이면 새 추적 시작)
+            **attributes: 초기 속성
+
+        Returns:
+            Span: 시작된 스팬
+        """
+        if parent is None:
+            parent = _current_span.get()
+        if parent is not None and parent.tracer is self:
+            span = Span(self, name, parent.trace_id, parent.span_id, attributes)
+        else:
+            span = Span(self, name, uuid.uuid4().hex, None, attributes)
+            with self._lock:
+                self._pending[span.trace_id] = []
+        return span
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        """
+        스팬을 시작하고 블록 동안 활성 스팬으로 설정 (예외 발생 시 오류로 표시)
+
+        Args:
+            name: 스팬 이름
+            **attributes: 초기 속성
+        """
+        span = self.start_span(name, **attributes)
+        reset_token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_error(e)
+            raise
+        finally:
+            _current_span.reset(reset_token)
+            span.end()
+
+    def _on_end(self, span: Span):
+        """스팬 종료 처리 - 루트 스팬이 끝나면 추적 전체를 내보냄"""
+        with self._lock:
+            pending = self._pending.get(span.trace_id)
+            if span.parent_id is not None and pending is not None:
+                pending.append(span)
+                return
+            batch = (pending or []) + [span]
+            self._pending.pop(span.trace_id, None)
+
+        batch.sort(key=lambda item: item.start_time)
+        for exporter in self.exporters:
+            try:
+                exporter.export(batch)
+            except Exception:
+                # 추적 기록 실패가 에이전트 실행을 중단시키지 않도록 무시
+                pass
+
+    def shutdown(self):
+        """모든 내보내기 자원 정리"""
+        for exporter in self.exporters:
+            exporter.shutdown()
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        return f"Tracer(exporters={[type(exporter).__name__ for exporter in self.exporters]})"
+
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
+
+
+def get_current_span():
+    """현재 실행 컨텍스트의 활성 스팬 (없으면 NOOP_SPAN)"""
+    return _current_span.get() or NOOP_SPAN
+
+
+@contextmanager
+def trace_span(name: str, **attributes):
+    """
+    현재 활성 스팬의 하위 스팬 생성 (추적 중이 아니면 NOOP_SPAN을 반환하고 아무것도 기록하지 않음)
+
+    도구/SSH 계층처럼 추적기를 직접 전달받지 않는 코드에서 사용
+
+    Args:
+        name: 스팬 이름
+        **attributes: 초기 속성
+    """
+    parent = _current_span.get()
+    if parent is None:
+        yield NOOP_SPAN
+        return
+    with parent.tracer.span(name, **attributes) as span:
+        yield span
+
+
+def tracer_from_env() -> Optional[Tracer]:
+    """
+    환경변수 설정에 따른 추적기 생성
+
+    REACT_AGENT_TRACE_DIR: Chrome trace 파일 저장 디렉터리
+    REACT_AGENT_TRACE_FILE: JSON Lines 스팬 기록 파일
+
+    Returns:
+        Optional[Tracer]: 둘 다 없으면 None
+    """
+    exporters: List[SpanExporter] = []
+    if os.getenv("REACT_AGENT_TRACE_DIR"):
+        exporters.append(ChromeTraceExporter(os.getenv("REACT_AGENT_TRACE_DIR")))
+    if os.getenv("REACT_AGENT_TRACE_FILE"):
+        exporters.append(JsonFileExporter(os.getenv("REACT_AGENT_TRACE_FILE")))
+    return Tracer(exporters) if exporters else None
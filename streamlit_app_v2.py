@@ -1,15 +1,65 @@
+import os
+import uuid
 import streamlit as st
 import time
 import json
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from agent_v2 import ReactAgentV2, ReasoningCallback
 from config.server_config import ServerConfig
+from core.blob_store import BlobStore
+from core.history_store import SpillingHistory
+from core.output_view import OutputPager, truncate_output
+from core.journal import SessionJournal
+from core.cassette import Cassette
+from core.tracing import tracer_from_env
+from core.metrics import DEFAULT_METRICS_HOST, start_metrics_server
+from core.event_bus import EventBus, AgentEvent, callback_handler
+
+
+# 세션 저널 저장 디렉토리 - 워커 재시작 후 대화/실행 기록 복원에 사용
+JOURNAL_DIR = os.environ.get("REACT_AGENT_JOURNAL_DIR", "journals")
+
+# 세션 저널 보관 기간 (일) - 마지막 기록 이후 이 기간이 지난 저널은 새 세션을 열 때 삭제 (0이면 삭제하지 않음)
+JOURNAL_RETENTION_DAYS = float(os.environ.get("REACT_AGENT_JOURNAL_RETENTION_DAYS", "7"))
+
+# 지정 시 실행마다 LLM/SSH 상호작용을 카세트로 기록 (오프라인 재생/벤치마크용)
+CASSETTE_DIR = os.environ.get("REACT_AGENT_CASSETTE_DIR")
+
+# 지정 시 해당 포트에서 Prometheus 형식 지표(/metrics) 제공
+METRICS_PORT = os.environ.get("REACT_AGENT_METRICS_PORT")
+METRICS_HOST = os.environ.get("REACT_AGENT_METRICS_HOST", DEFAULT_METRICS_HOST)
+
+# 백그라운드 실행 중 추론/상태 영역을 다시 그리는 주기 (초)
+RUN_REFRESH_INTERVAL = 0.5
+
+# 진행 화면에서 이벤트를 그대로 다시 그릴 최근 반복 수 (이전 반복은 한 줄 요약으로 축약)
+LIVE_ITERATIONS = 2
+# 반복 1개에 보관하는 최대 이벤트 수 (초과분은 개수만 표시, 반복 종료/최종 결과/오류는 항상 보관)
+MAX_EVENTS_PER_ITERATION = 40
+
+# 세션 기록(대화/실행/추론/최종 결과)별로 메모리에 보관할 최근 항목 수 - 오래된 항목은 압축하여 디스크로 내보냄
+HISTORY_LIMIT = int(os.environ.get("REACT_AGENT_HISTORY_LIMIT", "20"))
+
+# 세션별로 메모리에 보관할 도구 출력 크기 (MB, 초과분은 디스크로 내보냄)
+BLOB_MEMORY_MB = float(os.environ.get("REACT_AGENT_BLOB_MEMORY_MB", "16"))
+
+# 디스크로 내보낸 기록/도구 출력 저장 위치 (기본값: 시스템 임시 디렉터리)
+SPILL_DIR = os.environ.get("REACT_AGENT_SPILL_DIR")
+
+# 진행 화면의 도구 결과 미리보기 길이, 출력 보기의 페이지당 줄 수
+TOOL_PREVIEW_CHARS = 500
+OUTPUT_PAGE_LINES = 200
 
 
 class StreamlitReasoningCallback(ReasoningCallback):
     """
     Streamlit UI를 위한 실시간 업데이트 콜백
+    
+    백그라운드 실행에서는 화면을 다시 그릴 때마다 새 인스턴스로 최근 반복의 이벤트를 재생하므로,
+    세션 상태 기록은 하지 않고 화면 표시만 담당 (기록은 실행 종료 시 finish_background_run에서 한 번 수행)
     """
     
     def __init__(self):
@@ -50,16 +100,6 @@ class StreamlitReasoningCallback(ReasoningCallback):
             with self.current_iteration_container:
                 st.markdown("### 🤔 추론 과정")
                 st.info(thought)
-                
-                # 세션 상태에 저장
-                if 'reasoning_steps' not in st.session_state:
-                    st.session_state.reasoning_steps = []
-                st.session_state.reasoning_steps.append({
-                    'iteration': iteration,
-                    'type': 'reasoning',
-                    'content': thought,
-                    'timestamp': datetime.now().isoformat()
-                })
     
     def on_tool_call(self, iteration: int, tool: str, arguments: Dict[str, Any]):
         """도구 호출 표시"""
@@ -77,14 +117,14 @@ class StreamlitReasoningCallback(ReasoningCallback):
         """도구 실행 결과 표시"""
         if self.current_iteration_container:
             with self.current_iteration_container:
+                # 결과 미리보기 - 출력 크기와 관계없이 앞부분만 검사하여 줄/섹션 단위로 축약 (전체는 실행 로그 탭에서 조회)
+                preview = truncate_output(result, TOOL_PREVIEW_CHARS)
                 if success:
-                    # 결과 미리보기 (너무 길면 축약)
-                    preview = result[:500] + "..." if len(result) > 500 else result
                     st.success(f"✅ {tool} 실행 성공")
                     with st.expander("결과 보기", expanded=False):
                         st.text(preview)
                 else:
-                    st.error(f"❌ {tool} 실행 실패: {result}")
+                    st.error(f"❌ {tool} 실행 실패: {preview}")
     
     def on_observation(self, iteration: int, observation: str):
         """관찰 단계 표시"""
@@ -105,8 +145,8 @@ class StreamlitReasoningCallback(ReasoningCallback):
         
         # 최종 결론을 메인 컨테이너에 표시
         if self.result_container and result:
-            # 부분 결론인지 확인 (최대 반복 횟수 도달)
-            is_partial = "최대 반복 횟수" in result and "도달로 분석이 중단" in result
+            # 부분 결론인지 확인 (최대 반복 횟수/시간 제한 도달 또는 취소)
+            is_partial = "분석이 중단되었습니다" in result.split('\n')[0]
             
             if is_partial:
                 # 부분 결론의 경우 경고 스타일 적용
@@ -116,15 +156,6 @@ class StreamlitReasoningCallback(ReasoningCallback):
                 final_content = f"### 🎯 최종 결론\n\n{result}"
             
             self.result_container.markdown(final_content)
-        
-        # 세션 상태에 최종 결과 저장 (히스토리용)
-        if 'final_results' not in st.session_state:
-            st.session_state.final_results = []
-        st.session_state.final_results.append({
-            'result': result,
-            'iterations': iterations,
-            'timestamp': datetime.now().isoformat()
-        })
     
     def on_error(self, iteration: int, error: str):
         """오류 발생"""
@@ -140,30 +171,375 @@ def init_session_state():
     """세션 상태 초기화"""
     if 'agent' not in st.session_state:
         st.session_state.agent = None
+    # 기록은 최근 HISTORY_LIMIT개만 메모리에 두고 나머지는 디스크에서 필요할 때 읽어 옴
     if 'messages' not in st.session_state:
-        st.session_state.messages = []
+        st.session_state.messages = SpillingHistory("messages", HISTORY_LIMIT * 2, SPILL_DIR)
     if 'execution_history' not in st.session_state:
-        st.session_state.execution_history = []
+        st.session_state.execution_history = SpillingHistory(
+            "execution", HISTORY_LIMIT, SPILL_DIR, summarize=summarize_execution_record
+        )
     if 'reasoning_steps' not in st.session_state:
-        st.session_state.reasoning_steps = []
+        st.session_state.reasoning_steps = SpillingHistory("reasoning", HISTORY_LIMIT, SPILL_DIR)
     if 'final_results' not in st.session_state:
-        st.session_state.final_results = []
+        st.session_state.final_results = SpillingHistory("final", HISTORY_LIMIT, SPILL_DIR)
+    if 'active_run' not in st.session_state:
+        st.session_state.active_run = None
+    if 'run_notice' not in st.session_state:
+        st.session_state.run_notice = None
+    if 'blob_store' not in st.session_state:
+        # 도구 출력 저장소 - 실행 기록은 digest 참조만 보관
+        st.session_state.blob_store = BlobStore(
+            max_memory_chars=int(BLOB_MEMORY_MB * 1024 * 1024),
+            spill_dir=os.path.join(SPILL_DIR, "blobs") if SPILL_DIR else None
+        )
+    if 'journal' not in st.session_state:
+        st.session_state.journal = open_session_journal()
+        restore_session_from_journal(st.session_state.journal)
     
     # 서버 설정 초기화
     ServerConfig.initialize_session()
 
 
-def create_agent_with_callback(endpoint: str, model: str, max_iterations: int) -> tuple:
-    """콜백과 함께 에이전트 생성"""
-    callback = StreamlitReasoningCallback()
-    agent = ReactAgentV2(
+def summarize_execution_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """실행 기록 목록 표시용 요약 (디스크로 내보낸 뒤에도 메모리에 유지)"""
+    return {
+        "timestamp": record.get("timestamp", ""),
+        "user_input": record.get("user_input", "")[:40]
+    }
+
+
+def open_session_journal() -> SessionJournal:
+    """
+    URL의 세션 ID(?session=...)에 해당하는 저널 열기
+    
+    세션 ID가 없거나 유효하지 않으면 새로 발급하여 URL에 기록 (새로고침/재시작 후에도 같은 저널 사용)
+    보관 기간이 지난 저널은 먼저 삭제
+    """
+    if JOURNAL_RETENTION_DAYS > 0:
+        SessionJournal.remove_expired(JOURNAL_DIR, JOURNAL_RETENTION_DAYS * 86400)
+    session_id = st.query_params.get("session")
+    try:
+        return SessionJournal.for_session(JOURNAL_DIR, session_id)
+    except ValueError:
+        session_id = uuid.uuid4().hex
+        st.query_params["session"] = session_id
+        return SessionJournal.for_session(JOURNAL_DIR, session_id)
+
+
+def restore_session_from_journal(journal: SessionJournal):
+    """저널에 기록된 현재 대화의 실행 결과로 화면 기록 복원"""
+    for run in journal.replay()["runs"]:
+        result = run["result"]
+        st.session_state.messages.append({"role": "user", "content": run["user_input"]})
+        if result.get("success"):
+            st.session_state.messages.append({"role": "assistant", "content": result["result"]})
+            st.session_state.execution_history.append({
+                "timestamp": datetime.fromtimestamp(run["timestamp"]).isoformat(),
+                "user_input": run["user_input"],
+                "result": result,
+                "reasoning_history": result.get("reasoning_history", []),
+                "execution_log": result.get("execution_log", [])
+            })
+
+
+def open_run_cassette() -> Optional[Cassette]:
+    """이번 실행을 기록할 카세트 생성 (CASSETTE_DIR 미설정 시 None)"""
+    if not CASSETTE_DIR:
+        return None
+    os.makedirs(CASSETTE_DIR, exist_ok=True)
+    session_id = st.query_params.get("session", "session")
+    filename = f"{session_id}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.jsonl"
+    return Cassette(os.path.join(CASSETTE_DIR, filename), mode=Cassette.RECORD)
+
+
+class BackgroundRun:
+    """
+    세션에 연결된 백그라운드 에이전트 실행
+    
+    에이전트는 별도 스레드에서 실행되고, 이벤트 버스로 받은 이벤트를 반복 단위로 쌓아 두면
+    화면 조각(fragment)이 주기적으로 이를 읽어 추론/상태 영역만 다시 그림
+    
+    화면 조각은 매번 전체를 다시 그려야 하므로, 다시 그리는 비용이 실행 길이에 비례해 늘지 않도록
+    최근 LIVE_ITERATIONS개 반복의 이벤트(반복당 최대 MAX_EVENTS_PER_ITERATION개)만 보관하고
+    이전 반복은 한 줄 요약으로 축약
+    """
+    
+    def __init__(self, agent: ReactAgentV2, prompt: str, connection_info: Optional[Dict[str, Any]]):
+        """
+        BackgroundRun 초기화
+        
+        Args:
+            agent: 이벤트 버스가 연결된 에이전트
+            prompt: 사용자 요청
+            connection_info: 실행 스레드에 바인딩할 서버 접속 정보 (워커 스레드에서는 세션 상태에 접근할 수 없음)
+        """
+        self.agent = agent
+        self.prompt = prompt
+        self.connection_info = connection_info
+        self.started_at = time.time()
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.cancel_requested = False
+        
+        self._live: "OrderedDict[int, List[AgentEvent]]" = OrderedDict()  # 반복 → 이벤트 (최근 반복만)
+        self._dropped: Dict[int, int] = {}  # 반복별 보관 한도를 넘어 버린 이벤트 수
+        self._tool_counts: Dict[int, Dict[str, List[int]]] = {}  # 반복 → 도구별 [성공, 실패] 횟수 (요약용)
+        self._summaries: List[str] = []  # 축약된 이전 반복 요약
+        self._history: List[AgentEvent] = []  # 실행 종료 시 세션 기록에 반영할 추론/최종 결과 이벤트
+        self._current = 0
+        self._lock = threading.Lock()
+        agent.event_bus.subscribe(self._on_event, name="ui")
+        self._thread = threading.Thread(target=self._run, name="agent-run", daemon=True)
+    
+    def start(self) -> "BackgroundRun":
+        """실행 시작"""
+        self._thread.start()
+        return self
+    
+    @property
+    def done(self) -> bool:
+        """실행 종료 여부"""
+        return self._thread.ident is not None and not self._thread.is_alive()
+    
+    @property
+    def elapsed(self) -> float:
+        """경과 시간 (초)"""
+        return time.time() - self.started_at
+    
+    def snapshot(self) -> Tuple[List[str], List[Tuple[List[AgentEvent], int]]]:
+        """
+        화면 표시용 상태 (복사본)
+        
+        Returns:
+            Tuple: (축약된 이전 반복 요약 목록, 최근 반복별 (이벤트 목록, 생략된 이벤트 수) 목록)
+        """
+        with self._lock:
+            live = [(list(events), self._dropped.get(iteration, 0)) for iteration, events in self._live.items()]
+            return list(self._summaries), live
+    
+    def history_events(self) -> List[AgentEvent]:
+        """세션 기록에 반영할 추론/최종 결과 이벤트 (복사본)"""
+        with self._lock:
+            return list(self._history)
+    
+    @staticmethod
+    def _summarize_iteration(iteration: int, counts: Dict[str, List[int]], dropped: int) -> str:
+        """축약할 반복의 한 줄 요약 - 실행한 도구별 성공/실패 횟수"""
+        tools = [
+            f"{tool} " + " ".join(f"{mark}×{count}" for mark, count in zip(("✅", "❌"), result) if count)
+            for tool, result in counts.items()
+        ]
+        summary = f"Step {iteration}: " + (", ".join(tools) if tools else "도구 실행 없음")
+        return summary + (f" (이벤트 {dropped}개 생략)" if dropped else "")
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """실행 종료 대기 - 종료되었으면 True"""
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+    
+    def cancel(self):
+        """
+        실행 취소 요청 - 에이전트가 부분 결론을 반환하며 종료
+        
+        실행 토큰이 만들어지기 전에 요청되면 첫 반복 시작 이벤트를 받을 때 취소
+        """
+        self.cancel_requested = True
+        self.agent.cancel()
+    
+    def _on_event(self, event: AgentEvent):
+        with self._lock:
+            if event.type == "iteration_start":
+                self._current = event.payload.get("iteration") or self._current + 1
+                self._live[self._current] = []
+                while len(self._live) > LIVE_ITERATIONS:
+                    iteration, _ = self._live.popitem(last=False)
+                    self._summaries.append(self._summarize_iteration(
+                        iteration, self._tool_counts.pop(iteration, {}), self._dropped.pop(iteration, 0)
+                    ))
+            
+            events = self._live.setdefault(self._current, [])
+            if len(events) < MAX_EVENTS_PER_ITERATION or event.type in ("iteration_end", "final_result", "error"):
+                events.append(event)
+            else:
+                self._dropped[self._current] = self._dropped.get(self._current, 0) + 1
+            if event.type == "tool_result":
+                counts = self._tool_counts.setdefault(self._current, {})
+                counts.setdefault(event.payload.get("tool"), [0, 0])[0 if event.payload.get("success") else 1] += 1
+            elif event.type in ("reasoning", "final_result"):
+                self._history.append(event)
+        if self.cancel_requested and event.type == "iteration_start":
+            self.agent.cancel()
+    
+    def _run(self):
+        """실행 스레드 본체"""
+        try:
+            with ServerConfig.bind_connection_info(self.connection_info or {}):
+                self.result = self.agent.run(self.prompt)
+        except Exception as e:
+            self.error = str(e)
+        finally:
+            self.agent.event_bus.close()
+            if self.agent.cassette:
+                self.agent.cassette.close()
+
+
+def create_agent(endpoint: str, model: str, max_iterations: int, fast_model: str = None, run_timeout: int = None, mode: str = "react") -> ReactAgentV2:
+    """백그라운드 실행용 에이전트 생성 (진행 이벤트는 이벤트 버스로 전달)"""
+    return ReactAgentV2(
         endpoint=endpoint,
         model=model,
         max_iterations=max_iterations,
-        callback=callback,
-        verbose=False  # UI에서는 콘솔 출력 비활성화
+        verbose=False,  # UI에서는 콘솔 출력 비활성화
+        fast_model=fast_model,
+        run_timeout=run_timeout,
+        mode=mode,
+        blob_store=st.session_state.blob_store,
+        journal=st.session_state.journal,  # 저널에 기록된 최근 대화 턴(REACT_AGENT_JOURNAL_RESTORE_TURNS)을 이어서 진행
+        cassette=open_run_cassette(),
+        tracer=tracer_from_env(),  # REACT_AGENT_TRACE_DIR/REACT_AGENT_TRACE_FILE 설정 시 실행 추적 기록
+        event_bus=EventBus()
     )
-    return agent, callback
+
+
+@st.fragment(run_every=RUN_REFRESH_INTERVAL)
+def render_active_run():
+    """
+    진행 중인 실행의 상태/추론 영역 (주기적으로 이 조각만 다시 실행)
+    
+    실행이 끝나면 결과를 세션에 기록하고 전체 화면을 다시 그림
+    """
+    run = st.session_state.active_run
+    if run is None:
+        return
+    if run.done:
+        finish_background_run(run)
+        st.rerun()
+    
+    # 상태 컨테이너
+    status_container = st.empty()
+    status_container.info("🤔 처리 중...")
+    
+    # 추론 과정을 표시할 컨테이너
+    reasoning_container = st.container()
+    
+    # 최종 결과를 표시할 컨테이너
+    result_container = st.empty()
+    
+    # 이전 반복은 요약 한 블록으로, 최근 반복만 이벤트를 새 콜백으로 재생하여 다시 그림
+    summaries, live = run.snapshot()
+    if summaries:
+        with reasoning_container:
+            with st.expander(f"📜 이전 단계 {len(summaries)}개", expanded=False):
+                st.markdown("\n".join(f"- {summary}" for summary in summaries))
+    
+    callback = StreamlitReasoningCallback()
+    callback.set_containers(reasoning_container, status_container, result_container)
+    handle = callback_handler(callback)
+    for events, dropped in live:
+        for event in events:
+            handle(event)
+        if dropped and callback.current_iteration_container:
+            callback.current_iteration_container.caption(f"… 이벤트 {dropped}개 생략")
+    
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        if st.button("⏹️ 중단", key="cancel_run", disabled=run.cancel_requested, use_container_width=True):
+            run.cancel()
+    with col2:
+        label = "중단 요청됨 - 부분 결론 작성 중" if run.cancel_requested else "실행 중"
+        st.caption(f"⏱️ {label} ({run.elapsed:.0f}초 경과)")
+
+
+def get_output_pager() -> OutputPager:
+    """세션 도구 출력 저장소의 페이지 조회 도우미"""
+    if 'output_pager' not in st.session_state or st.session_state.output_pager.blob_store is not st.session_state.blob_store:
+        st.session_state.output_pager = OutputPager(st.session_state.blob_store, page_lines=OUTPUT_PAGE_LINES)
+    return st.session_state.output_pager
+
+
+@st.fragment
+def render_output_viewer(result_ref: str, key: str):
+    """
+    도구 출력 보기 - 검색과 페이지 이동은 이 조각만 다시 실행
+    
+    한 번에 한 페이지만 그리므로 출력이 커져도 다시 그리는 비용은 페이지 크기로 제한됨
+    """
+    pager = get_output_pager()
+    info = pager.info(result_ref)
+    if info is None:
+        st.caption("(저장소에서 삭제된 출력)")
+        return
+    
+    page_key = f"{key}_page"
+    query = st.text_input("🔍 출력 검색", key=f"{key}_query", placeholder="검색어 입력 후 Enter")
+    if query:
+        hits = pager.search(result_ref, query)
+        st.caption(f"{len(hits)}건 일치" + (" (처음 50건만 표시)" if len(hits) >= 50 else ""))
+        for hit in hits[:10]:
+            st.button(
+                f"{hit['line'] + 1}행: {hit['text'][:80]}",
+                key=f"{key}_hit_{hit['line']}",
+                on_click=lambda page=hit['page']: st.session_state.update({page_key: page + 1})
+            )
+    
+    # 검색 결과 버튼이 페이지를 바꿀 수 있도록 기본값은 세션 상태로만 지정
+    st.session_state.setdefault(page_key, 1)
+    page = st.number_input(f"페이지 (전체 {info['pages']})", min_value=1, max_value=info['pages'], key=page_key) - 1
+    first_line = page * pager.page_lines
+    last_line = min(first_line + pager.page_lines, info['lines'])
+    st.caption(f"{first_line + 1}–{last_line}행 / 전체 {info['lines']:,}행, {info['chars']:,}자")
+    st.code(pager.page(result_ref, page), language=info['language'])
+
+
+def finish_background_run(run: BackgroundRun):
+    """종료된 실행의 결과를 대화/실행 기록에 반영"""
+    st.session_state.active_run = None
+    
+    for event in run.history_events():
+        if event.type == "reasoning":
+            st.session_state.reasoning_steps.append({
+                'iteration': event.payload["iteration"],
+                'type': 'reasoning',
+                'content': event.payload["thought"],
+                'timestamp': datetime.fromtimestamp(event.timestamp).isoformat()
+            })
+        elif event.type == "final_result":
+            st.session_state.final_results.append({
+                'result': event.payload["result"],
+                'iterations': event.payload["iterations"],
+                'timestamp': datetime.fromtimestamp(event.timestamp).isoformat()
+            })
+    
+    result = run.result
+    if run.error is not None:
+        st.session_state.run_notice = ("error", f"❌ 시스템 오류 발생: {run.error}")
+    elif not result.get('success'):
+        st.session_state.run_notice = ("error", f"❌ 처리 실패: {result.get('error', '알 수 없는 오류')}")
+    else:
+        # 대화 히스토리에 추가
+        st.session_state.messages.append({
+            "role": "assistant",
+            "content": result['result']
+        })
+        
+        # 실행 기록 저장
+        st.session_state.execution_history.append({
+            "timestamp": datetime.now().isoformat(),
+            "user_input": run.prompt,
+            "result": result,
+            # result에 이미 포함된 목록은 같은 객체를 참조 (복사하지 않음)
+            "reasoning_history": result.get('reasoning_history', []),
+            "execution_log": result.get('execution_log', [])
+        })
+        
+        label = "⏹️ 중단됨" if result.get('stop_reason') == "cancelled" else "✅ 완료!"
+        st.session_state.run_notice = (
+            "success",
+            f"{label} "
+            f"(분석 단계: {result['iterations']}, "
+            f"시간: {result['execution_time']}초, "
+            f"토큰: {result.get('token_usage', {}).get('total_tokens', 0)})"
+        )
 
 
 def main():
@@ -173,6 +549,10 @@ def main():
         layout="wide"
     )
     
+    # 지표 서버는 프로세스당 한 번만 시작 (스크립트 재실행 시에는 기존 서버 유지)
+    if METRICS_PORT:
+        start_metrics_server(int(METRICS_PORT), host=METRICS_HOST)
+    
     st.title("🤖 ReAct Agent v2")
     st.markdown("LLM의 추론 과정을 실시간으로 확인할 수 있는 개선된 인터페이스")
     
@@ -209,6 +589,27 @@ def main():
             help="사용할 LLM 모델 선택"
         )
         
+        fast_model = st.selectbox(
+            "⚡ 도구 선택용 빠른 모델",
+            options=[
+                "사용 안 함",
+                "gpt-5-nano",
+                "gpt-oss:20b",
+                "iteasy-gpt",
+            ],
+            index=0,
+            help="도구 선택 단계는 빠른 모델로, 최종 보고서는 위 모델로 작성합니다"
+        )
+        fast_model = None if fast_model == "사용 안 함" else fast_model
+        
+        mode = st.radio(
+            "🗺️ 실행 모드",
+            options=["react", "plan"],
+            format_func=lambda value: "ReAct (단계별 추론)" if value == "react" else "Plan (계획 후 일괄 실행)",
+            index=0,
+            help="Plan 모드는 도구 호출 계획을 먼저 세우고 독립적인 단계를 동시에 실행하여 LLM 호출 횟수를 줄입니다"
+        )
+        
         max_iterations = st.slider(
             "🧠 최대 분석 단계",
             min_value=1,
@@ -217,6 +618,15 @@ def main():
             help="ReAct 에이전트의 최대 사고 단계 수"
         )
         
+        run_timeout = st.slider(
+            "⏱️ 실행 시간 제한 (초)",
+            min_value=30,
+            max_value=600,
+            value=180,
+            step=30,
+            help="시간 제한에 도달하면 분석을 중단하고 부분 결론을 표시합니다"
+        )
+        
         st.divider()
         
         # 서버 접속 설정
@@ -282,13 +692,26 @@ def main():
         st.divider()
         
         # 대화 기록 초기화
-        if st.button("🔄 대화 초기화", use_container_width=True):
-            st.session_state.messages = []
-            st.session_state.execution_history = []
-            st.session_state.reasoning_steps = []
-            st.session_state.final_results = []
+        reset_requested = st.button("🔄 대화 초기화", use_container_width=True)
+        if reset_requested and st.session_state.active_run:
+            # 취소된 실행의 저널 기록이 초기화 기록보다 뒤에 남지 않도록 종료를 기다리고,
+            # 제한 시간 안에 끝나지 않으면(도구/LLM 호출 진행 중) 실행을 유지한 채 초기화하지 않음
+            st.session_state.active_run.cancel()
+            if st.session_state.active_run.wait(timeout=10):
+                st.session_state.active_run = None
+            else:
+                reset_requested = False
+                st.warning("⏳ 실행이 아직 종료되지 않아 대화를 초기화하지 않았습니다. 종료 후 다시 시도해주세요.")
+        if reset_requested:
+            st.session_state.run_notice = None
+            st.session_state.messages.clear()
+            st.session_state.execution_history.clear()
+            st.session_state.reasoning_steps.clear()
+            st.session_state.final_results.clear()
             if st.session_state.agent:
                 st.session_state.agent.reset()
+            else:
+                st.session_state.journal.append(SessionJournal.RESET, {})
             st.rerun()
     
     # 메인 컨텐츠 영역
@@ -297,76 +720,43 @@ def main():
     with col1:
         st.header("💬 대화")
         
-        # 대화 히스토리 표시
-        for message in st.session_state.messages:
+        # 대화 히스토리 표시 (디스크로 내보낸 이전 대화는 요청 시에만 불러옴)
+        messages = st.session_state.messages
+        if messages.spilled and st.toggle(f"이전 대화 {messages.spilled}개 보기", key="show_spilled_messages"):
+            for index in range(messages.spilled):
+                message = messages.load(index)
+                with st.chat_message(message["role"]):
+                    st.markdown(message["content"])
+        for message in messages.recent():
             with st.chat_message(message["role"]):
                 st.markdown(message["content"])
         
-        # 사용자 입력
-        if prompt := st.chat_input("질문을 입력하세요..."):
+        # 직전 실행 결과 상태
+        if st.session_state.run_notice and not st.session_state.active_run:
+            kind, text = st.session_state.run_notice
+            (st.success if kind == "success" else st.error)(text)
+        
+        # 사용자 입력 (실행 중에는 비활성화)
+        if prompt := st.chat_input("질문을 입력하세요...", disabled=st.session_state.active_run is not None):
             # 사용자 메시지 추가
             st.session_state.messages.append({"role": "user", "content": prompt})
+            st.session_state.run_notice = None
             with st.chat_message("user"):
                 st.markdown(prompt)
             
-            # 에이전트 응답 생성
+            try:
+                # 에이전트를 백그라운드 스레드에서 실행 - 페이지는 계속 응답하고 진행 상황은 아래 조각이 갱신
+                agent = create_agent(endpoint, model, max_iterations, fast_model, run_timeout, mode)
+                st.session_state.agent = agent
+                st.session_state.active_run = BackgroundRun(agent, prompt, ServerConfig.get_connection_info()).start()
+            except Exception as e:
+                st.session_state.run_notice = ("error", f"❌ 시스템 오류 발생: {str(e)}")
+                st.error(f"시스템 오류: {str(e)}")
+        
+        # 에이전트 응답 (진행 중)
+        if st.session_state.active_run:
             with st.chat_message("assistant"):
-                # 상태 컨테이너
-                status_container = st.empty()
-                status_container.info("🤔 처리 중...")
-                
-                # 추론 과정을 표시할 컨테이너
-                reasoning_container = st.container()
-                
-                # 최종 결과를 표시할 컨테이너
-                result_container = st.empty()
-                
-                try:
-                    # 에이전트와 콜백 생성
-                    agent, callback = create_agent_with_callback(endpoint, model, max_iterations)
-                    st.session_state.agent = agent
-                    
-                    # 콜백에 컨테이너 설정
-                    callback.set_containers(reasoning_container, status_container, result_container)
-                    
-                    # 에이전트 실행
-                    result = agent.run(prompt)
-                    
-                    if result['success']:
-                        # 최종 결론은 on_final_result에서 표시됨
-                        pass
-                        
-                        # 대화 히스토리에 추가
-                        st.session_state.messages.append({
-                            "role": "assistant",
-                            "content": result['result']
-                        })
-                        
-                        # 실행 기록 저장
-                        execution_record = {
-                            "timestamp": datetime.now().isoformat(),
-                            "user_input": prompt,
-                            "result": result,
-                            "reasoning_history": result.get('reasoning_history', []),
-                            "execution_log": result.get('execution_log', [])
-                        }
-                        st.session_state.execution_history.append(execution_record)
-                        
-                        # 상태 업데이트
-                        status_container.success(
-                            f"✅ 완료! "
-                            f"(분석 단계: {result['iterations']}, "
-                            f"시간: {result['execution_time']}초, "
-                            f"토큰: {result.get('token_usage', {}).get('total_tokens', 0)})"
-                        )
-                    else:
-                        error_msg = result.get('error', '알 수 없는 오류')
-                        result_container.error(f"오류: {error_msg}")
-                        status_container.error("❌ 처리 실패")
-                        
-                except Exception as e:
-                    result_container.error(f"시스템 오류: {str(e)}")
-                    status_container.error("❌ 시스템 오류 발생")
+                render_active_run()
     
     with col2:
         st.header("📊 분석 정보")
@@ -377,7 +767,7 @@ def main():
         with tab1:
             st.subheader("🤔 추론 히스토리")
             if st.session_state.reasoning_steps:
-                for step in reversed(st.session_state.reasoning_steps[-10:]):  # 최근 10개
+                for step in reversed(st.session_state.reasoning_steps.recent(10)):  # 최근 10개
                     with st.expander(f"🧠 Step {step['iteration']} - {step['type']}", expanded=False):
                         st.write(step['content'])
                         st.caption(f"시간: {step['timestamp']}")
@@ -387,7 +777,15 @@ def main():
         with tab2:
             st.subheader("📝 실행 로그")
             if st.session_state.execution_history:
-                latest = st.session_state.execution_history[-1]
+                # 실행 선택 - 오래된 실행은 선택했을 때만 디스크에서 불러옴
+                summaries = st.session_state.execution_history.summaries()
+                selected = st.selectbox(
+                    "실행",
+                    options=list(reversed(range(len(summaries)))),
+                    format_func=lambda index: f"#{index + 1} {summaries[index]['timestamp'][11:19]} {summaries[index]['user_input']}",
+                    key="execution_log_run"
+                )
+                latest = st.session_state.execution_history.load(selected)
                 execution_log = latest.get('execution_log', [])
                 
                 if execution_log:
@@ -395,12 +793,14 @@ def main():
                         if 'tool_calls' in log:
                             for tool_call in log['tool_calls']:
                                 with st.expander(f"🔧 {tool_call['tool']}", expanded=False):
-                                    st.json({
-                                        "도구": tool_call['tool'],
-                                        "인자": tool_call['arguments'],
-                                        "성공": tool_call.get('success', False),
-                                        "결과 크기": tool_call.get('result_length', 0)
-                                    })
+                                    status = "✅ 성공" if tool_call.get('success', False) else "❌ 실패"
+                                    arguments = json.dumps(tool_call['arguments'], ensure_ascii=False)
+                                    st.caption(f"{status} · 결과 {tool_call.get('result_length', 0):,}자 · 인자 {arguments[:200]}")
+                                    # 도구 출력은 요청 시에만 저장소에서 페이지 단위로 불러옴
+                                    result_ref = tool_call.get('result_ref')
+                                    key = f"show_{log.get('iteration')}_{tool_call.get('tool_call_id', result_ref)}"
+                                    if result_ref and st.toggle("출력 보기", key=key):
+                                        render_output_viewer(result_ref, key)
                 else:
                     st.info("실행 로그가 여기에 표시됩니다")
             else:
@@ -409,7 +809,7 @@ def main():
         with tab3:
             st.subheader("⚡ 성능 지표")
             if st.session_state.execution_history:
-                latest = st.session_state.execution_history[-1]
+                latest = st.session_state.execution_history.load(-1)
                 result = latest['result']
                 
                 # 성능 메트릭
@@ -435,6 +835,31 @@ def main():
                     st.write(f"• 프롬프트: {token_usage.get('prompt_tokens', 0)}")
                     st.write(f"• 완성: {token_usage.get('completion_tokens', 0)}")
                 
+                # 모델 계층별 지표 (2-tier 라우팅 사용 시)
+                routing = result.get('routing')
+                if routing:
+                    st.divider()
+                    st.write("**모델 계층별 지표:**")
+                    for tier, metrics in routing['tiers'].items():
+                        st.write(
+                            f"• {tier} ({metrics['model']}): {metrics['calls']}회, "
+                            f"평균 {metrics['avg_latency']}초, 토큰 {metrics['total_tokens']}"
+                        )
+                    if routing.get('escalated'):
+                        st.caption(f"⬆️ 승격: {routing.get('escalation_reason')}")
+                
+                # 도구 출력 저장소 현황
+                blob_stats = st.session_state.blob_store.stats()
+                if blob_stats['blobs']:
+                    st.divider()
+                    st.write("**도구 출력 저장소:**")
+                    st.write(
+                        f"• {blob_stats['blobs']}개 / {blob_stats['chars']:,}자 "
+                        f"(중복 {blob_stats['dedup_hits']}회, {blob_stats['chars_saved']:,}자 절약)"
+                    )
+                    if blob_stats['spilled_blobs']:
+                        st.write(f"• 메모리 {blob_stats['memory_chars']:,}자, 디스크 {blob_stats['spilled_blobs']}개")
+                
                 # 사용된 도구 목록
                 if result.get('tools_used'):
                     st.divider()
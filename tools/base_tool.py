@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 
 class BaseTool(ABC):
@@ -14,6 +14,15 @@ class BaseTool(ABC):
     description: str = ""
     parameters: Optional[Dict[str, Any]] = None
     
+    # 도구 선택(검색)용 키워드 - 설명에 없는 한국어 표현/동의어 등
+    tags: List[str] = []
+    
+    # 다른 도구와 동시에 실행해도 안전한지 여부 (상태를 변경할 수 있는 도구는 False)
+    parallel_safe: bool = True
+    
+    # 한 번의 실행(run) 안에서 동일 인자 호출 결과를 재사용해도 되는지 여부 (멱등성)
+    cacheable: bool = True
+    
     def __init__(self):
         """도구 초기화"""
         if not self.name:
@@ -54,6 +63,20 @@ class BaseTool(ABC):
             
         return schema
     
+    def is_cacheable(self, arguments: Dict[str, Any]) -> bool:
+        """
+        주어진 인자로의 호출 결과를 실행 내에서 재사용할 수 있는지 판단
+        
+        인자에 따라 멱등성이 달라지는 도구는 이 메서드를 재정의
+        
+        Args:
+            arguments (Dict): 호출 인자
+            
+        Returns:
+            bool: 결과 재사용 가능 여부
+        """
+        return self.cacheable
+    
     def validate_arguments(self, arguments: Dict[str, Any]) -> bool:
         """
         인자 유효성 검사
@@ -1,6 +1,7 @@
-import paramiko
 from tools.base_tool import BaseTool
+from tools.remote_session import RemoteSession
 from config.server_config import ServerConfig
+from core.tracing import trace_span
 
 class ContainerAnalyzer(BaseTool):
     """
@@ -15,6 +16,8 @@ class ContainerAnalyzer(BaseTool):
         "properties": {},
         "required": []
     }
+    # 도구 선택(검색)용 키워드
+    tags = ["docker", "kubernetes", "k8s", "pod", "container", "image", "컨테이너", "도커", "쿠버네티스", "파드", "이미지"]
     
     def execute(self) -> str:
         # 서버 설정 정보 가져오기
@@ -22,15 +25,10 @@ class ContainerAnalyzer(BaseTool):
         if not connection_info:
             return "Error: Server connection information not configured. Please configure server settings in the sidebar."
         
-        ip = connection_info['ip']
-        port = connection_info['port']
-        username = connection_info['username']
-        password = connection_info['password']
-        ssh = paramiko.SSHClient()
-        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        ssh = RemoteSession(connection_info)
 
         try:
-            ssh.connect(ip, port=port, username=username, password=password)
+            ssh.connect()
             
             # 먼저 Docker 및 Kubernetes 사용 가능 여부 확인
             availability_check = [
@@ -46,8 +44,7 @@ class ContainerAnalyzer(BaseTool):
                 check_commands.append(f'echo "SECTION_END:$?"')
             
             check_command = " && ".join(check_commands)
-            _, stdout, stderr = ssh.exec_command(check_command)
-            check_output = stdout.read().decode('utf-8')
+            check_output, _ = ssh.run(check_command)
             
             # 사용 가능 여부 파싱
             check_sections = self._parse_batch_output(check_output)
@@ -95,11 +92,11 @@ class ContainerAnalyzer(BaseTool):
             if available_commands:
                 # 한 번의 SSH 실행으로 모든 명령어 실행
                 full_command = " && ".join(batch_commands)
-                _, stdout, stderr = ssh.exec_command(full_command)
-                full_output = stdout.read().decode('utf-8')
+                full_output, _ = ssh.run(full_command)
                 
                 # 섹션별로 결과 분리
-                sections = self._parse_batch_output(full_output)
+                with trace_span("ssh.parse", tool=self.name):
+                    sections = self._parse_batch_output(full_output)
                 
                 for description, command in available_commands:
                     section_data = sections.get(description, {})
@@ -1,7 +1,53 @@
-import paramiko
+from typing import Dict, Any
 from tools.base_tool import BaseTool
+from tools.remote_session import RemoteSession
 from config.server_config import ServerConfig
 
+
+# 결과 재사용이 안전한 읽기 전용 명령어 (인자와 관계없이 상태를 바꾸지 않음)
+READ_ONLY_PROGRAMS = {
+    "cat", "ls", "df", "du", "free", "uptime", "uname", "whoami", "id",
+    "ps", "pstree", "top", "vmstat", "iostat", "lscpu", "lsblk", "lsof", "nproc",
+    "ss", "netstat", "ifconfig", "findmnt",
+    "head", "tail", "grep", "egrep", "wc", "sort", "uniq", "cut",
+    "last", "who", "w", "stat", "which", "getent"
+}
+
+# 하위 명령에 따라 읽기 전용 여부가 갈리는 명령어
+READ_ONLY_SUBCOMMANDS = {
+    "systemctl": {"status", "list-units", "list-unit-files", "is-active", "is-enabled", "is-failed", "show", "cat"},
+    "docker": {"ps", "images", "inspect", "logs", "stats", "info", "version"},
+    "kubectl": {"get", "describe", "logs", "top", "version", "cluster-info"}
+}
+
+# ip는 객체 다음 동작까지 확인 (ip addr / ip route show 등은 조회, ip link set 등은 변경)
+IP_READ_ONLY_OBJECTS = {"a", "addr", "address", "l", "link", "r", "route", "n", "neigh", "rule", "maddr", "netns"}
+IP_READ_ONLY_ACTIONS = {"show", "list", "ls", "get"}
+
+# 위치 인자가 있으면 상태를 바꾸는 명령어 (mount /dev/x /mnt, hostname 새이름, date MMDDhhmm, route add ...)
+# 위치 인자 없이(date는 +형식만) 쓸 때만 읽기 전용
+NO_POSITIONAL_PROGRAMS = {"mount", "hostname", "date", "route"}
+
+# 명령어별 상태를 바꾸는 옵션 - 포함되면 읽기 전용이 아님
+STATEFUL_OPTIONS = {
+    "mount": {"-a", "--all"},
+    "hostname": {"-F", "--file", "-b", "--boot"},
+    "date": {"-s", "--set"},
+    "dmesg": {"-c", "-C", "-D", "-E", "-n", "--clear", "--read-clear", "--console-off", "--console-on", "--console-level"},
+    "journalctl": {
+        "--rotate", "--flush", "--sync", "--relinquish-var", "--smart-relinquish-var",
+        "--vacuum-size", "--vacuum-time", "--vacuum-files", "--setup-keys", "--update-catalog"
+    },
+    "sort": {"-o", "--output"}
+}
+
+# 위치 인자 수가 이 값을 넘으면 마지막 인자를 출력 파일로 쓰는 명령어 (uniq INPUT OUTPUT)
+MAX_READ_ONLY_POSITIONALS = {"uniq": 1}
+
+# 리다이렉션/명령 연결 등 부수 효과 가능성이 있는 셸 구문
+UNSAFE_SHELL_TOKENS = (">", ";", "&", "`", "$(")
+
+
 class ExecCommandRemoteSystem(BaseTool):
     """
     원격 시스템에서 명령어를 실행하는 도구 클래스
@@ -20,6 +66,73 @@ class ExecCommandRemoteSystem(BaseTool):
         },
         "required": ["command"]
     }
+    # 도구 선택(검색)용 키워드
+    tags = ["command", "shell", "ssh", "run", "log", "file", "명령", "명령어", "실행", "로그", "파일", "셸"]
+    # 임의 명령은 시스템 상태를 변경할 수 있으므로 단독 실행
+    parallel_safe = False
+    
+    def is_cacheable(self, arguments: Dict[str, Any]) -> bool:
+        """
+        읽기 전용 명령(파이프 연결 포함)만 실행 내 결과 재사용 허용
+        
+        Args:
+            arguments (Dict): 호출 인자
+            
+        Returns:
+            bool: 결과 재사용 가능 여부
+        """
+        command = str(arguments.get("command", "")).strip()
+        if not command or any(token in command for token in UNSAFE_SHELL_TOKENS):
+            return False
+        
+        for segment in command.split("|"):
+            words = segment.split()
+            if not words or not self._is_read_only_segment(words):
+                return False
+        
+        return True
+    
+    @staticmethod
+    def _is_read_only_segment(words) -> bool:
+        """
+        파이프로 나뉜 명령 하나의 읽기 전용 여부
+        
+        Args:
+            words: 명령 단어 목록 (첫 단어가 명령어)
+            
+        Returns:
+            bool: 읽기 전용 여부
+        """
+        program = words[0].rsplit("/", 1)[-1]
+        flags = [word for word in words[1:] if word.startswith("-")]
+        options = [word for word in words[1:] if not word.startswith("-")]
+        
+        stateful = STATEFUL_OPTIONS.get(program)
+        if stateful:
+            for flag in flags:
+                # 긴 옵션은 GNU getopt처럼 축약형(--out=파일 등)도 확인
+                name = flag.split("=", 1)[0]
+                if name in stateful or (name.startswith("--") and len(name) > 2 and any(
+                        option.startswith(name) for option in stateful)):
+                    return False
+                # 묶인 짧은 옵션 (dmesg -Tc 등)
+                if not flag.startswith("--") and any(f"-{letter}" in stateful for letter in flag[1:]):
+                    return False
+        
+        if len(options) > MAX_READ_ONLY_POSITIONALS.get(program, len(options)):
+            return False
+        if program in NO_POSITIONAL_PROGRAMS:
+            return all(program == "date" and option.startswith("+") for option in options)
+        if program in STATEFUL_OPTIONS or program in READ_ONLY_PROGRAMS:
+            return True
+        if program == "ip":
+            return (
+                bool(options) and options[0] in IP_READ_ONLY_OBJECTS
+                and (len(options) == 1 or options[1] in IP_READ_ONLY_ACTIONS)
+            )
+        
+        subcommands = READ_ONLY_SUBCOMMANDS.get(program)
+        return bool(subcommands and options and options[0] in subcommands)
     
     def execute(self, command: str) -> str:
         # 서버 설정 정보 가져오기
@@ -27,20 +140,12 @@ class ExecCommandRemoteSystem(BaseTool):
         if not connection_info:
             return "Error: Server connection information not configured. Please configure server settings in the sidebar."
         
-        ip = connection_info['ip']
-        port = connection_info['port']
-        username = connection_info['username']
-        password = connection_info['password']
-        ssh = paramiko.SSHClient()
-        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        ssh = RemoteSession(connection_info)
 
         try:
-            ssh.connect(ip, port=port, username=username, password=password)
-            
-            stdin, stdout, stderr = ssh.exec_command(command)
+            ssh.connect()
             
-            output = stdout.read().decode('utf-8')
-            error = stderr.read().decode('utf-8')
+            output, error = ssh.run(command)
             if error:
                 return f"실행 결과:\n{output}\n에러:\n{error}"
             else:
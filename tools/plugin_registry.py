@@ -0,0 +1,311 @@
+import os
+import sys
+import json
+import hashlib
+import tempfile
+import threading
+import importlib.util
+import importlib.metadata
+from typing import Dict, Any, List, Optional, Tuple
+from tools.tool_catalog import BUILTIN_PACK, ToolSpec, parse_tool_file
+
+
+# 도구 팩 패키지가 등록하는 entry point 그룹
+# 예) pyproject.toml: [project.entry-points."react_agent.tools"] database = "acme_db_tools.tools"
+#     값은 모듈("패키지.모듈" - 모듈의 BaseTool 하위 클래스 전체) 또는 "패키지.모듈:클래스"
+ENTRY_POINT_GROUP = "react_agent.tools"
+
+# 레지스트리 캐시 파일 (설치된 패키지가 바뀌지 않으면 site-packages를 다시 훑지 않음)
+DEFAULT_CACHE_PATH = os.getenv(
+    "REACT_AGENT_PLUGIN_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "react_agent", "tool_packs.json")
+)
+
+# 캐시 형식 버전 - ToolSpec 직렬화 형식이 바뀌면 올림
+CACHE_VERSION = 2
+
+# 시그니처 → 팩 목록 (같은 프로세스에서 에이전트마다 캐시 파일을 다시 읽지 않도록 공유)
+_MEMORY_CACHE: Dict[str, Dict[str, "ToolPack"]] = {}
+_MEMORY_CACHE_LOCK = threading.Lock()
+
+
+class ToolPack:
+    """entry point로 설치된 도구 팩 1개"""
+
+    def __init__(
+        self,
+        name: str,
+        value: str,
+        distribution: Optional[str] = None,
+        version: Optional[str] = None,
+        specs: Optional[List[ToolSpec]] = None,
+        sources: Optional[Dict[str, List[int]]] = None,
+        error: Optional[str] = None
+    ):
+        """
+        ToolPack 초기화
+
+        Args:
+            name: 팩 이름 (entry point 이름)
+            value: entry point 값 ("모듈" 또는 "모듈:클래스")
+            distribution: 배포 패키지명
+            version: 배포 패키지 버전
+            specs: 팩의 도구 메타데이터
+            sources: 소스 파일 경로 → [mtime_ns, 크기] (캐시 유효성 확인용)
+            error: 메타데이터 수집 실패 사유
+        """
+        self.name = name
+        self.value = value
+        self.distribution = distribution
+        self.version = version
+        self.specs = specs or []
+        self.sources = sources or {}
+        self.error = error
+
+    @property
+    def module(self) -> str:
+        """entry point 값의 모듈 경로"""
+        return self.value.partition(":")[0].strip()
+
+    @property
+    def class_name(self) -> Optional[str]:
+        """entry point 값의 클래스명 (모듈 전체를 가리키면 None)"""
+        return self.value.partition(":")[2].strip() or None
+
+    def is_stale(self) -> bool:
+        """소스 파일이 캐시 이후 수정되었는지 여부 (편집 가능 설치 대비)"""
+        for path, (mtime_ns, size) in self.sources.items():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return True
+            if stat.st_mtime_ns != mtime_ns or stat.st_size != size:
+                return True
+        return False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 직렬화용 딕셔너리 (레지스트리 캐시)"""
+        return {
+            "name": self.name,
+            "value": self.value,
+            "distribution": self.distribution,
+            "version": self.version,
+            "specs": [spec.to_dict() for spec in self.specs],
+            "sources": self.sources,
+            "error": self.error
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ToolPack":
+        """to_dict 결과에서 복원"""
+        return cls(
+            data["name"], data["value"], data.get("distribution"), data.get("version"),
+            [ToolSpec.from_dict(spec) for spec in data.get("specs", [])],
+            data.get("sources"), data.get("error")
+        )
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        return f"ToolPack(name='{self.name}', value='{self.value}', tools={[spec.name for spec in self.specs]})"
+
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
+
+
+def locate_module_source(module: str) -> Optional[str]:
+    """
+    모듈을 임포트하지 않고 소스 파일 경로 찾기
+
+    importlib.util.find_spec은 하위 모듈을 찾을 때 부모 패키지를 임포트하므로,
+    최상위 패키지 위치만 찾은 뒤 하위 경로는 직접 따라감
+
+    Args:
+        module: 모듈 경로 (예: "acme_db_tools.tools")
+
+    Returns:
+        Optional[str]: .py 소스 경로 (찾지 못하거나 확장 모듈이면 None)
+    """
+    parts = module.split(".")
+    try:
+        spec = importlib.util.find_spec(parts[0])
+    except (ImportError, ValueError):
+        return None
+    if spec is None:
+        return None
+
+    if len(parts) == 1:
+        return spec.origin if spec.origin and spec.origin.endswith(".py") else None
+
+    for location in spec.submodule_search_locations or []:
+        base = os.path.join(location, *parts[1:])
+        for candidate in (base + ".py", os.path.join(base, "__init__.py")):
+            if os.path.isfile(candidate):
+                return candidate
+    return None
+
+
+def _path_signature() -> str:
+    """
+    설치 상태 시그니처 - sys.path 디렉토리들의 mtime
+
+    패키지 설치/삭제 시 site-packages 디렉토리의 항목(dist-info, .pth)이 바뀌어 mtime이 갱신됨
+    """
+    entries = []
+    for entry in sys.path:
+        path = os.path.abspath(entry or os.curdir)
+        try:
+            entries.append(f"{path}:{os.stat(path).st_mtime_ns}")
+        except OSError:
+            continue
+    return hashlib.sha256("\n".join(entries).encode("utf-8")).hexdigest()[:16]
+
+
+def _collect_pack(entry_point: importlib.metadata.EntryPoint) -> ToolPack:
+    """entry point 1개의 도구 메타데이터를 임포트 없이 수집 (정적으로 읽을 수 없으면 동적 도구로 표시)"""
+    distribution = getattr(entry_point, "dist", None)
+    pack = ToolPack(
+        entry_point.name,
+        entry_point.value,
+        distribution.metadata["Name"] if distribution is not None else None,
+        distribution.version if distribution is not None else None
+    )
+
+    path = locate_module_source(pack.module)
+    if path is None:
+        # 소스를 찾을 수 없으면 로딩 시 임포트하여 클래스 속성을 읽음
+        pack.specs = [ToolSpec(pack.module, pack.class_name or "", "", {}, static=False, pack=pack.name)]
+        return pack
+
+    try:
+        specs = parse_tool_file(path, pack.module)
+        stat = os.stat(path)
+    except (OSError, SyntaxError) as e:
+        pack.error = str(e)
+        return pack
+
+    if pack.class_name:
+        specs = [spec for spec in specs if spec.class_name == pack.class_name]
+        if not specs:
+            # 다른 모듈에서 다시 내보낸 클래스 등 - 임포트하여 확인
+            specs = [ToolSpec(pack.module, pack.class_name, path, {}, static=False)]
+    elif not specs:
+        # 하위 모듈의 도구 클래스만 다시 내보내는 패키지 __init__.py 등 - 임포트하여 탐색
+        specs = [ToolSpec(pack.module, "", path, {}, static=False)]
+    pack.specs = [spec.with_pack(pack.name) for spec in specs]
+    pack.sources = {path: [stat.st_mtime_ns, stat.st_size]}
+    return pack
+
+
+def _scan_entry_points() -> Dict[str, ToolPack]:
+    """설치된 패키지의 도구 팩 entry point 수집 (site-packages 전체를 훑으므로 캐시 미스 시에만 호출)"""
+    packs: Dict[str, ToolPack] = {}
+    for entry_point in importlib.metadata.entry_points(group=ENTRY_POINT_GROUP):
+        if entry_point.name in packs or entry_point.name == BUILTIN_PACK:
+            print(f"⚠️ 중복 도구 팩 무시: {entry_point.name} ({entry_point.value})")
+            continue
+        packs[entry_point.name] = _collect_pack(entry_point)
+    return packs
+
+
+def load_tool_packs(cache_path: Optional[str] = DEFAULT_CACHE_PATH, refresh: bool = False) -> Dict[str, ToolPack]:
+    """
+    설치된 도구 팩 목록 (캐시 사용)
+
+    sys.path 디렉토리의 mtime 시그니처가 같으면 메모리/파일 캐시를 사용하고,
+    팩 소스가 수정된 경우에는 해당 팩만 다시 파싱
+
+    Args:
+        cache_path: 레지스트리 캐시 파일 경로 (None이면 파일 캐시 미사용)
+        refresh: 캐시를 무시하고 다시 수집할지 여부
+
+    Returns:
+        Dict[str, ToolPack]: 팩 이름 → 도구 팩 (이름 순)
+    """
+    signature = _path_signature()
+
+    packs: Optional[Dict[str, ToolPack]] = None
+    from_memory = False
+    if not refresh:
+        with _MEMORY_CACHE_LOCK:
+            packs = _MEMORY_CACHE.get(signature)
+        from_memory = packs is not None
+        if packs is None and cache_path:
+            packs = _read_cache(cache_path, signature)
+
+    if packs is None:
+        packs = dict(sorted(_scan_entry_points().items()))
+        changed = True
+    else:
+        stale = [name for name, pack in packs.items() if pack.is_stale()]
+        for name in stale:
+            packs = dict(packs, **{name: _collect_pack_again(packs[name])})
+        changed = bool(stale)
+        if from_memory and not changed:
+            return packs
+
+    with _MEMORY_CACHE_LOCK:
+        _MEMORY_CACHE.clear()
+        _MEMORY_CACHE[signature] = packs
+    if cache_path and changed:
+        _write_cache(cache_path, signature, packs)
+    return packs
+
+
+def _collect_pack_again(pack: ToolPack) -> ToolPack:
+    """소스가 수정된 팩 재수집 (배포 정보는 유지)"""
+    entry_point = importlib.metadata.EntryPoint(pack.name, pack.value, ENTRY_POINT_GROUP)
+    refreshed = _collect_pack(entry_point)
+    refreshed.distribution, refreshed.version = pack.distribution, pack.version
+    return refreshed
+
+
+def _read_cache(cache_path: str, signature: str) -> Optional[Dict[str, ToolPack]]:
+    """캐시 파일 읽기 (형식/시그니처가 다르거나 손상되었으면 None)"""
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != CACHE_VERSION or data.get("signature") != signature:
+            return None
+        return {name: ToolPack.from_dict(pack) for name, pack in data["packs"].items()}
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_cache(cache_path: str, signature: str, packs: Dict[str, ToolPack]):
+    """캐시 파일 기록 (임시 파일 교체로 원자적으로, 실패는 무시)"""
+    data = {
+        "version": CACHE_VERSION,
+        "signature": signature,
+        "packs": {name: pack.to_dict() for name, pack in packs.items()}
+    }
+    try:
+        directory = os.path.dirname(os.path.abspath(cache_path))
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix=".tool_packs-", dir=directory)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        print(f"⚠️ 도구 팩 캐시 기록 실패: {str(e)}")
+
+
+def parse_pack_names(value: Optional[str]) -> Optional[List[str]]:
+    """쉼표로 구분된 팩 이름 목록 파싱 (빈 값이면 None)"""
+    if not value:
+        return None
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    return names or None
+
+
+def pack_selection_from_env() -> Tuple[Optional[List[str]], Optional[List[str]]]:
+    """
+    환경 변수의 팩 활성화 설정
+
+    Returns:
+        Tuple: (REACT_AGENT_TOOL_PACKS - 활성화할 팩 목록, REACT_AGENT_DISABLED_TOOL_PACKS - 비활성화할 팩 목록)
+    """
+    return (
+        parse_pack_names(os.getenv("REACT_AGENT_TOOL_PACKS")),
+        parse_pack_names(os.getenv("REACT_AGENT_DISABLED_TOOL_PACKS"))
+    )
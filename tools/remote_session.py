@@ -0,0 +1,517 @@
+import os
+import time
+import socket
+import hashlib
+import threading
+import paramiko
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from core.cancellation import CancellationError, CancellationToken, get_current_token
+from core.cassette import get_current_cassette
+from core.tracing import trace_span, get_current_span
+from core.metrics import (
+    SSH_CONNECTS, SSH_CONNECT_LATENCY, SSH_COMMAND_LATENCY, SSH_SESSIONS_OPEN, SSH_POOL_IDLE, SSH_POOL_IN_USE
+)
+
+
+# 토큰에 제한 시간이 없을 때 적용할 기본 SSH 제한 시간 (초)
+DEFAULT_SSH_TIMEOUT = 60.0
+
+# 공개 키 인증에 시도할 ~/.ssh 기본 개인 키 (SSHClient와 같은 순서)
+DEFAULT_KEY_FILES = (
+    (paramiko.RSAKey, "id_rsa"),
+    (paramiko.ECDSAKey, "id_ecdsa"),
+    (paramiko.Ed25519Key, "id_ed25519")
+)
+
+# 공개 키 인증 후 서버가 추가로 요구할 수 있는 2단계 인증 방식
+_TWO_FACTOR_TYPES = {"keyboard-interactive", "password"}
+
+# SSH 작업 관찰자 목록 - (이벤트, 소요 시간, 세부 정보)를 전달받음 (벤치마크/계측용)
+_observers: List[Callable[[str, float, Dict[str, Any]], None]] = []
+_observers_lock = threading.Lock()
+
+
+def add_observer(observer: Callable[[str, float, Dict[str, Any]], None]):
+    """
+    SSH 작업 관찰자 등록
+
+    Args:
+        observer: observer(event, duration, details) - event는 "connect" 또는 "run"
+    """
+    with _observers_lock:
+        _observers.append(observer)
+
+
+def remove_observer(observer: Callable[[str, float, Dict[str, Any]], None]):
+    """SSH 작업 관찰자 해제"""
+    with _observers_lock:
+        if observer in _observers:
+            _observers.remove(observer)
+
+
+def _notify(event: str, duration: float, details: Dict[str, Any]):
+    """등록된 관찰자에게 SSH 작업 완료 알림 (관찰자 오류는 무시)"""
+    with _observers_lock:
+        observers = list(_observers)
+    for observer in observers:
+        try:
+            observer(event, duration, details)
+        except Exception:
+            pass
+
+
+def _close_transport(transport: paramiko.Transport):
+    """Transport 종료 및 열린 세션 지표 반영"""
+    transport.close()
+    SSH_SESSIONS_OPEN.dec()
+
+
+class TransportPool:
+    """
+    인증을 마친 SSH Transport 재사용 풀
+
+    API 서버처럼 같은 서버에 반복 접속하는 환경에서 RemoteSession.close 시 연결을 닫지 않고 보관했다가
+    다음 연결에 넘겨 TCP 연결/키 교환/인증을 생략 (도구 코드는 변경 없이 그대로 connect/close 호출)
+    접속 정보(ip, port, username, password)가 같은 연결끼리만 재사용
+    """
+
+    def __init__(self, max_idle_per_key: int = 4, idle_timeout: float = 60.0):
+        """
+        TransportPool 초기화
+
+        Args:
+            max_idle_per_key: 접속 대상별로 보관할 최대 유휴 연결 수
+            idle_timeout: 유휴 연결 보관 시간 (초, 지나면 닫음)
+        """
+        self.max_idle_per_key = max_idle_per_key
+        self.idle_timeout = idle_timeout
+        self.in_use = 0
+        self.hits = 0
+        self.misses = 0
+        self._idle: Dict[Tuple, List[Tuple[paramiko.Transport, float]]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(connection_info: Dict[str, Any]) -> Tuple:
+        """접속 대상 식별 키 (비밀번호는 해시로만 보관)"""
+        password = str(connection_info.get('password') or "")
+        return (
+            connection_info.get('ip'),
+            connection_info.get('port'),
+            connection_info.get('username'),
+            hashlib.sha256(password.encode("utf-8")).hexdigest()
+        )
+
+    def acquire(self, connection_info: Dict[str, Any]) -> Optional[paramiko.Transport]:
+        """
+        재사용 가능한 유휴 연결 가져오기
+
+        Args:
+            connection_info: 접속 정보
+
+        Returns:
+            Optional[paramiko.Transport]: 유휴 연결 (없으면 None - 호출자가 새로 연결 후 adopt 호출)
+        """
+        now = time.monotonic()
+        expired = []
+        transport = None
+        with self._lock:
+            idle = self._idle.get(self._key(connection_info), [])
+            while idle:
+                candidate, released_at = idle.pop()
+                if candidate.is_active() and now - released_at < self.idle_timeout:
+                    transport = candidate
+                    break
+                expired.append(candidate)
+            if transport is not None:
+                self.in_use += 1
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        for candidate in expired:
+            _close_transport(candidate)
+        return transport
+
+    def adopt(self):
+        """새로 연결한 Transport를 풀 관리 대상(사용 중)으로 등록"""
+        with self._lock:
+            self.in_use += 1
+
+    def release(self, connection_info: Dict[str, Any], transport: paramiko.Transport):
+        """
+        사용이 끝난 연결 반환 (끊어졌거나 보관 한도를 넘으면 닫음)
+
+        Args:
+            connection_info: 접속 정보
+            transport: 반환할 연결
+        """
+        with self._lock:
+            self.in_use -= 1
+            idle = self._idle.setdefault(self._key(connection_info), [])
+            keep = transport.is_active() and len(idle) < self.max_idle_per_key
+            if keep:
+                idle.append((transport, time.monotonic()))
+        if not keep:
+            _close_transport(transport)
+
+    def discard(self, transport: paramiko.Transport):
+        """사용 중인 연결을 재사용하지 않고 닫음 (끊어진 연결 등)"""
+        with self._lock:
+            self.in_use -= 1
+        _close_transport(transport)
+
+    def idle_count(self) -> int:
+        """보관 중인 유휴 연결 수"""
+        with self._lock:
+            return sum(len(idle) for idle in self._idle.values())
+
+    def close_all(self):
+        """유휴 연결 모두 종료 (사용 중인 연결은 반환 시 보관 한도에 따라 처리)"""
+        with self._lock:
+            transports = [transport for idle in self._idle.values() for transport, _ in idle]
+            self._idle.clear()
+        for transport in transports:
+            _close_transport(transport)
+
+    def stats(self) -> Dict[str, int]:
+        """풀 사용 통계"""
+        return {"idle": self.idle_count(), "in_use": self.in_use, "hits": self.hits, "misses": self.misses}
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        return f"TransportPool(idle={self.idle_count()}, in_use={self.in_use}, max_idle_per_key={self.max_idle_per_key})"
+
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
+
+
+# 프로세스 공용 연결 풀 (None이면 세션마다 연결/종료)
+_transport_pool: Optional[TransportPool] = None
+
+
+def set_transport_pool(pool: Optional[TransportPool]):
+    """
+    RemoteSession이 사용할 연결 풀 설정
+
+    Args:
+        pool: 연결 풀 (None이면 풀 사용 안 함, 기존 풀의 유휴 연결은 닫음)
+    """
+    global _transport_pool
+    previous, _transport_pool = _transport_pool, pool
+    if previous is not None and previous is not pool:
+        previous.close_all()
+    SSH_POOL_IDLE.set_function(pool.idle_count if pool else (lambda: 0))
+    SSH_POOL_IN_USE.set_function((lambda: pool.in_use) if pool else (lambda: 0))
+
+
+def get_transport_pool() -> Optional[TransportPool]:
+    """현재 설정된 연결 풀"""
+    return _transport_pool
+
+
+class RemoteSession:
+    """
+    원격 서버 SSH 세션 - 도구들이 공통으로 사용하는 paramiko 래퍼
+
+    현재 실행 컨텍스트의 취소 토큰을 따라 연결/명령 실행 제한 시간을 적용하고,
+    취소되거나 마감 시각이 지나면 SSH 채널을 닫아 블로킹 읽기를 중단
+    카세트가 설정된 컨텍스트에서는 연결/명령 실행을 카세트에 기록하거나 기록에서 재생
+    추적 중이면 연결(ssh.connect → ssh.handshake, ssh.auth)과 실행(ssh.run → ssh.exec, ssh.read)을 스팬으로 기록
+    연결 풀이 설정되어 있으면 풀의 유휴 연결을 재사용하고 close 시 풀에 반환
+    """
+
+    def __init__(
+        self,
+        connection_info: Dict[str, Any],
+        timeout: Optional[float] = None,
+        token: Optional[CancellationToken] = None
+    ):
+        """
+        RemoteSession 초기화
+
+        Args:
+            connection_info: 접속 정보 (ip, port, username, password)
+            timeout: 연결 및 명령 실행 제한 시간 (기본값: 토큰 남은 시간 또는 DEFAULT_SSH_TIMEOUT)
+            token: 취소 토큰 (기본값: 현재 실행 컨텍스트의 토큰)
+        """
+        self.connection_info = connection_info
+        self.timeout = timeout
+        self.token = token if token is not None else get_current_token()
+        self.transport: Optional[paramiko.Transport] = None
+        self._pool: Optional[TransportPool] = None  # 연결을 반환할 풀
+        self._reused = False  # 풀의 유휴 연결을 재사용했는지 여부
+
+    def _timeout(self) -> float:
+        """현재 작업에 적용할 제한 시간"""
+        default = self.timeout if self.timeout is not None else DEFAULT_SSH_TIMEOUT
+        if self.token is None:
+            return default
+        timeout = self.token.timeout_for(default)
+        # 마감 시각이 이미 지났으면 즉시 중단
+        if self.token.cancelled or not timeout:
+            raise CancellationError(self.token.reason or "timeout")
+        return timeout
+
+    def connect(self, reuse: bool = True) -> "RemoteSession":
+        """
+        SSH 연결 수립 (추적 스팬, 카세트 기록, 연결 지표, 관찰자 알림 포함)
+
+        Args:
+            reuse: 연결 풀의 유휴 연결 재사용 여부
+
+        Returns:
+            RemoteSession: 자기 자신 (체이닝용)
+        """
+        start_time = time.perf_counter()
+        success = False
+        try:
+            with trace_span("ssh.connect", host=self.connection_info.get('ip'), port=self.connection_info.get('port'), reuse=reuse):
+                cassette = get_current_cassette()
+                if cassette is not None:
+                    cassette.ssh_connect(self.connection_info, lambda: self._connect(reuse=reuse))
+                else:
+                    self._connect(reuse=reuse)
+            success = True
+        finally:
+            duration = time.perf_counter() - start_time
+            SSH_CONNECTS.labels("success" if success else "error").inc()
+            SSH_CONNECT_LATENCY.observe(duration)
+            _notify("connect", duration, {"host": self.connection_info.get('ip'), "success": success})
+        return self
+
+    def _connect(self, reuse: bool = True) -> "RemoteSession":
+        """
+        실제 SSH 연결 수립
+
+        TCP 연결/키 교환과 사용자 인증 구간을 따로 측정하기 위해 SSHClient 대신 Transport를 직접 사용
+        (호스트 키는 기존 AutoAddPolicy와 같이 검증하지 않고, 인증은 SSHClient와 같은 순서로 시도)
+
+        Args:
+            reuse: 연결 풀의 유휴 연결 재사용 여부
+        """
+        pool = get_transport_pool()
+        if pool is not None and reuse:
+            pooled = pool.acquire(self.connection_info)
+            if pooled is not None:
+                get_current_span().set_attribute("pooled", True)
+                self.transport, self._pool, self._reused = pooled, pool, True
+                return self
+
+        timeout = self._timeout()
+        transport = None
+        closed = threading.Event()
+
+        def abort():
+            closed.set()
+            if transport is not None:
+                transport.close()
+
+        handle = self.token.register(abort) if self.token else None
+        sock = None
+        try:
+            with trace_span("ssh.handshake"):
+                sock = socket.create_connection(
+                    (self.connection_info['ip'], self.connection_info['port']),
+                    timeout=timeout
+                )
+                transport = paramiko.Transport(sock)
+                transport.banner_timeout = timeout
+                # 토큰 등록 이후 Transport 생성 전에 취소된 경우
+                if closed.is_set():
+                    transport.close()
+                transport.start_client(timeout=timeout)
+
+            with trace_span("ssh.auth", username=self.connection_info['username']):
+                transport.auth_timeout = timeout
+                self._authenticate(transport)
+        except Exception:
+            if transport is not None:
+                transport.close()
+            if sock is not None:
+                sock.close()
+            if self.token and self.token.cancelled:
+                raise CancellationError(self.token.reason or "cancelled")
+            raise
+        finally:
+            if self.token:
+                self.token.unregister(handle)
+
+        self.transport, self._pool, self._reused = transport, pool, False
+        SSH_SESSIONS_OPEN.inc()
+        if pool is not None:
+            pool.adopt()
+        return self
+
+    def _authenticate(self, transport: paramiko.Transport):
+        """
+        사용자 인증 - SSHClient.connect와 같은 순서로 시도
+
+        SSH 에이전트 키 → ~/.ssh 기본 키 → 비밀번호 (비밀번호 없는 접속 정보는 키 인증만 사용)
+        공개 키 인증 후 서버가 2단계 인증을 요구하면 비밀번호 또는 keyboard-interactive로 이어서 인증
+
+        Args:
+            transport: 키 교환을 마친 연결
+
+        Raises:
+            paramiko.SSHException: 모든 인증 수단이 실패한 경우 (마지막 인증 오류)
+        """
+        username = self.connection_info['username']
+        password = self.connection_info.get('password')
+        saved_exception = None
+        two_factor = False
+
+        agent = paramiko.Agent()
+        try:
+            for key in self._candidate_keys(agent, password):
+                try:
+                    allowed_types = set(transport.auth_publickey(username, key))
+                except paramiko.SSHException as e:
+                    saved_exception = e
+                    continue
+                two_factor = bool(allowed_types & _TWO_FACTOR_TYPES)
+                if not two_factor:
+                    return
+                break
+        finally:
+            agent.close()
+
+        try:
+            if password is not None:
+                transport.auth_password(username, password)
+                return
+            if two_factor:
+                transport.auth_interactive_dumb(username)
+                return
+        except paramiko.SSHException as e:
+            saved_exception = e
+
+        if saved_exception is not None:
+            raise saved_exception
+        raise paramiko.SSHException("No authentication methods available")
+
+    @staticmethod
+    def _candidate_keys(agent: paramiko.Agent, passphrase: Optional[str]):
+        """
+        공개 키 인증에 시도할 키 - 에이전트 키, ~/.ssh 기본 키 순서
+
+        키 파일은 비밀번호로 암호를 풀어 보고, 읽을 수 없거나 형식이 다른 키는 건너뜀
+        """
+        yield from agent.get_keys()
+        for key_class, name in DEFAULT_KEY_FILES:
+            path = os.path.expanduser(os.path.join("~", ".ssh", name))
+            if not os.path.isfile(path):
+                continue
+            try:
+                yield key_class.from_private_key_file(path, password=passphrase)
+            except (paramiko.SSHException, OSError):
+                continue
+
+    def run(self, command: str) -> Tuple[str, str]:
+        """
+        원격 명령 실행
+
+        Args:
+            command: 실행할 명령어
+
+        Returns:
+            Tuple[str, str]: (표준 출력, 표준 에러)
+
+        Raises:
+            CancellationError: 취소되었거나 마감 시각이 지난 경우
+            TimeoutError: 명령 실행이 제한 시간을 넘긴 경우
+        """
+        start_time = time.perf_counter()
+        success = False
+        try:
+            with trace_span("ssh.run", command=command[:200]):
+                cassette = get_current_cassette()
+                if cassette is not None:
+                    result = cassette.ssh_run(command, lambda: self._run(command))
+                else:
+                    result = self._run(command)
+            success = True
+        finally:
+            duration = time.perf_counter() - start_time
+            SSH_COMMAND_LATENCY.observe(duration)
+            _notify("run", duration, {"command": command, "success": success})
+        return result
+
+    def _run(self, command: str) -> Tuple[str, str]:
+        """실제 원격 명령 실행"""
+        if self.transport is None:
+            self.connect()
+
+        timeout = self._timeout()
+        with trace_span("ssh.exec"):
+            try:
+                channel = self.transport.open_session(timeout=timeout)
+            except (paramiko.SSHException, EOFError, OSError):
+                if not self._reused:
+                    raise
+                # 풀에서 가져온 연결이 서버 측에서 끊어진 경우 새로 연결하여 한 번만 재시도
+                self._pool.discard(self.transport)
+                self.transport = None
+                self.connect(reuse=False)
+                channel = self.transport.open_session(timeout=timeout)
+            channel.settimeout(timeout)
+            channel.exec_command(command)
+        stdout = channel.makefile("rb")
+        stderr = channel.makefile_stderr("rb")
+
+        # 취소 시 채널을 닫아 블로킹 읽기 중단, 제한 시간 경과 시에도 동일하게 처리
+        expired = threading.Event()
+
+        def expire():
+            expired.set()
+            channel.close()
+
+        timer = threading.Timer(timeout, expire)
+        timer.daemon = True
+        timer.start()
+        handle = self.token.register(channel.close) if self.token else None
+
+        try:
+            with trace_span("ssh.read") as span:
+                output = stdout.read().decode('utf-8', errors='replace')
+                error = stderr.read().decode('utf-8', errors='replace')
+                span.set_attributes(stdout_length=len(output), stderr_length=len(error))
+        except socket.timeout:
+            expired.set()
+            output, error = "", ""
+        finally:
+            timer.cancel()
+            if self.token:
+                self.token.unregister(handle)
+
+        if self.token and self.token.cancelled:
+            raise CancellationError(self.token.reason or "cancelled")
+        if expired.is_set():
+            raise TimeoutError(f"원격 명령 실행 시간 초과 ({round(timeout, 1)}초): {command[:80]}")
+
+        return output, error
+
+    def close(self):
+        """SSH 연결 종료"""
+        if self.transport is not None:
+            if self._pool is not None:
+                self._pool.release(self.connection_info, self.transport)
+            else:
+                _close_transport(self.transport)
+            self.transport = None
+            self._pool = None
+
+    def __enter__(self) -> "RemoteSession":
+        return self.connect()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        return f"RemoteSession({self.connection_info.get('username')}@{self.connection_info.get('ip')}:{self.connection_info.get('port')})"
+
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
@@ -1,6 +1,7 @@
-import paramiko
 from tools.base_tool import BaseTool
+from tools.remote_session import RemoteSession
 from config.server_config import ServerConfig
+from core.tracing import trace_span
 
 class SystemInfoAnalyzer(BaseTool):
     """
@@ -15,6 +16,8 @@ class SystemInfoAnalyzer(BaseTool):
         "properties": {},
         "required": []
     }
+    # 도구 선택(검색)용 키워드
+    tags = ["os", "kernel", "uptime", "memory", "disk", "cpu", "hardware", "시스템", "메모리", "디스크", "용량", "커널", "가동", "서버", "점검"]
     
     def execute(self) -> str:
         # 서버 설정 정보 가져오기
@@ -22,15 +25,10 @@ class SystemInfoAnalyzer(BaseTool):
         if not connection_info:
             return "Error: Server connection information not configured. Please configure server settings in the sidebar."
         
-        ip = connection_info['ip']
-        port = connection_info['port']
-        username = connection_info['username']
-        password = connection_info['password']
-        ssh = paramiko.SSHClient()
-        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        ssh = RemoteSession(connection_info)
 
         try:
-            ssh.connect(ip, port=port, username=username, password=password)
+            ssh.connect()
             
             # 실행할 시스템 정보 수집 명령어들
             commands = [
@@ -52,8 +50,7 @@ class SystemInfoAnalyzer(BaseTool):
             full_command = " && ".join(batch_commands)
             
             # 한 번의 SSH 실행으로 모든 명령어 실행
-            _, stdout, stderr = ssh.exec_command(full_command)
-            full_output = stdout.read().decode('utf-8')
+            full_output, _ = ssh.run(full_command)
             
             # 결과 파싱
             results = []
@@ -62,7 +59,8 @@ class SystemInfoAnalyzer(BaseTool):
             results.append("="*60)
             
             # 섹션별로 결과 분리
-            sections = self._parse_batch_output(full_output)
+            with trace_span("ssh.parse", tool=self.name):
+                sections = self._parse_batch_output(full_output)
             
             for description, command in commands:
                 section_data = sections.get(description, {})
@@ -0,0 +1,279 @@
+import os
+import ast
+import hashlib
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+
+
+# 클래스 본문에서 정적으로 읽어 올 도구 메타데이터 속성
+METADATA_ATTRIBUTES = ("name", "description", "parameters", "tags", "parallel_safe", "cacheable")
+
+# 재정의되어 있으면 정적 메타데이터만으로 스키마를 만들 수 없는 메서드
+DYNAMIC_METHODS = ("get_schema", "__init__")
+
+# tools/ 디렉토리 도구가 속하는 기본 도구 팩 이름
+BUILTIN_PACK = "builtin"
+
+# 도구가 아닌 지원 모듈
+NON_TOOL_MODULES = {"base_tool", "tools_manager", "tool_catalog", "plugin_registry", "remote_session"}
+
+# (파일 경로, mtime_ns, 크기) → 파싱 결과 - 같은 파일을 에이전트마다 다시 파싱하지 않도록 프로세스 단위로 공유
+_PARSE_CACHE: Dict[Tuple[str, int, int], List["ToolSpec"]] = {}
+_PARSE_CACHE_LOCK = threading.Lock()
+
+
+class ToolSpec:
+    """
+    임포트 없이 소스에서 읽어 온 도구 메타데이터
+
+    이름/설명/파라미터가 모두 리터럴로 정의된 도구는 static=True이며,
+    이 경우 모듈을 임포트하지 않고도 스키마와 프롬프트를 만들 수 있음
+    """
+
+    __slots__ = (
+        "name", "description", "parameters", "tags", "parallel_safe", "cacheable",
+        "module", "class_name", "path", "static", "custom_cacheable", "pack"
+    )
+
+    def __init__(
+        self,
+        module: str,
+        class_name: str,
+        path: str,
+        metadata: Dict[str, Any],
+        static: bool = True,
+        custom_cacheable: bool = False,
+        pack: str = BUILTIN_PACK
+    ):
+        """
+        ToolSpec 초기화
+
+        Args:
+            module: 모듈 경로 (예: "tools.system_info_analyzer")
+            class_name: 도구 클래스명
+            path: 소스 파일 경로
+            metadata: 클래스 속성에서 읽은 메타데이터
+            static: 메타데이터만으로 스키마를 만들 수 있는지 여부
+            custom_cacheable: is_cacheable을 재정의했는지 여부 (인자별 판단은 임포트 필요)
+            pack: 도구가 속한 도구 팩 이름
+        """
+        self.module = module
+        self.class_name = class_name
+        self.path = path
+        self.name: str = metadata.get("name", "")
+        self.description: str = metadata.get("description", "")
+        self.parameters: Optional[Dict[str, Any]] = metadata.get("parameters")
+        self.tags: List[str] = list(metadata.get("tags") or [])
+        self.parallel_safe: bool = metadata.get("parallel_safe", True)
+        self.cacheable: bool = metadata.get("cacheable", True)
+        self.static = static
+        self.custom_cacheable = custom_cacheable
+        self.pack = pack
+
+    def get_schema(self) -> Dict[str, Any]:
+        """
+        OpenAI Function Calling 스키마 (BaseTool.get_schema와 같은 형식)
+
+        Returns:
+            Dict: OpenAI tools 형식의 스키마
+        """
+        schema = {
+            "type": "function",
+            "function": {
+                "name": self.name,
+                "description": self.description
+            }
+        }
+        if self.parameters:
+            schema["function"]["parameters"] = self.parameters
+        return schema
+
+    def with_pack(self, pack: str) -> "ToolSpec":
+        """다른 도구 팩 이름을 가진 사본 (파싱 캐시의 공유 객체를 수정하지 않도록)"""
+        data = self.to_dict()
+        data["pack"] = pack
+        return ToolSpec.from_dict(data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 직렬화용 딕셔너리 (도구 팩 레지스트리 캐시)"""
+        return {
+            "module": self.module,
+            "class_name": self.class_name,
+            "path": self.path,
+            "metadata": {
+                "name": self.name,
+                "description": self.description,
+                "parameters": self.parameters,
+                "tags": self.tags,
+                "parallel_safe": self.parallel_safe,
+                "cacheable": self.cacheable
+            },
+            "static": self.static,
+            "custom_cacheable": self.custom_cacheable,
+            "pack": self.pack
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ToolSpec":
+        """to_dict 결과에서 복원"""
+        return cls(
+            data["module"], data["class_name"], data["path"], data["metadata"],
+            data.get("static", True), data.get("custom_cacheable", False), data.get("pack", BUILTIN_PACK)
+        )
+
+    def __str__(self) -> str:
+        """문자열 표현"""
+        return f"ToolSpec(name='{self.name}', class='{self.module}.{self.class_name}', static={self.static})"
+
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
+
+
+def _base_names(node: ast.ClassDef) -> List[str]:
+    """클래스의 기반 클래스 이름 목록 (tools.base_tool.BaseTool 같은 속성 형태 포함)"""
+    names = []
+    for base in node.bases:
+        if isinstance(base, ast.Name):
+            names.append(base.id)
+        elif isinstance(base, ast.Attribute):
+            names.append(base.attr)
+    return names
+
+
+def _class_metadata(node: ast.ClassDef) -> Tuple[Dict[str, Any], bool, bool]:
+    """
+    클래스 본문의 리터럴 속성 읽기
+
+    Returns:
+        Tuple: (메타데이터, 정적 여부, is_cacheable 재정의 여부)
+    """
+    metadata: Dict[str, Any] = {}
+    static = True
+    custom_cacheable = False
+
+    for statement in node.body:
+        if isinstance(statement, ast.Assign):
+            targets = [target.id for target in statement.targets if isinstance(target, ast.Name)]
+        elif isinstance(statement, ast.AnnAssign) and isinstance(statement.target, ast.Name) and statement.value:
+            targets = [statement.target.id]
+        elif isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if statement.name in DYNAMIC_METHODS:
+                static = False
+            elif statement.name == "is_cacheable":
+                custom_cacheable = True
+            continue
+        else:
+            continue
+
+        for target in targets:
+            if target not in METADATA_ATTRIBUTES:
+                continue
+            try:
+                metadata[target] = ast.literal_eval(statement.value)
+            except ValueError:
+                # 상수 참조/계산식 등 - 값은 임포트해야 알 수 있음
+                static = False
+
+    if not metadata.get("name") or not metadata.get("description"):
+        static = False
+    return metadata, static, custom_cacheable
+
+
+def parse_tool_file(path: str, module: str) -> List[ToolSpec]:
+    """
+    도구 소스 파일을 임포트하지 않고 AST로 파싱하여 도구 메타데이터 추출
+
+    BaseTool을 직접 상속한 클래스를 도구로 인식하고, 중간 기반 클래스나 별칭으로 상속한 클래스처럼
+    정적으로 판단할 수 없는 클래스가 있으면 모듈 전체를 동적 도구(임포트 후 issubclass로 탐색)로 표시
+    결과는 파일의 mtime/크기 기준으로 캐시
+
+    Args:
+        path: 소스 파일 경로
+        module: 모듈 경로
+
+    Returns:
+        List[ToolSpec]: 파일에 정의된 도구 목록
+
+    Raises:
+        OSError: 파일을 읽을 수 없는 경우
+        SyntaxError: 소스 구문 오류
+    """
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    with _PARSE_CACHE_LOCK:
+        cached = _PARSE_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    specs = []
+    undetermined = False
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        if "BaseTool" in _base_names(node):
+            metadata, static, custom_cacheable = _class_metadata(node)
+            specs.append(ToolSpec(module, node.name, path, metadata, static, custom_cacheable))
+        elif node.bases:
+            undetermined = True
+
+    if undetermined:
+        # 직접 상속한 도구도 함께 임포트 시 탐색되므로 중복 등록되지 않도록 모듈 단위 항목 하나로 대체
+        specs = [ToolSpec(module, "", path, {}, static=False)]
+
+    with _PARSE_CACHE_LOCK:
+        # 같은 파일의 이전 버전 항목 제거
+        for stale in [entry for entry in _PARSE_CACHE if entry[0] == path]:
+            del _PARSE_CACHE[stale]
+        _PARSE_CACHE[key] = specs
+    return specs
+
+
+def tool_files(tools_dir: str, package: str = "tools") -> List[Tuple[str, str]]:
+    """
+    도구 디렉터리의 도구 소스 파일 목록 (파일명 순)
+
+    Args:
+        tools_dir: 도구 디렉터리
+        package: 모듈 경로 접두어
+
+    Returns:
+        List[Tuple]: (파일 경로, 모듈 경로) 목록
+    """
+    files = []
+    for filename in sorted(os.listdir(tools_dir)):
+        if not filename.endswith(".py") or filename.startswith("_"):
+            continue
+        module_name = filename[:-3]
+        if module_name in NON_TOOL_MODULES:
+            continue
+        files.append((os.path.join(tools_dir, filename), f"{package}.{module_name}"))
+    return files
+
+
+def file_signature(path: str, previous: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    변경 감지용 파일 서명 (mtime/크기 + 내용 해시)
+
+    mtime과 크기가 이전 서명과 같으면 파일을 읽지 않고 이전 해시를 재사용
+
+    Args:
+        path: 파일 경로
+        previous: 이전 서명
+
+    Returns:
+        Dict: {"mtime_ns", "size", "sha256"}
+
+    Raises:
+        OSError: 파일을 읽을 수 없는 경우
+    """
+    stat = os.stat(path)
+    if previous and previous["mtime_ns"] == stat.st_mtime_ns and previous["size"] == stat.st_size:
+        return previous
+    with open(path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": digest}
+
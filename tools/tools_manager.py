@@ -1,31 +1,86 @@
 import os
 import sys
+import copy
+import json
+import hashlib
+import threading
 import importlib
 import importlib.util
 import inspect
-from typing import Dict, List, Any, Optional, Type
+import time
+from typing import Dict, List, Any, Optional, Tuple, Type
 from tools.base_tool import BaseTool
+from tools.tool_catalog import (
+    BUILTIN_PACK, METADATA_ATTRIBUTES, ToolSpec, tool_files, file_signature, parse_tool_file
+)
+from tools.plugin_registry import DEFAULT_CACHE_PATH, ToolPack, load_tool_packs, pack_selection_from_env
+from core.metrics import TOOL_EXECUTIONS, TOOL_LATENCY
+
+
+# 도구가 예외 대신 반환하는 오류 메시지 접두어 (지표의 오류 분류용)
+ERROR_OUTPUT_PREFIXES = ("Error:", "❌ 연결 오류", "연결 오류", '{"error"')
 
 
 class ToolsManager:
     """
     도구들을 자동으로 발견하고 관리하는 매니저 클래스
-    순수 동적 로딩으로 새 도구 파일만 추가하면 자동 인식
+    새 도구 파일만 추가하면 자동 인식
+    
+    도구 메타데이터는 소스를 AST로 파싱하여 읽고, 모듈 임포트와 인스턴스 생성은
+    도구를 처음 실행(get_tool)할 때로 미룸 - 시작 시간과 에이전트 생성 비용 절감
+    
+    tools/ 디렉토리(builtin 팩) 외에 "react_agent.tools" entry point로 설치된 도구 팩도 발견하며,
+    팩 단위로 활성화/비활성화하여 프롬프트에 들어가는 스키마 수를 조절
     """
     
-    def __init__(self, tools_dir: Optional[str] = None):
+    def __init__(
+        self,
+        tools_dir: Optional[str] = None,
+        lazy: bool = True,
+        packs: Optional[List[str]] = None,
+        disabled_packs: Optional[List[str]] = None,
+        plugin_cache: Optional[str] = DEFAULT_CACHE_PATH
+    ):
         """
         ToolsManager 초기화
         
         Args:
             tools_dir (str, optional): 도구들이 있는 디렉토리 경로
+            lazy (bool): 도구 모듈을 최초 사용 시 임포트할지 여부 (False면 시작 시 모두 로딩)
+            packs (List[str], optional): 활성화할 도구 팩 ("builtin" 포함, 기본값: REACT_AGENT_TOOL_PACKS 또는 전체)
+            disabled_packs (List[str], optional): 비활성화할 도구 팩 (기본값: REACT_AGENT_DISABLED_TOOL_PACKS)
+            plugin_cache (str, optional): 도구 팩 레지스트리 캐시 파일 (None이면 파일 캐시 미사용)
         """
         if tools_dir is None:
             tools_dir = os.path.dirname(__file__)
         
         self.tools_dir = tools_dir
-        self.tools: Dict[str, BaseTool] = {}
+        self.lazy = lazy
+        self.specs: Dict[str, ToolSpec] = {}  # 발견된 도구 메타데이터 (도구 파일 순)
+        self.tools: Dict[str, BaseTool] = {}  # 로딩된 도구 인스턴스
         self.tools_classes: Dict[str, Type[BaseTool]] = {}
+        self.discovery_time = 0.0
+        self._load_lock = threading.RLock()
+        
+        # 도구 팩 - 설치된 팩 목록과 팩별 등록된 도구명
+        env_packs, env_disabled = pack_selection_from_env()
+        self.plugin_cache = plugin_cache
+        self.pack_filter = set(packs if packs is not None else env_packs or []) or None
+        self.disabled_packs = set(disabled_packs if disabled_packs is not None else env_disabled or [])
+        self.tool_packs: Dict[str, ToolPack] = {}
+        self._pack_tools: Dict[str, List[str]] = {}
+        
+        # 도구 파일 매니페스트 - 파일 경로 → 서명(mtime/크기/해시), 모듈, 정의된 도구명
+        self._manifest: Dict[str, Dict[str, Any]] = {}
+        self._watcher: Optional["ToolWatcher"] = None
+        
+        # 도구 스키마 캐시 - 도구 구성이 바뀌면 바뀐 도구의 스키마만 무효화
+        self._schema_lock = threading.Lock()
+        self._schema_version = 0
+        self._schema_bundle: Optional[Tuple[Dict[str, Any], ...]] = None
+        self._schema_by_name: Dict[str, Dict[str, Any]] = {}
+        self._schema_json: Optional[str] = None
+        self._schema_fingerprint: Optional[str] = None
         
         # 패키지 경로 설정으로 임포트 문제 해결
         self._setup_package_path()
@@ -53,143 +108,246 @@ class ToolsManager:
             except ImportError as e:
                 print(f"⚠️ tools 패키지 로딩 실패: {e}")
     
-    def _discover_tools(self):
+    def _discover_tools(self, refresh_packs: bool = False):
         """
-        tools 디렉토리에서 도구들을 자동으로 발견하고 로딩
+        tools 디렉토리와 설치된 도구 팩에서 도구 메타데이터를 정적으로 발견 (모듈은 임포트하지 않음)
+        
+        메타데이터를 리터럴로 읽을 수 없는 도구만 즉시 임포트하며,
+        lazy=False이면 기존처럼 모든 도구를 시작 시 로딩
+        
+        Args:
+            refresh_packs: 도구 팩 레지스트리 캐시를 무시하고 다시 수집할지 여부
         """
-        # tools 디렉토리의 모든 Python 파일 검색
-        for filename in os.listdir(self.tools_dir):
-            if filename.endswith('.py') and not filename.startswith('_'):
-                if filename in ['base_tool.py', 'tools_manager.py']:
-                    continue
-                    
-                module_name = filename[:-3]  # .py 제거
-                self._load_tool_from_file(filename, module_name)
+        start_time = time.perf_counter()
+        if self.is_pack_enabled(BUILTIN_PACK):
+            for path, module in tool_files(self.tools_dir):
+                self._register_file(path, module)
+        
+        # 설치된 도구 팩 - 레지스트리 캐시에서 메타데이터를 읽으므로 site-packages를 매번 훑지 않음
+        self.tool_packs = load_tool_packs(self.plugin_cache, refresh=refresh_packs)
+        for name, pack in self.tool_packs.items():
+            if pack.error:
+                print(f"❌ 도구 팩 메타데이터 수집 실패: {name} ({pack.value}) - {pack.error}")
+            elif self.is_pack_enabled(name):
+                self._pack_tools[name] = self._register_specs(pack.specs)
+        
+        self.discovery_time = time.perf_counter() - start_time
+        enabled = [name for name in [BUILTIN_PACK, *self.tool_packs] if self.is_pack_enabled(name)]
+        print(
+            f"🧰 도구 {len(self.specs)}개 발견 (팩: {', '.join(enabled) or '없음'}, "
+            f"{'지연' if self.lazy else '즉시'} 로딩, {self.discovery_time * 1000:.1f}ms)"
+        )
     
-    def _load_tool_from_file(self, filename: str, module_name: str):
+    def _register_file(self, path: str, module: str, previous: Optional[Dict[str, Any]] = None) -> List[str]:
         """
-        파일에서 도구를 로드 - 다층 fallback 전략
+        도구 파일 1개의 도구들을 등록하고 매니페스트 갱신 (호출자가 필요 시 _load_lock 보유)
         
         Args:
-            filename (str): 파일명
-            module_name (str): 모듈명
+            path: 소스 파일 경로
+            module: 모듈 경로
+            previous: 이전 매니페스트 서명 (있으면 mtime/크기가 같을 때 해시 재사용)
+            
+        Returns:
+            List[str]: 등록된 도구명
         """
-        full_module_name = f"tools.{module_name}"
+        try:
+            signature = file_signature(path, previous)
+            specs = parse_tool_file(path, module)
+        except (OSError, SyntaxError) as e:
+            print(f"❌ 도구 파일 파싱 실패: {os.path.basename(path)} - {str(e)}")
+            return []
         
-        # 전략 1: importlib.import_module (가장 안전)
-        if self._load_with_import_module(full_module_name, module_name):
-            return
+        names = self._register_specs(specs)
+        self._manifest[path] = dict(signature, module=module, tools=names)
+        return names
+    
+    def _register_specs(self, specs: List[ToolSpec]) -> List[str]:
+        """
+        도구 메타데이터 등록 (이미 있는 도구명은 건너뜀)
         
-        # 전략 2: importlib.util.spec_from_file_location (직접 로딩)
-        if self._load_with_spec_from_file(filename, full_module_name, module_name):
-            return
+        메타데이터를 정적으로 읽을 수 없는 도구만 이 때 임포트하여 실제 속성을 사용하며,
+        lazy=False이면 등록한 도구를 모두 로딩
         
-        # 전략 3: 파일 직접 읽기 및 exec (최후 수단)
-        if self._load_with_exec(filename, full_module_name, module_name):
-            return
+        Args:
+            specs: 도구 메타데이터 목록
+            
+        Returns:
+            List[str]: 등록된 도구명
+        """
+        names = []
+        for spec in specs:
+            if spec.static:
+                resolved = [(spec, None, None)]
+            else:
+                resolved = self._resolve_dynamic(spec)
+            
+            for resolved_spec, tool, tool_class in resolved:
+                if resolved_spec.name in self.specs:
+                    print(f"⚠️ 중복 도구명 무시: {resolved_spec.name} ({resolved_spec.module}.{resolved_spec.class_name})")
+                    continue
+                self.specs[resolved_spec.name] = resolved_spec
+                if tool is not None:
+                    self.tools[resolved_spec.name] = tool
+                    self.tools_classes[resolved_spec.name] = tool_class
+                names.append(resolved_spec.name)
         
-        print(f"❌ 모든 로딩 전략 실패: {filename}")
+        if not self.lazy:
+            for name in names:
+                self.get_tool(name)
+        return names
     
-    def _load_with_import_module(self, full_module_name: str, module_name: str) -> bool:
-        """
-        importlib.import_module을 사용한 표준 로딩
+    def _resolve_dynamic(self, spec: ToolSpec) -> List[Tuple[ToolSpec, BaseTool, Type[BaseTool]]]:
         """
-        try:
-            print(f"🔄 표준 임포트 시도: {full_module_name}")
-            module = importlib.import_module(full_module_name)
-            return self._extract_tools_from_module(module, module_name, "import_module")
+        정적으로 읽을 수 없는 도구를 임포트하여 인스턴스의 실제 속성으로 메타데이터 생성
+        
+        클래스명이 없으면(모듈 전체를 가리키는 항목) 모듈(패키지이면 하위 모듈 포함)에 정의된
+        BaseTool 하위 클래스 중 추상 클래스(중간 기반 클래스 등)가 아닌 것을 모두 사용
+        
+        Args:
+            spec: 동적 도구 메타데이터
             
-        except ImportError as e:
-            print(f"📝 표준 임포트 실패: {full_module_name} - {str(e)}")
-            return False
-        except Exception as e:
-            print(f"❌ 표준 임포트 오류: {full_module_name} - {str(e)}")
-            return False
-    
-    def _load_with_spec_from_file(self, filename: str, full_module_name: str, module_name: str) -> bool:
+        Returns:
+            List[Tuple]: (메타데이터, 인스턴스, 클래스) 목록
         """
-        importlib.util.spec_from_file_location을 사용한 직접 로딩
+        module = self._import_module(spec)
+        if module is None:
+            return []
+        
+        if spec.class_name:
+            classes = [getattr(module, spec.class_name, None)]
+        else:
+            # 패키지 __init__.py가 하위 모듈의 도구 클래스를 다시 내보내는 도구 팩도 포함
+            prefix = module.__name__ + "." if hasattr(module, "__path__") else None
+            classes = [
+                obj for _, obj in inspect.getmembers(module, inspect.isclass)
+                if issubclass(obj, BaseTool) and not inspect.isabstract(obj)
+                and (obj.__module__ == module.__name__ or (prefix and obj.__module__.startswith(prefix)))
+            ]
+        
+        resolved = []
+        for tool_class in classes:
+            if not (inspect.isclass(tool_class) and issubclass(tool_class, BaseTool)):
+                print(f"❌ 도구 클래스를 찾을 수 없습니다: {spec.module}.{spec.class_name}")
+                continue
+            try:
+                tool = tool_class()
+            except Exception as e:
+                print(f"❌ 도구 인스턴스 생성 실패: {tool_class.__name__} - {str(e)}")
+                continue
+            metadata = {attribute: getattr(tool, attribute) for attribute in METADATA_ATTRIBUTES}
+            resolved_spec = ToolSpec(spec.module, tool_class.__name__, spec.path, metadata, static=False, pack=spec.pack)
+            resolved.append((resolved_spec, tool, tool_class))
+        return resolved
+    
+    def _unregister_names(self, names: List[str]):
+        """도구 등록 해제 (호출자가 _load_lock 보유)"""
+        for name in names:
+            self.specs.pop(name, None)
+            self.tools.pop(name, None)
+            self.tools_classes.pop(name, None)
+    
+    def _unregister_file(self, path: str) -> List[str]:
         """
-        try:
-            print(f"🔄 파일 스펙 로딩 시도: {filename}")
-            file_path = os.path.join(self.tools_dir, filename)
-            
-            spec = importlib.util.spec_from_file_location(full_module_name, file_path)
-            if spec is None or spec.loader is None:
-                print(f"📝 스펙 생성 실패: {filename}")
-                return False
-            
-            module = importlib.util.module_from_spec(spec)
-            
-            # sys.modules에 등록하여 패키지 컨텍스트 제공
-            sys.modules[full_module_name] = module
-            
-            # 모듈 실행
-            spec.loader.exec_module(module)
-            
-            return self._extract_tools_from_module(module, module_name, "spec_from_file")
-            
-        except Exception as e:
-            print(f"📝 파일 스펙 로딩 실패: {filename} - {str(e)}")
-            return False
+        도구 파일의 도구들을 등록 해제하고 모듈을 sys.modules에서 제거 (호출자가 _load_lock 보유)
+        
+        Returns:
+            List[str]: 등록 해제된 도구명
+        """
+        entry = self._manifest.pop(path, None)
+        if entry is None:
+            return []
+        self._unregister_names(entry["tools"])
+        self._unload_module(entry["module"], path)
+        return entry["tools"]
     
-    def _load_with_exec(self, filename: str, full_module_name: str, module_name: str) -> bool:
+    @staticmethod
+    def _unload_module(module: str, path: str):
         """
-        파일 내용을 직접 읽어서 exec으로 실행 (최후 수단)
+        모듈을 sys.modules와 부모 패키지 속성에서 제거하여 다음 임포트 때 새로 실행되도록 함
+        
+        같은 초 안에 같은 크기로 수정된 파일이 오래된 바이트코드로 로딩되지 않도록 .pyc도 삭제
         """
+        sys.modules.pop(module, None)
+        package, _, attribute = module.rpartition(".")
+        parent = sys.modules.get(package)
+        if parent is not None and hasattr(parent, attribute):
+            delattr(parent, attribute)
         try:
-            print(f"🔄 직접 실행 시도: {filename}")
-            file_path = os.path.join(self.tools_dir, filename)
-            
-            # 파일 내용 읽기
-            with open(file_path, 'r', encoding='utf-8') as f:
-                source_code = f.read()
-            
-            # 새로운 모듈 생성
-            module = type(sys)('tools.' + module_name)
-            module.__file__ = file_path
-            module.__name__ = full_module_name
+            os.remove(importlib.util.cache_from_source(path))
+        except (OSError, NotImplementedError, ValueError):
+            pass
+    
+    def _load_tool(self, spec: ToolSpec) -> Optional[BaseTool]:
+        """
+        등록된 도구의 모듈을 임포트하고 인스턴스 생성 (최초 사용 시 1회)
+        
+        Args:
+            spec: 도구 메타데이터
             
-            # sys.modules에 등록
-            sys.modules[full_module_name] = module
+        Returns:
+            BaseTool: 도구 인스턴스 (실패 시 None)
+        """
+        with self._load_lock:
+            tool = self.tools.get(spec.name)
+            if tool is not None:
+                return tool
             
-            # 코드 실행
-            exec(source_code, module.__dict__)
+            module = self._import_module(spec)
+            tool_class = getattr(module, spec.class_name, None) if module is not None else None
+            if tool_class is None or not (inspect.isclass(tool_class) and issubclass(tool_class, BaseTool)):
+                print(f"❌ 도구 클래스를 찾을 수 없습니다: {spec.module}.{spec.class_name}")
+                return None
             
-            return self._extract_tools_from_module(module, module_name, "exec")
+            try:
+                tool = tool_class()
+            except Exception as e:
+                print(f"❌ 도구 인스턴스 생성 실패: {spec.class_name} - {str(e)}")
+                return None
             
-        except Exception as e:
-            print(f"📝 직접 실행 실패: {filename} - {str(e)}")
-            return False
+            if tool.name != spec.name:
+                print(f"⚠️ 도구명이 정적 메타데이터와 다릅니다: {spec.name} → {tool.name}")
+            self.tools[spec.name] = tool
+            self.tools_classes[spec.name] = tool_class
+            return tool
     
-    def _extract_tools_from_module(self, module, module_name: str, method: str) -> bool:
+    def _import_module(self, spec: ToolSpec):
         """
-        모듈에서 BaseTool 서브클래스를 찾아 등록
+        도구 모듈 임포트 - 표준 임포트 실패 시 파일 스펙으로 직접 로딩
+        
+        Args:
+            spec: 도구 메타데이터
+            
+        Returns:
+            module: 임포트된 모듈 (실패 시 None)
         """
-        found_tools = 0
+        try:
+            return importlib.import_module(spec.module)
+        except ImportError as e:
+            print(f"📝 표준 임포트 실패: {spec.module} - {str(e)}")
+        except Exception as e:
+            print(f"❌ 표준 임포트 오류: {spec.module} - {str(e)}")
+            return None
+        if not spec.path:
+            return None
         
-        for name, obj in inspect.getmembers(module, inspect.isclass):
-            if (obj != BaseTool and 
-                issubclass(obj, BaseTool) and 
-                getattr(obj, '__module__', '').endswith(module_name)):
-                
-                try:
-                    # 도구 인스턴스 생성
-                    tool_instance = obj()
-                    self.tools[tool_instance.name] = tool_instance
-                    self.tools_classes[tool_instance.name] = obj
-                    
-                    print(f"✅ 도구 로딩 성공: {tool_instance.name} ({name}) via {method}")
-                    found_tools += 1
-                    
-                except Exception as e:
-                    print(f"❌ 도구 인스턴스 생성 실패: {name} - {str(e)}")
-        
-        return found_tools > 0
+        try:
+            module_spec = importlib.util.spec_from_file_location(spec.module, spec.path)
+            if module_spec is None or module_spec.loader is None:
+                print(f"📝 스펙 생성 실패: {spec.path}")
+                return None
+            module = importlib.util.module_from_spec(module_spec)
+            # sys.modules에 등록하여 패키지 컨텍스트 제공
+            sys.modules[spec.module] = module
+            module_spec.loader.exec_module(module)
+            return module
+        except Exception as e:
+            sys.modules.pop(spec.module, None)
+            print(f"📝 파일 스펙 로딩 실패: {spec.path} - {str(e)}")
+            return None
     
     def get_tool(self, name: str) -> Optional[BaseTool]:
         """
-        이름으로 도구 인스턴스 조회
+        이름으로 도구 인스턴스 조회 (아직 로딩되지 않았으면 이 때 임포트)
         
         Args:
             name (str): 도구명
@@ -197,15 +355,37 @@ class ToolsManager:
         Returns:
             BaseTool: 도구 인스턴스 (없으면 None)
         """
-        return self.tools.get(name)
+        tool = self.tools.get(name)
+        if tool is not None:
+            return tool
+        spec = self.specs.get(name)
+        return self._load_tool(spec) if spec is not None else None
+    
+    def get_tool_spec(self, name: str) -> Optional[ToolSpec]:
+        """
+        임포트 없이 도구 메타데이터 조회
+        
+        Args:
+            name (str): 도구명
+            
+        Returns:
+            ToolSpec: 도구 메타데이터 (없으면 None)
+        """
+        return self.specs.get(name)
+    
+    def is_loaded(self, name: str) -> bool:
+        """도구 모듈이 이미 임포트되어 인스턴스가 만들어졌는지 여부"""
+        return name in self.tools
     
     def get_all_tools(self) -> Dict[str, BaseTool]:
         """
-        모든 도구 인스턴스 반환
+        모든 도구 인스턴스 반환 (로딩되지 않은 도구도 모두 로딩)
         
         Returns:
             Dict[str, BaseTool]: 도구명: 도구인스턴스 매핑
         """
+        for name in list(self.specs):
+            self.get_tool(name)
         return self.tools.copy()
     
     def get_function_registry(self) -> Dict[str, BaseTool]:
@@ -215,19 +395,91 @@ class ToolsManager:
         Returns:
             Dict[str, BaseTool]: 함수명: 도구인스턴스 매핑
         """
-        return self.tools.copy()
+        return self.get_all_tools()
     
-    def get_tools_schemas(self) -> List[Dict[str, Any]]:
+    def _build_schema_bundle(self):
+        """
+        도구 스키마 번들 생성 (호출자가 _schema_lock 보유)
+        
+        도구명 순으로 정렬하여 도구 목록이 같으면 항상 같은 직렬화 결과를 보장
+        """
+        # 무효화되지 않은 도구의 스키마는 그대로 재사용
+        schema_by_name = {
+            name: self._schema_by_name.get(name) or copy.deepcopy(self._schema_source(name).get_schema())
+            for name in sorted(self.specs)
+        }
+        bundle = tuple(schema_by_name.values())
+        serialized = json.dumps(bundle, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        
+        self._schema_by_name = schema_by_name
+        self._schema_bundle = bundle
+        self._schema_json = serialized
+        self._schema_fingerprint = hashlib.sha256(serialized.encode("utf-8")).hexdigest()[:16]
+    
+    def _schema_source(self, name: str):
+        """스키마 원천 - 정적 메타데이터가 있으면 임포트 없이 사용"""
+        spec = self.specs[name]
+        if spec.static:
+            return spec
+        return self.get_tool(name) or spec
+    
+    def _ensure_schema_bundle(self):
+        """스키마 번들이 없으면 생성"""
+        if self._schema_bundle is None:
+            with self._schema_lock:
+                if self._schema_bundle is None:
+                    self._build_schema_bundle()
+    
+    def _invalidate_schemas(self, names: Optional[List[str]] = None):
+        """
+        스키마 캐시 무효화 및 버전 증가
+        
+        Args:
+            names: 무효화할 도구명 (None이면 전체) - 나머지 도구의 스키마는 번들 재생성 시 재사용
+        """
+        with self._schema_lock:
+            self._schema_version += 1
+            self._schema_bundle = None
+            if names is None:
+                self._schema_by_name = {}
+            else:
+                for name in names:
+                    self._schema_by_name.pop(name, None)
+            self._schema_json = None
+            self._schema_fingerprint = None
+    
+    def get_tools_schemas(self) -> Tuple[Dict[str, Any], ...]:
         """
         모든 도구들의 OpenAI 스키마 반환
         
+        캐시된 번들을 그대로 반환하므로 호출자는 내용을 수정하면 안 됨
+        
+        Returns:
+            Tuple[Dict]: OpenAI tools 스키마 목록 (도구명 순)
+        """
+        self._ensure_schema_bundle()
+        return self._schema_bundle
+    
+    def get_tools_schemas_json(self) -> str:
+        """
+        직렬화된 스키마 번들 반환 (프롬프트 캐시 키/토큰 계산용)
+        
         Returns:
-            List[Dict]: OpenAI tools 스키마 리스트
+            str: 정렬된 키의 압축 JSON 문자열
         """
-        schemas = []
-        for tool in self.tools.values():
-            schemas.append(tool.get_schema())
-        return schemas
+        self._ensure_schema_bundle()
+        return self._schema_json
+    
+    @property
+    def schema_version(self) -> int:
+        """도구 구성이 다시 로딩될 때마다 증가하는 스키마 버전"""
+        return self._schema_version
+    
+    @property
+    def schema_fingerprint(self) -> str:
+        """스키마 번들 내용 기반 지문 (같은 도구 구성이면 인스턴스가 달라도 동일)"""
+        self._ensure_schema_bundle()
+        return self._schema_fingerprint
     
     def execute_tool(self, name: str, arguments: Dict[str, Any]) -> str:
         """
@@ -242,34 +494,203 @@ class ToolsManager:
         """
         tool = self.get_tool(name)
         if not tool:
-            return f"{{\"error\": \"알 수 없는 도구: {name}\", \"available_tools\": {list(self.tools.keys())}}}"
+            # 모델이 만든 임의의 도구명으로 레이블이 늘어나지 않도록 하나로 묶음
+            TOOL_EXECUTIONS.labels("unknown", "unknown_tool").inc()
+            return f"{{\"error\": \"알 수 없는 도구: {name}\", \"available_tools\": {list(self.specs.keys())}}}"
         
         # 인자 유효성 검사
         missing_args = tool.get_missing_arguments(arguments)
         if missing_args:
+            TOOL_EXECUTIONS.labels(name, "invalid_arguments").inc()
             return f"{{\"error\": \"필수 인자가 누락되었습니다: {missing_args}\"}}"
         
+        start_time = time.perf_counter()
+        status = "error"
         try:
-            return tool.execute(**arguments)
+            result = tool.execute(**arguments)
+            status = "error" if isinstance(result, str) and result.startswith(ERROR_OUTPUT_PREFIXES) else "success"
+            return result
         except Exception as e:
             return f"{{\"error\": \"도구 실행 중 오류가 발생했습니다: {str(e)}\", \"tool\": \"{name}\", \"arguments\": {arguments}}}"
+        finally:
+            TOOL_LATENCY.labels(name).observe(time.perf_counter() - start_time)
+            TOOL_EXECUTIONS.labels(name, status).inc()
     
     def get_available_tools(self) -> List[str]:
         """
         사용 가능한 도구 목록 반환
         
         Returns:
-            List[str]: 도구명 목록
+            List[str]: 도구명 목록 (정렬됨)
         """
-        return list(self.tools.keys())
+        return sorted(self.specs.keys())
     
     def reload_tools(self):
         """
-        도구들을 다시 로딩 (개발 시 유용)
+        도구들을 모두 다시 로딩 (개발 시 유용)
+        
+        변경된 도구만 다시 로딩하려면 refresh_tools 사용
+        """
+        with self._load_lock:
+            for path in list(self._manifest):
+                self._unregister_file(path)
+            self.tools.clear()
+            self.tools_classes.clear()
+            self.specs.clear()
+            self._pack_tools.clear()
+            importlib.invalidate_caches()
+            self._discover_tools(refresh_packs=True)
+        self._invalidate_schemas()
+    
+    def refresh_tools(self) -> Dict[str, List[str]]:
         """
-        self.tools.clear()
-        self.tools_classes.clear()
-        self._discover_tools()
+        매니페스트와 비교하여 추가/수정/삭제된 도구 파일만 다시 로딩
+        
+        mtime/크기가 그대로인 파일은 읽지 않고, 바뀐 파일도 내용 해시가 같으면 건너뜀
+        수정된 모듈은 sys.modules에서 교체되며(지연 로딩이면 다음 사용 시 임포트),
+        스키마 캐시는 영향받은 도구만 무효화 (tools/ 디렉토리만 대상, 설치된 도구 팩은 reload_tools로 갱신)
+        
+        Returns:
+            Dict[str, List[str]]: {"added": [...], "updated": [...], "removed": [...]} 도구명 목록
+        """
+        changes: Dict[str, List[str]] = {"added": [], "updated": [], "removed": []}
+        with self._load_lock:
+            current = dict(tool_files(self.tools_dir)) if self.is_pack_enabled(BUILTIN_PACK) else {}
+            
+            for path in [path for path in self._manifest if path not in current]:
+                changes["removed"].extend(self._unregister_file(path))
+            
+            changed = []
+            for path, module in current.items():
+                previous = self._manifest.get(path)
+                try:
+                    signature = file_signature(path, previous)
+                except OSError:
+                    continue
+                if previous is None:
+                    changed.append((path, module, None))
+                elif signature["sha256"] != previous["sha256"]:
+                    changed.append((path, module, previous))
+                elif signature is not previous:
+                    # 내용은 같고 mtime만 바뀐 경우 - 서명만 갱신
+                    self._manifest[path] = dict(signature, module=module, tools=previous["tools"])
+            
+            if changed:
+                importlib.invalidate_caches()
+            for path, module, previous in changed:
+                old_names = set(self._unregister_file(path)) if previous is not None else set()
+                new_names = self._register_file(path, module)
+                changes["removed"].extend(sorted(old_names - set(new_names)))
+                changes["updated"].extend(name for name in new_names if name in old_names)
+                changes["added"].extend(name for name in new_names if name not in old_names)
+        
+        affected = changes["added"] + changes["updated"] + changes["removed"]
+        if affected:
+            self._invalidate_schemas(affected)
+            summary = ", ".join(f"{kind} {names}" for kind, names in changes.items() if names)
+            print(f"🔄 도구 변경 반영: {summary}")
+        return changes
+    
+    def is_pack_enabled(self, name: str) -> bool:
+        """도구 팩 활성화 여부"""
+        if name in self.disabled_packs:
+            return False
+        return self.pack_filter is None or name in self.pack_filter
+    
+    def list_packs(self) -> Dict[str, Dict[str, Any]]:
+        """
+        도구 팩 목록
+        
+        Returns:
+            Dict: 팩 이름 → {"enabled", "source", "version", "tools"}
+        """
+        packs = {
+            BUILTIN_PACK: {
+                "enabled": self.is_pack_enabled(BUILTIN_PACK),
+                "source": self.tools_dir,
+                "version": None,
+                "tools": sorted(name for entry in self._manifest.values() for name in entry["tools"])
+            }
+        }
+        for name, pack in self.tool_packs.items():
+            packs[name] = {
+                "enabled": self.is_pack_enabled(name),
+                "source": pack.distribution or pack.value,
+                "version": pack.version,
+                "tools": sorted(self._pack_tools.get(name) or [spec.name for spec in pack.specs if spec.name])
+            }
+        return packs
+    
+    def enable_pack(self, name: str) -> List[str]:
+        """
+        도구 팩 활성화 (해당 팩 도구의 스키마만 추가)
+        
+        Args:
+            name: 팩 이름
+            
+        Returns:
+            List[str]: 등록된 도구명
+            
+        Raises:
+            KeyError: 설치되지 않은 팩
+        """
+        if name != BUILTIN_PACK and name not in self.tool_packs:
+            raise KeyError(f"설치되지 않은 도구 팩입니다: {name}")
+        with self._load_lock:
+            if self.is_pack_enabled(name):
+                return []
+            self.disabled_packs.discard(name)
+            if self.pack_filter is not None:
+                self.pack_filter.add(name)
+            if name == BUILTIN_PACK:
+                names = [tool for path, module in tool_files(self.tools_dir) for tool in self._register_file(path, module)]
+            else:
+                names = self._pack_tools[name] = self._register_specs(self.tool_packs[name].specs)
+        self._invalidate_schemas(names)
+        return names
+    
+    def disable_pack(self, name: str) -> List[str]:
+        """
+        도구 팩 비활성화 (해당 팩 도구를 스키마와 프롬프트에서 제외)
+        
+        Args:
+            name: 팩 이름
+            
+        Returns:
+            List[str]: 등록 해제된 도구명
+        """
+        with self._load_lock:
+            if not self.is_pack_enabled(name):
+                return []
+            self.disabled_packs.add(name)
+            if name == BUILTIN_PACK:
+                names = [tool for path in list(self._manifest) for tool in self._unregister_file(path)]
+            else:
+                names = self._pack_tools.pop(name, [])
+                self._unregister_names(names)
+        self._invalidate_schemas(names)
+        return names
+    
+    def start_watcher(self, interval: float = 2.0) -> "ToolWatcher":
+        """
+        도구 디렉토리를 주기적으로 확인하여 변경 시 refresh_tools를 호출하는 감시 스레드 시작
+        
+        Args:
+            interval: 확인 주기 (초)
+            
+        Returns:
+            ToolWatcher: 실행 중인 감시자 (이미 실행 중이면 기존 감시자)
+        """
+        if self._watcher is None or not self._watcher.is_alive():
+            self._watcher = ToolWatcher(self, interval)
+            self._watcher.start()
+        return self._watcher
+    
+    def stop_watcher(self):
+        """감시 스레드 중지"""
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
     
     def get_tool_info(self, name: str) -> Dict[str, Any]:
         """
@@ -281,26 +702,78 @@ class ToolsManager:
         Returns:
             Dict: 도구 정보
         """
-        tool = self.get_tool(name)
-        if not tool:
+        spec = self.specs.get(name)
+        if not spec:
             return {"error": f"도구를 찾을 수 없습니다: {name}"}
         
+        source = self._schema_source(name)
+        self._ensure_schema_bundle()
         return {
-            "name": tool.name,
-            "description": tool.description,
-            "parameters": tool.parameters,
-            "schema": tool.get_schema(),
-            "class": tool.__class__.__name__
+            "name": name,
+            "description": source.description,
+            "parameters": source.parameters,
+            "tags": list(getattr(source, "tags", None) or []),
+            "schema": self._schema_by_name.get(name) or source.get_schema(),
+            "class": spec.class_name,
+            "pack": spec.pack,
+            "loaded": name in self.tools
         }
     
     def __len__(self) -> int:
-        """로딩된 도구 개수"""
-        return len(self.tools)
+        """발견된 도구 개수"""
+        return len(self.specs)
+    
+    def __str__(self) -> str:
+        """문자열 표현"""
+        return f"ToolsManager(tools={len(self.specs)}: {list(self.specs.keys())}, loaded={len(self.tools)})"
+    
+    def __repr__(self) -> str:
+        """개발자용 표현"""
+        return self.__str__()
+
+
+class ToolWatcher(threading.Thread):
+    """
+    도구 디렉토리 폴링 감시자 (데몬 스레드)
+    
+    파일 시스템 알림 의존성 없이 주기적으로 refresh_tools를 호출하며,
+    변경이 없으면 파일별 stat만 수행하므로 비용이 작음
+    """
+    
+    def __init__(self, manager: ToolsManager, interval: float = 2.0):
+        """
+        ToolWatcher 초기화
+        
+        Args:
+            manager: 감시할 도구 매니저
+            interval: 확인 주기 (초)
+        """
+        super().__init__(name="tool-watcher", daemon=True)
+        self.manager = manager
+        self.interval = interval
+        self.refreshes = 0
+        self._stop_event = threading.Event()
+    
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                changes = self.manager.refresh_tools()
+            except Exception as e:
+                print(f"❌ 도구 변경 확인 실패: {str(e)}")
+                continue
+            if any(changes.values()):
+                self.refreshes += 1
+    
+    def stop(self, timeout: Optional[float] = None):
+        """감시 중지 (timeout 동안 스레드 종료 대기)"""
+        self._stop_event.set()
+        if self is not threading.current_thread():
+            self.join(timeout)
     
     def __str__(self) -> str:
         """문자열 표현"""
-        return f"ToolsManager(tools={len(self.tools)}: {list(self.tools.keys())})"
+        return f"ToolWatcher(dir='{self.manager.tools_dir}', interval={self.interval}, refreshes={self.refreshes})"
     
     def __repr__(self) -> str:
         """개발자용 표현"""
-        return self.__str__()
\ No newline at end of file
+        return self.__str__()